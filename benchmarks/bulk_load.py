@@ -0,0 +1,79 @@
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .synthetic_data import ALLIANCE_COLUMNS, COLLECTION_COLUMNS, USER_COLUMNS, SyntheticCollection
+
+
+@dataclass(frozen=True)
+class BulkLoadResult:
+    collections: int
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+async def bulk_load(engine: AsyncEngine, collections: Iterable[SyntheticCollection], batch_size: int = 24, verbose: bool = True) -> BulkLoadResult:
+    """Copies the `collections` into the database using the binary `COPY` protocol, bypassing the ORM. Afterwards, the `collection_id` sequence is advanced past the loaded Collections and the tables are analyzed.
+
+    Args:
+        engine (AsyncEngine): An engine using the `asyncpg` driver.
+        collections (Iterable[SyntheticCollection]): The Collections to load. Their `collection_id`s must not exist in the database, yet.
+        batch_size (int, optional): The number of Collections copied per `COPY` statement. Defaults to 24.
+        verbose (bool, optional): Print progress to stdout. Defaults to True.
+
+    Returns:
+        BulkLoadResult: The number of loaded Collections and rows and the time it took.
+    """
+    started_at = time.perf_counter()
+    collection_count = 0
+    row_count = 0
+
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        batch: list[SyntheticCollection] = []
+        for collection in collections:
+            batch.append(collection)
+            if len(batch) >= batch_size:
+                row_count += await _copy_batch(driver_connection, batch)
+                collection_count += len(batch)
+                batch = []
+                if verbose and collection_count % (batch_size * 100) == 0:
+                    print(f"Loaded {collection_count} Collections ({row_count / (time.perf_counter() - started_at):.0f} rows/s)")
+        if batch:
+            row_count += await _copy_batch(driver_connection, batch)
+            collection_count += len(batch)
+
+        await driver_connection.execute(
+            "SELECT setval(pg_get_serial_sequence('collection', 'collection_id'), (SELECT COALESCE(max(collection_id), 1) FROM collection))"
+        )
+        await driver_connection.execute("ANALYZE collection, pss_alliance, pss_user")
+
+    return BulkLoadResult(collections=collection_count, rows=row_count, seconds=time.perf_counter() - started_at)
+
+
+async def _copy_batch(driver_connection, batch: list[SyntheticCollection]) -> int:
+    async with driver_connection.transaction():
+        await driver_connection.copy_records_to_table(
+            "collection", records=[collection.collection for collection in batch], columns=COLLECTION_COLUMNS
+        )
+        await driver_connection.copy_records_to_table(
+            "pss_alliance", records=[row for collection in batch for row in collection.alliances], columns=ALLIANCE_COLUMNS
+        )
+        await driver_connection.copy_records_to_table(
+            "pss_user", records=[row for collection in batch for row in collection.users], columns=USER_COLUMNS
+        )
+    return sum(collection.row_count for collection in batch)
+
+
+__all__ = [
+    "BulkLoadResult",
+    "bulk_load",
+]
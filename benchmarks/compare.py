@@ -0,0 +1,26 @@
+"""Compares the results of two benchmark runs.
+
+Usage:
+    python -m benchmarks.compare bench_crud.json bench_crud_new.json
+"""
+
+import argparse
+
+from .results import compare_results, load_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the results of two benchmark runs.")
+    parser.add_argument("baseline", type=str, help="The JSON file with the results of the earlier run.")
+    parser.add_argument("candidate", type=str, help="The JSON file with the results of the later run.")
+    args = parser.parse_args()
+
+    baseline_metadata, baseline = load_results(args.baseline)
+    candidate_metadata, candidate = load_results(args.candidate)
+    print(f"Baseline:  {baseline_metadata.get('commit')} ({baseline_metadata.get('started_at')})")
+    print(f"Candidate: {candidate_metadata.get('commit')} ({candidate_metadata.get('started_at')})")
+    print(compare_results(baseline, candidate))
+
+
+if __name__ == "__main__":
+    main()
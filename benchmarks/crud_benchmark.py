@@ -0,0 +1,292 @@
+"""Benchmarks the crud functions against a synthetic dataset at production scale.
+
+Usage:
+    python -m benchmarks.crud_benchmark --load --years 1 --output bench_crud.json
+    python -m benchmarks.crud_benchmark --output bench_crud_new.json --compare bench_crud.json
+    USER_DELTA_STORAGE_ENABLED=true python -m benchmarks.crud_benchmark --load --years 1 --output bench_crud_delta.json --compare bench_crud.json
+
+The database is configured via the environment variables `DATABASE_URL` and `DATABASE_NAME`. Loading a dataset with `--load` drops all tables first,
+so use a dedicated database. If delta storage is enabled, the loaded dataset gets compressed afterwards. The sizes of the User tables are reported with the results,
+so that the table size can be compared against the read latency.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from sqlmodel import func, select, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.config import SETTINGS
+from src.api.database import crud, db, delta_storage
+from src.api.database.models import AllianceDB, CollectionDB, UserCarriedForwardDB, UserDB
+from src.api.models.enums import ParameterInterval, ParameterOnMissing
+
+from .bulk_load import bulk_load
+from .results import BenchmarkResult, compare_results, format_results, get_run_metadata, load_results, save_results
+from .synthetic_data import SyntheticDataConfig, generate_collections
+
+
+SAMPLE_SIZE: int = 1_000
+WINDOW_BY_INTERVAL: dict[ParameterInterval, timedelta] = {
+    ParameterInterval.HOURLY: timedelta(days=7),
+    ParameterInterval.DAILY: timedelta(days=180),
+    ParameterInterval.MONTHLY: timedelta(days=10 * 365),
+}
+"""The time span of the requested data per interval."""
+SIZED_TABLE_NAMES: tuple[str, ...] = (UserDB.__tablename__, UserCarriedForwardDB.__tablename__)
+"""The tables whose size is reported."""
+
+
+@dataclass(frozen=True)
+class DatasetInfo:
+    first_collected_at: datetime
+    last_collected_at: datetime
+    collection_ids: list[int]
+    alliance_ids: list[int]
+    user_ids: list[int]
+
+
+BenchmarkCase = Callable[[AsyncSession, random.Random], Awaitable[int]]
+"""Runs a single iteration of a benchmark case and returns the number of rows read or written."""
+
+
+async def get_dataset_info() -> DatasetInfo:
+    """Looks up the time range of the Collections in the database and samples the IDs of Collections, Alliances and Users to request."""
+    async with AsyncSession(db.ENGINE) as session:
+        first_collected_at, last_collected_at = (
+            await session.exec(select(func.min(CollectionDB.collected_at), func.max(CollectionDB.collected_at)))
+        ).one()
+        if first_collected_at is None:
+            raise RuntimeError("There are no Collections in the database. Run the benchmark with `--load` first.")
+
+        collection_ids = list((await session.exec(select(CollectionDB.collection_id))).all())
+        latest_collection_id = max(collection_ids)
+        alliance_ids = list((await session.exec(select(AllianceDB.alliance_id).where(AllianceDB.collection_id == latest_collection_id))).all())
+        user = delta_storage.get_user_source()
+        user_ids = list((await session.exec(select(user.user_id).where(user.collection_id == latest_collection_id).limit(SAMPLE_SIZE))).all())
+
+    return DatasetInfo(first_collected_at, last_collected_at, collection_ids, alliance_ids, user_ids)
+
+
+async def get_table_sizes() -> dict[str, int]:
+    """Looks up the size of the `SIZED_TABLE_NAMES` including their indexes in bytes."""
+    async with AsyncSession(db.ENGINE) as session:
+        return {
+            table_name: (await session.exec(select(func.pg_total_relation_size(table_name)))).one()  # type: ignore
+            for table_name in SIZED_TABLE_NAMES
+        }
+
+
+async def compress_users() -> BenchmarkResult:
+    """Carries forward the unchanged Users of the loaded dataset and rewrites the User tables, so that their size reflects delta storage."""
+    started_at = time.perf_counter()
+    carried_forward_count = await delta_storage.compress_all_users(db.ENGINE, verbose=False)
+    duration = time.perf_counter() - started_at
+
+    async with db.ENGINE.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        for table_name in SIZED_TABLE_NAMES:
+            await connection.execute(text(f"VACUUM FULL ANALYZE {table_name}"))
+
+    print(f"Carried forward {carried_forward_count} Users in {duration:.1f} s")
+    return BenchmarkResult.from_durations("compress_users", [duration], carried_forward_count)
+
+
+def get_read_cases(dataset: DatasetInfo) -> dict[str, BenchmarkCase]:
+    """Creates the benchmark cases for the reading crud functions. Every iteration requests random, existing data.
+
+    Args:
+        dataset (DatasetInfo): Describes the data in the database.
+
+    Returns:
+        dict[str, BenchmarkCase]: The benchmark cases by name.
+    """
+    cases: dict[str, BenchmarkCase] = {}
+
+    def random_date_range(rng: random.Random, interval: ParameterInterval) -> tuple[datetime, datetime]:
+        window = min(WINDOW_BY_INTERVAL[interval], dataset.last_collected_at - dataset.first_collected_at)
+        latest_start = dataset.last_collected_at - window
+        from_date = dataset.first_collected_at + (latest_start - dataset.first_collected_at) * rng.random()
+        return from_date.replace(microsecond=0), (from_date + window).replace(microsecond=0)
+
+    for interval in ParameterInterval:
+        for on_missing in ParameterOnMissing:
+
+            async def get_collections(session: AsyncSession, rng: random.Random, interval=interval, on_missing=on_missing) -> int:
+                from_date, to_date = random_date_range(rng, interval)
+                return len(await crud.get_collections(session, from_date, to_date, interval, False, 0, 100, on_missing))
+
+            cases[f"get_collections[{interval.value},{on_missing.value}]"] = get_collections
+
+        async def get_user_history(session: AsyncSession, rng: random.Random, interval=interval) -> int:
+            from_date, to_date = random_date_range(rng, interval)
+            return len(await crud.get_user_history(session, rng.choice(dataset.user_ids), True, from_date, to_date, interval, False, 0, 100))
+
+        async def get_alliance_history(session: AsyncSession, rng: random.Random, interval=interval) -> int:
+            from_date, to_date = random_date_range(rng, interval)
+            history = await crud.get_alliance_history(session, rng.choice(dataset.alliance_ids), True, from_date, to_date, interval, False, 0, 100)
+            return sum(1 + len(alliance.users) for _, alliance in history)
+
+        cases[f"get_user_history[{interval.value}]"] = get_user_history
+        cases[f"get_alliance_history[{interval.value}]"] = get_alliance_history
+
+    async def get_collection(session: AsyncSession, rng: random.Random) -> int:
+        collection = await crud.get_collection(session, rng.choice(dataset.collection_ids), True, True)
+        return 1 + len(collection.alliances) + len(collection.users)
+
+    async def get_top_100_from_collection(session: AsyncSession, rng: random.Random) -> int:
+        return len(await crud.get_top_100_from_collection(session, rng.choice(dataset.collection_ids), 0, 100))
+
+    cases["get_collection"] = get_collection
+    cases["get_top_100_from_collection"] = get_top_100_from_collection
+    return cases
+
+
+async def measure(name: str, iterations: int, case: BenchmarkCase, rng: random.Random) -> BenchmarkResult:
+    """Runs a benchmark case sequentially, each iteration in a new session.
+
+    Args:
+        name (str): The name of the benchmark case.
+        iterations (int): The number of iterations.
+        case (BenchmarkCase): The benchmark case.
+        rng (random.Random): Provides the random parameters of the iterations.
+
+    Returns:
+        BenchmarkResult: The measurements.
+    """
+    durations = []
+    rows = 0
+    for _ in range(iterations):
+        async with AsyncSession(db.ENGINE) as session:
+            started_at = time.perf_counter()
+            rows += await case(session, rng)
+            durations.append(time.perf_counter() - started_at)
+    return BenchmarkResult.from_durations(name, durations, rows)
+
+
+async def benchmark_writes(config: SyntheticDataConfig, dataset: DatasetInfo, iterations: int) -> list[BenchmarkResult]:
+    """Saves and then updates synthetic Collections following the last Collection in the database via the ORM. The Collections get deleted afterwards, so that the dataset stays the same between runs.
+
+    Args:
+        config (SyntheticDataConfig): The configuration of the loaded dataset.
+        dataset (DatasetInfo): Describes the data in the database.
+        iterations (int): The number of Collections to save and update.
+
+    Returns:
+        list[BenchmarkResult]: The measurements of `save_collection` and `update_collection`.
+    """
+    write_config = replace(config, start=dataset.last_collected_at + timedelta(hours=1), years=iterations / (365 * 24), seed=config.seed + 1)
+    synthetic_collections = list(generate_collections(write_config))
+    rows = sum(collection.row_count for collection in synthetic_collections)
+
+    save_durations = []
+    collection_ids = []
+    for synthetic_collection in synthetic_collections:
+        collection = synthetic_collection.to_collection_db()
+        async with AsyncSession(db.ENGINE) as session:
+            started_at = time.perf_counter()
+            collection = await crud.save_collection(session, collection, True, True)
+            save_durations.append(time.perf_counter() - started_at)
+        collection_ids.append(collection.collection_id)
+
+    update_durations = []
+    for collection_id, synthetic_collection in zip(collection_ids, synthetic_collections, strict=True):
+        collection = synthetic_collection.to_collection_db()
+        for user in collection.users:
+            user.trophy += 1
+        async with AsyncSession(db.ENGINE) as session:
+            started_at = time.perf_counter()
+            await crud.update_collection(session, collection_id, collection)
+            update_durations.append(time.perf_counter() - started_at)
+
+    for collection_id in collection_ids:
+        async with AsyncSession(db.ENGINE) as session:
+            await crud.delete_collection(session, collection_id)
+
+    return [
+        BenchmarkResult.from_durations("save_collection", save_durations, rows),
+        BenchmarkResult.from_durations("update_collection", update_durations, rows),
+    ]
+
+
+async def run(args: argparse.Namespace) -> tuple[list[BenchmarkResult], dict[str, int]]:
+    config = SyntheticDataConfig(years=args.years, alliance_count=args.alliances, user_count=args.users, seed=args.seed)
+    db.set_up_db_engine(SETTINGS.async_database_connection_str, echo=False)
+    results = []
+
+    if args.load:
+        print(f"Loading {config.collection_count} synthetic Collections into '{db.ENGINE.url.database}'")
+        db.initialize_db(reinitialize=True)
+        load_result = await bulk_load(db.ENGINE, generate_collections(config))
+        print(f"Loaded {load_result.rows} rows in {load_result.seconds:.1f} s ({load_result.rows_per_second:.0f} rows/s)")
+        results.append(BenchmarkResult.from_durations("bulk_load", [load_result.seconds], load_result.rows))
+        if SETTINGS.user_delta_storage_enabled:
+            results.append(await compress_users())
+
+    table_sizes = await get_table_sizes()
+    for table_name, size in table_sizes.items():
+        print(f"Size of '{table_name}': {size / 1024**2:.1f} MiB")
+
+    dataset = await get_dataset_info()
+    rng = random.Random(args.seed)
+    for name, case in get_read_cases(dataset).items():
+        if args.filter and args.filter not in name:
+            continue
+        print(f"Running {name}")
+        results.append(await measure(name, args.iterations, case, rng))
+
+    if args.write_iterations and (not args.filter or any(args.filter in name for name in ("save_collection", "update_collection"))):
+        print("Running save_collection and update_collection")
+        results.extend(await benchmark_writes(config, dataset, args.write_iterations))
+
+    await db.ENGINE.dispose()
+    return results, table_sizes
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the crud functions against a synthetic dataset.")
+    parser.add_argument("--load", action="store_true", help="Drop all tables and bulk load a new synthetic dataset before running the benchmarks.")
+    parser.add_argument("--years", type=float, default=1.0, help="The number of years of hourly Collections to generate. Defaults to 1.")
+    parser.add_argument("--alliances", type=int, default=100, help="The number of Alliances per Collection. Defaults to 100.")
+    parser.add_argument("--users", type=int, default=12_000, help="The number of players in the pool. Defaults to 12000.")
+    parser.add_argument("--seed", type=int, default=42, help="The seed of the data generator and of the random parameters. Defaults to 42.")
+    parser.add_argument("--iterations", type=int, default=50, help="The number of iterations per read benchmark. Defaults to 50.")
+    parser.add_argument("--write-iterations", type=int, default=5, help="The number of Collections to save and update. Defaults to 5.")
+    parser.add_argument("--filter", type=str, default=None, help="Only run benchmarks whose name contains this string.")
+    parser.add_argument("--output", type=str, default=None, help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", type=str, default=None, help="Compare the results to the results stored in this file.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metadata = get_run_metadata(benchmark="crud", arguments=vars(args), user_delta_storage_enabled=SETTINGS.user_delta_storage_enabled)
+    results, metadata["table_sizes"] = asyncio.run(run(args))
+
+    print(format_results(results))
+    if args.output:
+        save_results(args.output, metadata, results)
+    if args.compare:
+        _, baseline = load_results(args.compare)
+        print(compare_results(baseline, results))
+
+
+__all__ = [
+    "DatasetInfo",
+    "benchmark_writes",
+    "compress_users",
+    "get_dataset_info",
+    "get_read_cases",
+    "get_table_sizes",
+    "measure",
+    "run",
+]
+
+
+if __name__ == "__main__":
+    main()
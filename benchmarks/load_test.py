@@ -0,0 +1,472 @@
+"""Load tests a running API with a weighted mix of concurrent requests.
+
+Usage:
+    python -m benchmarks.load_test --start-server --workers 4 --concurrency 32 --duration 60 --output bench_load.json
+    python -m benchmarks.load_test --base-url http://localhost:8000 --upload-weight 1 --api-key <key> --compare bench_load.json
+
+With `--start-server`, the API is started with uvicorn against the database configured via the environment variables `DATABASE_URL` and
+`DATABASE_NAME`, for example the dataset loaded by `python -m benchmarks.crud_benchmark --load`. Rate limiting is disabled for the started server.
+Uploaded Collections get deleted after the run.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Callable
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+
+from src.api.database.models import CollectionDB
+from src.api.metrics import METRICS_PREFIX
+from src.api.models.converters import FromDB
+from src.api.models.enums import ParameterInterval
+
+from .results import BenchmarkResult, compare_results, format_results, get_run_metadata, load_results, save_results
+from .synthetic_data import SyntheticDataConfig, SyntheticDataGenerator
+
+
+SAMPLE_SIZE: int = 1_000
+WINDOW_BY_INTERVAL: dict[ParameterInterval, timedelta] = {
+    ParameterInterval.HOURLY: timedelta(days=7),
+    ParameterInterval.DAILY: timedelta(days=180),
+    ParameterInterval.MONTHLY: timedelta(days=10 * 365),
+}
+"""The time span of the requested data per interval."""
+
+
+@dataclass(frozen=True)
+class TargetInfo:
+    """
+    Describes the data served by the API under test.
+    """
+
+    first_collected_at: datetime
+    last_collected_at: datetime
+    collection_ids: list[int]
+    alliance_ids: list[int]
+    user_ids: list[int]
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    method: str
+    url: str
+    params: dict[str, str] = field(default_factory=dict)
+    files: dict[str, tuple[str, bytes, str]] | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    A kind of request in the mix. Scenarios get picked proportionally to their `weight`.
+    """
+
+    name: str
+    weight: float
+    build: Callable[[random.Random, TargetInfo], RequestSpec]
+
+
+@dataclass
+class ScenarioMeasurements:
+    durations: list[float] = field(default_factory=list)
+    errors: int = 0
+    response_bytes: int = 0
+
+
+ServerMetrics = dict[tuple[str, tuple[tuple[str, str], ...]], float]
+"""Prometheus samples by name and sorted labels."""
+
+
+def random_date_range(rng: random.Random, target: TargetInfo, interval: ParameterInterval) -> tuple[datetime, datetime]:
+    window = min(WINDOW_BY_INTERVAL[interval], target.last_collected_at - target.first_collected_at)
+    latest_start = target.last_collected_at - window
+    from_date = target.first_collected_at + (latest_start - target.first_collected_at) * rng.random()
+    return from_date.replace(microsecond=0), (from_date + window).replace(microsecond=0)
+
+
+def get_read_scenarios() -> list[Scenario]:
+    """Creates the mix of reading requests. The weights approximate the traffic of the production API, where history lookups dominate.
+
+    Returns:
+        list[Scenario]: The scenarios.
+    """
+
+    def history_params(rng: random.Random, target: TargetInfo, interval: ParameterInterval) -> dict[str, str]:
+        from_date, to_date = random_date_range(rng, target, interval)
+        return {"interval": interval.value, "fromDate": from_date.isoformat(), "toDate": to_date.isoformat()}
+
+    scenarios = []
+    for interval, weight in ((ParameterInterval.HOURLY, 1.0), (ParameterInterval.DAILY, 2.0), (ParameterInterval.MONTHLY, 2.0)):
+        scenarios.append(
+            Scenario(
+                f"GET /collections[{interval.value}]",
+                weight,
+                lambda rng, target, interval=interval: RequestSpec("GET", "/collections/", history_params(rng, target, interval)),
+            )
+        )
+        scenarios.append(
+            Scenario(
+                f"GET /userHistory/{{userId}}[{interval.value}]",
+                weight * 3,
+                lambda rng, target, interval=interval: RequestSpec(
+                    "GET", f"/userHistory/{rng.choice(target.user_ids)}", history_params(rng, target, interval)
+                ),
+            )
+        )
+        scenarios.append(
+            Scenario(
+                f"GET /allianceHistory/{{allianceId}}[{interval.value}]",
+                weight,
+                lambda rng, target, interval=interval: RequestSpec(
+                    "GET", f"/allianceHistory/{rng.choice(target.alliance_ids)}", history_params(rng, target, interval)
+                ),
+            )
+        )
+
+    scenarios.append(
+        Scenario(
+            "GET /collections/{collectionId}/users",
+            1.0,
+            lambda rng, target: RequestSpec("GET", f"/collections/{rng.choice(target.collection_ids)}/users"),
+        )
+    )
+    scenarios.append(
+        Scenario(
+            "GET /collections/{collectionId}/top100Users",
+            2.0,
+            lambda rng, target: RequestSpec("GET", f"/collections/{rng.choice(target.collection_ids)}/top100Users"),
+        )
+    )
+    return scenarios
+
+
+def get_upload_scenario(weight: float, api_key: str | None, config: SyntheticDataConfig) -> Scenario:
+    """Creates the scenario uploading synthetic Collections following the last Collection of the target.
+
+    Args:
+        weight (float): The weight of the scenario.
+        api_key (str, optional): The api key to send in the `Authorization` header.
+        config (SyntheticDataConfig): Configures the size of the uploaded Collections. `start` is replaced by the hour after the last Collection of the target.
+
+    Returns:
+        Scenario: The scenario.
+    """
+    generators: list[SyntheticDataGenerator] = []
+
+    def build(_rng: random.Random, target: TargetInfo) -> RequestSpec:
+        if not generators:
+            start = target.last_collected_at.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            generators.append(SyntheticDataGenerator(replace(config, start=start, years=100, first_collection_id=1)).generate())
+        collection = next(generators[0]).to_collection_db()
+        content = json.dumps(to_upload_payload(collection)).encode()
+        headers = {"Authorization": api_key} if api_key else {}
+        return RequestSpec(
+            "POST", "/collections/upload", files={"collection_file": ("collection.json", content, "application/json")}, headers=headers
+        )
+
+    return Scenario("POST /collections/upload", weight, build)
+
+
+def to_upload_payload(collection: CollectionDB) -> dict:
+    """Converts a `CollectionDB` into the JSON contents of an upload file of the latest schema version."""
+    payload = json.loads(FromDB.to_collection(collection, True, True).model_dump_json())
+    payload["meta"]["schema_version"] = 9
+    payload["meta"]["max_tournament_battle_attempts"] = payload["meta"]["max_tournament_battle_attempts"] or 0
+    payload["meta"].pop("collection_id", None)
+    return payload
+
+
+def pick_scenario(scenarios: list[Scenario], rng: random.Random) -> Scenario:
+    return rng.choices(scenarios, weights=[scenario.weight for scenario in scenarios])[0]
+
+
+async def get_target_info(client: httpx.AsyncClient) -> TargetInfo:
+    """Looks up the Collections served by the API and samples the IDs of Alliances and Users from the latest Collection."""
+    response = await client.get("/collections/", params={"interval": ParameterInterval.HOURLY.value, "take": 100, "desc": "true"})
+    response.raise_for_status()
+    latest_collections = response.json()
+    if not latest_collections:
+        raise RuntimeError("The API doesn't serve any Collections. Load a dataset with `python -m benchmarks.crud_benchmark --load` first.")
+
+    response = await client.get("/collections/", params={"interval": ParameterInterval.HOURLY.value, "take": 1})
+    response.raise_for_status()
+    first_collected_at = datetime.fromisoformat(response.json()[0]["timestamp"])
+    last_collected_at = datetime.fromisoformat(latest_collections[0]["timestamp"])
+
+    collection_ids = [collection["collection_id"] for collection in latest_collections]
+    response = await client.get(f"/collections/{collection_ids[0]}/alliances")
+    response.raise_for_status()
+    alliance_ids = [fleet[0] for fleet in response.json()["fleets"]]
+    response = await client.get(f"/collections/{collection_ids[0]}/users")
+    response.raise_for_status()
+    user_ids = [user[0] for user in response.json()["users"][:SAMPLE_SIZE]]
+
+    return TargetInfo(first_collected_at, last_collected_at, collection_ids, alliance_ids, user_ids)
+
+
+async def scrape_metrics(client: httpx.AsyncClient) -> ServerMetrics:
+    try:
+        response = await client.get("/metrics")
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return {}
+    return parse_metrics(response.text)
+
+
+def parse_metrics(text: str) -> ServerMetrics:
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(text)
+        for sample in family.samples
+    }
+
+
+def summarize_server_metrics(before: ServerMetrics, after: ServerMetrics) -> dict[str, float]:
+    """Calculates what the server measured between two scrapes of `/metrics`.
+
+    Args:
+        before (ServerMetrics): The samples scraped before the run.
+        after (ServerMetrics): The samples scraped after the run.
+
+    Returns:
+        dict[str, float]: The number of requests and SQL statements and their mean durations in milliseconds as well as the number of ingested rows.
+            Empty, if the metrics are unavailable.
+    """
+    if not after:
+        return {}
+
+    totals: dict[str, float] = defaultdict(float)
+    for key, value in after.items():
+        name, labels = key
+        label_dict = dict(labels)
+        if label_dict.get("route") == "/metrics":
+            continue
+        totals[name] += value - before.get(key, 0.0)
+
+    requests = totals[f"{METRICS_PREFIX}_http_request_duration_seconds_count"]
+    statements = totals[f"{METRICS_PREFIX}_db_query_duration_seconds_count"]
+    return {
+        "requests": requests,
+        "mean_request_ms": totals[f"{METRICS_PREFIX}_http_request_duration_seconds_sum"] / requests * 1000 if requests else 0.0,
+        "sql_statements": statements,
+        "sql_statements_per_request": statements / requests if requests else 0.0,
+        "mean_sql_ms": totals[f"{METRICS_PREFIX}_db_query_duration_seconds_sum"] / statements * 1000 if statements else 0.0,
+        "ingested_rows": totals[f"{METRICS_PREFIX}_ingested_rows_total"],
+    }
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    target: TargetInfo,
+    concurrency: int,
+    duration: float | None,
+    requests: int | None,
+    seed: int,
+) -> tuple[dict[str, ScenarioMeasurements], float, list[int]]:
+    """Sends requests from `concurrency` workers until `duration` seconds have passed or `requests` requests have been sent.
+
+    Args:
+        client (httpx.AsyncClient): The client connected to the API under test.
+        scenarios (list[Scenario]): The weighted mix of requests.
+        target (TargetInfo): Describes the data served by the API.
+        concurrency (int): The number of concurrent workers.
+        duration (float, optional): The duration of the run in seconds.
+        requests (int, optional): The total number of requests to send.
+        seed (int): The seed of the random choice of scenarios and parameters.
+
+    Returns:
+        tuple[dict[str, ScenarioMeasurements], float, list[int]]: The measurements by scenario name, the wall clock time of the run and the IDs of uploaded Collections.
+    """
+    measurements: dict[str, ScenarioMeasurements] = defaultdict(ScenarioMeasurements)
+    uploaded_collection_ids: list[int] = []
+    rng = random.Random(seed)
+    started_at = time.perf_counter()
+    deadline = started_at + duration if duration else None
+    remaining = [requests] if requests else None
+
+    def should_continue() -> bool:
+        if deadline is not None and time.perf_counter() >= deadline:
+            return False
+        if remaining is not None:
+            if remaining[0] <= 0:
+                return False
+            remaining[0] -= 1
+        return True
+
+    async def worker():
+        while should_continue():
+            scenario = pick_scenario(scenarios, rng)
+            spec = scenario.build(rng, target)
+            measurement = measurements[scenario.name]
+            request_started_at = time.perf_counter()
+            try:
+                response = await client.request(spec.method, spec.url, params=spec.params, files=spec.files, headers=spec.headers)
+                content = response.content
+            except httpx.HTTPError:
+                measurement.errors += 1
+                continue
+            measurement.durations.append(time.perf_counter() - request_started_at)
+            measurement.response_bytes += len(content)
+            if response.status_code >= 400:
+                measurement.errors += 1
+            elif spec.files:
+                uploaded_collection_ids.append(response.json()["collection_id"])
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return measurements, time.perf_counter() - started_at, uploaded_collection_ids
+
+
+def to_results(measurements: dict[str, ScenarioMeasurements], total_seconds: float) -> list[BenchmarkResult]:
+    """Calculates latency percentiles, throughput and errors per scenario and in total. `rows` holds the number of received bytes."""
+    results = [
+        BenchmarkResult.from_durations(name, measurement.durations, measurement.response_bytes, measurement.errors, total_seconds)
+        for name, measurement in sorted(measurements.items())
+    ]
+    all_durations = [duration for measurement in measurements.values() for duration in measurement.durations]
+    results.append(
+        BenchmarkResult.from_durations(
+            "total",
+            all_durations,
+            sum(measurement.response_bytes for measurement in measurements.values()),
+            sum(measurement.errors for measurement in measurements.values()),
+            total_seconds,
+        )
+    )
+    return results
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    env = {**os.environ, "RATE_LIMIT_ENABLED": "false"}
+    if workers > 1 and "PROMETHEUS_MULTIPROC_DIR" not in env:
+        env["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="pss_fleet_data_api_metrics_")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.main:app", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+    )
+
+
+async def wait_for_server(client: httpx.AsyncClient, timeout: float = 60.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if (await client.get("/ping")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        if time.perf_counter() >= deadline:
+            raise RuntimeError(f"The API at '{client.base_url}' didn't respond within {timeout:.0f} seconds.")
+        await asyncio.sleep(0.5)
+
+
+async def run(args: argparse.Namespace) -> tuple[list[BenchmarkResult], dict[str, float]]:
+    scenarios = get_read_scenarios()
+    if args.filter:
+        scenarios = [scenario for scenario in scenarios if args.filter in scenario.name]
+    if args.upload_weight:
+        upload_config = SyntheticDataConfig(alliance_count=args.alliances, user_count=args.users, seed=args.seed + 1)
+        scenarios.append(get_upload_scenario(args.upload_weight, args.api_key, upload_config))
+    if not scenarios:
+        raise RuntimeError(f"No scenario matches the filter '{args.filter}'.")
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        await wait_for_server(client)
+        target = await get_target_info(client)
+        print(f"Running {len(scenarios)} scenarios with {args.concurrency} concurrent clients against {args.base_url}")
+
+        metrics_before = await scrape_metrics(client)
+        measurements, total_seconds, uploaded_collection_ids = await run_load(
+            client, scenarios, target, args.concurrency, args.duration, args.requests, args.seed
+        )
+        metrics_after = await scrape_metrics(client)
+
+        headers = {"Authorization": args.api_key} if args.api_key else {}
+        for collection_id in uploaded_collection_ids:
+            await client.delete(f"/collections/{collection_id}", headers=headers)
+
+    return to_results(measurements, total_seconds), summarize_server_metrics(metrics_before, metrics_after)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the API with a weighted mix of concurrent requests.")
+    parser.add_argument("--base-url", type=str, default="http://127.0.0.1:8000", help="The URL of the API. Defaults to http://127.0.0.1:8000.")
+    parser.add_argument(
+        "--start-server", action="store_true", help="Start the API with uvicorn on the port of `--base-url` for the duration of the run."
+    )
+    parser.add_argument("--workers", type=int, default=1, help="The number of uvicorn workers of the started server. Defaults to 1.")
+    parser.add_argument("--concurrency", type=int, default=16, help="The number of concurrent clients. Defaults to 16.")
+    parser.add_argument("--duration", type=float, default=30.0, help="The duration of the run in seconds. Defaults to 30.")
+    parser.add_argument("--requests", type=int, default=None, help="Stop after this number of requests instead of after `--duration`.")
+    parser.add_argument("--timeout", type=float, default=30.0, help="The timeout of a single request in seconds. Defaults to 30.")
+    parser.add_argument("--upload-weight", type=float, default=0.0, help="The weight of Collection uploads in the mix. Defaults to 0 (no uploads).")
+    parser.add_argument("--api-key", type=str, default=None, help="The api key used for uploads, if the API requires one.")
+    parser.add_argument("--alliances", type=int, default=100, help="The number of Alliances per uploaded Collection. Defaults to 100.")
+    parser.add_argument("--users", type=int, default=12_000, help="The number of players in the pool of uploaded Collections. Defaults to 12000.")
+    parser.add_argument("--seed", type=int, default=42, help="The seed of the random choice of requests and parameters. Defaults to 42.")
+    parser.add_argument("--filter", type=str, default=None, help="Only send requests of scenarios whose name contains this string.")
+    parser.add_argument("--output", type=str, default=None, help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", type=str, default=None, help="Compare the results to the results stored in this file.")
+    args = parser.parse_args()
+    if args.requests:
+        args.duration = None
+    return args
+
+
+def main():
+    args = parse_args()
+    metadata = get_run_metadata(benchmark="load", arguments=vars(args))
+
+    server = start_server(httpx.URL(args.base_url).port or 80, args.workers) if args.start_server else None
+    try:
+        results, server_metrics = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(format_results(results))
+    if server_metrics:
+        print("Server side: " + ", ".join(f"{name}={value:.2f}" for name, value in server_metrics.items()))
+    if args.output:
+        save_results(args.output, {**metadata, "server_metrics": server_metrics}, results)
+    if args.compare:
+        baseline_metadata, baseline = load_results(args.compare)
+        print(compare_results(baseline, results))
+        baseline_server_metrics = baseline_metadata.get("server_metrics") or {}
+        for name, value in server_metrics.items():
+            if name in baseline_server_metrics:
+                print(f"{name}: {baseline_server_metrics[name]:.2f} -> {value:.2f}")
+
+
+__all__ = [
+    "RequestSpec",
+    "Scenario",
+    "ScenarioMeasurements",
+    "TargetInfo",
+    "get_read_scenarios",
+    "get_target_info",
+    "get_upload_scenario",
+    "parse_metrics",
+    "pick_scenario",
+    "run",
+    "run_load",
+    "summarize_server_metrics",
+    "to_results",
+    "to_upload_payload",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import json
+import platform
+import subprocess
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+
+PERCENTILES: tuple[int, ...] = (50, 90, 95, 99)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    The measurements of a single benchmark case. Durations are given in milliseconds.
+    """
+
+    name: str
+    iterations: int
+    errors: int
+    rows: int
+    total_seconds: float
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    rows_per_second: float
+    throughput: float
+    """The number of iterations per second."""
+
+    @classmethod
+    def from_durations(
+        cls, name: str, durations: list[float], rows: int = 0, errors: int = 0, total_seconds: float | None = None
+    ) -> "BenchmarkResult":
+        """Calculates the statistics of a benchmark case.
+
+        Args:
+            name (str): The name of the benchmark case.
+            durations (list[float]): The duration of each iteration in seconds.
+            rows (int, optional): The total number of rows read or written in all iterations. Defaults to 0.
+            errors (int, optional): The number of failed iterations. Defaults to 0.
+            total_seconds (float, optional): The wall clock time of all iterations. Defaults to None (the sum of `durations`).
+
+        Returns:
+            BenchmarkResult: The statistics.
+        """
+        durations = sorted(durations)
+        if total_seconds is None:
+            total_seconds = sum(durations)
+        percentiles = {f"p{p}_ms": percentile(durations, p) * 1000 for p in PERCENTILES}
+        return cls(
+            name=name,
+            iterations=len(durations),
+            errors=errors,
+            rows=rows,
+            total_seconds=total_seconds,
+            mean_ms=(sum(durations) / len(durations) * 1000) if durations else 0.0,
+            max_ms=(durations[-1] * 1000) if durations else 0.0,
+            rows_per_second=(rows / total_seconds) if total_seconds else 0.0,
+            throughput=(len(durations) / total_seconds) if total_seconds else 0.0,
+            **percentiles,
+        )
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Calculates the `p`th percentile of `sorted_values` using linear interpolation between the closest ranks.
+
+    Args:
+        sorted_values (list[float]): The values in ascending order.
+        p (float): The percentile between 0 and 100.
+
+    Returns:
+        float: The percentile. `0.0`, if there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+
+    rank = (len(sorted_values) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def get_run_metadata(**kwargs) -> dict[str, Any]:
+    """Collects information about the environment of a benchmark run.
+
+    Returns:
+        dict[str, Any]: The metadata including the current git commit, the python version and the provided `kwargs`.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **kwargs,
+    }
+
+
+def save_results(file_path: str, metadata: dict[str, Any], results: list[BenchmarkResult]):
+    with open(file_path, "w") as fp:
+        json.dump({"meta": metadata, "results": [asdict(result) for result in results]}, fp, indent=2, default=str)
+
+
+def load_results(file_path: str) -> tuple[dict[str, Any], list[BenchmarkResult]]:
+    with open(file_path, "r") as fp:
+        data = json.load(fp)
+    return data["meta"], [BenchmarkResult(**result) for result in data["results"]]
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    """Renders the results as a table.
+
+    Args:
+        results (list[BenchmarkResult]): The results to render.
+
+    Returns:
+        str: The rendered table.
+    """
+    name_width = max([len("name"), *(len(result.name) for result in results)])
+    lines = [
+        f"{'name':<{name_width}}  {'n':>6}  {'err':>5}  {'p50 ms':>9}  {'p90 ms':>9}  {'p99 ms':>9}  {'max ms':>9}  {'rows/s':>11}  {'req/s':>8}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.name:<{name_width}}  {result.iterations:>6}  {result.errors:>5}  {result.p50_ms:>9.2f}  {result.p90_ms:>9.2f}  {result.p99_ms:>9.2f}"
+            f"  {result.max_ms:>9.2f}  {result.rows_per_second:>11.0f}  {result.throughput:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare_results(baseline: list[BenchmarkResult], candidate: list[BenchmarkResult]) -> str:
+    """Renders a table comparing the percentiles and row throughput of two runs. Only cases present in both runs are compared.
+
+    Args:
+        baseline (list[BenchmarkResult]): The results of the earlier run.
+        candidate (list[BenchmarkResult]): The results of the later run.
+
+    Returns:
+        str: The rendered table. Negative changes of durations and positive changes of throughput are improvements.
+    """
+    baseline_by_name = {result.name: result for result in baseline}
+    pairs = [(baseline_by_name[result.name], result) for result in candidate if result.name in baseline_by_name]
+    name_width = max([len("name"), *(len(result.name) for _, result in pairs)])
+
+    lines = [f"{'name':<{name_width}}  {'p50 ms':>19}  {'p99 ms':>19}  {'rows/s':>25}  {'err':>9}"]
+    for old, new in pairs:
+        lines.append(
+            f"{new.name:<{name_width}}  {_format_change(old.p50_ms, new.p50_ms, '.2f'):>19}  {_format_change(old.p99_ms, new.p99_ms, '.2f'):>19}"
+            f"  {_format_change(old.rows_per_second, new.rows_per_second, '.0f'):>25}  {f'{old.errors}->{new.errors}':>9}"
+        )
+    return "\n".join(lines)
+
+
+def _format_change(old: float, new: float, number_format: str) -> str:
+    change = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+    return f"{new:{number_format}} ({change})"
+
+
+__all__ = [
+    "BenchmarkResult",
+    "compare_results",
+    "format_results",
+    "get_run_metadata",
+    "load_results",
+    "percentile",
+    "save_results",
+]
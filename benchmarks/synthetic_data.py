@@ -0,0 +1,412 @@
+import calendar
+import heapq
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from src.api.database.models import AllianceDB, CollectionDB, UserDB
+from src.api.models.enums import UserAllianceMembership
+
+
+COLLECTION_COLUMNS: tuple[str, ...] = (
+    "collection_id",
+    "data_version",
+    "collected_at",
+    "duration",
+    "fleet_count",
+    "user_count",
+    "tournament_running",
+    "max_tournament_battle_attempts",
+)
+ALLIANCE_COLUMNS: tuple[str, ...] = (
+    "collection_id",
+    "alliance_id",
+    "alliance_name",
+    "score",
+    "division_design_id",
+    "trophy",
+    "championship_score",
+    "number_of_members",
+    "number_of_approved_members",
+)
+USER_COLUMNS: tuple[str, ...] = (
+    "collection_id",
+    "user_id",
+    "alliance_id",
+    "user_name",
+    "trophy",
+    "alliance_score",
+    "alliance_membership",
+    "alliance_join_date",
+    "last_login_date",
+    "last_heartbeat_date",
+    "crew_donated",
+    "crew_received",
+    "pvp_attack_wins",
+    "pvp_attack_losses",
+    "pvp_attack_draws",
+    "pvp_defence_wins",
+    "pvp_defence_losses",
+    "pvp_defence_draws",
+    "championship_score",
+    "highest_trophy",
+    "tournament_bonus_score",
+)
+
+MAX_ALLIANCE_MEMBERS: int = 100
+TOP_USER_COUNT: int = 100
+TOURNAMENT_DAYS: int = 7
+DIVISION_LIMITS: tuple[tuple[int, int], ...] = ((8, 1), (20, 2), (50, 3))
+"""The number of Alliances in the divisions A to C by tournament rank. All other Alliances are in division D."""
+MEMBER_RANKS: tuple[UserAllianceMembership, ...] = (
+    UserAllianceMembership.CANDIDATE,
+    UserAllianceMembership.ENSIGN,
+    UserAllianceMembership.LIEUTENANT,
+    UserAllianceMembership.MAJOR,
+    UserAllianceMembership.COMMANDER,
+    UserAllianceMembership.VICE_ADMIRAL,
+)
+
+
+@dataclass(frozen=True)
+class SyntheticDataConfig:
+    """
+    Describes a synthetic dataset. The same configuration always generates the same data.
+    """
+
+    start: datetime = datetime(2020, 1, 1)
+    years: float = 1.0
+    alliance_count: int = 100
+    user_count: int = 12_000
+    """The number of players in the pool. Only members of the Alliances and the top 100 players are part of a Collection."""
+    active_user_ratio: float = 0.1
+    """The ratio of players whose stats change per hour."""
+    hourly_user_churn: float = 0.001
+    """The ratio of players joining, leaving or switching Alliances per hour."""
+    monthly_alliance_churn: float = 0.03
+    """The ratio of Alliances disbanding at the start of a month. They get replaced by newly founded Alliances."""
+    hourly_rename_ratio: float = 0.0001
+    """The ratio of players and Alliances changing their name per hour."""
+    seed: int = 42
+    first_collection_id: int = 1
+
+    @property
+    def collection_count(self) -> int:
+        return round(self.years * 365 * 24)
+
+
+@dataclass(slots=True)
+class _AllianceState:
+    alliance_id: int
+    alliance_name: str
+    score: int = 0
+    championship_score: int = 0
+    member_ids: set[int] = field(default_factory=set)
+
+
+@dataclass(slots=True)
+class _UserState:
+    user_id: int
+    user_name: str
+    trophy: int
+    alliance_id: int = 0
+    alliance_score: int = 0
+    alliance_membership: str = UserAllianceMembership.NONE.value
+    alliance_join_date: datetime | None = None
+    last_login_date: datetime | None = None
+    last_heartbeat_date: datetime | None = None
+    crew_donated: int = 0
+    crew_received: int = 0
+    pvp_attack_wins: int = 0
+    pvp_attack_losses: int = 0
+    pvp_attack_draws: int = 0
+    pvp_defence_wins: int = 0
+    pvp_defence_losses: int = 0
+    pvp_defence_draws: int = 0
+    championship_score: int = 0
+    highest_trophy: int = 0
+    tournament_bonus_score: int = 0
+
+
+@dataclass(frozen=True)
+class SyntheticCollection:
+    """
+    A generated Collection as rows ready to be copied into the tables `collection`, `pss_alliance` and `pss_user`. The rows hold the values in the order of `COLLECTION_COLUMNS`, `ALLIANCE_COLUMNS` and `USER_COLUMNS`.
+    """
+
+    collection: tuple
+    alliances: list[tuple]
+    users: list[tuple]
+
+    @property
+    def row_count(self) -> int:
+        return 1 + len(self.alliances) + len(self.users)
+
+    def to_collection_db(self) -> CollectionDB:
+        """Converts the rows into a `CollectionDB` without `collection_id`, as it'd be passed to `crud.save_collection`.
+
+        Returns:
+            CollectionDB: The converted Collection including its Alliances and Users.
+        """
+        collection = dict(zip(COLLECTION_COLUMNS[1:], self.collection[1:], strict=True))
+        alliances = [AllianceDB(**dict(zip(ALLIANCE_COLUMNS[1:], row[1:], strict=True))) for row in self.alliances]
+        users = [UserDB(**dict(zip(USER_COLUMNS[1:], row[1:], strict=True))) for row in self.users]
+        return CollectionDB(**collection, alliances=alliances, users=users)
+
+
+class SyntheticDataGenerator:
+    """
+    Generates hourly Collections with realistic churn: players gain trophies and stats, join, leave and switch Alliances and sometimes change their names.
+    Alliances disband and get founded at the start of a month. Tournaments run during the last days of a month, during which Alliances get assigned to divisions and players earn stars.
+    """
+
+    def __init__(self, config: SyntheticDataConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.alliances: dict[int, _AllianceState] = {}
+        self.users: dict[int, _UserState] = {}
+        self.user_ids: list[int] = []
+        self._next_alliance_id = 1_000
+        self._next_user_id = 1_000_000
+        self._initialize()
+
+    def generate(self) -> Iterator[SyntheticCollection]:
+        """Generates `config.collection_count` hourly Collections.
+
+        Yields:
+            SyntheticCollection: The next Collection.
+        """
+        collected_at = self.config.start
+        for i in range(self.config.collection_count):
+            if i and collected_at.day == 1 and collected_at.hour == 0:
+                self._start_new_month(collected_at)
+            self._churn_users(collected_at)
+            self._update_stats(collected_at)
+            self._rename(collected_at)
+            yield self._snapshot(self.config.first_collection_id + i, collected_at)
+            collected_at += timedelta(hours=1)
+
+    def _initialize(self):
+        for _ in range(self.config.user_count):
+            user_id = self._next_user_id
+            self._next_user_id += self.rng.randint(1, 50)
+            trophy = int(self.rng.lognormvariate(8.0, 0.6))
+            self.users[user_id] = _UserState(
+                user_id=user_id,
+                user_name=f"U{user_id}",
+                trophy=trophy,
+                highest_trophy=trophy,
+                last_login_date=self.config.start - timedelta(minutes=self.rng.randint(0, 60 * 24 * 7)),
+                crew_donated=self.rng.randint(0, 5_000),
+                crew_received=self.rng.randint(0, 5_000),
+                pvp_attack_wins=self.rng.randint(0, 20_000),
+                pvp_attack_losses=self.rng.randint(0, 5_000),
+                pvp_attack_draws=self.rng.randint(0, 200),
+                pvp_defence_wins=self.rng.randint(0, 10_000),
+                pvp_defence_losses=self.rng.randint(0, 10_000),
+                pvp_defence_draws=self.rng.randint(0, 200),
+            )
+        self.user_ids = list(self.users)
+
+        for _ in range(self.config.alliance_count):
+            self._found_alliance(self.config.start - timedelta(days=self.rng.randint(30, 1_000)))
+
+    def _found_alliance(self, founded_at: datetime):
+        alliance_id = self._next_alliance_id
+        self._next_alliance_id += self.rng.randint(1, 20)
+        alliance = _AllianceState(alliance_id=alliance_id, alliance_name=f"A{alliance_id}")
+        self.alliances[alliance_id] = alliance
+
+        unaffiliated = [user_id for user_id in self.user_ids if self.users[user_id].alliance_id == 0]
+        member_count = min(len(unaffiliated), self.rng.randint(MAX_ALLIANCE_MEMBERS * 3 // 5, MAX_ALLIANCE_MEMBERS))
+        for rank, user_id in enumerate(self.rng.sample(unaffiliated, member_count)):
+            membership = UserAllianceMembership.FLEET_ADMIRAL if rank == 0 else self.rng.choice(MEMBER_RANKS)
+            self._join(self.users[user_id], alliance, founded_at, membership)
+
+    def _join(self, user: _UserState, alliance: _AllianceState, joined_at: datetime, membership: UserAllianceMembership):
+        user.alliance_id = alliance.alliance_id
+        user.alliance_membership = membership.value
+        user.alliance_join_date = joined_at
+        user.alliance_score = 0
+        alliance.member_ids.add(user.user_id)
+
+    def _leave(self, user: _UserState):
+        alliance = self.alliances.get(user.alliance_id)
+        if alliance:
+            alliance.member_ids.discard(user.user_id)
+        user.alliance_id = 0
+        user.alliance_membership = UserAllianceMembership.NONE.value
+        user.alliance_join_date = None
+        user.alliance_score = 0
+
+    def _start_new_month(self, now: datetime):
+        ranked_alliances = sorted(self.alliances.values(), key=lambda alliance: (-alliance.score, alliance.alliance_id))
+        for rank, alliance in enumerate(ranked_alliances[: DIVISION_LIMITS[0][0]]):
+            points = DIVISION_LIMITS[0][0] - rank
+            alliance.championship_score += points
+            for user_id in alliance.member_ids:
+                self.users[user_id].championship_score += points
+
+        for alliance in self.alliances.values():
+            alliance.score = 0
+        for user in self.users.values():
+            user.alliance_score = 0
+            user.tournament_bonus_score = 0
+
+        disband_count = round(len(self.alliances) * self.config.monthly_alliance_churn)
+        for alliance_id in self.rng.sample(sorted(self.alliances), disband_count):
+            alliance = self.alliances.pop(alliance_id)
+            for user_id in list(alliance.member_ids):
+                self._leave(self.users[user_id])
+        for _ in range(disband_count):
+            self._found_alliance(now)
+
+    def _churn_users(self, now: datetime):
+        churn_count = max(1, round(len(self.user_ids) * self.config.hourly_user_churn))
+        alliance_ids = sorted(self.alliances)
+        for user_id in self.rng.sample(self.user_ids, churn_count):
+            user = self.users[user_id]
+            if user.alliance_id and self.rng.random() < 0.5:
+                self._leave(user)
+                continue
+
+            alliance = self.alliances[self.rng.choice(alliance_ids)]
+            if len(alliance.member_ids) < MAX_ALLIANCE_MEMBERS and alliance.alliance_id != user.alliance_id:
+                self._leave(user)
+                self._join(user, alliance, now, UserAllianceMembership.CANDIDATE)
+
+    def _update_stats(self, now: datetime):
+        tournament_running = _is_tournament_running(now)
+        active_count = round(len(self.user_ids) * self.config.active_user_ratio)
+        randint = self._fast_randint
+        for user_id in self.rng.sample(self.user_ids, active_count):
+            user = self.users[user_id]
+            user.trophy = max(0, user.trophy + randint(-30, 40))
+            user.highest_trophy = max(user.highest_trophy, user.trophy)
+            user.last_login_date = now - timedelta(minutes=randint(0, 59))
+            user.last_heartbeat_date = now - timedelta(minutes=randint(0, 5))
+            user.pvp_attack_wins += randint(0, 4)
+            user.pvp_attack_losses += randint(0, 2)
+            user.pvp_defence_wins += randint(0, 2)
+            user.pvp_defence_losses += randint(0, 2)
+            if user.alliance_id:
+                user.crew_donated += randint(0, 3)
+                user.crew_received += randint(0, 3)
+                if tournament_running:
+                    stars = randint(0, 6)
+                    user.alliance_score += stars
+                    user.tournament_bonus_score += randint(0, 1)
+                    self.alliances[user.alliance_id].score += stars
+
+    def _fast_randint(self, a: int, b: int) -> int:
+        """A faster, but slightly less uniform alternative to `random.randint`. Used in the hot loop of the generator."""
+        return a + int(self.rng.random() * (b - a + 1))
+
+    def _rename(self, now: datetime):
+        for user_id in self.rng.sample(self.user_ids, round(len(self.user_ids) * self.config.hourly_rename_ratio)):
+            self.users[user_id].user_name = f"U{user_id}_{now:%y%m%d%H}"
+        if self.rng.random() < len(self.alliances) * self.config.hourly_rename_ratio:
+            alliance = self.alliances[self.rng.choice(sorted(self.alliances))]
+            alliance.alliance_name = f"A{alliance.alliance_id}_{now:%y%m%d%H}"
+
+    def _snapshot(self, collection_id: int, collected_at: datetime) -> SyntheticCollection:
+        tournament_running = _is_tournament_running(collected_at)
+        ranked_alliances = sorted(self.alliances.values(), key=lambda alliance: (-alliance.score, alliance.alliance_id))
+
+        alliance_rows = []
+        user_ids = set()
+        for rank, alliance in enumerate(ranked_alliances):
+            division_design_id = _get_division_design_id(rank) if tournament_running else 0
+            trophy = sum(self.users[user_id].trophy for user_id in alliance.member_ids)
+            alliance_rows.append(
+                (
+                    collection_id,
+                    alliance.alliance_id,
+                    alliance.alliance_name,
+                    alliance.score,
+                    division_design_id,
+                    trophy,
+                    alliance.championship_score,
+                    len(alliance.member_ids),
+                    0,
+                )
+            )
+            user_ids.update(alliance.member_ids)
+
+        top_users = heapq.nlargest(TOP_USER_COUNT, self.users.values(), key=lambda user: (user.trophy, user.user_id))
+        user_ids.update(user.user_id for user in top_users)
+        user_rows = [_to_user_row(collection_id, self.users[user_id]) for user_id in sorted(user_ids)]
+
+        collection_row = (
+            collection_id,
+            9,
+            collected_at,
+            round(self.rng.uniform(8.0, 20.0), 6),
+            len(alliance_rows),
+            len(user_rows),
+            tournament_running,
+            6 if tournament_running else None,
+        )
+        return SyntheticCollection(collection=collection_row, alliances=alliance_rows, users=user_rows)
+
+
+def generate_collections(config: SyntheticDataConfig) -> Iterator[SyntheticCollection]:
+    """Generates the synthetic dataset described by `config`.
+
+    Args:
+        config (SyntheticDataConfig): Describes the dataset.
+
+    Returns:
+        Iterator[SyntheticCollection]: The hourly Collections in chronological order.
+    """
+    return SyntheticDataGenerator(config).generate()
+
+
+def _get_division_design_id(rank: int) -> int:
+    for limit, division_design_id in DIVISION_LIMITS:
+        if rank < limit:
+            return division_design_id
+    return 4
+
+
+def _is_tournament_running(dt: datetime) -> bool:
+    days_in_month = calendar.monthrange(dt.year, dt.month)[1]
+    return dt.day > days_in_month - TOURNAMENT_DAYS
+
+
+def _to_user_row(collection_id: int, user: _UserState) -> tuple:
+    return (
+        collection_id,
+        user.user_id,
+        user.alliance_id,
+        user.user_name,
+        user.trophy,
+        user.alliance_score,
+        user.alliance_membership,
+        user.alliance_join_date,
+        user.last_login_date,
+        user.last_heartbeat_date,
+        user.crew_donated,
+        user.crew_received,
+        user.pvp_attack_wins,
+        user.pvp_attack_losses,
+        user.pvp_attack_draws,
+        user.pvp_defence_wins,
+        user.pvp_defence_losses,
+        user.pvp_defence_draws,
+        user.championship_score,
+        user.highest_trophy,
+        user.tournament_bonus_score,
+    )
+
+
+__all__ = [
+    "ALLIANCE_COLUMNS",
+    "COLLECTION_COLUMNS",
+    "USER_COLUMNS",
+    "SyntheticCollection",
+    "SyntheticDataConfig",
+    "SyntheticDataGenerator",
+    "generate_collections",
+]
@@ -0,0 +1,172 @@
+import asyncio
+import copy
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Hashable
+from urllib.parse import parse_qsl
+
+from fastapi import Request
+from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from . import exception_handlers
+from .database import db
+from .models.exceptions import TooManyRequestsError
+from .routers import dependencies
+
+
+class SingleFlight:
+    """
+    Makes sure that only one call per key is in flight at any time. Callers requesting a key that's already in flight wait for and share the result of the running call.
+    """
+
+    def __init__(self):
+        self.calls: dict[Hashable, asyncio.Future] = {}
+
+    def is_in_flight(self, key: Hashable) -> bool:
+        return key in self.calls
+
+    def join(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> tuple[asyncio.Future, bool]:
+        """Starts `func`, unless a call for the same `key` is already in flight. In that case, joins that call instead.
+
+        Starting or joining happens without yielding to the event loop, so the caller knows for sure, whether it runs the call or shares the result of another caller.
+        The call runs in its own task, so that a caller being cancelled (e.g. due to a client disconnecting) doesn't cancel the call for the other callers.
+
+        Args:
+            key (Hashable): Identifies the call.
+            func (Callable[[], Awaitable[Any]]): Creates the awaitable to be run, if there's no call in flight for `key`.
+
+        Returns:
+            tuple[asyncio.Future, bool]: The call to be awaited with `asyncio.shield` and whether an existing call has been joined.
+        """
+        call = self.calls.get(key)
+        if call is not None:
+            return (call, True)
+
+        call = asyncio.ensure_future(func())
+        self.calls[key] = call
+        call.add_done_callback(lambda _: self.calls.pop(key, None))
+        return (call, False)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Runs `func`, unless a call for the same `key` is already in flight. In that case, waits for that call to finish instead.
+
+        Args:
+            key (Hashable): Identifies the call.
+            func (Callable[[], Awaitable[Any]]): Creates the awaitable to be run, if there's no call in flight for `key`.
+
+        Returns:
+            Any: The result of the call.
+
+        Raises:
+            Exception: Any exception raised by the call is raised to all callers.
+        """
+        call, _ = self.join(key, func)
+        return await asyncio.shield(call)
+
+
+class RequestCoalescingMiddleware:
+    """
+    Coalesces identical concurrent `GET` requests. The first request for a key runs the endpoint as usual, while identical requests arriving before it finishes
+    get sent copies of the very same response messages (status, headers and body bytes). This way, the database queries and the serialization run only once.
+
+    Requests are identified by the path template of the matched route, its path parameters, the query parameters, sorted by name, and the `Accept-Encoding` header.
+    Routes streaming their response and requests of clients, whose reads are pinned to the primary database, are never coalesced.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.single_flight = SingleFlight()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        route_scope = _match_route(scope)
+        if route_scope is None or _is_streaming_endpoint(route_scope["route"].endpoint) or _is_pinned_to_primary(scope):
+            await self.app(scope, receive, send)
+            return
+
+        key = _get_request_key(scope, route_scope)
+        call, joined = self.single_flight.join(key, lambda: self._capture(scope, receive))
+        if joined:
+            # Only the scope of the first request passes the router, so the outer middlewares (e.g. metrics) wouldn't know the route of the other requests.
+            scope.update(route_scope)
+            if not await _acquire_rate_limit(scope, receive, send):
+                return
+
+        messages: list[Message] = await asyncio.shield(call)
+        for message in messages:
+            # The messages are shared by all waiters, while the outer middlewares may modify them in place (e.g. compressing the body or adding headers).
+            await send(copy.deepcopy(message))
+
+    async def _capture(self, scope: Scope, receive: Receive) -> list[Message]:
+        messages: list[Message] = []
+
+        async def capture_send(message: Message):
+            messages.append(message)
+
+        await self.app(scope, receive, capture_send)
+        return messages
+
+
+async def _acquire_rate_limit(scope: Scope, receive: Receive, send: Send) -> bool:
+    """Charges a coalesced request against the client's rate limit, since it doesn't pass the dependencies of the route. Sends a `429` response, if the client is rate limited.
+
+    Returns:
+        bool: `True`, if the request may pass.
+    """
+    request = Request(scope, receive)
+    try:
+        await dependencies.rate_limit(request)
+    except TooManyRequestsError as exc:
+        response = await exception_handlers.handle_too_many_requests(request, exc)
+        await response(scope, receive, send)
+        return False
+    return True
+
+
+def _get_request_key(scope: Scope, route_scope: Scope) -> tuple:
+    route: APIRoute = route_scope["route"]
+    path_params = tuple(sorted(route_scope.get("path_params", {}).items()))
+    query_params = tuple(sorted(parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)))
+    accept_encoding = Headers(scope=scope).get("Accept-Encoding", "")
+    return (route.path, path_params, query_params, accept_encoding)
+
+
+def _is_pinned_to_primary(scope: Scope) -> bool:
+    """Checks, if the client sent the cookie pinning its reads to the primary database. These requests must not share the response of a request read from a replica."""
+    cookie = Headers(scope=scope).get("Cookie")
+    return bool(cookie) and db.READ_YOUR_WRITES_COOKIE in cookie_parser(cookie)
+
+
+@functools.cache
+def _is_streaming_endpoint(endpoint: Callable) -> bool:
+    """Checks, if an endpoint returns a streamed or file response. These are sent in many chunks and must not be buffered in memory."""
+    return_annotation = inspect.signature(endpoint).return_annotation
+    return inspect.isclass(return_annotation) and issubclass(return_annotation, (FileResponse, StreamingResponse))
+
+
+def _match_route(scope: Scope) -> Scope | None:
+    """Looks up the `GET` API route handling the request.
+
+    Returns:
+        Scope | None: The child scope of the matching route, including the keys `route` and `path_params`. `None`, if no API route fully matches.
+    """
+    for route in scope["app"].router.routes:
+        if isinstance(route, APIRoute):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return child_scope
+    return None
+
+
+__all__ = [
+    "RequestCoalescingMiddleware",
+    "SingleFlight",
+]
@@ -44,6 +44,16 @@ class Settings:
     database_engine_echo: bool = getenv("DATABASE_ENGINE_ECHO", "false") == "true"
     async_database_connection_str: str = f"postgresql+asyncpg://{getenv('DATABASE_URL')}/{getenv('DATABASE_NAME', 'pss-fleet-data')}"
     sync_database_connection_str: str = f"postgresql://{getenv('DATABASE_URL')}/{getenv('DATABASE_NAME', 'pss-fleet-data')}"
+    async_read_replica_connection_strs: tuple[str, ...] = tuple(
+        f"postgresql+asyncpg://{url.strip()}/{getenv('DATABASE_NAME', 'pss-fleet-data')}"
+        for url in getenv("DATABASE_READ_REPLICA_URLS", "").split(",")
+        if url.strip()
+    )
+    read_replica_health_check_interval: float = float(getenv("DATABASE_READ_REPLICA_HEALTH_CHECK_INTERVAL", "10"))
+    read_your_writes_window: float = float(getenv("DATABASE_READ_YOUR_WRITES_WINDOW", "5"))
+
+    # Export
+    export_directory: str = getenv("EXPORT_DIRECTORY", "exports")
 
     # Flags
     create_dummy_data_on_startup: bool = getenv("CREATE_DUMMY_DATA", "false") == "true"
@@ -54,6 +64,23 @@ class Settings:
     # Access
     root_api_key: str | None = getenv("ROOT_API_KEY", None)
 
+    # Rate limiting
+    rate_limit_enabled: bool = getenv("RATE_LIMIT_ENABLED", "true") == "true"
+    rate_limit_backend: str = getenv("RATE_LIMIT_BACKEND", "memory")
+    rate_limit_capacity: int = int(getenv("RATE_LIMIT_CAPACITY", "300"))
+    rate_limit_refill_rate: float = float(getenv("RATE_LIMIT_REFILL_RATE", "5"))
+    rate_limit_trusted_proxies: tuple[str, ...] = tuple(
+        proxy.strip() for proxy in getenv("RATE_LIMIT_TRUSTED_PROXIES", "").split(",") if proxy.strip()
+    )
+
+    # Performance
+    request_coalescing_enabled: bool = getenv("REQUEST_COALESCING_ENABLED", "true") == "true"
+    server_timing_enabled: bool = getenv("SERVER_TIMING_ENABLED", "false") == "true"
+    snapshot_collection_count: int = int(getenv("SNAPSHOT_COLLECTION_COUNT", "3"))
+    snapshot_directory: str = getenv("SNAPSHOT_DIRECTORY", "snapshot")
+    snapshot_refresh_interval: float = float(getenv("SNAPSHOT_REFRESH_INTERVAL", "10"))
+    user_delta_storage_enabled: bool = getenv("USER_DELTA_STORAGE_ENABLED", "false") == "true"
+
 
 SETTINGS = Settings()
 CONSTANTS = Constants()
@@ -0,0 +1,80 @@
+"""Backfills the events of Alliances and Users for the Collections stored before the table `entity_event` had been created. Events are only recorded when a Collection is inserted, updated or deleted otherwise.
+
+Usage:
+    python -m src.api.database.backfill events
+
+Every Collection is committed separately, so backfilling can be interrupted and resumed. Already recorded events are replaced.
+The database is configured via the environment variables `DATABASE_URL` and `DATABASE_NAME`.
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..config import SETTINGS
+from . import crud
+from .models import CollectionDB
+
+
+async def backfill_entity_events(engine: AsyncEngine, verbose: bool = True) -> int:
+    """Records the events of all Collections by comparing each Collection with the previous one.
+
+    Args:
+        engine (AsyncEngine): The engine used for the connection to the database.
+        verbose (bool, optional): Print progress to stdout. Defaults to True.
+
+    Returns:
+        int: The number of recorded events.
+    """
+    async with AsyncSession(engine) as session:
+        collections = (
+            await session.exec(select(CollectionDB.collection_id, CollectionDB.collected_at).order_by(col(CollectionDB.collected_at)))
+        ).all()
+
+    event_count = 0
+    for index, ((previous_collection_id, _), (collection_id, collected_at)) in enumerate(itertools.pairwise(collections), 2):
+        async with AsyncSession(engine) as session:
+            event_count += await crud.record_entity_events(session, previous_collection_id, collection_id, collected_at)
+            await session.commit()
+
+        if verbose and index % 100 == 0:
+            print(f"Backfilled {index} of {len(collections)} Collections ({event_count} events)")
+
+    return event_count
+
+
+async def run(args: argparse.Namespace):
+    engine = create_async_engine(SETTINGS.async_database_connection_str)
+    started_at = time.perf_counter()
+    if args.command == "events":
+        count = await backfill_entity_events(engine)
+        print(f"Recorded {count} events in {time.perf_counter() - started_at:.1f} s")
+    await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Backfill data derived from the stored Collections.")
+    parser.add_argument(
+        "command",
+        choices=["events"],
+        help="`events` records the events of Alliances and Users of all Collections.",
+    )
+    return parser.parse_args()
+
+
+def main():
+    asyncio.run(run(parse_args()))
+
+
+__all__ = [
+    "backfill_entity_events",
+]
+
+
+if __name__ == "__main__":
+    main()
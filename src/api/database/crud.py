@@ -1,15 +1,56 @@
+import calendar
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Sequence
 
+from sqlalchemy import DateTime, Float, Integer, RowMapping, String, Subquery, any_, bindparam, case, cast, delete, literal, tuple_
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlalchemy.orm import selectinload
-from sqlmodel import SQLModel, col, extract, func, select, text
+from sqlalchemy.orm import InstrumentedAttribute, aliased, selectinload
+from sqlalchemy.orm.util import AliasedClass
+from sqlmodel import SQLModel, and_, col, extract, func, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
-from .. import utils
-from ..config import CONSTANTS
-from ..models.enums import ParameterInterval, ParameterOnMissing
-from .models import AllianceDB, AllianceHistoryDB, CollectionDB, UserDB, UserHistoryDB
+from .. import metrics, server_timing, utils
+from ..config import CONSTANTS, SETTINGS
+from ..models.enums import (
+    EntityChange,
+    EntityEventType,
+    EntityType,
+    ParameterAllianceMetric,
+    ParameterInterval,
+    ParameterOnMissing,
+    ParameterSearchMode,
+    ParameterUserMetric,
+    UserAllianceMembership,
+)
+from . import delta_storage
+from .models import (
+    AllianceDB,
+    AllianceHistoryDB,
+    AllianceRankDB,
+    CollectionDB,
+    CollectionStatsDB,
+    CollectionStatsHistoryDB,
+    DivisionStandingDB,
+    EntityChangeDB,
+    EntityEventDB,
+    EntityNameDB,
+    EntityNameMatchDB,
+    EntityNameSpanDB,
+    HistogramDB,
+    TournamentAllianceProgressDB,
+    TournamentDB,
+    TournamentUserDeltaDB,
+    UserCarriedForwardDB,
+    UserDB,
+    UserHistoryDB,
+    UserHistoryDeltaDB,
+    UserMoverDB,
+    UserRankDB,
+)
 
 
 DATE_TRUNC_TYPE_BY_INTERVAL: dict[ParameterInterval, str] = {
@@ -17,6 +58,25 @@ DATE_TRUNC_TYPE_BY_INTERVAL: dict[ParameterInterval, str] = {
     ParameterInterval.DAILY: "day",
     ParameterInterval.MONTHLY: "month",
 }
+SECONDS_PER_DAY: int = 86_400
+HISTOGRAM_PERCENTILES: tuple[float, ...] = (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+TOURNAMENT_GAP: timedelta = timedelta(days=7)
+"""Collections collected during a tournament belong to different tournaments, if more time than this lies between them."""
+
+ALLIANCE_CHANGE_BY_COLUMN: dict[str, EntityChange] = {
+    "alliance_name": EntityChange.RENAMED,
+}
+"""The compared properties of an Alliance and the change reported for them. The first property is the name of the Alliance."""
+USER_CHANGE_BY_COLUMN: dict[str, EntityChange] = {
+    "user_name": EntityChange.RENAMED,
+    "alliance_id": EntityChange.ALLIANCE_CHANGED,
+    "alliance_membership": EntityChange.MEMBERSHIP_CHANGED,
+}
+"""The compared properties of a User and the change reported for them. The first property is the name of the User."""
+ALLIANCE_EVENT_COLUMNS: tuple[str, ...] = ("alliance_name", "division_design_id")
+"""The properties of an Alliance compared to record events."""
+USER_EVENT_COLUMNS: tuple[str, ...] = ("user_name", "alliance_id", "alliance_membership")
+"""The properties of a User compared to record events."""
 
 
 async def drop_tables(engine: AsyncEngine):
@@ -52,7 +112,10 @@ async def delete_collection(session: AsyncSession, collection_id: int) -> bool:
     async with session:
         collection = await get_collection(session, collection_id, True, True)
         try:
+            await delta_storage.expand_users(session, collection_id)
             await session.delete(collection)
+            await session.flush()
+            await _refresh_entity_events(session, collection.collected_at)
             await session.commit()
             return True
         except Exception as e:
@@ -85,15 +148,90 @@ async def get_alliance_from_collection(session: AsyncSession, collection_id: int
         alliance, collection = alliance_history
 
         if alliance and collection:
-            user_query = select(UserDB).where(UserDB.collection_id == collection_id).where(UserDB.alliance_id == alliance_id)
-            users = (await session.exec(user_query)).all()
-            alliance.users = list(users)
-            for user in alliance.users:
-                user.alliance = alliance
+            await _load_alliance_users(session, [alliance])
 
         return (collection, alliance)
 
 
+async def get_alliance_changes(session: AsyncSession, from_collection_id: int, to_collection_id: int) -> AsyncIterator[EntityChangeDB]:
+    """Compares the Alliances of two Collections and streams the changes from the database.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        from_collection_id (int): The `collection_id` of the earlier Collection.
+        to_collection_id (int): The `collection_id` of the later Collection.
+
+    Yields:
+        tuple[int, EntityChange, int | str | None, int | str | None]: A tuple of the `alliance_id`, the change, the old and the new value ordered by `alliance_id`.
+    """
+    query = _get_entity_changes_query(AllianceDB, "alliance_id", list(ALLIANCE_CHANGE_BY_COLUMN), from_collection_id, to_collection_id)
+    async for change in _stream_entity_changes(session, query, ALLIANCE_CHANGE_BY_COLUMN):
+        yield change
+
+
+async def get_alliance_histogram(session: AsyncSession, collection_id: int, metric: ParameterAllianceMetric, buckets: int = 50) -> HistogramDB:
+    """Computes the distribution of a numeric property of the Alliances of a Collection in the database, so that only the counts need to be transferred.
+
+    The range from the lowest to the highest value is divided into `buckets` buckets of equal width with `width_bucket`. The upper bound of the range is the highest value + 1, so that the highest value falls into the last bucket.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int): The `collection_id` of the Collection to retrieve the data from.
+        metric (ParameterAllianceMetric): The property of the Alliances to compute the distribution of.
+        buckets (int, optional): The number of buckets. Defaults to 50.
+
+    Returns:
+        tuple[int, int | None, int | None, list[tuple[float, int]], list[int]]: A tuple of the number of Alliances with a value, the lowest and the highest value, the values at the `HISTOGRAM_PERCENTILES` computed with `percentile_disc` and the number of Alliances per bucket. Alliances with a missing value are omitted. If no Alliance has a value, the lowest and the highest value are `None` and the lists are empty.
+    """
+    value = col(getattr(AllianceDB, metric.value))
+    return await _get_histogram(session, value, [col(AllianceDB.collection_id) == collection_id, value.is_not(None)], buckets)
+
+
+async def get_alliance_histories(
+    session: AsyncSession,
+    alliance_ids: Sequence[int],
+    include_users: bool = True,
+    collection_id: int | None = None,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    interval: ParameterInterval = ParameterInterval.MONTHLY,
+    desc: bool = False,
+    skip: int = 0,
+    take: int = 100,
+) -> dict[int, list[AllianceHistoryDB]]:
+    """Retrieves the histories of multiple Alliances with a single query. Missing Collections are skipped.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        alliance_ids (Sequence[int]): The `alliance_id`s of the Alliances to retrieve data for.
+        include_users (bool): Determines, if the Alliances' members should be included in the results.
+        collection_id (int, optional): Only return data from the Collection with this `collection_id`. If specified, `from_date`, `to_date` and `interval` are ignored. Defaults to None.
+        from_date (datetime, optional): Return only data collected after this date and time or exactly at this point. Defaults to None.
+        to_date (datetime, optional): Return only data collected before this date and time or exactly at this point. Defaults to None.
+        interval (ParameterInterval, optional): Specify the interval of the data returned. Defaults to ParameterInterval.MONTHLY.
+        desc (bool, optional): Determines, whether the data should be returned in descending order by the collection date and time. Defaults to False.
+        skip (int, optional): Skip this number of results per Alliance. Defaults to 0.
+        take (int, optional): Limit the number of results returned per Alliance. Defaults to 100.
+
+    Returns:
+        dict[int, list[tuple[CollectionDB, AllianceDB]]]: The entries in the history of each Alliance by `alliance_id` in the order of `alliance_ids`. Alliances without any data are mapped to an empty list.
+    """
+    async with session:
+        query = _get_entity_histories_query(
+            AllianceDB, AllianceDB.alliance_id, alliance_ids, collection_id, from_date, to_date, interval, desc, skip, take
+        )
+
+        with server_timing.phase("query"):
+            result = (await session.exec(query)).all()
+            if include_users:
+                await _load_alliance_users(session, [alliance for alliance, _ in result])
+
+    alliance_histories = {alliance_id: [] for alliance_id in alliance_ids}
+    for alliance, collection in result:
+        alliance_histories[alliance.alliance_id].append((collection, alliance))
+    return alliance_histories
+
+
 async def get_alliance_history(
     session: AsyncSession,
     alliance_id: int,
@@ -105,6 +243,8 @@ async def get_alliance_history(
     skip: int = 0,
     take: int = 100,
     on_missing: ParameterOnMissing = ParameterOnMissing.SKIP,
+    start_after: datetime | None = None,
+    division_design_id: int | None = None,
 ) -> list[AllianceHistoryDB]:
     """Retrieve an Alliance's history over time.
 
@@ -119,12 +259,34 @@ async def get_alliance_history(
         skip (int, optional): Skip this number of results from the result set. Defaults to 0.
         take (int, optional): Limit the number of results returned. Defaults to 100.
         on_missing (ParameterOnMissing, optional): Specify, how to handle missing collections. Defaults to ParameterOnMissing.SKIP.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page. Only data collected after (or before, if `desc` is True) this point is returned. Defaults to None.
+        division_design_id (int, optional): Return only data from Collections, in which the Alliance was in this tournament division. Defaults to None.
 
     Returns:
         list[tuple[CollectionDB, AllianceDB]]: A list of tuples representing entries in the Alliance history. A tuple contains the metadata of the respective Collection and the Alliance's data from that Collection.
     """
     async with session:
-        collections = await get_collections(session, from_date, to_date, interval, desc, skip, take, on_missing)
+        if on_missing == ParameterOnMissing.SKIP:
+            # Page through the Alliance's entries directly, so that pages are always full and a page after `start_after` costs as much as the first one.
+            query = (
+                select(AllianceDB, CollectionDB)
+                .join(CollectionDB, AllianceDB.collection_id == CollectionDB.collection_id)
+                .where(AllianceDB.alliance_id == alliance_id)
+            )
+            if division_design_id is not None:
+                query = query.where(AllianceDB.division_design_id == division_design_id)
+            query = _apply_select_parameters_to_query(query, from_date, to_date, interval, desc)
+            query = _apply_start_after_to_query(query, start_after, desc)
+            query = query.offset(skip).limit(take)
+
+            with server_timing.phase("query"):
+                result = (await session.exec(query)).all()
+                if include_users:
+                    await _load_alliance_users(session, [alliance for alliance, _ in result])
+            return [(collection, alliance) for alliance, collection in result]
+
+        with server_timing.phase("get_collections"):
+            collections = await get_collections(session, from_date, to_date, interval, desc, skip, take, on_missing, start_after)
         collection_ids = [collection.collection_id for collection in collections if collection is not None and collection.collection_id is not None]
 
         query = (
@@ -133,10 +295,13 @@ async def get_alliance_history(
             .where(col(CollectionDB.collection_id).in_(collection_ids))
             .where(AllianceDB.alliance_id == alliance_id)
         )
-        if include_users:
-            query = query.options(selectinload(AllianceDB.users))
+        if division_design_id is not None:
+            query = query.where(AllianceDB.division_design_id == division_design_id)
 
-        result = (await session.exec(query)).all()
+        with server_timing.phase("query"):
+            result = (await session.exec(query)).all()
+            if include_users:
+                await _load_alliance_users(session, [alliance for alliance, _ in result])
 
         alliance_histories_by_collection_id = {collection.collection_id: (alliance, collection) for alliance, collection in result}
         alliance_histories = []
@@ -154,7 +319,49 @@ async def get_alliance_history(
         return alliance_histories
 
 
-async def get_collection(session: AsyncSession, collection_id: int, include_alliances: bool, include_users: bool) -> CollectionDB | None:
+async def get_alliance_leaderboard(
+    session: AsyncSession,
+    collection_id: int,
+    metric: ParameterAllianceMetric,
+    division_design_id: int | None = None,
+    skip: int = 0,
+    take: int = 100,
+) -> list[AllianceRankDB]:
+    """Ranks the Alliances of a Collection by a numeric property.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int): The `collection_id` of the Collection to retrieve the data from.
+        metric (ParameterAllianceMetric): The property of the Alliances to rank by.
+        division_design_id (int, optional): Rank only the Alliances in this tournament division. Defaults to None.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+
+    Returns:
+        list[tuple[int, int, str, int, int]]: A list of tuples of the rank, the `alliance_id`, the `alliance_name`, the `division_design_id` and the value of the `metric` ordered by rank. Alliances with equal values share a rank. Alliances with a missing value are omitted.
+    """
+    value = col(getattr(AllianceDB, metric.value))
+    conditions = [col(AllianceDB.collection_id) == collection_id, value.is_not(None)]
+    if division_design_id is not None:
+        conditions.append(col(AllianceDB.division_design_id) == division_design_id)
+
+    async with session:
+        query = (
+            select(AllianceDB.alliance_id, AllianceDB.alliance_name, AllianceDB.division_design_id, value)
+            .where(*conditions)
+            .order_by(value.desc(), col(AllianceDB.alliance_id))
+            .offset(skip)
+            .limit(take)
+        )
+        with server_timing.phase("query"):
+            rows = (await session.exec(query)).all()
+            count_query = select(func.count()).select_from(AllianceDB).where(*conditions)
+            return await _rank_leaderboard_rows(session, count_query, value, rows, skip)
+
+
+async def get_collection(
+    session: AsyncSession, collection_id: int, include_alliances: bool, include_users: bool, division_design_id: int | None = None
+) -> CollectionDB | None:
     """Retrieves the Collection with the specified `collection_id`.
 
     Args:
@@ -162,6 +369,7 @@ async def get_collection(session: AsyncSession, collection_id: int, include_alli
         collection_id (int): The `collection_id` of the Collection to retrieve.
         include_alliances (bool): Determines, whether to also retrieve the Alliances related to the Collection.
         include_users (bool): Determines, whether to also retrieve the Users related to the Collection.
+        division_design_id (int, optional): Only retrieve the Alliances in this tournament division. Defaults to None.
 
     Returns:
         CollectionDB | None: The requested Collection, if it exists. Else, None. If a Collection is returned and `include_alliances` is `True`, then the property `alliances` will be populated. Else, it will be empty. If a Collection is returned and `include_users` is `True`, then the property `users` will be populated. Else, it will be empty.
@@ -173,13 +381,16 @@ async def get_collection(session: AsyncSession, collection_id: int, include_alli
 
         if include_alliances:  # Split up retrieving alliances, because getting all data at once was significantly slower
             query = select(AllianceDB).where(AllianceDB.collection_id == collection_id)
+            if division_design_id is not None:
+                query = query.where(AllianceDB.division_design_id == division_design_id)
             alliances = (await session.exec(query)).all()
             collection.alliances = alliances
             for alliance in collection.alliances:
                 alliance.collection = collection
 
         if include_users:  # Split up retrieving users, because getting all data at once was significantly slower
-            query = select(UserDB).where(UserDB.collection_id == collection_id)
+            user = delta_storage.get_user_source()
+            query = select(user).where(user.collection_id == collection_id)
             users = (await session.exec(query)).all()
             collection.users = users
             for user in collection.users:
@@ -206,6 +417,64 @@ async def get_collection_by_timestamp(session: AsyncSession, collected_at: datet
         return collection
 
 
+async def get_collection_stats(session: AsyncSession, collection_id: int) -> CollectionStatsHistoryDB | None:
+    """Retrieves the aggregated numbers of a Collection.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int): The `collection_id` of the Collection to retrieve the numbers of.
+
+    Returns:
+        tuple[CollectionDB, CollectionStatsDB] | None: The Collection and its numbers. `None`, if there's no Collection with the specified `collection_id`.
+    """
+    async with session:
+        query = (
+            select(CollectionDB, CollectionStatsDB)
+            .join(CollectionStatsDB, col(CollectionStatsDB.collection_id) == col(CollectionDB.collection_id))
+            .where(col(CollectionDB.collection_id) == collection_id)
+        )
+        result = (await session.exec(query)).first()
+        return tuple(result) if result else None
+
+
+async def get_collection_stats_history(
+    session: AsyncSession,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    interval: ParameterInterval = ParameterInterval.MONTHLY,
+    desc: bool = False,
+    skip: int = 0,
+    take: int = 100,
+    start_after: datetime | None = None,
+) -> list[CollectionStatsHistoryDB]:
+    """Retrieves the aggregated numbers of the Collections meeting the specified criteria.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        from_date (datetime, optional): Return only data collected after this date and time or exactly at this point. Defaults to None.
+        to_date (datetime, optional): Return only data collected before this date and time or exactly at this point. Defaults to None.
+        interval (ParameterInterval, optional): Specify the interval of the data returned. Defaults to ParameterInterval.MONTHLY.
+        desc (bool, optional): Determines, whether the data should be returned in descending order by the collection date and time. Defaults to False.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page. Only data collected after (or before, if `desc` is True) this point is returned. Defaults to None.
+
+    Returns:
+        list[tuple[CollectionDB, CollectionStatsDB]]: A list of tuples of the Collections without any Alliances or Users and their numbers.
+    """
+    async with session:
+        query = select(CollectionDB, CollectionStatsDB).join(
+            CollectionStatsDB, col(CollectionStatsDB.collection_id) == col(CollectionDB.collection_id)
+        )
+        query = _apply_select_parameters_to_query(query, from_date, to_date, interval, desc)
+        query = _apply_start_after_to_query(query, start_after, desc, CollectionDB)
+        query = query.offset(skip).limit(take)
+
+        with server_timing.phase("query"):
+            results = (await session.exec(query)).all()
+        return [tuple(result) for result in results]
+
+
 async def get_collections(
     session: AsyncSession,
     from_date: datetime | None = None,
@@ -215,6 +484,7 @@ async def get_collections(
     skip: int = 0,
     take: int = 100,
     on_missing: ParameterOnMissing = ParameterOnMissing.SKIP,
+    start_after: datetime | None = None,
 ) -> list[CollectionDB]:
     """Retrieves metadata of Collections meeting the specified criteria.
 
@@ -227,22 +497,240 @@ async def get_collections(
         skip (int, optional): Skip this number of results from the result set. Defaults to 0.
         take (int, optional): Limit the number of results returned. Defaults to 100.
         on_missing (ParameterOnMissing, optional): Specify, how to handle missing collections. Defaults to ParameterOnMissing.SKIP.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page. Only data collected after (or before, if `desc` is True) this point is returned. Defaults to None.
 
     Returns:
         list[CollectionDB]: A list of Collections without any Alliances or Users.
     """
     match on_missing:
         case ParameterOnMissing.SKIP:
-            return await _get_collections_on_missing_skip(session, from_date, to_date, interval, desc, skip, take)
+            return await _get_collections_on_missing_skip(session, from_date, to_date, interval, desc, skip, take, start_after)
         case ParameterOnMissing.EMPTY:
-            return await _get_collections_on_missing_empty_or_null(session, from_date, to_date, interval, desc, skip, take, on_missing)
+            return await _get_collections_on_missing_empty_or_null(session, from_date, to_date, interval, desc, skip, take, on_missing, start_after)
         case ParameterOnMissing.NULL:
-            return await _get_collections_on_missing_empty_or_null(session, from_date, to_date, interval, desc, skip, take, on_missing)
+            return await _get_collections_on_missing_empty_or_null(session, from_date, to_date, interval, desc, skip, take, on_missing, start_after)
         case ParameterOnMissing.LAST:
             if interval == ParameterInterval.HOURLY:
-                return await _get_collections_on_missing_skip(session, from_date, to_date, interval, desc, skip, take)
+                return await _get_collections_on_missing_skip(session, from_date, to_date, interval, desc, skip, take, start_after)
+
+            return await _get_collections_on_missing_last(session, from_date, to_date, interval, desc, skip, take, start_after)
+
+
+async def get_division_standings(session: AsyncSession, collection_id: int, division_design_id: int) -> list[DivisionStandingDB]:
+    """Ranks the Alliances in a tournament division of a Collection by their stars and aggregates the properties of their members.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int): The `collection_id` of the Collection.
+        division_design_id (int): The `division_design_id` of the tournament division.
+
+    Returns:
+        list[DivisionStandingDB]: The Alliances in the division ordered by rank. Alliances with the same `score` share a rank.
+    """
+    user = delta_storage.get_user_source()
+    division_alliance_ids = select(AllianceDB.alliance_id).where(
+        AllianceDB.collection_id == collection_id, AllianceDB.division_design_id == division_design_id
+    )
+    members = (
+        select(
+            user.alliance_id,
+            func.count().label("member_count"),
+            func.coalesce(func.sum(user.alliance_score), 0).label("member_stars"),
+            func.coalesce(func.sum(user.trophy), 0).label("member_trophy"),
+        )
+        .where(user.collection_id == collection_id, col(user.alliance_id).in_(division_alliance_ids))
+        .group_by(user.alliance_id)
+        .subquery()
+    )
+    rank = func.rank().over(order_by=col(AllianceDB.score).desc())
+
+    async with session:
+        # Both the Alliances and their members are looked up via indexes starting with `collection_id`.
+        query = (
+            select(
+                rank,
+                AllianceDB.alliance_id,
+                AllianceDB.alliance_name,
+                AllianceDB.score,
+                AllianceDB.trophy,
+                AllianceDB.championship_score,
+                func.coalesce(members.c.member_count, 0),
+                func.coalesce(members.c.member_stars, 0),
+                func.coalesce(members.c.member_trophy, 0),
+            )
+            .outerjoin(members, members.c.alliance_id == AllianceDB.alliance_id)
+            .where(AllianceDB.collection_id == collection_id, AllianceDB.division_design_id == division_design_id)
+            .order_by(col(AllianceDB.score).desc(), col(AllianceDB.trophy).desc().nulls_last(), AllianceDB.alliance_id)
+        )
 
-            return await _get_collections_on_missing_last(session, from_date, to_date, interval, desc, skip, take)
+        with server_timing.phase("query"):
+            rows = (await session.exec(query)).all()
+
+    return [tuple(row) for row in rows]
+
+
+async def get_entity_names(session: AsyncSession, entity_type: EntityType, entity_id: int, desc: bool = False) -> list[EntityNameSpanDB]:
+    """Retrieves the names an Alliance or a User has had and the time frames, in which they have been seen.
+
+    The time frames are computed from the Collections containing the entity with a gaps-and-islands query served by the index on the `alliance_id` or `user_id`:
+    consecutive Collections with the same name form one time frame, so a name the entity has returned to is returned once per time frame and time frames never overlap.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        entity_type (EntityType): The type of the entity.
+        entity_id (int): The `alliance_id` or `user_id` of the entity.
+        desc (bool, optional): Return the most recently adopted name first. Defaults to False.
+
+    Returns:
+        list[EntityNameSpanDB]: The names of the entity and their time frames ordered by `first_seen_at`. Empty, if the entity has never been seen.
+    """
+    if entity_type == EntityType.ALLIANCE:
+        entity_id_column, name_column, collection_id_column = AllianceDB.alliance_id, AllianceDB.alliance_name, AllianceDB.collection_id
+    else:
+        user = delta_storage.get_user_source()
+        entity_id_column, name_column, collection_id_column = user.user_id, user.user_name, user.collection_id
+
+    # Within an island of consecutive Collections with the same name, both row numbers increase in lockstep, so their difference is constant.
+    island = func.row_number().over(order_by=CollectionDB.collected_at) - func.row_number().over(
+        partition_by=name_column, order_by=CollectionDB.collected_at
+    )
+    names = (
+        select(name_column.label("name"), CollectionDB.collected_at, island.label("island"))
+        .join(CollectionDB, CollectionDB.collection_id == collection_id_column)
+        .where(entity_id_column == entity_id)
+        .subquery("names")
+    )
+    first_seen_at = func.min(names.c.collected_at).label("first_seen_at")
+    query = select(names.c.name, first_seen_at, func.max(names.c.collected_at)).group_by(names.c.name, names.c.island)
+    query = query.order_by(first_seen_at.desc() if desc else first_seen_at.asc())
+
+    async with session:
+        with server_timing.phase("query"):
+            rows = (await session.exec(query)).all()
+        return [tuple(row) for row in rows]
+
+
+async def get_events(
+    session: AsyncSession,
+    entity_type: EntityType | None = None,
+    entity_id: int | None = None,
+    event_types: Sequence[EntityEventType] | None = None,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    desc: bool = False,
+    skip: int = 0,
+    take: int = 100,
+) -> list[EntityEventDB]:
+    """Retrieves the events recorded for Alliances and Users when saving Collections.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        entity_type (EntityType, optional): Only return events of this type of entity. Defaults to None.
+        entity_id (int, optional): Only return events of the entity with this `alliance_id` or `user_id`. Defaults to None.
+        event_types (Sequence[EntityEventType], optional): Only return events of these types. Defaults to None.
+        from_date (datetime, optional): Only return events recorded at or after this date. Defaults to None.
+        to_date (datetime, optional): Only return events recorded at or before this date. Defaults to None.
+        desc (bool, optional): Return the newest events first. Defaults to False.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+
+    Returns:
+        list[EntityEventDB]: The requested events ordered by `collected_at` and `event_id`.
+    """
+    async with session:
+        query = select(EntityEventDB)
+        if entity_type:
+            query = query.where(EntityEventDB.entity_type == entity_type)
+        if entity_id is not None:
+            query = query.where(EntityEventDB.entity_id == entity_id)
+        if event_types:
+            query = query.where(col(EntityEventDB.event_type).in_(event_types))
+        query = _apply_datetime_limits_to_query(query, from_date, to_date, EntityEventDB)
+        if desc:
+            query = query.order_by(col(EntityEventDB.collected_at).desc(), col(EntityEventDB.event_id).desc())
+        else:
+            query = query.order_by(col(EntityEventDB.collected_at).asc(), col(EntityEventDB.event_id).asc())
+        query = query.offset(skip).limit(take)
+
+        with server_timing.phase("query"):
+            events = (await session.exec(query)).all()
+        return list(events)
+
+
+async def get_histogram(session: AsyncSession, collection_id: int, metric: ParameterUserMetric, buckets: int = 50) -> HistogramDB:
+    """Computes the distribution of a numeric property of the Users of a Collection in the database, so that only the counts need to be transferred.
+
+    The range from the lowest to the highest value is divided into `buckets` buckets of equal width with `width_bucket`. The upper bound of the range is the highest value + 1, so that the highest value falls into the last bucket.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int): The `collection_id` of the Collection to retrieve the data from.
+        metric (ParameterUserMetric): The property of the Users to compute the distribution of.
+        buckets (int, optional): The number of buckets. Defaults to 50.
+
+    Returns:
+        tuple[int, int | None, int | None, list[tuple[float, int]], list[int]]: A tuple of the number of Users with a value, the lowest and the highest value, the values at the `HISTOGRAM_PERCENTILES` computed with `percentile_disc` and the number of Users per bucket. Users with a missing value are omitted. If no User has a value, the lowest and the highest value are `None` and the lists are empty.
+    """
+    user = delta_storage.get_user_source()
+    value = getattr(user, metric.value)
+    return await _get_histogram(session, value, [user.collection_id == collection_id, value.is_not(None)], buckets)
+
+
+async def get_latest_collection(session: AsyncSession, collected_at: datetime | None = None) -> CollectionDB | None:
+    """Retrieves the metadata of the latest Collection collected at or before the given `collected_at` datetime.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        collected_at (datetime, optional): Return the latest Collection collected before this date and time or exactly at this point. Defaults to None, which returns the latest Collection overall.
+
+    Returns:
+        CollectionDB | None: The Collection without any Alliances or Users, if such a Collection exists in the database. Else, `None`.
+    """
+    async with session:
+        query = select(CollectionDB)
+        if collected_at:
+            query = query.where(CollectionDB.collected_at <= utils.remove_timezone(collected_at))
+        query = query.order_by(col(CollectionDB.collected_at).desc()).limit(1)
+        collection = (await session.exec(query)).first()
+        return collection
+
+
+async def get_page_timestamps(
+    session: AsyncSession,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    interval: ParameterInterval = ParameterInterval.MONTHLY,
+    desc: bool = False,
+    skip: int = 0,
+    take: int = 100,
+    on_missing: ParameterOnMissing = ParameterOnMissing.SKIP,
+    start_after: datetime | None = None,
+) -> list[datetime]:
+    """Retrieves the timestamps of the slots of a page of Collections, which the entries of a page of Collections or of an Alliance or User history are taken from or fill in for.
+
+    The entries of an entity can't be used to determine the next page, since `null` entries have no timestamp and the entity may be missing from some of the Collections.
+    If `on_missing` is `empty` or `null`, the slots are the expected timestamps and the database is not queried.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        from_date (datetime, optional): Return only data collected after this date and time or exactly at this point. Defaults to None.
+        to_date (datetime, optional): Return only data collected before this date and time or exactly at this point. Defaults to None.
+        interval (ParameterInterval, optional): Specify the interval of the data returned. Defaults to ParameterInterval.MONTHLY.
+        desc (bool, optional): Determines, whether the data should be returned in descending order by the collection date and time. Defaults to False.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+        on_missing (ParameterOnMissing, optional): Specify, how to handle missing collections. Defaults to ParameterOnMissing.SKIP.
+        start_after (datetime, optional): The timestamp of the last slot of the previous page. Defaults to None.
+
+    Returns:
+        list[datetime]: The timestamps of the slots of the page in the requested order. The last one is to be used as the cursor of the next page, if the page is full.
+    """
+    if on_missing in (ParameterOnMissing.EMPTY, ParameterOnMissing.NULL):
+        from_date, to_date = _get_date_defaults(from_date, to_date)
+        return _get_expected_timestamps(from_date, to_date, interval, desc, skip, take, start_after)
+
+    collections = await get_collections(session, from_date, to_date, interval, desc, skip, take, on_missing, start_after)
+    return [collection.collected_at for collection in collections]
 
 
 async def get_top_100_from_collection(session: AsyncSession, collection_id: int, skip: int = 0, take: int = 100) -> list[UserDB]:
@@ -257,14 +745,277 @@ async def get_top_100_from_collection(session: AsyncSession, collection_id: int,
     Returns:
         list[UserDB]: A (filtered) list of top 100 Users in the requested Collection ordered descending by Trophies.
     """
+    user = delta_storage.get_user_source()
     async with session:
-        query = select(UserDB).where(UserDB.collection_id == collection_id).order_by(col(UserDB.trophy).desc())
+        query = select(user).where(user.collection_id == collection_id).order_by(user.trophy.desc())
         query = query.offset(skip).limit(take)
 
         results = await session.exec(query)
         return list(results.all())
 
 
+async def get_top_movers(
+    session: AsyncSession,
+    from_collection_id: int,
+    to_collection_id: int,
+    metric: ParameterUserMetric,
+    desc: bool = True,
+    alliance_id: int | None = None,
+    division_design_id: int | None = None,
+    skip: int = 0,
+    take: int = 100,
+) -> list[UserMoverDB]:
+    """Ranks the Users present in both of the specified Collections by the change of a numeric property between these Collections.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        from_collection_id (int): The `collection_id` of the Collection to compare against.
+        to_collection_id (int): The `collection_id` of the Collection to compare.
+        metric (ParameterUserMetric): The property of the Users to rank by.
+        desc (bool, optional): Determines, whether the biggest increases (True) or the biggest decreases (False) should be returned first. Defaults to True.
+        alliance_id (int, optional): Return only Users, who are members of this Alliance in the Collection to compare. Defaults to None.
+        division_design_id (int, optional): Return only Users, whose Alliance is in this tournament division in the Collection to compare. Defaults to None.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+
+    Returns:
+        list[tuple[int, str, int, int, int, int]]: A list of tuples of the `user_id`, the `user_name` and the `alliance_id` of the User in the Collection to compare, the values of the `metric` in both Collections and the change. Users with a missing value are omitted.
+    """
+    user = delta_storage.get_user_source()
+    from_user = aliased(user)
+    to_user = aliased(user)
+    from_value = getattr(from_user, metric.value)
+    to_value = getattr(to_user, metric.value)
+    change = (to_value - from_value).label("change")
+
+    async with session:
+        # Both sides are looked up via the primary key (collection_id, user_id), so Postgres can join them with index scans.
+        query = (
+            select(to_user.user_id, to_user.user_name, to_user.alliance_id, from_value, to_value, change)
+            .join(from_user, and_(from_user.user_id == to_user.user_id, from_user.collection_id == from_collection_id))
+            .where(to_user.collection_id == to_collection_id, from_value.is_not(None), to_value.is_not(None))
+        )
+        if alliance_id is not None:
+            query = query.where(to_user.alliance_id == alliance_id)
+        if division_design_id is not None:
+            query = query.join(
+                AllianceDB, and_(AllianceDB.collection_id == to_user.collection_id, AllianceDB.alliance_id == to_user.alliance_id)
+            ).where(AllianceDB.division_design_id == division_design_id)
+
+        query = query.order_by(change.desc() if desc else change.asc(), to_user.user_id).offset(skip).limit(take)
+
+        with server_timing.phase("query"):
+            rows = (await session.exec(query)).all()
+
+    return [tuple(row) for row in rows]
+
+
+async def get_tournament(session: AsyncSession, collection_id: int) -> TournamentDB | None:
+    """Retrieves the tournament, during which a specific Collection has been collected.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int): The `collection_id` of the Collection.
+
+    Returns:
+        tuple[CollectionDB, CollectionDB, int] | None: The first and the last Collection collected during the tournament and the number of Collections collected during it. `None`, if there's no such Collection or if it hasn't been collected during a tournament.
+    """
+    tournament = _get_tournaments_query()
+    first_collection = aliased(CollectionDB)
+    last_collection = aliased(CollectionDB)
+
+    async with session:
+        query = (
+            select(first_collection, last_collection, tournament.c.collection_count)
+            .select_from(tournament)
+            .join(first_collection, first_collection.collected_at == tournament.c.started_at)
+            .join(last_collection, last_collection.collected_at == tournament.c.ended_at)
+            .join(
+                CollectionDB,
+                and_(CollectionDB.collected_at >= tournament.c.started_at, CollectionDB.collected_at <= tournament.c.ended_at),
+            )
+            .where(CollectionDB.collection_id == collection_id, col(CollectionDB.tournament_running))
+        )
+
+        with server_timing.phase("query"):
+            result = (await session.exec(query)).first()
+        return tuple(result) if result else None
+
+
+async def get_tournament_alliance_progression(
+    session: AsyncSession,
+    started_at: datetime,
+    ended_at: datetime,
+    alliance_id: int | None = None,
+    division_design_id: int | None = None,
+) -> list[TournamentAllianceProgressDB]:
+    """Retrieves the stars and trophies of the Alliances at the start of a tournament and at the end of each of its days together with their changes since the previous entry.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        started_at (datetime): The `collected_at` of the first Collection collected during the tournament.
+        ended_at (datetime): The `collected_at` of the last Collection collected during the tournament.
+        alliance_id (int, optional): Return only the progression of the Alliance with this `alliance_id`. Defaults to None.
+        division_design_id (int, optional): Return only the progression of the Alliances in this tournament division. Defaults to None.
+
+    Returns:
+        list[TournamentAllianceProgressDB]: The entries ordered by `alliance_id` and `collected_at`. The changes of the first entry of an Alliance are `None`.
+    """
+    # The last Collection of each day is determined and the changes are computed with window functions, so the progression of all Alliances is read with a single query.
+    day_index = func.row_number().over(partition_by=func.date_trunc("day", CollectionDB.collected_at), order_by=col(CollectionDB.collected_at).desc())
+    collections = (
+        select(CollectionDB.collection_id, CollectionDB.collected_at, day_index.label("day_index"))
+        .where(CollectionDB.collected_at >= started_at, CollectionDB.collected_at <= ended_at)
+        .subquery()
+    )
+    score_change = AllianceDB.score - func.lag(AllianceDB.score).over(partition_by=AllianceDB.alliance_id, order_by=collections.c.collected_at)
+    trophy_change = AllianceDB.trophy - func.lag(AllianceDB.trophy).over(partition_by=AllianceDB.alliance_id, order_by=collections.c.collected_at)
+
+    async with session:
+        query = (
+            select(
+                collections.c.collected_at,
+                AllianceDB.alliance_id,
+                AllianceDB.alliance_name,
+                AllianceDB.division_design_id,
+                AllianceDB.score,
+                score_change,
+                AllianceDB.trophy,
+                trophy_change,
+            )
+            .join(collections, collections.c.collection_id == AllianceDB.collection_id)
+            .where(or_(collections.c.day_index == 1, collections.c.collected_at == started_at))
+        )
+        if alliance_id is not None:
+            query = query.where(AllianceDB.alliance_id == alliance_id)
+        if division_design_id is not None:
+            query = query.where(AllianceDB.division_design_id == division_design_id)
+        query = query.order_by(AllianceDB.alliance_id, collections.c.collected_at)
+
+        with server_timing.phase("query"):
+            rows = (await session.exec(query)).all()
+
+    return [tuple(row) for row in rows]
+
+
+async def get_tournament_user_deltas(
+    session: AsyncSession,
+    from_collection_id: int,
+    to_collection_id: int,
+    alliance_id: int | None = None,
+    division_design_id: int | None = None,
+    skip: int = 0,
+    take: int = 100,
+) -> list[TournamentUserDeltaDB]:
+    """Retrieves the tournament bonus score and the championship score of the Users in a Collection and their changes since an earlier Collection, usually the first and the last Collection of a tournament.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        from_collection_id (int): The `collection_id` of the Collection to compare against.
+        to_collection_id (int): The `collection_id` of the Collection to compare.
+        alliance_id (int, optional): Return only Users, who are members of this Alliance in the Collection to compare. Defaults to None.
+        division_design_id (int, optional): Return only Users, whose Alliance is in this tournament division in the Collection to compare. Defaults to None.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+
+    Returns:
+        list[TournamentUserDeltaDB]: The Users ordered descending by the change of their championship score and then of their tournament bonus score. The changes of Users missing from the Collection to compare against are `None`.
+    """
+    user = delta_storage.get_user_source()
+    from_user = aliased(user)
+    to_user = aliased(user)
+    tournament_bonus_score_change = (to_user.tournament_bonus_score - from_user.tournament_bonus_score).label("tournament_bonus_score_change")
+    championship_score_change = (to_user.championship_score - from_user.championship_score).label("championship_score_change")
+
+    async with session:
+        query = (
+            select(
+                to_user.user_id,
+                to_user.user_name,
+                to_user.alliance_id,
+                to_user.tournament_bonus_score,
+                tournament_bonus_score_change,
+                to_user.championship_score,
+                championship_score_change,
+            )
+            .outerjoin(from_user, and_(from_user.user_id == to_user.user_id, from_user.collection_id == from_collection_id))
+            .where(to_user.collection_id == to_collection_id)
+        )
+        if alliance_id is not None:
+            query = query.where(to_user.alliance_id == alliance_id)
+        if division_design_id is not None:
+            query = query.join(
+                AllianceDB, and_(AllianceDB.collection_id == to_user.collection_id, AllianceDB.alliance_id == to_user.alliance_id)
+            ).where(AllianceDB.division_design_id == division_design_id)
+
+        query = query.order_by(championship_score_change.desc().nulls_last(), tournament_bonus_score_change.desc().nulls_last(), to_user.user_id)
+        query = query.offset(skip).limit(take)
+
+        with server_timing.phase("query"):
+            rows = (await session.exec(query)).all()
+
+    return [tuple(row) for row in rows]
+
+
+async def get_tournaments(
+    session: AsyncSession,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    desc: bool = False,
+    skip: int = 0,
+    take: int = 100,
+) -> list[TournamentDB]:
+    """Retrieves the tournaments detected from the Collections collected during them.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        from_date (datetime, optional): Return only tournaments, which ended after this date and time or exactly at this point. Defaults to None.
+        to_date (datetime, optional): Return only tournaments, which started before this date and time or exactly at this point. Defaults to None.
+        desc (bool, optional): Determines, whether the tournaments should be returned in descending order by their start. Defaults to False.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+
+    Returns:
+        list[tuple[CollectionDB, CollectionDB, int]]: A list of tuples of the first and the last Collection collected during a tournament and the number of Collections collected during it.
+    """
+    tournament = _get_tournaments_query()
+    first_collection = aliased(CollectionDB)
+    last_collection = aliased(CollectionDB)
+
+    async with session:
+        query = (
+            select(first_collection, last_collection, tournament.c.collection_count)
+            .select_from(tournament)
+            .join(first_collection, first_collection.collected_at == tournament.c.started_at)
+            .join(last_collection, last_collection.collected_at == tournament.c.ended_at)
+        )
+        if from_date:
+            query = query.where(tournament.c.ended_at >= from_date)
+        if to_date:
+            query = query.where(tournament.c.started_at <= to_date)
+        query = query.order_by(tournament.c.started_at.desc() if desc else tournament.c.started_at.asc()).offset(skip).limit(take)
+
+        with server_timing.phase("query"):
+            results = (await session.exec(query)).all()
+        return [tuple(result) for result in results]
+
+
+async def get_user_changes(session: AsyncSession, from_collection_id: int, to_collection_id: int) -> AsyncIterator[EntityChangeDB]:
+    """Compares the Users of two Collections and streams the changes from the database.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        from_collection_id (int): The `collection_id` of the earlier Collection.
+        to_collection_id (int): The `collection_id` of the later Collection.
+
+    Yields:
+        tuple[int, EntityChange, int | str | None, int | str | None]: A tuple of the `user_id`, the change, the old and the new value ordered by `user_id`. A User may have multiple changes.
+    """
+    query = _get_entity_changes_query(delta_storage.get_user_source(), "user_id", list(USER_CHANGE_BY_COLUMN), from_collection_id, to_collection_id)
+    async for change in _stream_entity_changes(session, query, USER_CHANGE_BY_COLUMN):
+        yield change
+
+
 async def get_user_from_collection(session: AsyncSession, collection_id: int, user_id: int) -> UserHistoryDB | None:
     """Retrieves information about a specific User from a specific collection.
 
@@ -276,13 +1027,14 @@ async def get_user_from_collection(session: AsyncSession, collection_id: int, us
     Returns:
         tuple[CollectionDB, UserDB] | None: Returns the specified User from the specified Collection, if there's one with the specified `user_id`. Else, it returns `None`. If a User is returned, `include_alliance` is `True` and the User was in an Alliance, then the property `alliance` will be populated. Else, it will be `None`.
     """
+    user = delta_storage.get_user_source()
     async with session:
         user_history_query = (
-            select(UserDB, CollectionDB)
-            .join(CollectionDB, UserDB.collection_id == CollectionDB.collection_id)
-            .where(UserDB.collection_id == collection_id)
-            .where(UserDB.user_id == user_id)
-            .options(selectinload(UserDB.alliance))
+            select(user, CollectionDB)
+            .join(CollectionDB, user.collection_id == CollectionDB.collection_id)
+            .where(user.collection_id == collection_id)
+            .where(user.user_id == user_id)
+            .options(selectinload(user.alliance))
         )
         user_history = (await session.exec(user_history_query)).first()
         if not user_history:
@@ -293,6 +1045,50 @@ async def get_user_from_collection(session: AsyncSession, collection_id: int, us
         return (collection, user)
 
 
+async def get_user_histories(
+    session: AsyncSession,
+    user_ids: Sequence[int],
+    include_alliance: bool = True,
+    collection_id: int | None = None,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    interval: ParameterInterval = ParameterInterval.MONTHLY,
+    desc: bool = False,
+    skip: int = 0,
+    take: int = 100,
+) -> dict[int, list[UserHistoryDB]]:
+    """Retrieves the histories of multiple Users with a single query. Missing Collections are skipped.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        user_ids (Sequence[int]): The `user_id`s of the Users to retrieve data for.
+        include_alliance (bool): Determines, whether to also retrieve the Alliances of the Users. Defaults to True.
+        collection_id (int, optional): Only return data from the Collection with this `collection_id`. If specified, `from_date`, `to_date` and `interval` are ignored. Defaults to None.
+        from_date (datetime, optional): Return only data collected after this date and time or exactly at this point. Defaults to None.
+        to_date (datetime, optional): Return only data collected before this date and time or exactly at this point. Defaults to None.
+        interval (ParameterInterval, optional): Specify the interval of the data returned. Defaults to ParameterInterval.MONTHLY.
+        desc (bool, optional): Determines, whether the data should be returned in descending order by the collection date and time. Defaults to False.
+        skip (int, optional): Skip this number of results per User. Defaults to 0.
+        take (int, optional): Limit the number of results returned per User. Defaults to 100.
+
+    Returns:
+        dict[int, list[tuple[CollectionDB, UserDB]]]: The entries in the history of each User by `user_id` in the order of `user_ids`. Users without any data are mapped to an empty list.
+    """
+    user_source = delta_storage.get_user_source()
+    async with session:
+        query = _get_entity_histories_query(user_source, user_source.user_id, user_ids, collection_id, from_date, to_date, interval, desc, skip, take)
+        if include_alliance:
+            query = query.options(selectinload(user_source.alliance))
+
+        with server_timing.phase("query"):
+            result = (await session.exec(query)).all()
+
+    user_histories = {user_id: [] for user_id in user_ids}
+    for user, collection in result:
+        user_histories[user.user_id].append((collection, user))
+    return user_histories
+
+
 async def get_user_history(
     session: AsyncSession,
     user_id: int,
@@ -303,54 +1099,217 @@ async def get_user_history(
     desc: bool = False,
     skip: int = 0,
     take: int = 100,
-    on_missing: ParameterOnMissing = ParameterOnMissing.SKIP,
-) -> list[UserHistoryDB]:
-    """Retrieve an User's history over time.
+    on_missing: ParameterOnMissing = ParameterOnMissing.SKIP,
+    start_after: datetime | None = None,
+) -> list[UserHistoryDB]:
+    """Retrieve an User's history over time.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        user_id (int): The `user_id` of the User to retrieve data for.
+        include_alliance (bool): Determines, whether to also retrieve the Alliance of the User. Defaults to True.
+        from_date (datetime, optional): Return only data collected after this date and time or exactly at this point. Defaults to None.
+        to_date (datetime, optional): Return only data collected before this date and time or exactly at this point. Defaults to None.
+        interval (ParameterInterval): Specify the interval of the data returned. Defaults to ParameterInterval.MONTHLY.
+        desc (bool, optional): Determines, whether the data should be returned in descending order by the collection date and time. Defaults to False.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+        on_missing (ParameterOnMissing, optional): Specify, how to handle missing collections. Defaults to ParameterOnMissing.SKIP.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page. Only data collected after (or before, if `desc` is True) this point is returned. Defaults to None.
+
+    Returns:
+        list[tuple[CollectionDB, UserDB]]: A list of tuples representing entries in the User history. A tuple contains the metadata of the respective Collection and the User's data from that Collection.
+    """
+    user_source = delta_storage.get_user_source()
+    async with session:
+        if on_missing == ParameterOnMissing.SKIP:
+            # Page through the User's entries directly, so that pages are always full and a page after `start_after` costs as much as the first one.
+            query = (
+                select(user_source, CollectionDB)
+                .join(CollectionDB, user_source.collection_id == CollectionDB.collection_id)
+                .where(user_source.user_id == user_id)
+            )
+            query = _apply_select_parameters_to_query(query, from_date, to_date, interval, desc)
+            query = _apply_start_after_to_query(query, start_after, desc)
+            query = query.offset(skip).limit(take)
+            if include_alliance:
+                query = query.options(selectinload(user_source.alliance))
+
+            with server_timing.phase("query"):
+                result = (await session.exec(query)).all()
+            return [(collection, user) for user, collection in result]
+
+        with server_timing.phase("get_collections"):
+            collections = await get_collections(session, from_date, to_date, interval, desc, skip, take, on_missing, start_after)
+        collection_ids = [collection.collection_id for collection in collections if collection is not None and collection.collection_id is not None]
+
+        query = (
+            select(user_source, CollectionDB)
+            .join(CollectionDB, user_source.collection_id == CollectionDB.collection_id)
+            .where(col(CollectionDB.collection_id).in_(collection_ids))
+            .where(user_source.user_id == user_id)
+        )
+        if include_alliance:
+            query = query.options(selectinload(user_source.alliance))
+
+        with server_timing.phase("query"):
+            result = (await session.exec(query)).all()
+
+        user_histories_by_collection_id = {collection.collection_id: (user, collection) for user, collection in result}
+        user_histories = []
+
+        for collection in collections:
+            if collection is None and on_missing == ParameterOnMissing.NULL:
+                user_histories.append(None)
+            elif collection.collection_id is None and on_missing == ParameterOnMissing.EMPTY:
+                user_histories.append((collection, None))
+            else:
+                user, _ = user_histories_by_collection_id.get(collection.collection_id, (None, None))
+                if user:
+                    user_histories.append((collection, user))
+
+        return user_histories
+
+
+async def get_user_history_deltas(
+    session: AsyncSession,
+    user_id: int,
+    metrics: Sequence[ParameterUserMetric],
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    interval: ParameterInterval = ParameterInterval.MONTHLY,
+    desc: bool = False,
+    skip: int = 0,
+    take: int = 100,
+) -> list[UserHistoryDeltaDB]:
+    """Retrieves the values of the specified numeric properties of a User over time and how they changed compared to the previous entry in the User's history. Missing Collections are skipped.
 
     Args:
         session (AsyncSession): The database session to use.
         user_id (int): The `user_id` of the User to retrieve data for.
-        include_alliance (bool): Determines, whether to also retrieve the Alliance of the User. Defaults to True.
+        metrics (Sequence[ParameterUserMetric]): The properties of the User to retrieve.
         from_date (datetime, optional): Return only data collected after this date and time or exactly at this point. Defaults to None.
         to_date (datetime, optional): Return only data collected before this date and time or exactly at this point. Defaults to None.
-        interval (ParameterInterval): Specify the interval of the data returned. Defaults to ParameterInterval.MONTHLY.
+        interval (ParameterInterval, optional): Specify the interval of the data returned. Defaults to ParameterInterval.MONTHLY.
         desc (bool, optional): Determines, whether the data should be returned in descending order by the collection date and time. Defaults to False.
         skip (int, optional): Skip this number of results from the result set. Defaults to 0.
         take (int, optional): Limit the number of results returned. Defaults to 100.
-        on_missing (ParameterOnMissing, optional): Specify, how to handle missing collections. Defaults to ParameterOnMissing.SKIP.
 
     Returns:
-        list[tuple[CollectionDB, UserDB]]: A list of tuples representing entries in the User history. A tuple contains the metadata of the respective Collection and the User's data from that Collection.
+        list[tuple[int, datetime, list[int | None], list[int | None], list[float | None]]]: A list of tuples of the `collection_id`, the `collected_at` of the Collection, the values of the `metrics`, their changes since the previous entry and their changes per day since the previous entry. The changes are `None` for the earliest entry in the requested time frame.
     """
+    user = delta_storage.get_user_source()
     async with session:
-        collections = await get_collections(session, from_date, to_date, interval, desc, skip, take, on_missing)
-        collection_ids = [collection.collection_id for collection in collections if collection is not None and collection.collection_id is not None]
+        # The changes are calculated over the whole time frame in ascending order before applying `desc`, `skip` and `take`.
+        window_order = col(CollectionDB.collected_at).asc()
+        elapsed_seconds = cast(extract("epoch", CollectionDB.collected_at - func.lag(CollectionDB.collected_at).over(order_by=window_order)), Float)
+        metric_columns = []
+        for metric in metrics:
+            column = getattr(user, metric.value)
+            delta = column - func.lag(column).over(order_by=window_order)
+            rate = cast(delta, Float) * SECONDS_PER_DAY / func.nullif(elapsed_seconds, 0)
+            metric_columns.extend((column.label(f"{metric.value}_value"), delta.label(f"{metric.value}_delta"), rate.label(f"{metric.value}_rate")))
+
+        deltas = (
+            select(CollectionDB.collection_id, CollectionDB.collected_at, *metric_columns)
+            .join(user, user.collection_id == CollectionDB.collection_id)
+            .where(user.user_id == user_id)
+        )
+        deltas = _apply_datetime_limits_to_query(deltas, from_date, to_date)
+        deltas = _apply_interval_to_query(deltas, interval)
+        deltas = deltas.subquery()
+
+        collected_at = deltas.c.collected_at
+        query = select(deltas).order_by(collected_at.desc() if desc else collected_at.asc()).offset(skip).limit(take)
+
+        with server_timing.phase("query"):
+            rows = (await session.exec(query)).all()
+
+    return [
+        (
+            row.collection_id,
+            row.collected_at,
+            [row._mapping[f"{metric.value}_value"] for metric in metrics],
+            [row._mapping[f"{metric.value}_delta"] for metric in metrics],
+            [row._mapping[f"{metric.value}_rate"] for metric in metrics],
+        )
+        for row in rows
+    ]
+
+
+async def get_user_leaderboard(
+    session: AsyncSession,
+    collection_id: int,
+    metric: ParameterUserMetric,
+    alliance_id: int | None = None,
+    skip: int = 0,
+    take: int = 100,
+) -> list[UserRankDB]:
+    """Ranks the Users of a Collection by a numeric property. Only the requested page is sorted, so that the database can select it from an index on the `metric` or with a bounded top-N sort.
 
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int): The `collection_id` of the Collection to retrieve the data from.
+        metric (ParameterUserMetric): The property of the Users to rank by.
+        alliance_id (int, optional): Rank only the members of this Alliance. Defaults to None.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+
+    Returns:
+        list[tuple[int, int, str, int, int]]: A list of tuples of the rank, the `user_id`, the `user_name`, the `alliance_id` and the value of the `metric` ordered by rank. Users with equal values share a rank. Users with a missing value are omitted.
+    """
+    user = delta_storage.get_user_source()
+    value = getattr(user, metric.value)
+    conditions = [user.collection_id == collection_id, value.is_not(None)]
+    if alliance_id is not None:
+        conditions.append(user.alliance_id == alliance_id)
+
+    async with session:
         query = (
-            select(UserDB, CollectionDB)
-            .join(CollectionDB, UserDB.collection_id == CollectionDB.collection_id)
-            .where(col(CollectionDB.collection_id).in_(collection_ids))
-            .where(UserDB.user_id == user_id)
+            select(user.user_id, user.user_name, user.alliance_id, value)
+            .where(*conditions)
+            .order_by(value.desc(), user.user_id)
+            .offset(skip)
+            .limit(take)
         )
-        if include_alliance:
-            query = query.options(selectinload(UserDB.alliance))
+        with server_timing.phase("query"):
+            rows = (await session.exec(query)).all()
+            count_query = select(func.count()).select_from(user).where(*conditions)
+            return await _rank_leaderboard_rows(session, count_query, value, rows, skip)
 
-        result = (await session.exec(query)).all()
 
-        user_histories_by_collection_id = {collection.collection_id: (user, collection) for user, collection in result}
-        user_histories = []
+async def get_user_rank(
+    session: AsyncSession, collection_id: int, user_id: int, metric: ParameterUserMetric, alliance_id: int | None = None
+) -> UserRankDB | None:
+    """Retrieves the rank of a User in the leaderboard of a numeric property of a Collection without retrieving the other Users.
 
-        for collection in collections:
-            if collection is None and on_missing == ParameterOnMissing.NULL:
-                user_histories.append(None)
-            elif collection.collection_id is None and on_missing == ParameterOnMissing.EMPTY:
-                user_histories.append((collection, None))
-            else:
-                user, _ = user_histories_by_collection_id.get(collection.collection_id, (None, None))
-                if user:
-                    user_histories.append((collection, user))
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int): The `collection_id` of the Collection to retrieve the data from.
+        user_id (int): The `user_id` of the User to rank.
+        metric (ParameterUserMetric): The property of the Users to rank by.
+        alliance_id (int, optional): Rank the User only among the members of this Alliance. Defaults to None.
 
-        return user_histories
+    Returns:
+        tuple[int, int, str, int, int] | None: A tuple of the rank, the `user_id`, the `user_name`, the `alliance_id` and the value of the `metric`. `None`, if the User isn't part of the Collection, isn't a member of the Alliance or has a missing value.
+    """
+    user = delta_storage.get_user_source()
+    value = getattr(user, metric.value)
+    conditions = [user.collection_id == collection_id, value.is_not(None)]
+    if alliance_id is not None:
+        conditions.append(user.alliance_id == alliance_id)
+
+    async with session:
+        query = select(user.user_id, user.user_name, user.alliance_id, value).where(*conditions, user.user_id == user_id)
+        with server_timing.phase("query"):
+            row = (await session.exec(query)).first()
+            if not row:
+                return None
+
+            count_query = select(func.count()).select_from(user).where(*conditions, value > row[-1])
+            users_ranked_higher = (await session.exec(count_query)).one()
+
+    return (users_ranked_higher + 1, *row)
 
 
 async def has_alliance_history(session: AsyncSession, alliance_id: int) -> bool:
@@ -416,6 +1375,24 @@ async def has_user_history(session: AsyncSession, user_id: int) -> bool:
         return user_history_count > 0
 
 
+async def record_entity_events(session: AsyncSession, from_collection_id: int, collection_id: int, collected_at: datetime) -> int:
+    """Replaces the events recorded for a Collection with the changes since the previous Collection. Doesn't commit.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        from_collection_id (int): The `collection_id` of the previous Collection.
+        collection_id (int): The `collection_id` of the Collection to record the events for.
+        collected_at (datetime): The `collected_at` timestamp of the Collection to record the events for.
+
+    Returns:
+        int: The number of recorded events.
+    """
+    await session.exec(delete(EntityEventDB).where(col(EntityEventDB.collection_id) == collection_id))
+    events = await _create_entity_events(session, from_collection_id, collection_id, collected_at)
+    session.add_all(events)
+    return len(events)
+
+
 async def save_collection(session: AsyncSession, collection: CollectionDB, include_alliances: bool, include_users: bool) -> CollectionDB:
     """Inserts a Collection into the database or updates an existing one.
 
@@ -426,21 +1403,86 @@ async def save_collection(session: AsyncSession, collection: CollectionDB, inclu
         include_users (bool): Determines, if the `alliances` related to the Collection should be saved to the database, too.
 
     Returns:
-        CollectionDB: The inserted or updated Collection.
+        CollectionDB: The inserted or updated Collection. If delta storage is enabled, its property `users` only holds the Users, that have changed since the previous Collection.
     """
+    started_at = time.perf_counter()
+    rows_by_table = {CollectionDB.__tablename__: 1}
     async with session:
+        unchanged_users = {}
+        if include_users and collection.users and SETTINGS.user_delta_storage_enabled:
+            unchanged_users = await _get_unchanged_users(session, collection)
+            collection.users = [user for user in collection.users if user.user_id not in unchanged_users]
+
         session.add(collection)
         if include_alliances and collection.alliances:
             for alliance in collection.alliances:
                 session.add(alliance)
+            rows_by_table[AllianceDB.__tablename__] = len(collection.alliances)
         if include_users and collection.users:
             for user in collection.users:
                 session.add(user)
+            rows_by_table[UserDB.__tablename__] = len(collection.users)
+        await session.flush()
+        if unchanged_users:
+            await delta_storage.carry_forward_users(session, collection.collection_id, unchanged_users)
+            rows_by_table[UserCarriedForwardDB.__tablename__] = len(unchanged_users)
+        rows_by_table[EntityEventDB.__tablename__] = await _refresh_entity_events(session, collection.collected_at, collection.collection_id)
+        rows_by_table[EntityNameDB.__tablename__] = await _refresh_entity_names(session, collection.collection_id, collection.collected_at)
+        rows_by_table[CollectionStatsDB.__tablename__] = await _refresh_collection_stats(session, collection.collection_id, collection.collected_at)
         await session.commit()
+        metrics.observe_ingest(rows_by_table, time.perf_counter() - started_at)
         await session.refresh(collection)
         return collection
 
 
+async def search_entity_names(
+    session: AsyncSession,
+    name: str,
+    entity_type: EntityType | None = None,
+    mode: ParameterSearchMode = ParameterSearchMode.PREFIX,
+    skip: int = 0,
+    take: int = 100,
+) -> list[EntityNameMatchDB]:
+    """Searches the names Alliances and Users have had. Every mode is served by the trigram index on the table `entity_name`.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        name (str): The name or part of a name to search for. Case-insensitive.
+        entity_type (EntityType, optional): Only search the names of this type of entity. Defaults to None.
+        mode (ParameterSearchMode, optional): Determines how names are matched. Defaults to ParameterSearchMode.PREFIX.
+        skip (int, optional): Skip this number of results from the result set. Defaults to 0.
+        take (int, optional): Limit the number of results returned. Defaults to 100.
+
+    Returns:
+        list[EntityNameMatchDB]: The matching names and their trigram similarity to `name`, ordered by similarity and the most recently seen names first.
+    """
+    async with session:
+        score = func.similarity(EntityNameDB.name, name)
+        query = select(EntityNameDB, score)
+        if entity_type:
+            query = query.where(EntityNameDB.entity_type == entity_type)
+        match mode:
+            case ParameterSearchMode.PREFIX:
+                query = query.where(col(EntityNameDB.name).istartswith(name, autoescape=True))
+            case ParameterSearchMode.SUBSTRING:
+                query = query.where(col(EntityNameDB.name).icontains(name, autoescape=True))
+            case ParameterSearchMode.SIMILAR:
+                # Uses the threshold `pg_trgm.similarity_threshold`, which defaults to 0.3.
+                query = query.where(col(EntityNameDB.name).op("%")(name))
+        query = query.order_by(
+            score.desc(),
+            col(EntityNameDB.last_seen_at).desc(),
+            col(EntityNameDB.entity_type),
+            col(EntityNameDB.entity_id),
+            col(EntityNameDB.name),
+        )
+        query = query.offset(skip).limit(take)
+
+        with server_timing.phase("query"):
+            matches = (await session.exec(query)).all()
+        return [(entity_name, score) for entity_name, score in matches]
+
+
 async def update_collection(session: AsyncSession, collection_id: int, new_collection: CollectionDB) -> CollectionDB:
     """Inserts a Collection into the database or updates an existing one.
 
@@ -454,10 +1496,12 @@ async def update_collection(session: AsyncSession, collection_id: int, new_colle
     """
     async with session:
         collection = await get_collection(session, collection_id, True, True)
+        await delta_storage.expand_users(session, collection_id)
 
         collection.duration = new_collection.duration
         collection.fleet_count = new_collection.fleet_count
         collection.max_tournament_battle_attempts = new_collection.max_tournament_battle_attempts
+        collection.modified_at = utils.remove_timezone(datetime.now(timezone.utc))
         collection.tournament_running = new_collection.tournament_running
         collection.user_count = new_collection.user_count
 
@@ -502,6 +1546,10 @@ async def update_collection(session: AsyncSession, collection_id: int, new_colle
             session.add(alliance)
         for user in collection.users:
             session.add(user)
+        await session.flush()
+        await _refresh_entity_events(session, collection.collected_at, collection.collection_id)
+        await _refresh_entity_names(session, collection.collection_id, collection.collected_at)
+        await _refresh_collection_stats(session, collection.collection_id, collection.collected_at)
         await session.commit()
         await session.refresh(collection)
         return collection
@@ -595,6 +1643,26 @@ def _apply_order_by_collected_at_to_query(query: SelectOfScalar | Select, desc:
     return query
 
 
+def _apply_start_after_to_query(
+    query: SelectOfScalar | Select, start_after: datetime | None, desc: bool, entity_type: type = CollectionDB
+) -> SelectOfScalar | Select:
+    """Restricts the given Select `query` to data following the last entry of the previous page in the requested sort direction.
+
+    Args:
+        query (SelectOfScalar | Select): The query to be modified.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page.
+        desc (bool): Specifies the sort direction of the returned data.
+
+    Returns:
+        SelectOfScalar | Select: The modified query.
+    """
+    if start_after is None:
+        return query
+    if desc:
+        return query.where(entity_type.collected_at < start_after)
+    return query.where(entity_type.collected_at > start_after)
+
+
 async def _get_collections_on_missing_empty_or_null(
     session: AsyncSession,
     from_date: datetime | None,
@@ -604,6 +1672,7 @@ async def _get_collections_on_missing_empty_or_null(
     skip: int,
     take: int,
     on_missing: ParameterOnMissing,
+    start_after: datetime | None = None,
 ) -> list[CollectionDB]:
     """Retrieves collections with handling for missing data by filling with empty or null entries.
 
@@ -616,27 +1685,17 @@ async def _get_collections_on_missing_empty_or_null(
         skip (int): Number of records to skip.
         take (int): Number of records to take.
         on_missing (ParameterOnMissing): How to handle missing data.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page.
 
     Returns:
         list[CollectionDB]: The list of collections with missing data handled.
     """
     from_date, to_date = _get_date_defaults(from_date, to_date)
-
-    hour_series = select(
-        func.generate_series(
-            from_date + timedelta(minutes=59),
-            to_date + timedelta(minutes=59),
-            text("interval '1 hour'"),
-        ).label("collected_at")
-    ).cte("hour_series")
+    timestamps = _get_expected_timestamps(from_date, to_date, interval, desc, skip, take, start_after)
+    if not timestamps:
+        return []
 
     async with session:
-        query_hour_series = select(hour_series)
-        query_hour_series = _apply_select_parameters_to_query(query_hour_series, from_date, to_date, interval, desc, entity_type=hour_series.c)
-        query_hour_series = query_hour_series.offset(skip).limit(take)
-
-        timestamps = (await session.exec(query_hour_series)).all()
-
         query_collections = select(CollectionDB).where(col(CollectionDB.collected_at).in_(timestamps))
 
         collections = (await session.exec(query_collections)).all()
@@ -672,6 +1731,7 @@ async def _get_collections_on_missing_last(
     desc: bool,
     skip: int,
     take: int,
+    start_after: datetime | None = None,
 ) -> list[CollectionDB]:
     """Retrieves collections within the specified date range, filling missing intervals with the last available collection for that interval.
 
@@ -683,11 +1743,17 @@ async def _get_collections_on_missing_last(
         desc (bool): Whether to order the results in descending order by collected_at.
         skip (int): The number of results to skip.
         take (int): The number of results to take.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page.
 
     Returns:
         list[CollectionDB]: A list of CollectionDB objects, with missing intervals filled by the last collection in that interval.
     """
     from_date, to_date = _get_date_defaults(from_date, to_date)
+    if start_after and desc:
+        # The previous page ended with the last Collection of an interval, so the next page starts with the interval before.
+        to_date = min(to_date, _truncate_to_interval(start_after, interval) - timedelta(microseconds=1))
+    elif start_after:
+        from_date = max(from_date, start_after + timedelta(microseconds=1))
 
     async with session:
         date_trunc_type = DATE_TRUNC_TYPE_BY_INTERVAL.get(interval)
@@ -723,6 +1789,7 @@ async def _get_collections_on_missing_skip(
     desc: bool,
     skip: int,
     take: int,
+    start_after: datetime | None = None,
 ) -> list[CollectionDB]:
     """Retrieves collections within the specified date range, skipping missing intervals.
 
@@ -734,6 +1801,7 @@ async def _get_collections_on_missing_skip(
         desc (bool): Whether to order the results in descending order by collected_at.
         skip (int): The number of results to skip.
         take (int): The number of results to take.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page.
 
     Returns:
         list[CollectionDB]: A list of CollectionDB objects.
@@ -742,12 +1810,587 @@ async def _get_collections_on_missing_skip(
         entity_type = CollectionDB
         query = select(entity_type)
         query = _apply_select_parameters_to_query(query, from_date, to_date, interval, desc, entity_type=entity_type)
+        query = _apply_start_after_to_query(query, start_after, desc, entity_type)
         query = query.offset(skip).limit(take)
 
         collections = (await session.exec(query)).all()
         return list(collections)
 
 
+async def _create_entity_events(session: AsyncSession, from_collection_id: int, collection_id: int, collected_at: datetime) -> list[EntityEventDB]:
+    """Compares the Alliances and Users of a Collection with the ones of the previous Collection and creates the events to be recorded for the later one.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        from_collection_id (int): The `collection_id` of the previous Collection.
+        collection_id (int): The `collection_id` of the Collection to record the events for.
+        collected_at (datetime): The `collected_at` timestamp of the Collection to record the events for.
+
+    Returns:
+        list[EntityEventDB]: The events to be recorded.
+    """
+    events = []
+    for entity_type, entity_db_type, id_column_name, column_names, get_events in (
+        (EntityType.ALLIANCE, AllianceDB, "alliance_id", ALLIANCE_EVENT_COLUMNS, _get_alliance_events),
+        (EntityType.USER, delta_storage.get_user_source(), "user_id", USER_EVENT_COLUMNS, _get_user_events),
+    ):
+        query = _get_entity_changes_query(entity_db_type, id_column_name, column_names, from_collection_id, collection_id)
+        for row in await session.exec(query):
+            events.extend(
+                EntityEventDB(
+                    collection_id=collection_id,
+                    collected_at=collected_at,
+                    entity_type=entity_type,
+                    entity_id=row.entity_id,
+                    event_type=event_type,
+                    old_value=None if old_value is None else str(old_value),
+                    new_value=None if new_value is None else str(new_value),
+                )
+                for event_type, old_value, new_value in get_events(row._mapping)
+            )
+    return events
+
+
+async def _get_unchanged_users(session: AsyncSession, collection: CollectionDB) -> dict[int, int]:
+    """Compares the Users of a Collection to be inserted with the Users of the previous Collection.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collection (CollectionDB): The Collection to be inserted.
+
+    Returns:
+        dict[int, int]: The `collection_id` of the Collection holding the data of each unchanged User by `user_id`.
+    """
+    previous_collection = await _get_adjacent_collection(session, collection.collected_at, True)
+    if not previous_collection:
+        return {}
+
+    previous_users = await delta_storage.get_user_snapshot(session, previous_collection[0])
+    return delta_storage.get_unchanged_users(previous_users, ((user.user_id, delta_storage.get_user_values(user)) for user in collection.users))
+
+
+async def _get_adjacent_collection(session: AsyncSession, collected_at: datetime, previous: bool) -> tuple[int, datetime] | None:
+    """Looks up the Collection collected right before or after the given timestamp.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collected_at (datetime): The timestamp to look up the adjacent Collection for.
+        previous (bool): Look up the previous Collection, if `True`. Else, look up the next one.
+
+    Returns:
+        tuple[int, datetime] | None: The `collection_id` and `collected_at` of the adjacent Collection, if there's one.
+    """
+    query = select(CollectionDB.collection_id, CollectionDB.collected_at)
+    if previous:
+        query = query.where(CollectionDB.collected_at < collected_at).order_by(col(CollectionDB.collected_at).desc())
+    else:
+        query = query.where(CollectionDB.collected_at > collected_at).order_by(col(CollectionDB.collected_at).asc())
+    result = (await session.exec(query.limit(1))).first()
+    return tuple(result) if result else None
+
+
+def _get_alliance_events(values: RowMapping) -> list[tuple[EntityEventType, int | str | None, int | str | None]]:
+    """Converts a row returned by a query created by `_get_entity_changes_query` comparing the `ALLIANCE_EVENT_COLUMNS` to events.
+
+    An Alliance appearing or disappearing can also mean, that it entered or left the top 100 fleets.
+
+    Args:
+        values (RowMapping): The row to convert.
+
+    Returns:
+        list[tuple[EntityEventType, int | str | None, int | str | None]]: Tuples of the event type, the old and the new value.
+    """
+    if values["old_id"] is None:
+        return [(EntityEventType.ALLIANCE_CREATED, None, values["new_alliance_name"])]
+    if values["new_id"] is None:
+        return [(EntityEventType.ALLIANCE_DISBANDED, values["old_alliance_name"], None)]
+
+    events = []
+    if values["old_alliance_name"] != values["new_alliance_name"]:
+        events.append((EntityEventType.RENAMED, values["old_alliance_name"], values["new_alliance_name"]))
+    if values["old_division_design_id"] != values["new_division_design_id"]:
+        events.append((EntityEventType.DIVISION_CHANGED, values["old_division_design_id"], values["new_division_design_id"]))
+    return events
+
+
+def _get_user_events(values: RowMapping) -> list[tuple[EntityEventType, int | str | None, int | str | None]]:
+    """Converts a row returned by a query created by `_get_entity_changes_query` comparing the `USER_EVENT_COLUMNS` to events.
+
+    A User switching Alliances leaves one Alliance and joins another one. A User appearing or disappearing while in an Alliance joined or left that Alliance.
+    Since Users are only tracked while they're in one of the top 100 fleets or among the top 100 players, this can also mean, that the Alliance entered or left the top 100 fleets.
+
+    Args:
+        values (RowMapping): The row to convert.
+
+    Returns:
+        list[tuple[EntityEventType, int | str | None, int | str | None]]: Tuples of the event type, the old and the new value.
+    """
+    if values["old_id"] is None:
+        return [(EntityEventType.JOINED_ALLIANCE, None, values["new_alliance_id"])] if values["new_alliance_id"] else []
+    if values["new_id"] is None:
+        return [(EntityEventType.LEFT_ALLIANCE, values["old_alliance_id"], None)] if values["old_alliance_id"] else []
+
+    events = []
+    if values["old_user_name"] != values["new_user_name"]:
+        events.append((EntityEventType.RENAMED, values["old_user_name"], values["new_user_name"]))
+    if values["old_alliance_id"] != values["new_alliance_id"]:
+        if values["old_alliance_id"]:
+            events.append((EntityEventType.LEFT_ALLIANCE, values["old_alliance_id"], None))
+        if values["new_alliance_id"]:
+            events.append((EntityEventType.JOINED_ALLIANCE, None, values["new_alliance_id"]))
+    elif values["old_alliance_membership"] != values["new_alliance_membership"]:
+        events.append((EntityEventType.RANK_CHANGED, values["old_alliance_membership"], values["new_alliance_membership"]))
+    return events
+
+
+def _get_entity_changes_query(
+    entity_type: type[AllianceDB | UserDB] | AliasedClass[UserDB],
+    id_column_name: str,
+    column_names: Sequence[str],
+    from_collection_id: int,
+    to_collection_id: int,
+) -> Select:
+    """Creates a query comparing the entities of two Collections with a full outer join on the entity ID. Only entities present in one Collection or with differing values in one of the specified columns are returned.
+
+    Args:
+        entity_type (type[AllianceDB | UserDB] | AliasedClass[UserDB]): The type of the entities to compare.
+        id_column_name (str): The name of the column holding the ID of the entities.
+        column_names (Sequence[str]): The names of the columns to compare.
+        from_collection_id (int): The `collection_id` of the earlier Collection.
+        to_collection_id (int): The `collection_id` of the later Collection.
+
+    Returns:
+        Select: The query returning the columns `entity_id`, `old_id`, `new_id` and `old_{column}` and `new_{column}` for each compared column ordered by `entity_id`.
+    """
+    selected_columns = [getattr(entity_type, column_name) for column_name in (id_column_name, *column_names)]
+    old = select(*selected_columns).where(entity_type.collection_id == from_collection_id).subquery("old")
+    new = select(*selected_columns).where(entity_type.collection_id == to_collection_id).subquery("new")
+    old_id = old.c[id_column_name]
+    new_id = new.c[id_column_name]
+
+    entity_id = func.coalesce(old_id, new_id).label("entity_id")
+    query = (
+        select(
+            entity_id,
+            old_id.label("old_id"),
+            new_id.label("new_id"),
+            *(old.c[column_name].label(f"old_{column_name}") for column_name in column_names),
+            *(new.c[column_name].label(f"new_{column_name}") for column_name in column_names),
+        )
+        .select_from(old.join(new, old_id == new_id, full=True))
+        .where(or_(old_id.is_(None), new_id.is_(None), *(old.c[column_name].is_distinct_from(new.c[column_name]) for column_name in column_names)))
+        .order_by(entity_id)
+    )
+    return query
+
+
+def _get_entity_histories_query(
+    entity_type: type[AllianceDB] | type[UserDB] | AliasedClass[UserDB],
+    id_column: InstrumentedAttribute,
+    entity_ids: Sequence[int],
+    collection_id: int | None,
+    from_date: datetime | None,
+    to_date: datetime | None,
+    interval: ParameterInterval,
+    desc: bool,
+    skip: int,
+    take: int,
+) -> Select:
+    """Creates a query selecting the entries of multiple Alliances or Users and their Collections. The entities are filtered with a single `= ANY(...)` comparison and the entries get numbered per entity, so that `skip` and `take` apply to each entity separately.
+
+    Args:
+        entity_type (type[AllianceDB] | type[UserDB] | AliasedClass[UserDB]): The table to select from.
+        id_column (InstrumentedAttribute): The column identifying an entity, `alliance_id` or `user_id`.
+        entity_ids (Sequence[int]): The IDs of the entities to select.
+        collection_id (int, optional): Only select entries from the Collection with this `collection_id`. If specified, `from_date`, `to_date` and `interval` are ignored.
+        from_date (datetime, optional): Specifies the earliest date to return data from.
+        to_date (datetime, optional): Specifies the latest date to return data from.
+        interval (ParameterInterval): Specifies the interval of the data to be returned.
+        desc (bool): Specifies the sort direction of the returned data.
+        skip (int): The number of entries to skip per entity.
+        take (int): The number of entries to select per entity.
+
+    Returns:
+        Select: The query selecting tuples of the entity and its Collection.
+    """
+    collected_at_order = col(CollectionDB.collected_at).desc() if desc else col(CollectionDB.collected_at).asc()
+    position = func.row_number().over(partition_by=id_column, order_by=collected_at_order).label("position")
+    ranked = (
+        select(entity_type.collection_id, id_column, position)
+        .join(CollectionDB, entity_type.collection_id == CollectionDB.collection_id)
+        .where(col(id_column) == any_(bindparam("entity_ids", list(entity_ids), type_=postgresql.ARRAY(Integer))))
+    )
+    if collection_id is None:
+        ranked = _apply_datetime_limits_to_query(ranked, from_date, to_date)
+        ranked = _apply_interval_to_query(ranked, interval)
+    else:
+        ranked = ranked.where(entity_type.collection_id == collection_id)
+    ranked = ranked.subquery()
+
+    query = (
+        select(entity_type, CollectionDB)
+        .join(ranked, and_(entity_type.collection_id == ranked.c.collection_id, id_column == ranked.c[id_column.key]))
+        .join(CollectionDB, entity_type.collection_id == CollectionDB.collection_id)
+        .where(ranked.c.position > skip)
+        .where(ranked.c.position <= skip + take)
+    )
+    return _apply_order_by_collected_at_to_query(query, desc)
+
+
+def _get_tournaments_query() -> Subquery:
+    """Creates a subquery detecting the tournaments from the Collections collected during them.
+
+    Returns:
+        Subquery: A subquery with the columns `started_at`, `ended_at` and `collection_count` of each tournament.
+    """
+    # Only the Collections collected during a tournament are read, which is covered by the partial index on `collected_at`.
+    gaps = (
+        select(
+            CollectionDB.collected_at,
+            (CollectionDB.collected_at - func.lag(CollectionDB.collected_at).over(order_by=CollectionDB.collected_at)).label("gap"),
+        )
+        .where(col(CollectionDB.tournament_running))
+        .subquery()
+    )
+    is_start = case((or_(gaps.c.gap.is_(None), gaps.c.gap > TOURNAMENT_GAP), 1), else_=0)
+    numbered = select(gaps.c.collected_at, func.sum(is_start).over(order_by=gaps.c.collected_at).label("tournament_number")).subquery()
+    return (
+        select(
+            func.min(numbered.c.collected_at).label("started_at"),
+            func.max(numbered.c.collected_at).label("ended_at"),
+            func.count().label("collection_count"),
+        )
+        .group_by(numbered.c.tournament_number)
+        .subquery("tournament")
+    )
+
+
+async def _load_alliance_users(session: AsyncSession, alliances: Sequence[AllianceDB]):
+    """Populates the property `users` of Alliances with a single query. Unlike `selectinload(AllianceDB.users)`, this includes Users carried forward, if delta storage is enabled.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        alliances (Sequence[AllianceDB]): The Alliances to populate.
+    """
+    if not alliances:
+        return
+
+    user = delta_storage.get_user_source()
+    alliance_keys = {(alliance.collection_id, alliance.alliance_id) for alliance in alliances}
+    query = select(user).where(tuple_(user.collection_id, user.alliance_id).in_(list(alliance_keys)))
+
+    users_by_alliance_key = defaultdict(list)
+    for alliance_user in (await session.exec(query)).all():
+        users_by_alliance_key[(alliance_user.collection_id, alliance_user.alliance_id)].append(alliance_user)
+    for alliance in alliances:
+        alliance.users = users_by_alliance_key[(alliance.collection_id, alliance.alliance_id)]
+        for alliance_user in alliance.users:
+            alliance_user.alliance = alliance
+
+
+async def _refresh_entity_events(session: AsyncSession, collected_at: datetime, collection_id: int | None = None) -> int:
+    """Replaces the events recorded for a Collection and for the Collection following it with the changes since their respective previous Collection. Needs to be called after a Collection has been inserted, updated or deleted. Doesn't commit.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collected_at (datetime): The `collected_at` timestamp of the inserted, updated or deleted Collection.
+        collection_id (int, optional): The `collection_id` of the inserted or updated Collection. Defaults to None, which only refreshes the events of the following Collection.
+
+    Returns:
+        int: The number of recorded events.
+    """
+    collections = [(collection_id, collected_at)] if collection_id is not None else []
+    next_collection = await _get_adjacent_collection(session, collected_at, False)
+    if next_collection:
+        collections.append(next_collection)
+
+    event_count = 0
+    for refreshed_collection_id, refreshed_collected_at in collections:
+        previous_collection = await _get_adjacent_collection(session, refreshed_collected_at, True)
+        if previous_collection:
+            event_count += await record_entity_events(session, previous_collection[0], refreshed_collection_id, refreshed_collected_at)
+        else:
+            await session.exec(delete(EntityEventDB).where(col(EntityEventDB.collection_id) == refreshed_collection_id))
+    return event_count
+
+
+async def _refresh_collection_stats(session: AsyncSession, collection_id: int, collected_at: datetime) -> int:
+    """Computes the aggregated numbers of a Collection, including the Users carried forward, and stores them. Needs to be called after a Collection has been inserted or updated. Doesn't commit.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collection_id (int): The `collection_id` of the inserted or updated Collection.
+        collected_at (datetime): The `collected_at` timestamp of the Collection.
+
+    Returns:
+        int: The number of inserted or updated rows.
+    """
+    user = delta_storage.get_user_source()
+    last_login_date = user.last_login_date
+    totals_query = select(
+        func.count(),
+        func.coalesce(func.sum(user.trophy), 0),
+        func.avg(user.trophy),
+        func.coalesce(func.sum(user.alliance_score), 0),
+        *(func.count().filter(last_login_date >= collected_at - timedelta(days=days)) for days in (1, 7, 30)),
+    ).where(user.collection_id == collection_id)
+    alliance_count_query = select(func.count()).select_from(AllianceDB).where(AllianceDB.collection_id == collection_id)
+    division_query = (
+        select(AllianceDB.division_design_id, func.count())
+        .join(user, and_(user.collection_id == AllianceDB.collection_id, user.alliance_id == AllianceDB.alliance_id))
+        .where(AllianceDB.collection_id == collection_id)
+        .group_by(AllianceDB.division_design_id)
+    )
+    membership_query = select(user.alliance_membership, func.count()).where(user.collection_id == collection_id).group_by(user.alliance_membership)
+
+    user_count, trophy_total, trophy_average, alliance_score_total, *active_user_counts = (await session.exec(totals_query)).one()
+    users_by_membership = defaultdict(int)
+    for membership, count in (await session.exec(membership_query)).all():
+        users_by_membership[membership or UserAllianceMembership.NONE.value] += count
+    stats = {
+        "collection_id": collection_id,
+        "user_count": user_count,
+        "alliance_count": (await session.exec(alliance_count_query)).one(),
+        "trophy_total": trophy_total,
+        "trophy_average": None if trophy_average is None else float(trophy_average),
+        "alliance_score_total": alliance_score_total,
+        "active_user_count_day": active_user_counts[0],
+        "active_user_count_week": active_user_counts[1],
+        "active_user_count_month": active_user_counts[2],
+        "users_by_division": {str(division_design_id): count for division_design_id, count in (await session.exec(division_query)).all()},
+        "users_by_membership": dict(users_by_membership),
+    }
+
+    statement = postgresql.insert(CollectionStatsDB).values(**stats)
+    statement = statement.on_conflict_do_update(
+        index_elements=["collection_id"], set_={key: value for key, value in stats.items() if key != "collection_id"}
+    )
+    return (await session.exec(statement)).rowcount
+
+
+async def _refresh_entity_names(session: AsyncSession, collection_id: int, collected_at: datetime) -> int:
+    """Records the names of the Alliances and Users of a Collection, including the Users carried forward, and widens the time frame, in which the names have been seen. Needs to be called after a Collection has been inserted or updated. Doesn't commit.
+
+    Names are not removed, when a Collection gets deleted, so the time frame of a name may include Collections that don't exist anymore.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collection_id (int): The `collection_id` of the inserted or updated Collection.
+        collected_at (datetime): The `collected_at` timestamp of the Collection.
+
+    Returns:
+        int: The number of inserted or updated names.
+    """
+    user = delta_storage.get_user_source()
+    seen_at = literal(collected_at, DateTime)
+    sources = [
+        select(literal(EntityType.ALLIANCE.value, String), AllianceDB.alliance_id, AllianceDB.alliance_name, seen_at, seen_at).where(
+            AllianceDB.collection_id == collection_id
+        ),
+        select(literal(EntityType.USER.value, String), user.user_id, user.user_name, seen_at, seen_at).where(user.collection_id == collection_id),
+    ]
+
+    column_names = ["entity_type", "entity_id", "name", "first_seen_at", "last_seen_at"]
+    name_count = 0
+    for source in sources:
+        statement = postgresql.insert(EntityNameDB).from_select(column_names, source)
+        statement = statement.on_conflict_do_update(
+            index_elements=["entity_type", "entity_id", "name"],
+            set_={
+                "first_seen_at": func.least(EntityNameDB.first_seen_at, statement.excluded.first_seen_at),
+                "last_seen_at": func.greatest(EntityNameDB.last_seen_at, statement.excluded.last_seen_at),
+            },
+        )
+        name_count += (await session.exec(statement)).rowcount
+    return name_count
+
+
+async def _stream_entity_changes(session: AsyncSession, query: Select, change_by_column: dict[str, EntityChange]) -> AsyncIterator[EntityChangeDB]:
+    """Executes a query created by `_get_entity_changes_query` with a server-side cursor and converts the rows to changes.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        query (Select): The query to execute.
+        change_by_column (dict[str, EntityChange]): The compared columns and the change reported for them. The first column holds the name of the entity.
+
+    Yields:
+        tuple[int, str, int | str | None, int | str | None]: A tuple of the entity ID, the change as an `EntityChange`, the old and the new value.
+    """
+    name_column = next(iter(change_by_column))
+
+    async with session:
+        with server_timing.phase("query"):
+            result = await session.stream(query.execution_options(yield_per=1_000))
+        async for row in result:
+            values = row._mapping
+            if row.old_id is None:
+                yield (row.entity_id, EntityChange.APPEARED, None, values[f"new_{name_column}"])
+            elif row.new_id is None:
+                yield (row.entity_id, EntityChange.DISAPPEARED, values[f"old_{name_column}"], None)
+            else:
+                for column_name, change in change_by_column.items():
+                    if values[f"old_{column_name}"] != values[f"new_{column_name}"]:
+                        yield (row.entity_id, change, values[f"old_{column_name}"], values[f"new_{column_name}"])
+
+
+def _get_expected_timestamps(
+    from_date: datetime, to_date: datetime, interval: ParameterInterval, desc: bool, skip: int, take: int, start_after: datetime | None = None
+) -> list[datetime]:
+    """Calculates the timestamps at which Collections are expected within the requested page, without querying the database.
+
+    Collections are expected 59 minutes after every full hour following `from_date`. With a daily interval, only the ones at 23:59 are expected and with a monthly interval, only the ones at 23:59 on the last day of a month. The effort depends on `take` only, not on the length of the time span.
+
+    Args:
+        from_date (datetime): The earliest date to return data from.
+        to_date (datetime): The latest date to return data from.
+        interval (ParameterInterval): The interval of the expected timestamps.
+        desc (bool): Whether to return the timestamps in descending order.
+        skip (int): The number of timestamps to skip.
+        take (int): The maximum number of timestamps to return.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page. Defaults to None.
+
+    Returns:
+        list[datetime]: The expected timestamps of the requested page.
+    """
+    first_timestamp = from_date + timedelta(minutes=59)
+
+    if interval == ParameterInterval.MONTHLY:
+        first_index, last_index = _get_month_index_range(first_timestamp, to_date, desc, start_after)
+
+        def get_timestamp(index: int) -> datetime:
+            return _get_end_of_month(index, first_timestamp)
+    else:
+        step = timedelta(hours=1)
+        if interval == ParameterInterval.DAILY:
+            step = timedelta(days=1)
+            first_timestamp += timedelta(hours=(23 - first_timestamp.hour) % 24)
+        first_index = 0
+        last_index = (to_date - first_timestamp) // step
+        if start_after and desc:
+            last_index = min(last_index, -((first_timestamp - start_after) // step) - 1)
+        elif start_after:
+            first_index = max(first_index, (start_after - first_timestamp) // step + 1)
+
+        def get_timestamp(index: int) -> datetime:
+            return first_timestamp + index * step
+
+    count = last_index - first_index + 1
+    indexes = range(skip, min(skip + take, count))
+    if desc:
+        return [get_timestamp(last_index - index) for index in indexes]
+    return [get_timestamp(first_index + index) for index in indexes]
+
+
+async def _get_histogram(session: AsyncSession, value: InstrumentedAttribute, conditions: list, buckets: int) -> HistogramDB:
+    """Computes the distribution of the `value` of the rows matching the `conditions`.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        value (InstrumentedAttribute): The column to compute the distribution of.
+        conditions (list): The conditions the rows need to match. Must exclude rows with a missing value.
+        buckets (int): The number of buckets.
+
+    Returns:
+        tuple[int, int | None, int | None, list[tuple[float, int]], list[int]]: A tuple of the number of rows, the lowest and the highest value, the values at the `HISTOGRAM_PERCENTILES` and the number of rows per bucket.
+    """
+    async with session:
+        bounds_query = select(
+            func.count(),
+            func.min(value),
+            func.max(value),
+            *(func.percentile_disc(fraction).within_group(value) for fraction in HISTOGRAM_PERCENTILES),
+        ).where(*conditions)
+        with server_timing.phase("query"):
+            count, min_value, max_value, *percentile_values = (await session.exec(bounds_query)).one()
+            if not count:
+                return (0, None, None, [], [])
+
+            bucket = func.width_bucket(cast(value, Float), float(min_value), float(max_value + 1), buckets).label("bucket")
+            buckets_query = select(bucket, func.count()).where(*conditions).group_by(bucket.name)
+            count_by_bucket = dict((await session.exec(buckets_query)).all())
+
+    percentiles = list(zip(HISTOGRAM_PERCENTILES, percentile_values, strict=True))
+    bucket_counts = [count_by_bucket.get(index, 0) for index in range(1, buckets + 1)]
+    return (count, min_value, max_value, percentiles, bucket_counts)
+
+
+async def _rank_leaderboard_rows(
+    session: AsyncSession, count_query: SelectOfScalar, value: InstrumentedAttribute, rows: Sequence, skip: int
+) -> list[tuple]:
+    """Prepends the rank to the rows of a page of a leaderboard ordered descending by their last column. Rows with equal values share a rank, the next distinct value is ranked by its position. The session will not be closed.
+
+    Only the rank of the first row may depend on the previous pages, if its value is tied with them, so it's counted in the database.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        count_query (SelectOfScalar): The query counting all ranked rows.
+        value (InstrumentedAttribute): The column ranked by.
+        rows (Sequence): The rows of the page.
+        skip (int): The number of rows on the previous pages.
+
+    Returns:
+        list[tuple]: The rows with the rank as their first element.
+    """
+    if not rows:
+        return []
+
+    rank = 1
+    if skip:
+        rank += (await session.exec(count_query.where(value > rows[0][-1]))).one()
+
+    ranked_rows = []
+    for index, row in enumerate(rows):
+        if index and row[-1] != rows[index - 1][-1]:
+            rank = skip + index + 1
+        ranked_rows.append((rank, *row))
+    return ranked_rows
+
+
+def _get_month_index_range(first_timestamp: datetime, to_date: datetime, desc: bool, start_after: datetime | None) -> tuple[int, int]:
+    """Determines the months, whose last hour lies between `first_timestamp` and `to_date` and follows `start_after` in the requested sort direction.
+
+    Args:
+        first_timestamp (datetime): The earliest expected timestamp. Provides the minutes, seconds and microseconds of all expected timestamps.
+        to_date (datetime): The latest date to return data from.
+        desc (bool): Whether the timestamps are returned in descending order.
+        start_after (datetime, optional): The timestamp of the last entry of the previous page.
+
+    Returns:
+        tuple[int, int]: The indexes of the first and the last month as the number of months since the year 0.
+    """
+    first_index = first_timestamp.year * 12 + first_timestamp.month - 1
+    if _get_end_of_month(first_index, first_timestamp) < first_timestamp:
+        first_index += 1
+    last_index = to_date.year * 12 + to_date.month - 1
+    if _get_end_of_month(last_index, first_timestamp) > to_date:
+        last_index -= 1
+
+    if start_after:
+        start_after_index = start_after.year * 12 + start_after.month - 1
+        end_of_month = _get_end_of_month(start_after_index, first_timestamp)
+        if desc:
+            last_index = min(last_index, start_after_index if end_of_month < start_after else start_after_index - 1)
+        else:
+            first_index = max(first_index, start_after_index if end_of_month > start_after else start_after_index + 1)
+
+    return first_index, last_index
+
+
+def _get_end_of_month(month_index: int, time_of_day: datetime) -> datetime:
+    """Returns the last hour of a month with the minutes, seconds and microseconds of `time_of_day`.
+
+    Args:
+        month_index (int): The number of months since the year 0.
+        time_of_day (datetime): Provides the minutes, seconds and microseconds.
+
+    Returns:
+        datetime: The last hour of the month.
+    """
+    year, month = divmod(month_index, 12)
+    month += 1
+    return time_of_day.replace(year=year, month=month, day=calendar.monthrange(year, month)[1], hour=23)
+
+
 def _get_date_defaults(from_date: datetime | None, to_date: datetime | None) -> tuple[datetime, datetime]:
     """Returns default values for `from_date` and `to_date` if they are not provided and removes timezone information from the provided dates.
 
@@ -765,17 +2408,59 @@ def _get_date_defaults(from_date: datetime | None, to_date: datetime | None) ->
     return utils.remove_timezone(from_date), utils.remove_timezone(to_date)
 
 
+def _truncate_to_interval(dt: datetime, interval: ParameterInterval) -> datetime:
+    """Returns the start of the hour, day or month containing `dt`.
+
+    Args:
+        dt (datetime): The `datetime` to be truncated.
+        interval (ParameterInterval): The interval to truncate to.
+
+    Returns:
+        datetime: The truncated `datetime`.
+    """
+    dt = dt.replace(minute=0, second=0, microsecond=0)
+    if interval in (ParameterInterval.DAILY, ParameterInterval.MONTHLY):
+        dt = dt.replace(hour=0)
+    if interval == ParameterInterval.MONTHLY:
+        dt = dt.replace(day=1)
+    return dt
+
+
 __all__ = [
     "create_tables",
     "delete_collection",
     "drop_tables",
+    "get_alliance_changes",
     "get_alliance_from_collection",
+    "get_alliance_histogram",
+    "get_alliance_histories",
     "get_alliance_history",
+    "get_alliance_leaderboard",
     "get_collection",
+    "get_collection_stats",
+    "get_collection_stats_history",
     "get_collections",
+    "get_division_standings",
+    "get_entity_names",
+    "get_events",
+    "get_histogram",
+    "get_latest_collection",
+    "get_page_timestamps",
     "get_top_100_from_collection",
+    "get_top_movers",
+    "get_tournament",
+    "get_tournament_alliance_progression",
+    "get_tournament_user_deltas",
+    "get_tournaments",
+    "get_user_changes",
     "get_user_from_collection",
+    "get_user_histories",
     "get_user_history",
+    "get_user_history_deltas",
+    "get_user_leaderboard",
+    "get_user_rank",
     "has_collection",
+    "record_entity_events",
     "save_collection",
+    "search_entity_names",
 ]
@@ -1,26 +1,105 @@
+import asyncio
 import io
+import itertools
 import json
+import math
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import AsyncGenerator
 
 import alembic.command
 import sqlalchemy_utils
 from alembic.config import Config as AlembicConfig
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import text
 from sqlmodel import SQLModel, create_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .. import utils
 from ..config import SETTINGS
 from . import crud
 
 # v Required for SQLModel.metadata.drop_all()
-from .models import AllianceBaseDB, AllianceDB, CollectionBaseDB, CollectionDB, UserBaseDB, UserDB  # noqa: F401
+from .models import (  # noqa: F401
+    AllianceBaseDB,
+    AllianceDB,
+    CollectionBaseDB,
+    CollectionDB,
+    EntityEventDB,
+    EntityNameDB,
+    RateLimitBucketDB,
+    UserBaseDB,
+    UserCarriedForwardDB,
+    UserDB,
+)
+
+
+READ_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+READ_YOUR_WRITES_COOKIE: str = "read_primary_until"
+"""Set on responses to requests, which committed a write. Contains the UNIX timestamp until which the reads of the client are sent to the primary `ENGINE`, so that it can read its own writes, even if the read replicas lag behind. Clients not keeping cookies can send it back manually."""
+
+
+@dataclass
+class ReadReplica:
+    """
+    A read-only replica of the primary database.
+    """
+
+    engine: AsyncEngine
+    healthy: bool = True
+
+
+@dataclass
+class PrimaryPin:
+    """
+    The time until which the reads of the client of the current request are to be sent to the primary `ENGINE`.
+    """
+
+    pinned_until: float = 0.0
+
+
+class ReadYourWritesMiddleware:
+    """
+    Sets the cookie `READ_YOUR_WRITES_COOKIE` on responses to requests, which committed a write. The pin is set, when the write is committed, and travels with the client,
+    so that its following reads are sent to the primary, no matter which worker process serves them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] in READ_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        pin = PrimaryPin()
+        token = _CURRENT_PIN.set(pin)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and pin.pinned_until:
+                max_age = math.ceil(SETTINGS.read_your_writes_window)
+                headers = MutableHeaders(scope=message)
+                headers.append("Set-Cookie", f"{READ_YOUR_WRITES_COOKIE}={pin.pinned_until:.3f}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _CURRENT_PIN.reset(token)
 
 
 ENGINE: AsyncEngine = None
+READ_REPLICAS: list[ReadReplica] = []
+
+_CURRENT_PIN: ContextVar[PrimaryPin | None] = ContextVar("primary_pin", default=None)
+_read_replica_counter = itertools.count()
 
 
 def create_collections_from_dummy_data(data: dict | list[dict]) -> list[CollectionDB]:
@@ -84,8 +163,26 @@ async def create_dummy_data(paths_to_dummy_data: list[str]):
     await insert_dummy_collections(collections)
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Creates and returns an `AsyncSession` from the `ENGINE` in this module. If an error occurs during a session, the changes will be rolled back and the exception will be raised again.
+async def check_read_replicas():
+    """Checks the health of every read replica in `READ_REPLICAS` by issuing a trivial query. Replicas that fail the check won't receive any reads until they pass a later check."""
+    for replica in READ_REPLICAS:
+        try:
+            async with replica.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            if not replica.healthy:
+                print(f"Read replica {replica.engine.url.render_as_string()} is healthy again.")
+            replica.healthy = True
+        except (DBAPIError, OSError) as exc:
+            if replica.healthy:
+                print(f"Read replica {replica.engine.url.render_as_string()} is unhealthy:\n{exc}")
+            replica.healthy = False
+
+
+async def get_session(request: Request = None) -> AsyncGenerator[AsyncSession, None]:
+    """Creates and returns an `AsyncSession` from the `ENGINE` in this module or, for reading requests, from one of the `READ_REPLICAS`. If an error occurs during a session, the changes will be rolled back and the exception will be raised again.
+
+    Args:
+        request (Request, optional): The request the session is being created for. Sessions for `GET` and `HEAD` requests are created from a healthy read replica, if there's any and the client hasn't recently committed a write. Defaults to None.
 
     Raises:
         RuntimeError: Raised, if `ENGINE` in this module hasn't been initialized, yet.
@@ -100,9 +197,12 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     if not ENGINE:
         raise RuntimeError(f"ENGINE is `None`. The function {set_up_db_engine.__name__}() needs to get called first!")
 
-    connection: AsyncConnection = await ENGINE.connect()
+    is_read = request is not None and request.method in READ_METHODS
+    connection: AsyncConnection = await _connect(is_read, _get_primary_pinned_until(request) if is_read else 0.0)
     try:
         async with AsyncSession(bind=connection) as async_session:
+            if not is_read:
+                event.listen(async_session.sync_session, "after_commit", _pin_primary)
             try:
                 yield async_session
             except DBAPIError as session_exception:
@@ -117,6 +217,25 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         await connection.close()
 
 
+def get_read_engine(pinned_until: float = 0.0) -> AsyncEngine:
+    """Selects the engine to use for reading. Rotates through the healthy `READ_REPLICAS`. Falls back to the primary `ENGINE`, if there are no healthy replicas or if the primary is pinned after a recent write.
+
+    Args:
+        pinned_until (float, optional): The UNIX timestamp until which the client's reads are to be sent to the primary. Defaults to 0.0 (not pinned).
+
+    Returns:
+        AsyncEngine: The engine to read from.
+    """
+    if time.time() < pinned_until:
+        return ENGINE
+
+    healthy_replicas = [replica for replica in READ_REPLICAS if replica.healthy]
+    if not healthy_replicas:
+        return ENGINE
+
+    return healthy_replicas[next(_read_replica_counter) % len(healthy_replicas)].engine
+
+
 async def insert_dummy_collections(collections: list[CollectionDB]):
     """Attempts to insert the provided `collections` into the database. If inserting a Collection fails, the transaction will be rolled back and the error will be printed to stdout.
 
@@ -154,12 +273,24 @@ def initialize_db(reinitialize: bool = False):
         alembic.command.upgrade(alembic_config, "head", tag="from_app")
 
 
-def set_up_db_engine(database_url: str, echo: bool | None = None):
-    """Initializes the database engine `ENGINE`.
+async def monitor_read_replicas(interval: float):
+    """Periodically checks the health of the `READ_REPLICAS` until cancelled.
+
+    Args:
+        interval (float): The number of seconds to wait between two checks.
+    """
+    while True:
+        await check_read_replicas()
+        await asyncio.sleep(interval)
+
+
+def set_up_db_engine(database_url: str, echo: bool | None = None, read_replica_urls: list[str] | tuple[str, ...] | None = None):
+    """Initializes the database engine `ENGINE` and the engines of the `READ_REPLICAS`.
 
     Args:
         database_url (str): The full url to the database, including: dialect, username, password, server url or IP address & port.
         echo (bool, optional): Determines, if the issued SQL statements should be written to stdout. Defaults to None.
+        read_replica_urls (list[str] | tuple[str, ...], optional): The full urls to read-only replicas of the database. Defaults to None (no replicas).
     """
     if echo is None:
         echo = SETTINGS.database_engine_echo
@@ -170,6 +301,11 @@ def set_up_db_engine(database_url: str, echo: bool | None = None):
     ENGINE = create_async_engine(database_url, echo=echo, future=True, connect_args=connect_args, pool_pre_ping=True)
     # pool_pre_ping fixes Issue #20 according to https://github.com/MagicStack/asyncpg/issues/309#issuecomment-1987144710
 
+    READ_REPLICAS.clear()
+    for read_replica_url in read_replica_urls or []:
+        engine = create_async_engine(read_replica_url, echo=echo, future=True, connect_args=connect_args, pool_pre_ping=True)
+        READ_REPLICAS.append(ReadReplica(engine=engine))
+
 
 def __alembic_current_is_head(sync_connection_string: str):
     """Determines, if the current alembic revision is at head.
@@ -188,6 +324,56 @@ def __alembic_current_is_head(sync_connection_string: str):
     return "(head)" in current
 
 
+async def _connect(is_read: bool, pinned_until: float = 0.0) -> AsyncConnection:
+    """Opens a connection to the database. Reads are sent to a read replica, if possible. If connecting to the replica fails, it's marked as unhealthy and the primary `ENGINE` is used instead.
+
+    Args:
+        is_read (bool): Determines, if the connection will only be used for reading.
+        pinned_until (float, optional): The UNIX timestamp until which the client's reads are to be sent to the primary. Defaults to 0.0 (not pinned).
+
+    Returns:
+        AsyncConnection: The opened connection.
+    """
+    engine = get_read_engine(pinned_until) if is_read else ENGINE
+    if engine is ENGINE:
+        return await ENGINE.connect()
+
+    try:
+        return await engine.connect()
+    except (DBAPIError, OSError) as exc:
+        print(f"Could not connect to read replica {engine.url.render_as_string()}, falling back to the primary:\n{exc}")
+        for replica in READ_REPLICAS:
+            if replica.engine is engine:
+                replica.healthy = False
+        return await ENGINE.connect()
+
+
+def _get_primary_pinned_until(request: Request | None) -> float:
+    """Reads the cookie `READ_YOUR_WRITES_COOKIE` sent by the client. The value is capped to the read-your-writes window, so that a client can't pin its reads to the primary indefinitely.
+
+    Args:
+        request (Request, optional): The request to read the cookie from.
+
+    Returns:
+        float: The UNIX timestamp until which the client's reads are to be sent to the primary. 0.0, if the cookie is missing or invalid.
+    """
+    if request is None:
+        return 0.0
+
+    try:
+        pinned_until = float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0.0))
+    except ValueError:
+        return 0.0
+    return min(pinned_until, time.time() + SETTINGS.read_your_writes_window)
+
+
+def _pin_primary(_session):
+    """Pins the reads of the client of the current request to the primary, after a write has been committed. Registered as `after_commit` listener on write sessions."""
+    pin = _CURRENT_PIN.get()
+    if pin is not None and READ_REPLICAS:
+        pin.pinned_until = time.time() + SETTINGS.read_your_writes_window
+
+
 def __drop_tables(sync_connection_string: str):
     """Drops all tables in the database. Additionally, the `alembic_version` table will be dropped, if it exists.
 
@@ -203,10 +389,19 @@ def __drop_tables(sync_connection_string: str):
 
 __all__ = [
     "ENGINE",
+    "READ_METHODS",
+    "READ_REPLICAS",
+    "READ_YOUR_WRITES_COOKIE",
+    "PrimaryPin",
+    "ReadReplica",
+    "ReadYourWritesMiddleware",
+    "check_read_replicas",
     "create_collections_from_dummy_data",
     "create_dummy_data",
+    "get_read_engine",
     "get_session",
     "initialize_db",
     "insert_dummy_collections",
+    "monitor_read_replicas",
     "set_up_db_engine",
 ]
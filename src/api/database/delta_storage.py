@@ -0,0 +1,278 @@
+"""Delta storage of Users: a User whose data hasn't changed since the previous Collection is stored as a small marker pointing to the Collection holding the User's data, instead of as a full row.
+
+Usage:
+    python -m src.api.database.delta_storage compress
+    python -m src.api.database.delta_storage expand
+
+Compress the existing data before enabling delta storage via the environment variable `USER_DELTA_STORAGE_ENABLED`, and expand it before disabling delta storage again.
+Compressing doesn't shrink the files of the table `pss_user`. Run `VACUUM FULL pss_user` afterwards to return the space to the operating system.
+The database is configured via the environment variables `DATABASE_URL` and `DATABASE_NAME`.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Iterable
+
+from sqlalchemy import and_, delete, insert, or_, union_all, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.util import AliasedClass
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select
+
+from ..config import SETTINGS
+from .models import CollectionDB, UserCarriedForwardDB, UserDB
+
+
+USER_VALUE_COLUMN_NAMES: tuple[str, ...] = tuple(
+    column.name for column in UserDB.__table__.columns if column.name not in ("collection_id", "user_id")
+)
+"""The properties of a User compared to determine, if the User has changed."""
+
+UserSnapshot = dict[int, tuple[tuple, int]]
+"""The values of the `USER_VALUE_COLUMN_NAMES` of the Users in a Collection and the `collection_id` of the Collection their data is stored for by `user_id`."""
+
+
+def get_user_source() -> type[UserDB] | AliasedClass[UserDB]:
+    """Returns the entity to select Users from. If delta storage is enabled, the Users carried forward are combined with the stored Users, so that every Collection contains all of its Users.
+
+    Returns:
+        type[UserDB] | AliasedClass[UserDB]: `UserDB` or an alias of it to be used in place of `UserDB` in queries.
+    """
+    if not SETTINGS.user_delta_storage_enabled:
+        return UserDB
+
+    stored = select(*UserDB.__table__.columns)
+    return aliased(UserDB, union_all(stored, _select_users_carried_forward()).subquery("pss_user_snapshot"))
+
+
+def get_unchanged_users(previous_users: UserSnapshot, users: Iterable[tuple[int, tuple]]) -> dict[int, int]:
+    """Determines the Users whose data is identical to their data in the previous Collection.
+
+    Args:
+        previous_users (UserSnapshot): The Users of the previous Collection.
+        users (Iterable[tuple[int, tuple]]): The `user_id` and the values of the `USER_VALUE_COLUMN_NAMES` of the Users to check.
+
+    Returns:
+        dict[int, int]: The `collection_id` of the Collection holding the data of each unchanged User by `user_id`.
+    """
+    unchanged_users = {}
+    for user_id, values in users:
+        previous_user = previous_users.get(user_id)
+        if previous_user and previous_user[0] == values:
+            unchanged_users[user_id] = previous_user[1]
+    return unchanged_users
+
+
+def get_user_values(user: UserDB) -> tuple:
+    """Returns the values of the `USER_VALUE_COLUMN_NAMES` of a User."""
+    return tuple(getattr(user, column_name) for column_name in USER_VALUE_COLUMN_NAMES)
+
+
+async def get_user_snapshot(session: AsyncSession, collection_id: int) -> UserSnapshot:
+    """Retrieves the data of all Users of a Collection, including the Users carried forward.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collection_id (int): The `collection_id` of the Collection.
+
+    Returns:
+        UserSnapshot: The Users of the Collection.
+    """
+    value_columns = [UserDB.__table__.c[column_name] for column_name in USER_VALUE_COLUMN_NAMES]
+    stored_query = select(UserDB.user_id, *value_columns).where(UserDB.collection_id == collection_id)
+    carried_forward_query = (
+        select(UserDB.user_id, UserDB.collection_id, *value_columns)
+        .join(UserCarriedForwardDB, _is_source_of_user_carried_forward())
+        .where(UserCarriedForwardDB.collection_id == collection_id)
+    )
+
+    snapshot = {row[0]: (tuple(row[1:]), collection_id) for row in await session.exec(stored_query)}
+    snapshot.update({row[0]: (tuple(row[2:]), row[1]) for row in await session.exec(carried_forward_query)})
+    return snapshot
+
+
+async def carry_forward_users(session: AsyncSession, collection_id: int, unchanged_users: dict[int, int]):
+    """Inserts the markers for Users carried forward into a Collection. The Collection must have been flushed to the database. Doesn't commit.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collection_id (int): The `collection_id` of the Collection.
+        unchanged_users (dict[int, int]): The `collection_id` of the Collection holding the data of each User to carry forward by `user_id`.
+    """
+    if unchanged_users:
+        markers = [
+            {"collection_id": collection_id, "user_id": user_id, "source_collection_id": source_collection_id}
+            for user_id, source_collection_id in unchanged_users.items()
+        ]
+        await session.exec(insert(UserCarriedForwardDB), params=markers)
+
+
+async def compress_users(session: AsyncSession, collection_id: int, previous_users: UserSnapshot) -> tuple[UserSnapshot, int]:
+    """Carries forward the stored Users of a Collection, whose data hasn't changed since the previous Collection, and deletes their rows. Markers pointing to the deleted rows are redirected to the rows the Users are carried forward from. Doesn't commit.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collection_id (int): The `collection_id` of the Collection.
+        previous_users (UserSnapshot): The Users of the previous Collection.
+
+    Returns:
+        tuple[UserSnapshot, int]: The Users of the Collection after compressing and the number of Users carried forward.
+    """
+    snapshot = await get_user_snapshot(session, collection_id)
+    stored_users = ((user_id, values) for user_id, (values, source_collection_id) in snapshot.items() if source_collection_id == collection_id)
+    unchanged_users = get_unchanged_users(previous_users, stored_users)
+    if not unchanged_users:
+        return snapshot, 0
+
+    await carry_forward_users(session, collection_id, unchanged_users)
+    carried_forward = aliased(UserCarriedForwardDB)
+    await session.exec(
+        update(UserCarriedForwardDB)
+        .where(UserCarriedForwardDB.source_collection_id == collection_id)
+        .where(carried_forward.collection_id == collection_id)
+        .where(carried_forward.user_id == UserCarriedForwardDB.user_id)
+        .values(source_collection_id=carried_forward.source_collection_id)
+    )
+    await session.exec(
+        delete(UserDB)
+        .where(UserDB.collection_id == collection_id)
+        .where(UserCarriedForwardDB.collection_id == collection_id)
+        .where(UserCarriedForwardDB.user_id == UserDB.user_id)
+    )
+
+    snapshot = {user_id: (values, unchanged_users.get(user_id, source_collection_id)) for user_id, (values, source_collection_id) in snapshot.items()}
+    return snapshot, len(unchanged_users)
+
+
+async def expand_users(session: AsyncSession, collection_id: int, include_dependent_collections: bool = True) -> int:
+    """Stores the data of the Users carried forward into a Collection as full rows again. Needs to be called before updating or deleting the Users of a Collection. Doesn't commit.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        collection_id (int): The `collection_id` of the Collection.
+        include_dependent_collections (bool, optional): Also expand the Users carried forward from this Collection into later Collections. Defaults to True.
+
+    Returns:
+        int: The number of expanded Users.
+    """
+    condition = UserCarriedForwardDB.collection_id == collection_id
+    if include_dependent_collections:
+        condition = or_(condition, UserCarriedForwardDB.source_collection_id == collection_id)
+
+    column_names = [column.name for column in UserDB.__table__.columns]
+    result = await session.exec(insert(UserDB).from_select(column_names, _select_users_carried_forward().where(condition)))
+    await session.exec(delete(UserCarriedForwardDB).where(condition))
+    return result.rowcount
+
+
+async def compress_all_users(engine: AsyncEngine, verbose: bool = True) -> int:
+    """Carries forward all Users of all Collections, whose data hasn't changed since the previous Collection. Every Collection is committed separately, so compressing can be interrupted and resumed.
+
+    Args:
+        engine (AsyncEngine): The engine used for the connection to the database.
+        verbose (bool, optional): Print progress to stdout. Defaults to True.
+
+    Returns:
+        int: The number of Users carried forward.
+    """
+    async with AsyncSession(engine) as session:
+        collection_ids = list((await session.exec(select(CollectionDB.collection_id).order_by(col(CollectionDB.collected_at)))).all())
+
+    carried_forward_count = 0
+    previous_snapshot: UserSnapshot = {}
+    for index, collection_id in enumerate(collection_ids, 1):
+        async with AsyncSession(engine) as session:
+            previous_snapshot, count = await compress_users(session, collection_id, previous_snapshot)
+            await session.commit()
+        carried_forward_count += count
+
+        if verbose and index % 100 == 0:
+            print(f"Compressed {index} of {len(collection_ids)} Collections ({carried_forward_count} Users carried forward)")
+
+    return carried_forward_count
+
+
+async def expand_all_users(engine: AsyncEngine, verbose: bool = True) -> int:
+    """Stores the data of all Users carried forward as full rows again. Every Collection is committed separately, so expanding can be interrupted and resumed.
+
+    Args:
+        engine (AsyncEngine): The engine used for the connection to the database.
+        verbose (bool, optional): Print progress to stdout. Defaults to True.
+
+    Returns:
+        int: The number of expanded Users.
+    """
+    async with AsyncSession(engine) as session:
+        collection_ids = list((await session.exec(select(UserCarriedForwardDB.collection_id).distinct())).all())
+
+    expanded_count = 0
+    for index, collection_id in enumerate(collection_ids, 1):
+        async with AsyncSession(engine) as session:
+            expanded_count += await expand_users(session, collection_id, False)
+            await session.commit()
+
+        if verbose and index % 100 == 0:
+            print(f"Expanded {index} of {len(collection_ids)} Collections ({expanded_count} Users)")
+
+    return expanded_count
+
+
+# ----- Helper functions -----
+
+
+def _is_source_of_user_carried_forward():
+    return and_(UserDB.collection_id == UserCarriedForwardDB.source_collection_id, UserDB.user_id == UserCarriedForwardDB.user_id)
+
+
+def _select_users_carried_forward() -> Select:
+    """Creates a query selecting the Users carried forward with the columns of the table `pss_user`. The column `collection_id` holds the Collection the User has been carried forward into."""
+    columns = [UserCarriedForwardDB.__table__.c.collection_id if column.name == "collection_id" else column for column in UserDB.__table__.columns]
+    return select(*columns).select_from(UserCarriedForwardDB).join(UserDB, _is_source_of_user_carried_forward())
+
+
+async def run(args: argparse.Namespace):
+    engine = create_async_engine(SETTINGS.async_database_connection_str)
+    started_at = time.perf_counter()
+    if args.command == "compress":
+        count = await compress_all_users(engine)
+        print(f"Carried forward {count} Users in {time.perf_counter() - started_at:.1f} s")
+    else:
+        count = await expand_all_users(engine)
+        print(f"Expanded {count} Users in {time.perf_counter() - started_at:.1f} s")
+    await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Convert the stored Users from and to delta storage.")
+    parser.add_argument(
+        "command",
+        choices=["compress", "expand"],
+        help="`compress` carries forward all unchanged Users, `expand` stores all Users carried forward as full rows again.",
+    )
+    return parser.parse_args()
+
+
+def main():
+    asyncio.run(run(parse_args()))
+
+
+__all__ = [
+    "USER_VALUE_COLUMN_NAMES",
+    "UserSnapshot",
+    "carry_forward_users",
+    "compress_all_users",
+    "compress_users",
+    "expand_all_users",
+    "expand_users",
+    "get_unchanged_users",
+    "get_user_snapshot",
+    "get_user_source",
+    "get_user_values",
+]
+
+
+if __name__ == "__main__":
+    main()
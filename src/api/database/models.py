@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Any
 
 from pydantic import field_validator
+from sqlalchemy import DDL, BigInteger, ForeignKeyConstraint, Index, event, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import foreign, relationship
 from sqlmodel import Field, Relationship, SQLModel, and_
 
@@ -40,6 +42,8 @@ class CollectionDB(CollectionBaseDB, table=True):
     """A snapshot of fleet and player data in PSS."""
 
     __tablename__ = "collection"
+    # Tournaments are detected from the Collections collected during them, so only these need to be indexed.
+    __table_args__ = (Index("ix_collection_collected_at_tournament_running", "collected_at", postgresql_where=text("tournament_running")),)
 
     collection_id: int | None = Field(primary_key=True, index=True, default=None, ge=0)
     """An arbitrary ID for this Collection."""
@@ -59,6 +63,8 @@ class CollectionDB(CollectionBaseDB, table=True):
     """Determines, if a monthly fleet tournament was active when collectin the data."""
     max_tournament_battle_attempts: int | None = Field(ge=0, default=None, nullable=True)
     """The maximum Tournament battle attempts per day for any given player."""
+    modified_at: datetime | None = Field(default=None, nullable=True)
+    """Date and time of when this snapshot was last updated after having been inserted. Used to export updated Collections again."""
 
     alliances: list["AllianceDB"] = Relationship(
         back_populates="collection", sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "noload"}
@@ -76,6 +82,7 @@ class AllianceDB(AllianceBaseDB, table=True):
     """A partial PSS Alliance (fleet)."""
 
     __tablename__ = "pss_alliance"
+    __table_args__ = (Index("ix_pss_alliance_collection_id_division_design_id", "collection_id", "division_design_id"),)
 
     collection_id: int = Field(primary_key=True, index=True, foreign_key="collection.collection_id", ge=0)
     """The `collection_id` of the Collection this User data is referencing."""
@@ -182,6 +189,13 @@ class UserDB(UserBaseDB, table=True):
     """A dipartial PSS User (player)."""
 
     __tablename__ = "pss_user"
+    # Lets the leaderboards of the most requested properties read the top Users of a Collection from the index instead of sorting all of them.
+    __table_args__ = (
+        Index("ix_pss_user_collection_id_alliance_score", "collection_id", "alliance_score"),
+        Index("ix_pss_user_collection_id_highest_trophy", "collection_id", "highest_trophy"),
+        Index("ix_pss_user_collection_id_pvp_attack_wins", "collection_id", "pvp_attack_wins"),
+        Index("ix_pss_user_collection_id_trophy", "collection_id", "trophy"),
+    )
 
     collection_id: int = Field(primary_key=True, index=True, foreign_key="collection.collection_id", ge=0)
     """The `collection_id` of the Collection this User data is referencing."""
@@ -257,14 +271,252 @@ UserDB.__mapper__.add_property(
 )
 
 
+class UserCarriedForwardDB(SQLModel, table=True):
+    """Marks a User as unchanged since an earlier Collection, if delta storage is enabled. The User's data is only stored for the earlier Collection."""
+
+    __tablename__ = "pss_user_carried_forward"
+    __table_args__ = (ForeignKeyConstraint(["source_collection_id", "user_id"], ["pss_user.collection_id", "pss_user.user_id"]),)
+
+    collection_id: int = Field(primary_key=True, foreign_key="collection.collection_id", ondelete="CASCADE", ge=0)
+    """The `collection_id` of the Collection the User is part of."""
+    user_id: int = Field(primary_key=True, index=True, ge=0)
+    """The PSS property `Id` of the User as returned by the PSS API."""
+    source_collection_id: int = Field(index=True, ge=0)
+    """The `collection_id` of the Collection the User's data is stored for."""
+
+
+class CollectionStatsDB(SQLModel, table=True):
+    """Aggregated numbers of a Collection, computed when the Collection is saved or updated. Includes the Users carried forward."""
+
+    __tablename__ = "collection_stats"
+
+    collection_id: int = Field(primary_key=True, foreign_key="collection.collection_id", ondelete="CASCADE", ge=0)
+    """The `collection_id` of the Collection the numbers have been computed for."""
+    user_count: int = Field(ge=0)
+    """The number of Users in the Collection."""
+    alliance_count: int = Field(ge=0)
+    """The number of Alliances in the Collection."""
+    trophy_total: int = Field(ge=0, sa_type=BigInteger)
+    """The sum of the trophies of all Users."""
+    trophy_average: float | None = Field(default=None, nullable=True)
+    """The average trophies of the Users. `None`, if there are no Users."""
+    alliance_score_total: int = Field(ge=0, sa_type=BigInteger)
+    """The sum of the stars of all Users."""
+    active_user_count_day: int = Field(ge=0)
+    """The number of Users, who logged in during the day before the Collection has been collected."""
+    active_user_count_week: int = Field(ge=0)
+    """The number of Users, who logged in during the 7 days before the Collection has been collected."""
+    active_user_count_month: int = Field(ge=0)
+    """The number of Users, who logged in during the 30 days before the Collection has been collected."""
+    users_by_division: dict[str, int] = Field(default_factory=dict, sa_type=JSONB)
+    """The number of Users in Alliances by the `division_design_id` of their Alliance."""
+    users_by_membership: dict[str, int] = Field(default_factory=dict, sa_type=JSONB)
+    """The number of Users by their `alliance_membership`. Users without a membership are counted as "None"."""
+
+
+class RateLimitBucketDB(SQLModel, table=True):
+    """The token bucket of an API client, if rate limiting is shared via the database."""
+
+    __tablename__ = "rate_limit_bucket"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    bucket_key: str = Field(primary_key=True)
+    """Identifies the client."""
+    tokens: float
+    """The number of tokens in the bucket at `updated_at`."""
+    updated_at: float
+    """The time of the last update of the bucket in seconds since the epoch."""
+
+
+class EntityEventDB(SQLModel, table=True):
+    """A change of an Alliance or a User since the previous Collection, recorded when a Collection is saved."""
+
+    __tablename__ = "entity_event"
+    __table_args__ = (
+        Index("ix_entity_event_entity_type_entity_id_collected_at", "entity_type", "entity_id", "collected_at"),
+        Index("ix_entity_event_event_type_collected_at", "event_type", "collected_at"),
+    )
+
+    event_id: int | None = Field(primary_key=True, default=None)
+    """An arbitrary ID for this event."""
+    collection_id: int = Field(index=True, foreign_key="collection.collection_id", ondelete="CASCADE", ge=0)
+    """The `collection_id` of the Collection in which the change has been observed first."""
+    collected_at: datetime = Field(index=True)
+    """The `collected_at` timestamp of the Collection in which the change has been observed first."""
+    entity_type: str
+    """The type of the changed entity (`EntityType`)."""
+    entity_id: int = Field(ge=0)
+    """The `alliance_id` or `user_id` of the changed entity."""
+    event_type: str
+    """The type of the change (`EntityEventType`)."""
+    old_value: str | None = Field(default=None, nullable=True)
+    """The value before the change, if any."""
+    new_value: str | None = Field(default=None, nullable=True)
+    """The value after the change, if any."""
+
+
+class EntityNameDB(SQLModel, table=True):
+    """A name an Alliance or a User has had, recorded when a Collection is saved. Every name of an entity is stored once, so that names can be searched without scanning the Collections."""
+
+    __tablename__ = "entity_name"
+    __table_args__ = (
+        Index("ix_entity_name_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_entity_name_entity_type_entity_id", "entity_type", "entity_id"),
+    )
+
+    entity_type: str = Field(primary_key=True)
+    """The type of the named entity (`EntityType`)."""
+    entity_id: int = Field(primary_key=True, ge=0)
+    """The `alliance_id` or `user_id` of the named entity."""
+    name: str = Field(primary_key=True)
+    """The `alliance_name` or `user_name` of the entity."""
+    first_seen_at: datetime
+    """The `collected_at` timestamp of the earliest Collection, in which the entity had this name."""
+    last_seen_at: datetime
+    """The `collected_at` timestamp of the latest Collection, in which the entity had this name."""
+
+
+# The trigram index requires the extension `pg_trgm`, which needs to exist before the table is created.
+event.listen(EntityNameDB.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
+
+
 AllianceHistoryDB = tuple[CollectionDB, AllianceDB]
+CollectionStatsHistoryDB = tuple[CollectionDB, CollectionStatsDB]
 UserHistoryDB = tuple[CollectionDB, UserDB]
+UserHistoryDeltaDB = tuple[int, datetime, list[int | None], list[int | None], list[float | None]]
+"""(
+    0: collection_id,
+    1: collected_at,
+    2: values,
+    3: deltas,
+    4: rates
+)
+"""
+EntityChangeDB = tuple[int, str, int | str | None, int | str | None]
+"""(
+    0: alliance_id or user_id,
+    1: change (EntityChange),
+    2: old_value,
+    3: new_value
+)
+"""
+EntityNameMatchDB = tuple[EntityNameDB, float]
+"""(
+    0: name,
+    1: score
+)
+"""
+EntityNameSpanDB = tuple[str, datetime, datetime]
+"""(
+    0: name,
+    1: first_seen_at,
+    2: last_seen_at
+)
+"""
+DivisionStandingDB = tuple[int, int, str, int, int | None, int | None, int, int, int]
+"""(
+    0: rank,
+    1: alliance_id,
+    2: alliance_name,
+    3: score,
+    4: trophy,
+    5: championship_score,
+    6: member_count,
+    7: member_stars,
+    8: member_trophy
+)
+"""
+HistogramDB = tuple[int, int | None, int | None, list[tuple[float, int]], list[int]]
+"""(
+    0: count,
+    1: min_value,
+    2: max_value,
+    3: percentiles (fraction, value),
+    4: bucket_counts
+)
+"""
+UserRankDB = tuple[int, int, str, int, int]
+"""(
+    0: rank,
+    1: user_id,
+    2: user_name,
+    3: alliance_id,
+    4: value
+)
+"""
+AllianceRankDB = tuple[int, int, str, int, int]
+"""(
+    0: rank,
+    1: alliance_id,
+    2: alliance_name,
+    3: division_design_id,
+    4: value
+)
+"""
+TournamentDB = tuple[CollectionDB, CollectionDB, int]
+"""(
+    0: first_collection,
+    1: last_collection,
+    2: collection_count
+)
+"""
+TournamentAllianceProgressDB = tuple[datetime, int, str, int, int, int | None, int | None, int | None]
+"""(
+    0: collected_at,
+    1: alliance_id,
+    2: alliance_name,
+    3: division_design_id,
+    4: score,
+    5: score_change,
+    6: trophy,
+    7: trophy_change
+)
+"""
+TournamentUserDeltaDB = tuple[int, str, int, int | None, int | None, int | None, int | None]
+"""(
+    0: user_id,
+    1: user_name,
+    2: alliance_id,
+    3: tournament_bonus_score,
+    4: tournament_bonus_score_change,
+    5: championship_score,
+    6: championship_score_change
+)
+"""
+UserMoverDB = tuple[int, str, int, int, int, int]
+"""(
+    0: user_id,
+    1: user_name,
+    2: alliance_id,
+    3: from_value,
+    4: to_value,
+    5: change
+)
+"""
 
 
 __all__ = [
     "AllianceDB",
     "AllianceHistoryDB",
+    "AllianceRankDB",
     "CollectionDB",
+    "CollectionStatsDB",
+    "CollectionStatsHistoryDB",
+    "DivisionStandingDB",
+    "EntityChangeDB",
+    "EntityEventDB",
+    "EntityNameDB",
+    "EntityNameMatchDB",
+    "EntityNameSpanDB",
+    "HistogramDB",
+    "RateLimitBucketDB",
+    "TournamentAllianceProgressDB",
+    "TournamentDB",
+    "TournamentUserDeltaDB",
+    "UserCarriedForwardDB",
     "UserDB",
     "UserHistoryDB",
+    "UserHistoryDeltaDB",
+    "UserMoverDB",
+    "UserRankDB",
 ]
@@ -9,12 +9,23 @@ from .models.exceptions import (
     ConflictError,
     FromDateTooEarlyError,
     InvalidAllianceIdError,
+    InvalidBucketsError,
     InvalidCollectionIdError,
+    InvalidCursorError,
     InvalidDescError,
+    InvalidDivisionDesignIdError,
+    InvalidEntityIdError,
+    InvalidEntityTypeError,
+    InvalidEventTypeError,
     InvalidFromDateError,
     InvalidIntervalError,
+    InvalidMetricError,
+    InvalidMonthError,
+    InvalidNameError,
     InvalidOnMissingError,
+    InvalidSearchModeError,
     InvalidSkipError,
+    InvalidTableError,
     InvalidTakeError,
     InvalidToDateError,
     InvalidUserIdError,
@@ -25,6 +36,7 @@ from .models.exceptions import (
     ParameterValidationError,
     ServerError,
     ToDateTooEarlyError,
+    TooManyRequestsError,
     UnsupportedSchemaError,
 )
 
@@ -153,6 +165,21 @@ async def handle_request_validation(request: Request, exc: RequestValidationErro
     raise ServerError("An error occured while raising an error for an invalid parameter.") from exc
 
 
+async def handle_too_many_requests(request: Request, exception: TooManyRequestsError) -> ORJSONResponse:
+    """Handles a `TooManyRequestsError` (429) thrown from within an API endpoint. Adds a `Retry-After` header to the response.
+
+    Args:
+        request (Request): The request that produced the exception.
+        exception (TooManyRequestsError): The exception that was thrown.
+
+    Returns:
+        ORJSONResponse: The response to be returned to the client.
+    """
+    response = await _handle_api_error(request, exception, status.HTTP_429_TOO_MANY_REQUESTS)
+    response.headers["Retry-After"] = str(exception.retry_after)
+    return response
+
+
 async def handle_server(request: Request, exception: ServerError) -> ORJSONResponse:
     """Handles any `ServerError` (500) thrown from within an API endpoint.
 
@@ -184,6 +211,12 @@ async def _handle_api_error(request: Request, exception: ApiError, status_code:
     return ORJSONResponse(dict(error_out), status_code=status_code)
 
 
+BODY_PARAMETER_ERROR_LOOKUP = {
+    "allianceIds": InvalidAllianceIdError,
+    "userIds": InvalidUserIdError,
+}
+
+
 def _raise_body_parameter_error(error: RequestValidationErrorOut, exc: RequestValidationError):
     """Handles a `RequestValidationError` (422) raised upon a failed validation of a body parameter and raises an appropriate detailed exception to be handled.
 
@@ -191,9 +224,15 @@ def _raise_body_parameter_error(error: RequestValidationErrorOut, exc: RequestVa
         error (RequestValidationErrorOut): Details of the `RequestValidationError` that was thrown.
 
     Raises:
+        InvalidAllianceIdError: Raised, if the body parameter `allianceIds` is missing, empty, holds more than 100 values or a value that can't be parsed to an `int` or is lower than 1.
+        InvalidUserIdError: Raised, if the body parameter `userIds` is missing, empty, holds more than 100 values or a value that can't be parsed to an `int` or is lower than 1.
         See functions `_raise_nested_body_parameter_error` and `_raise_non_nested_body_parameter_error`.
         ServerError: Raised, if the functions mentioned above don't raise an exception.
     """
+    error_type = BODY_PARAMETER_ERROR_LOOKUP.get(error.loc[1]) if len(error.loc) > 1 else None
+    if error_type:
+        raise error_type(error.msg)
+
     if error.param_path:
         _raise_nested_body_parameter_error(error, exc)
     else:
@@ -365,20 +404,49 @@ def _raise_path_parameter_error(error: RequestValidationErrorOut, exc: RequestVa
 
     Raises:
         InvalidAllianceIdError: Raised, if the path parameter `allianceId` received a value that can't be parsed to an `int` or is lower than 1.
-        InvalidCollectionIdError: Raised, if the path parameter `collectionId` received a value that can't be parsed to an `int` or is lower than 1.
+        InvalidCollectionIdError: Raised, if the path parameter `collectionId` or `otherCollectionId` received a value that can't be parsed to an `int` or is lower than 1.
+        InvalidMonthError: Raised, if the path parameter `month` received a value that is not a month in the format `YYYY-MM`.
+        InvalidTableError: Raised, if the path parameter `table` received a value that is not an exported table.
         InvalidUserIdError: Raised, if the path parameter `userId` received a value that can't be parsed to an `int` or is lower than 1.
         ServerError: Raised, if none of the other exceptions was raised.
     """
     match error.param_name:
         case "allianceId":
             raise InvalidAllianceIdError(error.msg)
-        case "collectionId":
+        case "collectionId" | "otherCollectionId":
             raise InvalidCollectionIdError(error.msg)
+        case "month":
+            raise InvalidMonthError(error.msg)
+        case "table":
+            raise InvalidTableError(error.msg)
         case "userId":
             raise InvalidUserIdError(error.msg)
     raise ServerError("An error occured while raising an error for an invalid path parameter.") from exc
 
 
+QUERY_PARAMETER_ERROR_LOOKUP = {
+    "allianceId": InvalidAllianceIdError,
+    "buckets": InvalidBucketsError,
+    "collectionId": InvalidCollectionIdError,
+    "cursor": InvalidCursorError,
+    "desc": InvalidDescError,
+    "divisionDesignId": InvalidDivisionDesignIdError,
+    "entityId": InvalidEntityIdError,
+    "entityType": InvalidEntityTypeError,
+    "eventTypes": InvalidEventTypeError,
+    "fromCollectionId": InvalidCollectionIdError,
+    "interval": InvalidIntervalError,
+    "metric": InvalidMetricError,
+    "metrics": InvalidMetricError,
+    "mode": InvalidSearchModeError,
+    "name": InvalidNameError,
+    "onMissing": InvalidOnMissingError,
+    "skip": InvalidSkipError,
+    "take": InvalidTakeError,
+    "toCollectionId": InvalidCollectionIdError,
+}
+
+
 def _raise_query_parameter_error(error: RequestValidationErrorOut, exc: RequestValidationError):
     """Handles a `RequestValidationError` (422) raised upon a failed validation of a query parameter and raises an appropriate detailed exception to be handled.
 
@@ -393,6 +461,17 @@ def _raise_query_parameter_error(error: RequestValidationErrorOut, exc: RequestV
         InvalidDescError: Raised, if the query parameter `desc` received a value that can't be parsed to a `bool`.
         InvalidSkipError: Raised, if the query parameter `skip` received a value that can't be parsed to an `int` or if it's negative.
         InvalidTakeError: Raised, if the query parameter `skip` received a value that can't be parsed to an `int`, if it's negative or if it's greater than 100.
+        InvalidCursorError: Raised, if the query parameter `cursor` received a value that is too long.
+        InvalidCollectionIdError: Raised, if the query parameter `collectionId`, `fromCollectionId` or `toCollectionId` received a value that can't be parsed to an `int` or is lower than 1.
+        InvalidAllianceIdError: Raised, if the query parameter `allianceId` received a value that can't be parsed to an `int` or is lower than 1.
+        InvalidDivisionDesignIdError: Raised, if the query parameter `divisionDesignId` received a value that can't be parsed to an `int` or is negative.
+        InvalidMetricError: Raised, if the query parameter `metric` or `metrics` received a value that can't be parsed to a `ParameterUserMetric` or `ParameterAllianceMetric` enum value.
+        InvalidEntityIdError: Raised, if the query parameter `entityId` received a value that can't be parsed to an `int` or is lower than 1.
+        InvalidEntityTypeError: Raised, if the query parameter `entityType` received a value that can't be parsed to an `EntityType` enum value.
+        InvalidEventTypeError: Raised, if the query parameter `eventTypes` received a value that can't be parsed to an `EntityEventType` enum value.
+        InvalidNameError: Raised, if the query parameter `name` is missing, empty or too long.
+        InvalidSearchModeError: Raised, if the query parameter `mode` received a value that can't be parsed to a `ParameterSearchMode` enum value.
+        InvalidBucketsError: Raised, if the query parameter `buckets` received a value that can't be parsed to an `int`, if it's lower than 1 or if it's greater than 1000.
         ServerError: Raised, if none of the other exceptions was raised.
         ToDateTooEarlyError: Raised, if the query parameter `toDate` received a value that is before the PSS start date.
     """
@@ -405,14 +484,8 @@ def _raise_query_parameter_error(error: RequestValidationErrorOut, exc: RequestV
             if not error.input or error.type == "datetime_from_date_parsing":
                 raise InvalidToDateError(error.msg)
             raise ToDateTooEarlyError(error.msg)
-        case "interval":
-            raise InvalidIntervalError(error.msg)
-        case "desc":
-            raise InvalidDescError(error.msg)
-        case "skip":
-            raise InvalidSkipError(error.msg)
-        case "take":
-            raise InvalidTakeError(error.msg)
-        case "onMissing":
-            raise InvalidOnMissingError(error.msg)
+
+    error_type = QUERY_PARAMETER_ERROR_LOOKUP.get(error.loc[1])  # The name of a list parameter is followed by the index of the invalid value.
+    if error_type:
+        raise error_type(error.msg)
     raise ServerError("An error occured while raising an error for an invalid query parameter.") from exc
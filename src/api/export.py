@@ -0,0 +1,323 @@
+"""Exports the Collections to Parquet files for offline analytics. Every month of Collections is exported to one file per table, so that a month of hourly data can be downloaded at once.
+
+The files are written to `{EXPORT_DIRECTORY}/month={YYYY-MM}/{table}.parquet`, which tools like pyarrow, pandas, polars and DuckDB read as a dataset partitioned by month.
+Exports are incremental: only the months with new, updated or deleted Collections get rewritten and the rows already exported are copied from the existing files instead of being read from the database again.
+Updated Collections are detected by their `modified_at` timestamp, which is exported with the Collections. The files of months without any Collections left are removed.
+
+Usage:
+    python -m src.api.export
+    python -m src.api.export --full
+
+The database is configured via the environment variables `DATABASE_URL` and `DATABASE_NAME`.
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import groupby
+from pathlib import Path
+from typing import AsyncIterator, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, DateTime, Float, Integer, String, Table
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.types import TypeDecorator, TypeEngine
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select
+
+from . import utils
+from .config import SETTINGS
+from .database import delta_storage
+from .database.models import AllianceDB, CollectionDB, UserDB
+from .models.enums import ExportTable
+
+
+EXPORT_BATCH_SIZE: int = 50_000
+"""The number of rows read from the database and converted to an Arrow record batch at once."""
+EXPORT_COMPRESSION: str = "zstd"
+MEDIA_TYPE_PARQUET: str = "application/vnd.apache.parquet"
+
+ARROW_TYPE_BY_COLUMN_TYPE: dict[type[TypeEngine], pa.DataType] = {
+    Boolean: pa.bool_(),
+    DateTime: pa.timestamp("us", tz="UTC"),
+    Float: pa.float64(),
+    Integer: pa.int32(),
+    String: pa.string(),
+}
+"""The Arrow type of the columns by the type of the database columns. Timestamps are stored in UTC without timezone in the database."""
+TABLE_BY_EXPORT_TABLE: dict[ExportTable, Table] = {
+    ExportTable.ALLIANCES: AllianceDB.__table__,
+    ExportTable.COLLECTIONS: CollectionDB.__table__,
+    ExportTable.USERS: UserDB.__table__,
+}
+
+EXPORT_LOCK: asyncio.Lock = asyncio.Lock()
+"""Held while an export is running, so that only one export writes the files at a time."""
+
+
+@dataclass(frozen=True)
+class ExportFile:
+    """
+    A Parquet file containing a table of the Collections of a month.
+    """
+
+    month: str
+    table: ExportTable
+    path: Path
+    row_count: int
+    size: int
+
+
+def get_arrow_schema(table: Table) -> pa.Schema:
+    """Derives the Arrow schema of an exported table from the columns of the database table.
+
+    Args:
+        table (Table): The database table.
+
+    Returns:
+        pa.Schema: The schema of the Parquet file.
+    """
+    fields = []
+    for column in table.columns:
+        column_type = column.type.impl if isinstance(column.type, TypeDecorator) else column.type
+        arrow_type = next(arrow_type for type_, arrow_type in ARROW_TYPE_BY_COLUMN_TYPE.items() if isinstance(column_type, type_))
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+def get_export_file(directory: str | Path, month: str, table: ExportTable) -> ExportFile | None:
+    """Looks up an exported file.
+
+    Args:
+        directory (str | Path): The export directory.
+        month (str): The month of the Collections in the format `YYYY-MM`.
+        table (ExportTable): The exported table.
+
+    Returns:
+        ExportFile | None: The exported file, if it exists. Else, `None`.
+    """
+    path = get_export_path(directory, month, table)
+    if not path.is_file():
+        return None
+    return ExportFile(month, table, path, pq.ParquetFile(path).metadata.num_rows, path.stat().st_size)
+
+
+def get_export_files(directory: str | Path) -> list[ExportFile]:
+    """Lists the exported files.
+
+    Args:
+        directory (str | Path): The export directory.
+
+    Returns:
+        list[ExportFile]: The exported files ordered by month and table.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+
+    months = sorted(path.name.removeprefix("month=") for path in directory.glob("month=*") if path.is_dir())
+    export_files = (get_export_file(directory, month, table) for month in months for table in ExportTable)
+    return [export_file for export_file in export_files if export_file]
+
+
+def get_export_path(directory: str | Path, month: str, table: ExportTable) -> Path:
+    """Returns the path of the file a table of the Collections of a month is exported to."""
+    return Path(directory) / f"month={month}" / f"{table}.parquet"
+
+
+def get_month(collected_at: datetime) -> str:
+    """Returns the month a Collection is exported with in the format `YYYY-MM`."""
+    return collected_at.strftime("%Y-%m")
+
+
+async def export_collections(session: AsyncSession, directory: str | Path, full: bool = False) -> list[ExportFile]:
+    """Exports the Collections in the database to Parquet files. Only months with Collections that haven't been exported yet, have been updated or have been deleted since are exported, unless `full` is `True`.
+    The files of months without any Collections in the database are removed.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        directory (str | Path): The export directory.
+        full (bool, optional): Determines, whether all months should be exported again from the database. Defaults to False.
+
+    Returns:
+        list[ExportFile]: The written files.
+    """
+    async with session:
+        query = select(CollectionDB.collection_id, CollectionDB.collected_at, CollectionDB.modified_at).order_by(col(CollectionDB.collected_at))
+        collections = (await session.exec(query)).all()
+
+        written_files = []
+        months = set()
+        for month, month_collections in groupby(collections, key=lambda collection: get_month(collection[1])):
+            months.add(month)
+            month_collections = list(month_collections)
+            collection_ids = [collection_id for collection_id, _, _ in month_collections]
+            exported_collections = {} if full else await asyncio.to_thread(_get_exported_collections, directory, month)
+            new_collection_ids = [
+                collection_id
+                for collection_id, _, modified_at in month_collections
+                if collection_id not in exported_collections or exported_collections[collection_id] != modified_at
+            ]
+            has_deleted_collections = not exported_collections.keys() <= set(collection_ids)
+            if not new_collection_ids and not has_deleted_collections:
+                continue
+
+            for table in ExportTable:
+                written_files.append(await _export_month(session, directory, month, table, collection_ids, new_collection_ids, full))
+
+    await asyncio.to_thread(_remove_deleted_months, directory, months)
+    return written_files
+
+
+# ----- Helper functions -----
+
+
+def _get_exported_collections(directory: str | Path, month: str) -> dict[int, datetime | None]:
+    """Reads the `modified_at` timestamps of the Collections of a month, that have already been exported, by `collection_id`. Files exported before `modified_at` had been added are read as not modified."""
+    path = get_export_path(directory, month, ExportTable.COLLECTIONS)
+    if not path.is_file():
+        return {}
+
+    schema = get_arrow_schema(CollectionDB.__table__)
+    exported = pq.read_table(path, columns=["collection_id", "modified_at"], schema=schema)
+    collection_ids = exported.column("collection_id").to_pylist()
+    modified_ats = (utils.remove_timezone(modified_at) for modified_at in exported.column("modified_at").to_pylist())
+    return dict(zip(collection_ids, modified_ats, strict=True))
+
+
+def _remove_deleted_months(directory: str | Path, months: set[str]):
+    """Removes the exported files of the months, that are not in `months`, because all of their Collections have been deleted."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return
+
+    for month_directory in directory.glob("month=*"):
+        if month_directory.is_dir() and month_directory.name.removeprefix("month=") not in months:
+            shutil.rmtree(month_directory)
+
+
+def _get_export_query(table: ExportTable, collection_ids: Sequence[int]) -> Select:
+    """Creates a query selecting the rows of the specified Collections from a table in the order of the exported file. The Users are read including the Users carried forward, if delta storage is enabled."""
+    if table == ExportTable.USERS:
+        user = delta_storage.get_user_source()
+        columns = [getattr(user, column.name) for column in UserDB.__table__.columns]
+        return select(*columns).where(col(user.collection_id).in_(collection_ids)).order_by(user.collection_id, user.user_id)
+
+    db_table = TABLE_BY_EXPORT_TABLE[table]
+    order_by = [db_table.c.collection_id] if table == ExportTable.COLLECTIONS else [db_table.c.collection_id, db_table.c.alliance_id]
+    return select(*db_table.columns).where(db_table.c.collection_id.in_(collection_ids)).order_by(*order_by)
+
+
+async def _export_month(
+    session: AsyncSession,
+    directory: str | Path,
+    month: str,
+    table: ExportTable,
+    collection_ids: Sequence[int],
+    new_collection_ids: Sequence[int],
+    full: bool,
+) -> ExportFile:
+    """Writes the rows of a table of the Collections of a month to a temporary file and replaces the exported file with it afterwards, so that readers never see a partially written file.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        directory (str | Path): The export directory.
+        month (str): The month in the format `YYYY-MM`.
+        table (ExportTable): The table to export.
+        collection_ids (Sequence[int]): The `collection_id`s of all Collections of the month in the database.
+        new_collection_ids (Sequence[int]): The `collection_id`s of the new and updated Collections to read from the database.
+        full (bool): Determines, whether to ignore the existing file.
+
+    Returns:
+        ExportFile: The written file.
+    """
+    schema = get_arrow_schema(TABLE_BY_EXPORT_TABLE[table])
+    path = get_export_path(directory, month, table)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.tmp")
+
+    writer = pq.ParquetWriter(temp_path, schema, compression=EXPORT_COMPRESSION)
+    try:
+        if not full and path.is_file():
+            # Rows of Collections deleted or updated since the last export are dropped.
+            unchanged_collection_ids = sorted(set(collection_ids).difference(new_collection_ids))
+            exported = await asyncio.to_thread(pq.read_table, path, schema=schema)
+            exported = exported.filter(pc.is_in(exported.column("collection_id"), value_set=pa.array(unchanged_collection_ids, type=pa.int32())))
+            await asyncio.to_thread(writer.write_table, exported)
+
+        async for batch in _stream_record_batches(session, _get_export_query(table, new_collection_ids), schema):
+            await asyncio.to_thread(writer.write_batch, batch)
+    finally:
+        writer.close()
+
+    os.replace(temp_path, path)
+    return get_export_file(directory, month, table)
+
+
+async def _stream_record_batches(session: AsyncSession, query: Select, schema: pa.Schema) -> AsyncIterator[pa.RecordBatch]:
+    """Executes a query with a server-side cursor and converts the rows to Arrow record batches of up to `EXPORT_BATCH_SIZE` rows.
+
+    Args:
+        session (AsyncSession): The database session to use. The session will not be closed.
+        query (Select): The query selecting the columns of the `schema` in order.
+        schema (pa.Schema): The schema of the record batches.
+
+    Yields:
+        pa.RecordBatch: The converted rows.
+    """
+    result = await session.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for rows in result.partitions():
+        yield await asyncio.to_thread(_to_record_batch, rows, schema)
+
+
+def _to_record_batch(rows: Sequence[Sequence], schema: pa.Schema) -> pa.RecordBatch:
+    columns = zip(*rows, strict=True)
+    return pa.RecordBatch.from_arrays([pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)], schema=schema)
+
+
+async def run(args: argparse.Namespace):
+    engine = create_async_engine(SETTINGS.async_database_connection_str)
+    started_at = time.perf_counter()
+    async with EXPORT_LOCK:
+        written_files = await export_collections(AsyncSession(engine), args.directory, args.full)
+    for written_file in written_files:
+        print(f"Exported {written_file.row_count} rows to '{written_file.path}' ({written_file.size / 1024**2:.1f} MiB)")
+    print(f"Wrote {len(written_files)} files in {time.perf_counter() - started_at:.1f} s")
+    await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export the Collections to Parquet files partitioned by month.")
+    parser.add_argument(
+        "--directory", type=str, default=SETTINGS.export_directory, help="The export directory. Defaults to the setting `EXPORT_DIRECTORY`."
+    )
+    parser.add_argument("--full", action="store_true", help="Export all months again instead of only the months with new Collections.")
+    return parser.parse_args()
+
+
+def main():
+    asyncio.run(run(parse_args()))
+
+
+__all__ = [
+    "EXPORT_LOCK",
+    "MEDIA_TYPE_PARQUET",
+    "ExportFile",
+    "export_collections",
+    "get_arrow_schema",
+    "get_export_file",
+    "get_export_files",
+    "get_export_path",
+    "get_month",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.gzip import GZipMiddleware
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from . import exception_handlers
+from . import exception_handlers, metrics, rate_limiting, server_timing, snapshot
+from .coalescing import RequestCoalescingMiddleware
 from .config import CONSTANTS, SETTINGS
 from .database import db
 from .models.exceptions import (
@@ -16,8 +18,9 @@ from .models.exceptions import (
     NotFoundError,
     ParameterValidationError,
     ServerError,
+    TooManyRequestsError,
 )
-from .routers import alliances, collections, root, users
+from .routers import alliances, collections, dependencies, events, exports, root, search, stats, tournaments, users
 
 
 @asynccontextmanager
@@ -34,6 +37,11 @@ async def lifespan(app: FastAPI):
     print(f"Reinitialize database: {SETTINGS.reinitialize_database_on_startup}")
     print(f"Insert dummy data: {SETTINGS.create_dummy_data_on_startup}")
     print(f"In github action: {SETTINGS.in_github_actions}")
+    print(f"Read replicas: {len(SETTINGS.async_read_replica_connection_strs)}")
+    print(f"Rate limiting: {SETTINGS.rate_limit_enabled} ({SETTINGS.rate_limit_backend})")
+    print(f"Request coalescing: {SETTINGS.request_coalescing_enabled}")
+    print(f"Server timing: {SETTINGS.server_timing_enabled}")
+    print(f"Snapshot: {SETTINGS.snapshot_collection_count} Collections in '{SETTINGS.snapshot_directory}'")
 
     await initialize_app(
         app,
@@ -41,10 +49,27 @@ async def lifespan(app: FastAPI):
         SETTINGS.debug,
         SETTINGS.reinitialize_database_on_startup,
         SETTINGS.create_dummy_data_on_startup,
+        SETTINGS.async_read_replica_connection_strs,
     )
 
+    read_replica_monitor = None
+    if db.READ_REPLICAS:
+        read_replica_monitor = asyncio.create_task(db.monitor_read_replicas(SETTINGS.read_replica_health_check_interval))
+
+    snapshot_monitor = None
+    if SETTINGS.snapshot_refresh_interval > 0:
+        snapshot_monitor = asyncio.create_task(snapshot.monitor_snapshot(SETTINGS.snapshot_refresh_interval))
+
     yield
 
+    for monitor in (read_replica_monitor, snapshot_monitor):
+        if monitor:
+            monitor.cancel()
+            with suppress(asyncio.CancelledError):
+                await monitor
+
+    metrics.mark_process_dead()
+
 
 app = FastAPI(
     version=SETTINGS.version,
@@ -56,16 +81,27 @@ app = FastAPI(
     lifespan=lifespan,
     swagger_ui_parameters={"syntaxHighlight": False},  # Increases performance on large responses
     strict_content_type=False,
+    dependencies=[Depends(dependencies.rate_limit)],
 )
 
 
 app.include_router(alliances.router)
 app.include_router(collections.router)
+app.include_router(events.router)
+app.include_router(exports.router)
+app.include_router(search.router)
+app.include_router(stats.router)
+app.include_router(tournaments.router)
 app.include_router(users.router)
 app.include_router(root.router)
 
 
+if SETTINGS.request_coalescing_enabled:
+    app.add_middleware(RequestCoalescingMiddleware)
+app.add_middleware(db.ReadYourWritesMiddleware)
 app.add_middleware(GZipMiddleware, minimum_size=1)
+app.add_middleware(server_timing.ServerTimingMiddleware)
+app.add_middleware(metrics.MetricsMiddleware)
 
 
 app.add_exception_handler(StarletteHTTPException, exception_handlers.handle_http_exception)
@@ -76,10 +112,18 @@ app.add_exception_handler(MethodNotAllowedError, exception_handlers.handle_metho
 app.add_exception_handler(ConflictError, exception_handlers.handle_conflict)
 app.add_exception_handler(ParameterValidationError, exception_handlers.handle_parameter_validation)
 app.add_exception_handler(RequestValidationError, exception_handlers.handle_request_validation)
+app.add_exception_handler(TooManyRequestsError, exception_handlers.handle_too_many_requests)
 app.add_exception_handler(ServerError, exception_handlers.handle_server)
 
 
-async def initialize_app(app: FastAPI, database_connection_string: str, echo: bool, reinitialize_database: bool, create_dummy_data: bool):
+async def initialize_app(
+    app: FastAPI,
+    database_connection_string: str,
+    echo: bool,
+    reinitialize_database: bool,
+    create_dummy_data: bool,
+    read_replica_connection_strings: tuple[str, ...] = (),
+):
     """Initialize the API.
 
     Args:
@@ -88,8 +132,15 @@ async def initialize_app(app: FastAPI, database_connection_string: str, echo: bo
         echo (bool): Determines, if SQL statements should be printed to stdout.
         reinitialize_database (bool): Determines, if the database tables should be dropped on app startup.
         create_dummy_data (bool): Determines, if dummy data should be attempted to be inserted on app startup.
+        read_replica_connection_strings (tuple[str, ...], optional): The connection strings of read-only database replicas to send reads to. Defaults to ().
     """
-    db.set_up_db_engine(database_connection_string, echo=echo)
+    db.set_up_db_engine(database_connection_string, echo=echo, read_replica_urls=read_replica_connection_strings)
+    metrics.instrument_engine(db.ENGINE, "primary")
+    server_timing.instrument_engine(db.ENGINE)
+    for read_replica in db.READ_REPLICAS:
+        metrics.instrument_engine(read_replica.engine, "replica")
+        server_timing.instrument_engine(read_replica.engine)
+    rate_limiting.set_up_rate_limiter(SETTINGS.rate_limit_backend)
 
     db.initialize_db(reinitialize=reinitialize_database)
 
@@ -0,0 +1,203 @@
+import os
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+METRICS_PREFIX: str = "pss_fleet_data_api"
+SQL_OPERATIONS: tuple[str, ...] = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+# HTTP
+HTTP_REQUEST_DURATION = Histogram(
+    f"{METRICS_PREFIX}_http_request_duration_seconds",
+    "The time it took to respond to a request.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    f"{METRICS_PREFIX}_http_response_size_bytes",
+    "The size of a response body as sent to the client.",
+    ["method", "route"],
+    buckets=(256, 1_024, 4_096, 16_384, 65_536, 262_144, 1_048_576, 4_194_304, 16_777_216, 67_108_864),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    f"{METRICS_PREFIX}_http_requests_in_flight",
+    "The number of requests currently being processed.",
+    multiprocess_mode="livesum",
+)
+
+# Database
+DB_QUERY_DURATION = Histogram(
+    f"{METRICS_PREFIX}_db_query_duration_seconds",
+    "The time it took to execute an SQL statement. The `_count` is the number of executed statements.",
+    ["database", "operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    f"{METRICS_PREFIX}_db_pool_connections",
+    "The number of open connections in the connection pool.",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    f"{METRICS_PREFIX}_db_pool_checked_out_connections",
+    "The number of connections currently checked out from the connection pool.",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+
+# Ingest
+INGEST_ROWS = Counter(
+    f"{METRICS_PREFIX}_ingested_rows_total",
+    "The number of rows inserted into the database by saving Collections.",
+    ["table"],
+)
+INGEST_DURATION = Histogram(
+    f"{METRICS_PREFIX}_ingest_duration_seconds",
+    "The time it took to save a Collection to the database.",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+INGEST_ROWS_PER_SECOND = Gauge(
+    f"{METRICS_PREFIX}_ingest_rows_per_second",
+    "The throughput of the most recent Collection save.",
+    multiprocess_mode="mostrecent",
+)
+
+
+class MetricsMiddleware:
+    """
+    Records the duration, response size and status of every HTTP request, labelled by the path template of the matched route to keep the number of time series bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.labels(method, route_path, status_code).observe(time.perf_counter() - started_at)
+            HTTP_RESPONSE_SIZE.labels(method, route_path).observe(response_size)
+
+
+def generate_metrics() -> bytes:
+    """Renders all metrics in the Prometheus text format. If the environment variable `PROMETHEUS_MULTIPROC_DIR` is set, the metrics of all worker processes are aggregated.
+
+    Returns:
+        bytes: The rendered metrics.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+
+    return generate_latest(REGISTRY)
+
+
+def get_sql_operation(statement: str) -> str:
+    """Determines the kind of an SQL statement by its first keyword.
+
+    Args:
+        statement (str): The SQL statement.
+
+    Returns:
+        str: One of `SQL_OPERATIONS` or `OTHER`.
+    """
+    head = statement[:16].lstrip().upper()
+    for operation in SQL_OPERATIONS:
+        if head.startswith(operation):
+            return operation
+    return "OTHER"
+
+
+def instrument_engine(engine: AsyncEngine, database: str):
+    """Registers SQLAlchemy event listeners on the `engine` to record the duration of SQL statements and the connection pool usage.
+
+    Args:
+        engine (AsyncEngine): The engine to be instrumented.
+        database (str): The value of the `database` label, e.g. `primary` or `replica`.
+    """
+    sync_engine = engine.sync_engine
+    query_duration = {operation: DB_QUERY_DURATION.labels(database, operation) for operation in (*SQL_OPERATIONS, "OTHER")}
+    pool_connections = DB_POOL_CONNECTIONS.labels(database)
+    pool_checked_out = DB_POOL_CHECKED_OUT.labels(database)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+        context._metrics_started_at = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(_conn, _cursor, statement, _parameters, context, _executemany):
+        query_duration[get_sql_operation(statement)].observe(time.perf_counter() - context._metrics_started_at)
+
+    @event.listens_for(sync_engine.pool, "connect")
+    def connect(_dbapi_connection, _connection_record):
+        pool_connections.inc()
+
+    @event.listens_for(sync_engine.pool, "close")
+    def close(_dbapi_connection, _connection_record):
+        pool_connections.dec()
+
+    @event.listens_for(sync_engine.pool, "checkout")
+    def checkout(_dbapi_connection, _connection_record, _connection_proxy):
+        pool_checked_out.inc()
+
+    @event.listens_for(sync_engine.pool, "checkin")
+    def checkin(_dbapi_connection, _connection_record):
+        pool_checked_out.dec()
+
+
+def mark_process_dead():
+    """Removes the live gauges of the current worker process from the aggregated metrics, if multiple worker processes are used."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def observe_ingest(rows_by_table: dict[str, int], duration: float):
+    """Records the number of rows inserted by saving a Collection and the throughput.
+
+    Args:
+        rows_by_table (dict[str, int]): The number of inserted rows per table.
+        duration (float): The number of seconds it took to insert the rows.
+    """
+    for table, rows in rows_by_table.items():
+        INGEST_ROWS.labels(table).inc(rows)
+    INGEST_DURATION.observe(duration)
+    if duration > 0:
+        INGEST_ROWS_PER_SECOND.set(sum(rows_by_table.values()) / duration)
+
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "MetricsMiddleware",
+    "generate_metrics",
+    "get_sql_operation",
+    "instrument_engine",
+    "mark_process_dead",
+    "observe_ingest",
+]
@@ -5,8 +5,12 @@ from .api_models import (
     AllianceCreate4,
     AllianceCreate6,
     AllianceCreate7,
+    AllianceHistogramOut,
+    AllianceHistoriesOut,
     AllianceHistoryOut,
+    AllianceLeaderboardOut,
     AllianceOut,
+    AllianceRankOut,
     CollectionCreate3,
     CollectionCreate4,
     CollectionCreate5,
@@ -14,12 +18,30 @@ from .api_models import (
     CollectionCreate7,
     CollectionCreate8,
     CollectionCreate9,
+    CollectionDiffOut,
     CollectionMetadataCreate4,
     CollectionMetadataCreate9,
     CollectionMetadataOut,
+    CollectionMoversOut,
     CollectionOut,
+    CollectionStatsOut,
     CollectionWithFleetsOut,
     CollectionWithUsersOut,
+    DivisionStandingOut,
+    DivisionStandingsOut,
+    EntityChangeOut,
+    EntityEventOut,
+    EntityNameOut,
+    EntityNameSpanOut,
+    ExportFileOut,
+    HistogramBucketOut,
+    HistogramOut,
+    PercentileOut,
+    TournamentAllianceProgressOut,
+    TournamentAlliancesOut,
+    TournamentOut,
+    TournamentUserDeltaOut,
+    TournamentUsersOut,
     UserCreate3,
     UserCreate4,
     UserCreate5,
@@ -27,8 +49,14 @@ from .api_models import (
     UserCreate8,
     UserCreate9,
     UserDataCreate3,
+    UserHistoriesOut,
+    UserHistoryDeltaOut,
+    UserHistoryDeltasOut,
     UserHistoryOut,
+    UserLeaderboardOut,
+    UserMoverOut,
     UserOut,
+    UserRankOut,
 )
 
 
@@ -40,8 +68,12 @@ __all__ = [
     "AllianceCreate4",
     "AllianceCreate6",
     "AllianceCreate7",
+    "AllianceHistogramOut",
+    "AllianceHistoriesOut",
     "AllianceHistoryOut",
+    "AllianceLeaderboardOut",
     "AllianceOut",
+    "AllianceRankOut",
     "CollectionCreate3",
     "CollectionCreate4",
     "CollectionCreate5",
@@ -49,12 +81,30 @@ __all__ = [
     "CollectionCreate7",
     "CollectionCreate8",
     "CollectionCreate9",
+    "CollectionDiffOut",
     "CollectionMetadataCreate4",
     "CollectionMetadataCreate9",
     "CollectionMetadataOut",
+    "CollectionMoversOut",
     "CollectionOut",
+    "CollectionStatsOut",
     "CollectionWithFleetsOut",
     "CollectionWithUsersOut",
+    "DivisionStandingOut",
+    "DivisionStandingsOut",
+    "EntityChangeOut",
+    "EntityEventOut",
+    "EntityNameOut",
+    "EntityNameSpanOut",
+    "ExportFileOut",
+    "HistogramBucketOut",
+    "HistogramOut",
+    "PercentileOut",
+    "TournamentAllianceProgressOut",
+    "TournamentAlliancesOut",
+    "TournamentOut",
+    "TournamentUserDeltaOut",
+    "TournamentUsersOut",
     "UserCreate3",
     "UserCreate4",
     "UserCreate5",
@@ -62,8 +112,14 @@ __all__ = [
     "UserCreate8",
     "UserCreate9",
     "UserDataCreate3",
+    "UserHistoriesOut",
+    "UserHistoryDeltaOut",
+    "UserHistoryDeltasOut",
     "UserHistoryOut",
+    "UserLeaderboardOut",
+    "UserMoverOut",
     "UserOut",
+    "UserRankOut",
     # Modules
     "converters",
     "exceptions",
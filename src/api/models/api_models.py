@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field, field_validator
 
 from .. import utils
 from ..config import CONSTANTS
-from .enums import UserAllianceMembershipEncoded
+from .enums import EntityChange, EntityEventType, EntityType, ExportTable, ParameterAllianceMetric, ParameterUserMetric, UserAllianceMembershipEncoded
 
 
 DATETIME = Annotated[datetime, Field(ge=CONSTANTS.pss_start_date)]
@@ -523,8 +523,8 @@ class CollectionMetadataOut(CollectionMetadataCreate9):
     See also: https://github.com/Zukunftsmusik/pss-fleet-data?tab=readme-ov-file#schema-version-9
     """
 
-    collection_id: int
-    """The ID of the collection in the database."""
+    collection_id: int | None
+    """The ID of the collection in the database. `None` for an empty Collection filling in for a missing one, if `onMissing=empty` has been specified."""
     max_tournament_battle_attempts: int | None
     """The maximum number of tournament battles any given player can do on a given monthly fleet tournament day."""
 
@@ -608,12 +608,23 @@ class AllianceHistoryOut(BaseModel):
 
     collection: CollectionMetadataOut
     """The metadata of the Collection that represents the point in the history of the Alliance."""
-    fleet: AllianceOut
-    """The recorded Alliance data."""
+    fleet: AllianceOut | None
+    """The recorded Alliance data. `None` for an empty Collection filling in for a missing one, if `onMissing=empty` has been specified."""
     users: list[UserOut]
     """The members of the Alliance at the time of recording the Alliance data."""
 
 
+class AllianceHistoriesOut(BaseModel):
+    """
+    The recorded history of one of multiple requested Alliances.
+    """
+
+    alliance_id: int
+    """The ID of the requested Alliance."""
+    history: list[AllianceHistoryOut]
+    """The points in the recorded history of the Alliance. Empty, if there's no data for the Alliance."""
+
+
 class UserHistoryOut(BaseModel):
     """
     A point in the recorded history of a User.
@@ -621,12 +632,383 @@ class UserHistoryOut(BaseModel):
 
     collection: CollectionMetadataOut
     """The metadata of the Collection that represents the point in the history of the Alliance."""
-    user: UserOut
-    """The recorded User data."""
+    user: UserOut | None
+    """The recorded User data. `None` for an empty Collection filling in for a missing one, if `onMissing=empty` has been specified."""
     fleet: AllianceOut | None
     """The Alliance of the User at the time of recording the User data. May be `None`, if the User was not in an Alliance at the time."""
 
 
+UserHistoryDeltaOut = tuple[int, datetime, list[int | None], list[int | None], list[float | None]]
+"""(
+    0: collection_id,
+    1: timestamp,
+    2: values,
+    3: deltas,
+    4: rates
+)
+The values, their changes since the previous entry (deltas) and their changes per day since the previous entry (rates) are listed in the order of the requested metrics.
+"""
+
+
+class UserHistoryDeltasOut(BaseModel):
+    """
+    The changes of numeric properties of a User over time.
+    """
+
+    user_id: int
+    """The ID of the requested User."""
+    metrics: list[ParameterUserMetric]
+    """The requested properties of the User in the order of the values in the entries."""
+    entries: list[UserHistoryDeltaOut]
+    """The points in the recorded history of the User. The deltas and rates of the earliest entry in the requested time frame are `None`."""
+
+
+EntityChangeOut = tuple[int, EntityChange, int | str | None, int | str | None]
+"""(
+    0: alliance_id or user_id,
+    1: change,
+    2: old_value,
+    3: new_value
+)
+The old value is `None` for appeared entities and the new value is `None` for disappeared entities.
+"""
+
+
+EntityEventOut = tuple[int, datetime, EntityType, int, EntityEventType, str | None, str | None]
+"""(
+    0: collection_id,
+    1: collected_at,
+    2: entity_type,
+    3: alliance_id or user_id,
+    4: event_type,
+    5: old_value,
+    6: new_value
+)
+The values are converted to `str`.
+"""
+
+
+EntityNameOut = tuple[EntityType, int, str, datetime, datetime, float]
+"""(
+    0: entity_type,
+    1: alliance_id or user_id,
+    2: name,
+    3: first_seen_at,
+    4: last_seen_at,
+    5: score
+)
+The score is the trigram similarity of the name and the search term between 0 and 1.
+"""
+
+
+EntityNameSpanOut = tuple[str, datetime, datetime]
+"""(
+    0: name,
+    1: first_seen_at,
+    2: last_seen_at
+)
+"""
+
+
+class CollectionDiffOut(BaseModel):
+    """
+    The changes of the Alliances and Users between two Collections.
+    """
+
+    from_collection: CollectionMetadataOut
+    """The metadata of the earlier Collection."""
+    to_collection: CollectionMetadataOut
+    """The metadata of the later Collection."""
+    alliances: list[EntityChangeOut]
+    """The changes of the Alliances ordered by `alliance_id`."""
+    users: list[EntityChangeOut]
+    """The changes of the Users ordered by `user_id`. A User may have multiple changes."""
+
+
+DivisionStandingOut = tuple[int, int, str, int, int | None, int | None, int, int, int]
+"""(
+    0: rank,
+    1: alliance_id,
+    2: alliance_name,
+    3: score,
+    4: trophy,
+    5: championship_score,
+    6: member_count,
+    7: member_stars,
+    8: member_trophy
+)
+The `score` is the number of stars of the Alliance. The member values are the number of members in the Collection and the sums of their `alliance_score` (stars) and `trophy`.
+"""
+
+
+class DivisionStandingsOut(BaseModel):
+    """
+    The standings of a tournament division in a Collection.
+    """
+
+    meta: CollectionMetadataOut
+    """The metadata of the Collection."""
+    division_design_id: int
+    """The tournament division."""
+    standings: list[DivisionStandingOut]
+    """The Alliances in the division ordered by rank."""
+
+
+UserMoverOut = tuple[int, str, int, int, int, int]
+"""(
+    0: user_id,
+    1: user_name,
+    2: alliance_id,
+    3: from_value,
+    4: to_value,
+    5: change
+)
+The `alliance_id` is the one of the User in the later Collection.
+"""
+
+
+class CollectionStatsOut(BaseModel):
+    """
+    Aggregated numbers of a Collection.
+    """
+
+    meta: CollectionMetadataOut
+    """The metadata of the Collection."""
+    user_count: int
+    """The number of Users in the Collection."""
+    alliance_count: int
+    """The number of Alliances in the Collection."""
+    trophy_total: int
+    """The sum of the trophies of all Users."""
+    trophy_average: float | None
+    """The average trophies of the Users. `None`, if there are no Users."""
+    alliance_score_total: int
+    """The sum of the stars of all Users."""
+    active_user_count_day: int
+    """The number of Users, who logged in during the day before the Collection has been collected."""
+    active_user_count_week: int
+    """The number of Users, who logged in during the 7 days before the Collection has been collected."""
+    active_user_count_month: int
+    """The number of Users, who logged in during the 30 days before the Collection has been collected."""
+    users_by_division: dict[int, int]
+    """The number of Users in Alliances by the `division_design_id` of their Alliance."""
+    users_by_membership: dict[str, int]
+    """The number of Users by their fleet rank. Users without a fleet rank are counted as "None"."""
+
+
+HistogramBucketOut = tuple[float, float, int]
+"""(
+    0: lower_bound,
+    1: upper_bound,
+    2: count
+)
+The lower bound is inclusive, the upper bound is exclusive.
+"""
+PercentileOut = tuple[float, int]
+"""(
+    0: fraction,
+    1: value
+)
+"""
+
+
+class HistogramOut(BaseModel):
+    """
+    The distribution of a numeric property of the Users of a Collection.
+    """
+
+    meta: CollectionMetadataOut
+    """The metadata of the Collection."""
+    metric: ParameterUserMetric
+    """The property of the Users, whose distribution has been computed."""
+    count: int
+    """The number of Users with a value."""
+    min_value: int | None
+    """The lowest value. `None`, if no User has a value."""
+    max_value: int | None
+    """The highest value. `None`, if no User has a value."""
+    percentiles: list[PercentileOut]
+    """The values at common percentiles. Every value is one of the values of the Users."""
+    buckets: list[HistogramBucketOut]
+    """The number of Users per bucket of equal width ordered by their bounds."""
+
+
+class AllianceHistogramOut(BaseModel):
+    """
+    The distribution of a numeric property of the Alliances of a Collection.
+    """
+
+    meta: CollectionMetadataOut
+    """The metadata of the Collection."""
+    metric: ParameterAllianceMetric
+    """The property of the Alliances, whose distribution has been computed."""
+    count: int
+    """The number of Alliances with a value."""
+    min_value: int | None
+    """The lowest value. `None`, if no Alliance has a value."""
+    max_value: int | None
+    """The highest value. `None`, if no Alliance has a value."""
+    percentiles: list[PercentileOut]
+    """The values at common percentiles. Every value is one of the values of the Alliances."""
+    buckets: list[HistogramBucketOut]
+    """The number of Alliances per bucket of equal width ordered by their bounds."""
+
+
+class CollectionMoversOut(BaseModel):
+    """
+    The Users with the biggest change of a numeric property between two Collections.
+    """
+
+    from_collection: CollectionMetadataOut
+    """The metadata of the Collection compared against."""
+    to_collection: CollectionMetadataOut
+    """The metadata of the compared Collection."""
+    metric: ParameterUserMetric
+    """The property of the Users that has been compared."""
+    users: list[UserMoverOut]
+    """The Users present in both Collections ordered by the change of the `metric`."""
+
+
+UserRankOut = tuple[int, int, str, int, int]
+"""(
+    0: rank,
+    1: user_id,
+    2: user_name,
+    3: alliance_id,
+    4: value
+)
+Users with equal values share a rank.
+"""
+
+
+class UserLeaderboardOut(BaseModel):
+    """
+    The Users of a Collection ranked by a numeric property.
+    """
+
+    meta: CollectionMetadataOut
+    """The metadata of the Collection."""
+    metric: ParameterUserMetric
+    """The property of the Users that has been ranked by."""
+    users: list[UserRankOut]
+    """The ranked Users ordered by rank."""
+
+
+AllianceRankOut = tuple[int, int, str, int, int]
+"""(
+    0: rank,
+    1: alliance_id,
+    2: alliance_name,
+    3: division_design_id,
+    4: value
+)
+Alliances with equal values share a rank.
+"""
+
+
+class AllianceLeaderboardOut(BaseModel):
+    """
+    The Alliances of a Collection ranked by a numeric property.
+    """
+
+    meta: CollectionMetadataOut
+    """The metadata of the Collection."""
+    metric: ParameterAllianceMetric
+    """The property of the Alliances that has been ranked by."""
+    alliances: list[AllianceRankOut]
+    """The ranked Alliances ordered by rank."""
+
+
+class TournamentOut(BaseModel):
+    """
+    A monthly fleet tournament detected from the Collections collected during it.
+    """
+
+    first_collection: CollectionMetadataOut
+    """The metadata of the first Collection collected during the tournament."""
+    last_collection: CollectionMetadataOut
+    """The metadata of the last Collection collected during the tournament. If the tournament is still running, this is the latest Collection."""
+    collection_count: int
+    """The number of Collections collected during the tournament."""
+
+
+TournamentAllianceProgressOut = tuple[datetime, int, str, int, int, int | None, int | None, int | None]
+"""(
+    0: timestamp,
+    1: alliance_id,
+    2: alliance_name,
+    3: division_design_id,
+    4: score,
+    5: score_change,
+    6: trophy,
+    7: trophy_change
+)
+The entries are taken from the first Collection of the tournament and from the last Collection of each of its days. The changes are relative to the previous entry of the Alliance and `None` for its first entry.
+"""
+
+
+class TournamentAlliancesOut(BaseModel):
+    """
+    The daily progression of the Alliances during a tournament.
+    """
+
+    tournament: TournamentOut
+    """The tournament."""
+    alliances: list[TournamentAllianceProgressOut]
+    """The progression of the Alliances ordered by `alliance_id` and timestamp."""
+
+
+TournamentUserDeltaOut = tuple[int, str, int, int | None, int | None, int | None, int | None]
+"""(
+    0: user_id,
+    1: user_name,
+    2: alliance_id,
+    3: tournament_bonus_score,
+    4: tournament_bonus_score_change,
+    5: championship_score,
+    6: championship_score_change
+)
+The values are taken from the last Collection of the tournament and the changes are relative to its first Collection. The changes are `None` for Users missing from the first Collection.
+"""
+
+
+class TournamentUsersOut(BaseModel):
+    """
+    The changes of the tournament scores of the Users during a tournament.
+    """
+
+    tournament: TournamentOut
+    """The tournament."""
+    users: list[TournamentUserDeltaOut]
+    """The Users ordered descending by the change of their championship score and then of their tournament bonus score."""
+
+
+class UserHistoriesOut(BaseModel):
+    """
+    The recorded history of one of multiple requested Users.
+    """
+
+    user_id: int
+    """The ID of the requested User."""
+    history: list[UserHistoryOut]
+    """The points in the recorded history of the User. Empty, if there's no data for the User."""
+
+
+class ExportFileOut(BaseModel):
+    """
+    A Parquet file containing a table of the Collections of a month.
+    """
+
+    month: str
+    """The month of the Collections in the format `YYYY-MM`."""
+    table: ExportTable
+    """The exported table."""
+    row_count: int
+    """The number of rows in the file."""
+    size: int
+    """The size of the file in bytes."""
+
+
 all = [
     "AllianceCreate2",
     "AllianceCreate3",
@@ -634,6 +1016,7 @@ all = [
     "AllianceCreate6",
     "AllianceCreate7",
     "AllianceOut",
+    "AllianceHistoriesOut",
     "AllianceHistoryOut",
     "CollectionCreate3",
     "CollectionCreate4",
@@ -642,10 +1025,19 @@ all = [
     "CollectionCreate7",
     "CollectionCreate8",
     "CollectionCreate9",
+    "CollectionDiffOut",
     "CollectionMetadataOut",
+    "CollectionMoversOut",
     "CollectionOut",
     "CollectionWithFleetsOut",
     "CollectionWithUsersOut",
+    "DivisionStandingOut",
+    "DivisionStandingsOut",
+    "EntityChangeOut",
+    "EntityEventOut",
+    "EntityNameOut",
+    "EntityNameSpanOut",
+    "ExportFileOut",
     "UserCreate3",
     "UserCreate4",
     "UserCreate5",
@@ -653,6 +1045,10 @@ all = [
     "UserCreate8",
     "UserCreate9",
     "UserDataCreate3",
+    "UserHistoriesOut",
+    "UserHistoryDeltaOut",
+    "UserHistoryDeltasOut",
     "UserHistoryOut",
+    "UserMoverOut",
     "UserOut",
 ]
@@ -1,13 +1,34 @@
 from .. import utils
 from ..config import CONSTANTS
-from ..database.models import AllianceDB, AllianceHistoryDB, CollectionDB, UserDB, UserHistoryDB
+from ..database.models import (
+    AllianceDB,
+    AllianceHistoryDB,
+    AllianceRankDB,
+    CollectionDB,
+    CollectionStatsHistoryDB,
+    DivisionStandingDB,
+    EntityEventDB,
+    EntityNameMatchDB,
+    EntityNameSpanDB,
+    HistogramDB,
+    TournamentAllianceProgressDB,
+    TournamentDB,
+    TournamentUserDeltaDB,
+    UserDB,
+    UserHistoryDB,
+    UserHistoryDeltaDB,
+    UserMoverDB,
+    UserRankDB,
+)
 from .api_models import (
     AllianceCreate2,
     AllianceCreate3,
     AllianceCreate4,
     AllianceCreate6,
     AllianceCreate7,
+    AllianceHistogramOut,
     AllianceHistoryOut,
+    AllianceLeaderboardOut,
     AllianceOut,
     CollectionCreate3,
     CollectionCreate4,
@@ -17,9 +38,20 @@ from .api_models import (
     CollectionCreate8,
     CollectionCreate9,
     CollectionMetadataOut,
+    CollectionMoversOut,
     CollectionOut,
+    CollectionStatsOut,
     CollectionWithFleetsOut,
     CollectionWithUsersOut,
+    DivisionStandingsOut,
+    EntityEventOut,
+    EntityNameOut,
+    EntityNameSpanOut,
+    HistogramBucketOut,
+    HistogramOut,
+    TournamentAlliancesOut,
+    TournamentOut,
+    TournamentUsersOut,
     UserCreate3,
     UserCreate4,
     UserCreate5,
@@ -27,10 +59,12 @@ from .api_models import (
     UserCreate8,
     UserCreate9,
     UserDataCreate3,
+    UserHistoryDeltaOut,
     UserHistoryOut,
+    UserLeaderboardOut,
     UserOut,
 )
-from .enums import UserAllianceMembership
+from .enums import EntityEventType, EntityType, ParameterAllianceMetric, ParameterUserMetric, UserAllianceMembership
 
 
 class FromDB:
@@ -70,10 +104,52 @@ class FromDB:
             AllianceHistoryOut: The converted Alliance History.
         """
         collection = FromDB.to_collection_metadata(source[0])
-        alliance = FromDB.to_alliance(source[1])
-        users = [FromDB.to_user(user) for user in source[1].users if user] if source[1].users else []
+        alliance = FromDB.to_alliance(source[1]) if source[1] else None
+        users = [FromDB.to_user(user) for user in source[1].users if user] if source[1] and source[1].users else []
         return AllianceHistoryOut(collection=collection, fleet=alliance, users=users)
 
+    @staticmethod
+    def to_alliance_histogram(collection: CollectionDB, metric: ParameterAllianceMetric, buckets: int, source: HistogramDB) -> AllianceHistogramOut:
+        """Takes a Collection and the distribution of a property of its Alliances from the database and converts them to an Alliance Histogram to be returned by the API.
+
+        Args:
+            collection (CollectionDB): The Collection.
+            metric (ParameterAllianceMetric): The property of the Alliances, whose distribution has been computed.
+            buckets (int): The number of buckets the range of values has been divided into.
+            source (HistogramDB): The tuple of the count, the lowest and the highest value, the percentiles and the counts per bucket to be converted.
+
+        Returns:
+            AllianceHistogramOut: The converted Alliance Histogram. The bounds of the buckets are rounded to 3 decimal places.
+        """
+        count, min_value, max_value, percentiles, bucket_counts = source
+        return AllianceHistogramOut(
+            meta=FromDB.to_collection_metadata(collection),
+            metric=metric,
+            count=count,
+            min_value=min_value,
+            max_value=max_value,
+            percentiles=[tuple(percentile) for percentile in percentiles],
+            buckets=_get_histogram_buckets(min_value, max_value, buckets, bucket_counts),
+        )
+
+    @staticmethod
+    def to_alliance_leaderboard(source: CollectionDB, metric: ParameterAllianceMetric, ranks: list[AllianceRankDB]) -> AllianceLeaderboardOut:
+        """Takes a Collection from the database and its Alliances ranked by a property and converts them to an Alliance Leaderboard to be returned by the API.
+
+        Args:
+            source (CollectionDB): The Collection.
+            metric (ParameterAllianceMetric): The property of the Alliances that has been ranked by.
+            ranks (list[AllianceRankDB]): The ranked Alliances.
+
+        Returns:
+            AllianceLeaderboardOut: The converted Alliance Leaderboard.
+        """
+        return AllianceLeaderboardOut(
+            meta=FromDB.to_collection_metadata(source),
+            metric=metric,
+            alliances=[tuple(rank) for rank in ranks],
+        )
+
     @staticmethod
     def to_collection(source: CollectionDB, include_alliances: bool, include_users: bool) -> CollectionOut:
         """Takes a Collection from the database and converts it to a Collection to be returned by the API.
@@ -98,11 +174,11 @@ class FromDB:
             source (CollectionDB): The Collection to be converted.
 
         Returns:
-            CollectionMetadataOut: The converted Collection.
+            CollectionMetadataOut: The converted Collection. An empty Collection filling in for a missing one doesn't have a `collection_id` and `data_version`.
         """
         return CollectionMetadataOut(
             collection_id=source.collection_id,
-            data_version=source.data_version,
+            data_version=source.data_version if source.collection_id is not None else None,
             timestamp=utils.localize_to_utc(source.collected_at),
             duration=source.duration,
             fleet_count=source.fleet_count,
@@ -112,6 +188,53 @@ class FromDB:
             schema_version=CONSTANTS.latest_schema_version,
         )
 
+    @staticmethod
+    def to_collection_movers(
+        from_collection: CollectionDB, to_collection: CollectionDB, metric: ParameterUserMetric, movers: list[UserMoverDB]
+    ) -> CollectionMoversOut:
+        """Takes two Collections from the database and the Users ranked by the change of a property between them and converts them to Collection Movers to be returned by the API.
+
+        Args:
+            from_collection (CollectionDB): The Collection compared against.
+            to_collection (CollectionDB): The compared Collection.
+            metric (ParameterUserMetric): The property of the Users that has been compared.
+            movers (list[UserMoverDB]): The ranked Users.
+
+        Returns:
+            CollectionMoversOut: The converted Collection Movers.
+        """
+        return CollectionMoversOut(
+            from_collection=FromDB.to_collection_metadata(from_collection),
+            to_collection=FromDB.to_collection_metadata(to_collection),
+            metric=metric,
+            users=[tuple(mover) for mover in movers],
+        )
+
+    @staticmethod
+    def to_collection_stats(source: CollectionStatsHistoryDB) -> CollectionStatsOut:
+        """Takes a Collection and its aggregated numbers from the database and converts them to Collection Stats to be returned by the API.
+
+        Args:
+            source (CollectionStatsHistoryDB): The Collection and its numbers.
+
+        Returns:
+            CollectionStatsOut: The converted Collection Stats.
+        """
+        collection, stats = source
+        return CollectionStatsOut(
+            meta=FromDB.to_collection_metadata(collection),
+            user_count=stats.user_count,
+            alliance_count=stats.alliance_count,
+            trophy_total=stats.trophy_total,
+            trophy_average=stats.trophy_average,
+            alliance_score_total=stats.alliance_score_total,
+            active_user_count_day=stats.active_user_count_day,
+            active_user_count_week=stats.active_user_count_week,
+            active_user_count_month=stats.active_user_count_month,
+            users_by_division={int(division_design_id): count for division_design_id, count in stats.users_by_division.items()},
+            users_by_membership=stats.users_by_membership,
+        )
+
     @staticmethod
     def to_collection_with_fleets(source: CollectionDB) -> CollectionWithFleetsOut:
         """Takes a Collection with Alliances from the database and converts it to a Collection with Fleets to be returned by the API.
@@ -142,6 +265,150 @@ class FromDB:
             users=[FromDB.to_user(user) for user in source.users if user] if source.users else [],
         )
 
+    @staticmethod
+    def to_division_standings(source: CollectionDB, division_design_id: int, standings: list[DivisionStandingDB]) -> DivisionStandingsOut:
+        """Takes a Collection from the database and the ranked Alliances of a tournament division in it and converts them to Division Standings to be returned by the API.
+
+        Args:
+            source (CollectionDB): The Collection.
+            division_design_id (int): The tournament division.
+            standings (list[DivisionStandingDB]): The ranked Alliances.
+
+        Returns:
+            DivisionStandingsOut: The converted Division Standings.
+        """
+        return DivisionStandingsOut(
+            meta=FromDB.to_collection_metadata(source),
+            division_design_id=division_design_id,
+            standings=[tuple(standing) for standing in standings],
+        )
+
+    @staticmethod
+    def to_entity_event(source: EntityEventDB) -> EntityEventOut:
+        """Takes an event of an Alliance or a User from the database and converts it to an Entity Event to be returned by the API.
+
+        Args:
+            source (EntityEventDB): The event to be converted.
+
+        Returns:
+            EntityEventOut: The converted Entity Event.
+        """
+        return (
+            source.collection_id,
+            source.collected_at,
+            EntityType(source.entity_type),
+            source.entity_id,
+            EntityEventType(source.event_type),
+            source.old_value,
+            source.new_value,
+        )
+
+    @staticmethod
+    def to_entity_name(source: EntityNameMatchDB) -> EntityNameOut:
+        """Takes a name of an Alliance or a User matching a search from the database and converts it to an Entity Name to be returned by the API.
+
+        Args:
+            source (EntityNameMatchDB): The matching name to be converted.
+
+        Returns:
+            EntityNameOut: The converted Entity Name.
+        """
+        entity_name, score = source
+        return (
+            EntityType(entity_name.entity_type),
+            entity_name.entity_id,
+            entity_name.name,
+            entity_name.first_seen_at,
+            entity_name.last_seen_at,
+            round(score, 4),
+        )
+
+    @staticmethod
+    def to_entity_name_span(source: EntityNameSpanDB) -> EntityNameSpanOut:
+        """Takes a name of an Alliance or a User and the time frame, in which it has been seen, from the database and converts it to an Entity Name Span to be returned by the API.
+
+        Args:
+            source (EntityNameSpanDB): The name and its time frame to be converted.
+
+        Returns:
+            EntityNameSpanOut: The converted Entity Name Span.
+        """
+        name, first_seen_at, last_seen_at = source
+        return (name, first_seen_at, last_seen_at)
+
+    @staticmethod
+    def to_histogram(collection: CollectionDB, metric: ParameterUserMetric, buckets: int, source: HistogramDB) -> HistogramOut:
+        """Takes a Collection and the distribution of a property of its Users from the database and converts them to a Histogram to be returned by the API.
+
+        Args:
+            collection (CollectionDB): The Collection.
+            metric (ParameterUserMetric): The property of the Users, whose distribution has been computed.
+            buckets (int): The number of buckets the range of values has been divided into.
+            source (HistogramDB): The tuple of the count, the lowest and the highest value, the percentiles and the counts per bucket to be converted.
+
+        Returns:
+            HistogramOut: The converted Histogram. The bounds of the buckets are rounded to 3 decimal places.
+        """
+        count, min_value, max_value, percentiles, bucket_counts = source
+        return HistogramOut(
+            meta=FromDB.to_collection_metadata(collection),
+            metric=metric,
+            count=count,
+            min_value=min_value,
+            max_value=max_value,
+            percentiles=[tuple(percentile) for percentile in percentiles],
+            buckets=_get_histogram_buckets(min_value, max_value, buckets, bucket_counts),
+        )
+
+    @staticmethod
+    def to_tournament(source: TournamentDB) -> TournamentOut:
+        """Takes a tournament from the database and converts it to a Tournament to be returned by the API.
+
+        Args:
+            source (TournamentDB): The first and the last Collection collected during the tournament and the number of Collections collected during it.
+
+        Returns:
+            TournamentOut: The converted Tournament.
+        """
+        first_collection, last_collection, collection_count = source
+        return TournamentOut(
+            first_collection=FromDB.to_collection_metadata(first_collection),
+            last_collection=FromDB.to_collection_metadata(last_collection),
+            collection_count=collection_count,
+        )
+
+    @staticmethod
+    def to_tournament_alliances(tournament: TournamentDB, progression: list[TournamentAllianceProgressDB]) -> TournamentAlliancesOut:
+        """Takes a tournament and the daily progression of its Alliances from the database and converts them to Tournament Alliances to be returned by the API.
+
+        Args:
+            tournament (TournamentDB): The tournament.
+            progression (list[TournamentAllianceProgressDB]): The progression of the Alliances.
+
+        Returns:
+            TournamentAlliancesOut: The converted Tournament Alliances.
+        """
+        return TournamentAlliancesOut(
+            tournament=FromDB.to_tournament(tournament),
+            alliances=[(utils.localize_to_utc(collected_at), *values) for collected_at, *values in progression],
+        )
+
+    @staticmethod
+    def to_tournament_users(tournament: TournamentDB, deltas: list[TournamentUserDeltaDB]) -> TournamentUsersOut:
+        """Takes a tournament and the changes of the tournament scores of its Users from the database and converts them to Tournament Users to be returned by the API.
+
+        Args:
+            tournament (TournamentDB): The tournament.
+            deltas (list[TournamentUserDeltaDB]): The Users and the changes of their tournament scores.
+
+        Returns:
+            TournamentUsersOut: The converted Tournament Users.
+        """
+        return TournamentUsersOut(
+            tournament=FromDB.to_tournament(tournament),
+            users=[tuple(delta) for delta in deltas],
+        )
+
     @staticmethod
     def to_user(source: UserDB) -> UserOut:
         """Takes a User from the database and converts it to a User to be returned by the API.
@@ -186,10 +453,42 @@ class FromDB:
             UserHistoryOut: The converted User History.
         """
         collection = FromDB.to_collection_metadata(source[0])
-        user = FromDB.to_user(source[1])
-        alliance = FromDB.to_alliance(source[1].alliance) if source[1].alliance else None
+        user = FromDB.to_user(source[1]) if source[1] else None
+        alliance = FromDB.to_alliance(source[1].alliance) if source[1] and source[1].alliance else None
         return UserHistoryOut(collection=collection, user=user, fleet=alliance)
 
+    @staticmethod
+    def to_user_history_delta(source: UserHistoryDeltaDB) -> UserHistoryDeltaOut:
+        """Takes a tuple of the values of numeric properties of a User and their changes from the database and converts it to a User History Delta to be returned by the API.
+
+        Args:
+            source (UserHistoryDeltaDB): The tuple of the `collection_id`, the `collected_at`, the values, the deltas and the rates to be converted.
+
+        Returns:
+            UserHistoryDeltaOut: The converted User History Delta. The rates are rounded to 3 decimal places.
+        """
+        collection_id, collected_at, values, deltas, rates = source
+        rates = [None if rate is None else round(rate, 3) for rate in rates]
+        return (collection_id, utils.localize_to_utc(collected_at), values, deltas, rates)
+
+    @staticmethod
+    def to_user_leaderboard(source: CollectionDB, metric: ParameterUserMetric, ranks: list[UserRankDB]) -> UserLeaderboardOut:
+        """Takes a Collection from the database and its Users ranked by a property and converts them to a User Leaderboard to be returned by the API.
+
+        Args:
+            source (CollectionDB): The Collection.
+            metric (ParameterUserMetric): The property of the Users that has been ranked by.
+            ranks (list[UserRankDB]): The ranked Users.
+
+        Returns:
+            UserLeaderboardOut: The converted User Leaderboard.
+        """
+        return UserLeaderboardOut(
+            meta=FromDB.to_collection_metadata(source),
+            metric=metric,
+            users=[tuple(rank) for rank in ranks],
+        )
+
 
 class ToDB:
     """
@@ -598,6 +897,28 @@ class ToDB:
         return user_db
 
 
+def _get_histogram_buckets(min_value: int | None, max_value: int | None, buckets: int, bucket_counts: list[int]) -> list[HistogramBucketOut]:
+    """Computes the bounds of the buckets of equal width, the range from the lowest to the highest value + 1 has been divided into.
+
+    Args:
+        min_value (int | None): The lowest value.
+        max_value (int | None): The highest value.
+        buckets (int): The number of buckets the range of values has been divided into.
+        bucket_counts (list[int]): The number of values per bucket.
+
+    Returns:
+        list[HistogramBucketOut]: The bounds rounded to 3 decimal places and the count of each bucket. Empty, if there are no values.
+    """
+    if not bucket_counts:
+        return []
+
+    width = (max_value + 1 - min_value) / buckets
+    return [
+        (round(min_value + index * width, 3), round(min_value + (index + 1) * width, 3), bucket_count)
+        for index, bucket_count in enumerate(bucket_counts)
+    ]
+
+
 __all__ = [
     "FromDB",
     "ToDB",
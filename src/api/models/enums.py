@@ -1,6 +1,55 @@
 from enum import IntEnum, StrEnum
 
 
+class EntityChange(StrEnum):
+    """
+    A change of an Alliance or a User between two Collections.
+    """
+
+    ALLIANCE_CHANGED = "alliance_changed"
+    """The User is in a different Alliance. The values are the `alliance_id`s."""
+    APPEARED = "appeared"
+    """The entity is only present in the later Collection. The new value is its name."""
+    DISAPPEARED = "disappeared"
+    """The entity is only present in the earlier Collection. The old value is its name."""
+    MEMBERSHIP_CHANGED = "membership_changed"
+    """The User has a different rank in the Alliance. The values are the `alliance_membership`s."""
+    RENAMED = "renamed"
+    """The entity has a different name. The values are the names."""
+
+
+class EntityEventType(StrEnum):
+    """
+    An event recorded for an Alliance or a User when a Collection is saved.
+    """
+
+    ALLIANCE_CREATED = "alliance_created"
+    """The Alliance appeared for the first time since the previous Collection. The new value is its name."""
+    ALLIANCE_DISBANDED = "alliance_disbanded"
+    """The Alliance is missing since the previous Collection. The old value is its name."""
+    DIVISION_CHANGED = "division_changed"
+    """The Alliance is in a different tournament division. The values are the `division_design_id`s."""
+    JOINED_ALLIANCE = "joined_alliance"
+    """The User joined an Alliance. The new value is the `alliance_id`."""
+    LEFT_ALLIANCE = "left_alliance"
+    """The User left an Alliance. The old value is the `alliance_id`."""
+    RANK_CHANGED = "rank_changed"
+    """The User has a different rank in the same Alliance. The values are the `alliance_membership`s."""
+    RENAMED = "renamed"
+    """The entity has a different name. The values are the names."""
+
+
+class EntityType(StrEnum):
+    """
+    The type of an entity in a Collection.
+    """
+
+    ALLIANCE = "alliance"
+    """A PSS Alliance (fleet)."""
+    USER = "user"
+    """A PSS User (player)."""
+
+
 class ErrorCode(StrEnum):
     """
     An error code returned by the API when an error occurs.
@@ -10,6 +59,8 @@ class ErrorCode(StrEnum):
     COLLECTION_NOT_DELETED = "COLLECTION_NOT_DELETED"
     COLLECTION_NOT_FOUND = "COLLECTION_NOT_FOUND"
     CONFLICT = "CONFLICT"
+    EXPORT_NOT_FOUND = "EXPORT_NOT_FOUND"
+    EXPORT_RUNNING = "EXPORT_RUNNING"
     FORBIDDEN = "FORBIDDEN"
     FROM_DATE_AFTER_TO_DATE = "FROM_DATE_AFTER_TO_DATE"
     INVALID_BOOL = "INVALID_BOOL"
@@ -25,13 +76,24 @@ class ErrorCode(StrEnum):
     NOT_AUTHENTICATED = "NOT_AUTHENTICATED"
     NOT_FOUND = "NOT_FOUND"
     PARAMETER_ALLIANCE_ID_INVALID = "PARAMETER_ALLIANCE_ID_INVALID"
+    PARAMETER_BUCKETS_INVALID = "PARAMETER_BUCKETS_INVALID"
     PARAMETER_COLLECTION_ID_INVALID = "PARAMETER_COLLECTION_ID_INVALID"
+    PARAMETER_CURSOR_INVALID = "PARAMETER_CURSOR_INVALID"
     PARAMETER_DESC_INVALID = "PARAMETER_DESC_INVALID"
+    PARAMETER_DIVISION_DESIGN_ID_INVALID = "PARAMETER_DIVISION_DESIGN_ID_INVALID"
+    PARAMETER_ENTITY_ID_INVALID = "PARAMETER_ENTITY_ID_INVALID"
+    PARAMETER_ENTITY_TYPE_INVALID = "PARAMETER_ENTITY_TYPE_INVALID"
+    PARAMETER_EVENT_TYPE_INVALID = "PARAMETER_EVENT_TYPE_INVALID"
     PARAMETER_FROM_DATE_INVALID = "PARAMETER_FROM_DATE_INVALID"
     PARAMETER_FROM_DATE_TOO_EARLY = "PARAMETER_FROM_DATE_TOO_EARLY"
     PARAMETER_INTERVAL_INVALID = "PARAMETER_INTERVAL_INVALID"
+    PARAMETER_METRIC_INVALID = "PARAMETER_METRIC_INVALID"
+    PARAMETER_MONTH_INVALID = "PARAMETER_MONTH_INVALID"
+    PARAMETER_NAME_INVALID = "PARAMETER_NAME_INVALID"
     PARAMETER_ONMISSING_INVALID = "PARAMETER_ONMISSING_INVALID"
+    PARAMETER_SEARCH_MODE_INVALID = "PARAMETER_SEARCH_MODE_INVALID"
     PARAMETER_SKIP_INVALID = "PARAMETER_SKIP_INVALID"
+    PARAMETER_TABLE_INVALID = "PARAMETER_TABLE_INVALID"
     PARAMETER_TAKE_INVALID = "PARAMETER_TAKE_INVALID"
     PARAMETER_TO_DATE_INVALID = "PARAMETER_TO_DATE_INVALID"
     PARAMETER_TO_DATE_TOO_EARLY = "PARAMETER_TO_DATE_TOO_EARLY"
@@ -39,33 +101,92 @@ class ErrorCode(StrEnum):
     RATE_LIMITED = "RATE_LIMITED"
     SCHEMA_VERSION_MISMATCH = "SCHEMA_VERSION_MISMATCH"
     SERVER_ERROR = "SERVER_ERROR"
+    TOURNAMENT_NOT_FOUND = "TOURNAMENT_NOT_FOUND"
     UNSUPPORTED_MEDIA_TYPE = "UNSUPPORTED_MEDIA_TYPE"
     UNSUPPORTED_SCHEMA = "UNSUPPORTED_SCHEMA"
     USER_NOT_FOUND = "USER_NOT_FOUND"
 
 
+class ExportTable(StrEnum):
+    """
+    A table of the archive export. Every month of Collections is exported to one Parquet file per table.
+    """
+
+    ALLIANCES = "alliances"
+    """The Alliances of the Collections."""
+    COLLECTIONS = "collections"
+    """The metadata of the Collections."""
+    USERS = "users"
+    """The Users of the Collections."""
+
+
 class OperationId(StrEnum):
     """
     An `operation_id` of an API endpoint.
     """
 
     CREATE_COLLECTION = "CreateCollection"
+    CREATE_EXPORT = "CreateExport"
     DELETE_COLLECTION = "DeleteCollection"
+    GET_ALLIANCE_HISTOGRAM = "GetAllianceHistogram"
+    GET_ALLIANCE_HISTORIES = "GetAllianceHistories"
     GET_ALLIANCE_HISTORY = "GetAllianceHistory"
+    GET_ALLIANCE_LEADERBOARD = "GetAllianceLeaderboard"
     GET_COLLECTION = "GetCollection"
+    GET_COLLECTION_DIFF = "GetCollectionDiff"
+    GET_COLLECTION_STATS = "GetCollectionStats"
     GET_COLLECTIONS = "GetCollections"
+    GET_DIVISION_STANDINGS = "GetDivisionStandings"
+    GET_EVENTS = "GetEvents"
+    GET_EXPORT = "GetExport"
+    GET_EXPORTS = "GetExports"
     GET_ALLIANCE_FROM_COLLECTION = "GetAllianceFromCollection"
+    GET_ALLIANCE_FROM_LATEST_COLLECTION = "GetAllianceFromLatestCollection"
+    GET_ALLIANCE_NAMES = "GetAllianceNames"
     GET_ALLIANCES_FROM_COLLECTION = "GetAlliancesFromCollection"
+    GET_ALLIANCES_FROM_LATEST_COLLECTION = "GetAlliancesFromLatestCollection"
+    GET_HISTOGRAM = "GetHistogram"
     GET_HOME_PAGE = "GetHomePage"
+    GET_LATEST_COLLECTION = "GetLatestCollection"
+    GET_METRICS = "GetMetrics"
     GET_PING = "GetPing"
+    GET_STATS = "GetStats"
     GET_TOP_100_USERS_FROM_COLLECTION = "GetTop100UsersFromCollection"
+    GET_TOP_100_USERS_FROM_LATEST_COLLECTION = "GetTop100UsersFromLatestCollection"
+    GET_TOP_MOVERS = "GetTopMovers"
+    GET_TOURNAMENT_ALLIANCES = "GetTournamentAlliances"
+    GET_TOURNAMENT_USERS = "GetTournamentUsers"
+    GET_TOURNAMENTS = "GetTournaments"
     GET_USER_FROM_COLLECTION = "GetUserFromCollection"
+    GET_USER_FROM_LATEST_COLLECTION = "GetUserFromLatestCollection"
     GET_USERS_FROM_COLLECTION = "GetUsersFromCollection"
+    GET_USERS_FROM_LATEST_COLLECTION = "GetUsersFromLatestCollection"
+    GET_USER_HISTORIES = "GetUserHistories"
     GET_USER_HISTORY = "GetUserHistory"
+    GET_USER_HISTORY_DELTAS = "GetUserHistoryDeltas"
+    GET_USER_LEADERBOARD = "GetUserLeaderboard"
+    GET_USER_NAMES = "GetUserNames"
+    GET_USER_RANK = "GetUserRank"
+    SEARCH_NAMES = "SearchNames"
     UPDATE_COLLECTION = "UpdateCollection"
     UPLOAD_COLLECTION = "UploadCollection"
 
 
+class ParameterAllianceMetric(StrEnum):
+    """
+    A numeric property of an Alliance to be analyzed.
+    """
+
+    CHAMPIONSHIP_SCORE = "championship_score"
+    """The championship score of the Alliance."""
+    NUMBER_OF_MEMBERS = "number_of_members"
+    """The number of members of the Alliance."""
+    SCORE = "score"
+    """The stars of the Alliance."""
+    TROPHY = "trophy"
+    """The trophies of the Alliance."""
+
+
 class ParameterInterval(StrEnum):
     """
     The interval of history data to be returned.
@@ -94,6 +215,52 @@ class ParameterOnMissing(StrEnum):
     """Skip a missing collection and return the next one instead (default behaviour)."""
 
 
+class ParameterSearchMode(StrEnum):
+    """
+    Control how names are matched when searching.
+    """
+
+    PREFIX = "prefix"
+    """Return names starting with the search term (default behaviour)."""
+    SIMILAR = "similar"
+    """Return names similar to the search term, tolerating typos and different spellings."""
+    SUBSTRING = "substring"
+    """Return names containing the search term."""
+
+
+class ParameterUserMetric(StrEnum):
+    """
+    A numeric property of a User to be analyzed.
+    """
+
+    ALLIANCE_SCORE = "alliance_score"
+    """The stars of the User."""
+    CHAMPIONSHIP_SCORE = "championship_score"
+    """The championship score of the User."""
+    CREW_DONATED = "crew_donated"
+    """The number of crew donated by the User."""
+    CREW_RECEIVED = "crew_received"
+    """The number of crew borrowed by the User."""
+    HIGHEST_TROPHY = "highest_trophy"
+    """The highest number of trophies the User has ever had."""
+    PVP_ATTACK_DRAWS = "pvp_attack_draws"
+    """The number of PvP attacks of the User ending in a draw."""
+    PVP_ATTACK_LOSSES = "pvp_attack_losses"
+    """The number of PvP attacks lost by the User."""
+    PVP_ATTACK_WINS = "pvp_attack_wins"
+    """The number of PvP attacks won by the User."""
+    PVP_DEFENCE_DRAWS = "pvp_defence_draws"
+    """The number of PvP defences of the User ending in a draw."""
+    PVP_DEFENCE_LOSSES = "pvp_defence_losses"
+    """The number of PvP defences lost by the User."""
+    PVP_DEFENCE_WINS = "pvp_defence_wins"
+    """The number of PvP defences won by the User."""
+    TOURNAMENT_BONUS_SCORE = "tournament_bonus_score"
+    """The tournament bonus score of the User."""
+    TROPHY = "trophy"
+    """The trophies of the User."""
+
+
 class UserAllianceMembership(StrEnum):
     """
     Denotes the rank of a fleet member in PSS.
@@ -141,9 +308,16 @@ class UserAllianceMembershipEncoded(IntEnum):
 
 
 __all__ = [
+    "EntityChange",
+    "EntityEventType",
+    "EntityType",
     "ErrorCode",
+    "ExportTable",
     "OperationId",
+    "ParameterAllianceMetric",
     "ParameterInterval",
+    "ParameterSearchMode",
+    "ParameterUserMetric",
     "UserAllianceMembership",
     "UserAllianceMembershipEncoded",
 ]
@@ -56,6 +56,16 @@ class CollectionNotFoundError(NotFoundError):
     message = "The requested Collection could not be found."
 
 
+class ExportNotFoundError(NotFoundError):
+    code = ErrorCode.EXPORT_NOT_FOUND
+    message = "The requested export file could not be found."
+
+
+class TournamentNotFoundError(NotFoundError):
+    code = ErrorCode.TOURNAMENT_NOT_FOUND
+    message = "The requested Collection has not been collected during a tournament."
+
+
 class UserNotFoundError(NotFoundError):
     code = ErrorCode.USER_NOT_FOUND
     message = "The requested User could not be found."
@@ -77,6 +87,11 @@ class ConflictError(ApiError):
     message = "The resource could not be created or updated."
 
 
+class ExportRunningError(ConflictError):
+    code = ErrorCode.EXPORT_RUNNING
+    message: str = f"{ConflictError.message}: An export is already running."
+
+
 class NonUniqueTimestampError(ConflictError):
     code = ErrorCode.NON_UNIQUE_TIMESTAMP
     message: str = f"{ConflictError.message}: A Collection with this timestamp already exists."
@@ -159,16 +174,46 @@ class InvalidAllianceIdError(ParameterValueError):
     message = "The provided value for the parameter `allianceId` is invalid."
 
 
+class InvalidBucketsError(ParameterValueError):
+    code = ErrorCode.PARAMETER_BUCKETS_INVALID
+    message = "The provided value for the parameter `buckets` is invalid."
+
+
 class InvalidCollectionIdError(ParameterValueError):
     code = ErrorCode.PARAMETER_COLLECTION_ID_INVALID
     message = "The provided value for the parameter `collectionId` is invalid."
 
 
+class InvalidCursorError(ParameterValueError):
+    code = ErrorCode.PARAMETER_CURSOR_INVALID
+    message = "The provided value for the parameter `cursor` is invalid."
+
+
 class InvalidDescError(ParameterValueError):
     code = ErrorCode.PARAMETER_DESC_INVALID
     message = "The provided value for the parameter `desc` is invalid."
 
 
+class InvalidDivisionDesignIdError(ParameterValueError):
+    code = ErrorCode.PARAMETER_DIVISION_DESIGN_ID_INVALID
+    message = "The provided value for the parameter `divisionDesignId` is invalid."
+
+
+class InvalidEntityIdError(ParameterValueError):
+    code = ErrorCode.PARAMETER_ENTITY_ID_INVALID
+    message = "The provided value for the parameter `entityId` is invalid."
+
+
+class InvalidEntityTypeError(ParameterValueError):
+    code = ErrorCode.PARAMETER_ENTITY_TYPE_INVALID
+    message = "The provided value for the parameter `entityType` is invalid."
+
+
+class InvalidEventTypeError(ParameterValueError):
+    code = ErrorCode.PARAMETER_EVENT_TYPE_INVALID
+    message = "The provided value for the parameter `eventTypes` is invalid."
+
+
 class InvalidFromDateError(ParameterValueError):
     code = ErrorCode.PARAMETER_FROM_DATE_INVALID
     message = "The provided value for the parameter `fromDate` is invalid."
@@ -194,16 +239,41 @@ class InvalidIntervalError(ParameterValueError):
     message = "The provided value for the parameter `interval` is invalid."
 
 
+class InvalidMetricError(ParameterValueError):
+    code = ErrorCode.PARAMETER_METRIC_INVALID
+    message = "The provided value for the parameter `metric` or `metrics` is invalid."
+
+
+class InvalidMonthError(ParameterValueError):
+    code = ErrorCode.PARAMETER_MONTH_INVALID
+    message = "The provided value for the parameter `month` is invalid."
+
+
+class InvalidNameError(ParameterValueError):
+    code = ErrorCode.PARAMETER_NAME_INVALID
+    message = "The provided value for the parameter `name` is invalid."
+
+
 class InvalidOnMissingError(ParameterValueError):
     code = ErrorCode.PARAMETER_ONMISSING_INVALID
     message = "The provided value for the parameter `onMissing` is invalid."
 
 
+class InvalidSearchModeError(ParameterValueError):
+    code = ErrorCode.PARAMETER_SEARCH_MODE_INVALID
+    message = "The provided value for the parameter `mode` is invalid."
+
+
 class InvalidSkipError(ParameterValueError):
     code = ErrorCode.PARAMETER_SKIP_INVALID
     message = "The provided value for the parameter `skip` is invalid."
 
 
+class InvalidTableError(ParameterValueError):
+    code = ErrorCode.PARAMETER_TABLE_INVALID
+    message = "The provided value for the parameter `table` is invalid."
+
+
 class InvalidTakeError(ParameterValueError):
     code = ErrorCode.PARAMETER_TAKE_INVALID
     message = "The provided value for the parameter `take` is invalid."
@@ -217,9 +287,11 @@ class InvalidUserIdError(ParameterValueError):
 # HTTP 429
 
 
+@dataclass(frozen=True)
 class TooManyRequestsError(ApiError):  # 429
     code = ErrorCode.RATE_LIMITED
     message = "You've been rate-limited."
+    retry_after: int = field(default=1)
 
 
 # HTTP 500
@@ -241,18 +313,31 @@ __all__ = [
     "CollectionNotDeletedError",
     "CollectionNotFoundError",
     "ConflictError",
+    "ExportNotFoundError",
+    "ExportRunningError",
     "FromDateAfterToDateError",
     "FromDateTooEarlyError",
     "InvalidAllianceIdError",
     "InvalidBoolError",
+    "InvalidBucketsError",
     "InvalidCollectionIdError",
+    "InvalidCursorError",
     "InvalidDateTimeError",
     "InvalidDescError",
+    "InvalidDivisionDesignIdError",
+    "InvalidEntityIdError",
+    "InvalidEntityTypeError",
+    "InvalidEventTypeError",
     "InvalidFromDateError",
     "InvalidIntervalError",
     "InvalidJsonUpload",
+    "InvalidMetricError",
+    "InvalidMonthError",
+    "InvalidNameError",
     "InvalidNumberError",
+    "InvalidSearchModeError",
     "InvalidSkipError",
+    "InvalidTableError",
     "InvalidTakeError",
     "InvalidToDateError",
     "InvalidUserIdError",
@@ -269,6 +354,7 @@ __all__ = [
     "ServerError",
     "ToDateTooEarlyError",
     "TooManyRequestsError",
+    "TournamentNotFoundError",
     "UnsupportedMediaTypeError",
     "UnsupportedSchemaError",
     "UserNotFoundError",
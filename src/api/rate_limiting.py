@@ -0,0 +1,224 @@
+import time
+from dataclasses import dataclass
+from typing import Protocol
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql import text
+
+from .config import SETTINGS
+from .database import db
+from .models.enums import OperationId
+
+
+DEFAULT_COST: int = 1
+
+COST_BY_OPERATION_ID: dict[OperationId, int] = {
+    OperationId.CREATE_COLLECTION: 1,
+    OperationId.CREATE_EXPORT: 1,
+    OperationId.DELETE_COLLECTION: 1,
+    OperationId.GET_ALLIANCE_FROM_COLLECTION: 2,
+    OperationId.GET_ALLIANCE_FROM_LATEST_COLLECTION: 2,
+    OperationId.GET_ALLIANCE_HISTOGRAM: 1,
+    OperationId.GET_ALLIANCE_HISTORIES: 100,
+    OperationId.GET_ALLIANCE_HISTORY: 10,
+    OperationId.GET_ALLIANCE_LEADERBOARD: 2,
+    OperationId.GET_ALLIANCE_NAMES: 1,
+    OperationId.GET_ALLIANCES_FROM_COLLECTION: 5,
+    OperationId.GET_ALLIANCES_FROM_LATEST_COLLECTION: 5,
+    OperationId.GET_COLLECTION: 50,
+    OperationId.GET_COLLECTION_DIFF: 30,
+    OperationId.GET_COLLECTION_STATS: 1,
+    OperationId.GET_COLLECTIONS: 2,
+    OperationId.GET_DIVISION_STANDINGS: 3,
+    OperationId.GET_EVENTS: 2,
+    OperationId.GET_EXPORT: 50,
+    OperationId.GET_EXPORTS: 1,
+    OperationId.GET_HISTOGRAM: 2,
+    OperationId.GET_HOME_PAGE: 1,
+    OperationId.GET_LATEST_COLLECTION: 50,
+    OperationId.GET_METRICS: 1,
+    OperationId.GET_PING: 1,
+    OperationId.GET_STATS: 2,
+    OperationId.GET_TOP_100_USERS_FROM_COLLECTION: 3,
+    OperationId.GET_TOP_100_USERS_FROM_LATEST_COLLECTION: 3,
+    OperationId.GET_TOP_MOVERS: 5,
+    OperationId.GET_TOURNAMENT_ALLIANCES: 2,
+    OperationId.GET_TOURNAMENT_USERS: 3,
+    OperationId.GET_TOURNAMENTS: 1,
+    OperationId.GET_USER_FROM_COLLECTION: 1,
+    OperationId.GET_USER_FROM_LATEST_COLLECTION: 1,
+    OperationId.GET_USER_HISTORIES: 50,
+    OperationId.GET_USER_HISTORY: 5,
+    OperationId.GET_USER_HISTORY_DELTAS: 5,
+    OperationId.GET_USER_LEADERBOARD: 3,
+    OperationId.GET_USER_NAMES: 1,
+    OperationId.GET_USER_RANK: 1,
+    OperationId.GET_USERS_FROM_COLLECTION: 30,
+    OperationId.GET_USERS_FROM_LATEST_COLLECTION: 30,
+    OperationId.SEARCH_NAMES: 2,
+    OperationId.UPDATE_COLLECTION: 1,
+    OperationId.UPLOAD_COLLECTION: 1,
+}
+"""The number of tokens a request to an endpoint costs. Endpoints returning large amounts of data cost more."""
+
+
+class RateLimitBackend(Protocol):
+    """
+    Stores the token buckets of the clients.
+    """
+
+    async def acquire(self, key: str, cost: int, capacity: int, refill_rate: float) -> float:
+        """Attempts to take `cost` tokens from the bucket identified by `key`.
+
+        Args:
+            key (str): Identifies the bucket.
+            cost (int): The number of tokens to take.
+            capacity (int): The maximum number of tokens in the bucket.
+            refill_rate (float): The number of tokens added to the bucket per second.
+
+        Returns:
+            float: `0.0`, if the tokens have been taken. Else, the number of seconds until enough tokens will be available.
+        """
+        ...
+
+
+@dataclass
+class TokenBucket:
+    """
+    A bucket of tokens that refills continuously.
+    """
+
+    tokens: float
+    updated_at: float
+
+
+class InMemoryRateLimitBackend:
+    """
+    Keeps the token buckets in the memory of the current process.
+    """
+
+    max_buckets: int = 100_000
+
+    def __init__(self):
+        self.buckets: dict[str, TokenBucket] = {}
+
+    async def acquire(self, key: str, cost: int, capacity: int, refill_rate: float) -> float:
+        now = time.monotonic()
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if len(self.buckets) >= self.max_buckets:
+                self._prune(now, capacity, refill_rate)
+            bucket = TokenBucket(tokens=float(capacity), updated_at=now)
+            self.buckets[key] = bucket
+
+        bucket.tokens = min(float(capacity), bucket.tokens + (now - bucket.updated_at) * refill_rate)
+        bucket.updated_at = now
+
+        if bucket.tokens >= cost:
+            bucket.tokens -= cost
+            return 0.0
+
+        return (cost - bucket.tokens) / refill_rate
+
+    def _prune(self, now: float, capacity: int, refill_rate: float):
+        """Removes all buckets that would be full by now, since they're indistinguishable from new buckets."""
+        self.buckets = {key: bucket for key, bucket in self.buckets.items() if bucket.tokens + (now - bucket.updated_at) * refill_rate < capacity}
+
+
+class DatabaseRateLimitBackend:
+    """
+    Keeps the token buckets in the table `rate_limit_bucket` of the primary database, so that they're shared by all workers and instances of the API.
+    """
+
+    _acquire_statement = text(
+        """
+        INSERT INTO rate_limit_bucket AS bucket (bucket_key, tokens, updated_at)
+        VALUES (:key, :capacity - :cost, extract(epoch FROM clock_timestamp()))
+        ON CONFLICT (bucket_key) DO UPDATE SET
+            tokens = LEAST(:capacity, bucket.tokens + (extract(epoch FROM clock_timestamp()) - bucket.updated_at) * :refill_rate) - :cost,
+            updated_at = extract(epoch FROM clock_timestamp())
+        WHERE LEAST(:capacity, bucket.tokens + (extract(epoch FROM clock_timestamp()) - bucket.updated_at) * :refill_rate) >= :cost
+        RETURNING tokens
+        """
+    )
+    _available_statement = text(
+        """
+        SELECT LEAST(:capacity, tokens + (extract(epoch FROM clock_timestamp()) - updated_at) * :refill_rate)
+        FROM rate_limit_bucket
+        WHERE bucket_key = :key
+        """
+    )
+
+    async def acquire(self, key: str, cost: int, capacity: int, refill_rate: float) -> float:
+        parameters = {"key": key, "cost": cost, "capacity": capacity, "refill_rate": refill_rate}
+        try:
+            async with db.ENGINE.begin() as connection:
+                if (await connection.execute(self._acquire_statement, parameters)).first():
+                    return 0.0
+                available = (await connection.execute(self._available_statement, parameters)).scalar() or 0.0
+        except (DBAPIError, OSError) as exc:
+            print(f"Could not acquire rate limit tokens, letting the request pass:\n{exc}")
+            return 0.0
+
+        return max((cost - available) / refill_rate, 0.0)
+
+
+BACKEND: RateLimitBackend = InMemoryRateLimitBackend()
+
+
+def get_cost(operation_id: str | None) -> int:
+    """Looks up the number of tokens a request to the endpoint with the given `operation_id` costs.
+
+    Args:
+        operation_id (str, optional): The `operation_id` of the requested endpoint.
+
+    Returns:
+        int: The cost of the request. Never more than the bucket capacity.
+    """
+    cost = COST_BY_OPERATION_ID.get(operation_id, DEFAULT_COST)
+    return min(cost, SETTINGS.rate_limit_capacity)
+
+
+async def acquire(client_key: str, operation_id: str | None) -> float:
+    """Takes the cost of the requested endpoint from the client's token bucket.
+
+    Args:
+        client_key (str): Identifies the client.
+        operation_id (str, optional): The `operation_id` of the requested endpoint.
+
+    Returns:
+        float: `0.0`, if the request may pass. Else, the number of seconds the client needs to wait before retrying.
+    """
+    return await BACKEND.acquire(client_key, get_cost(operation_id), SETTINGS.rate_limit_capacity, SETTINGS.rate_limit_refill_rate)
+
+
+def set_up_rate_limiter(backend: str):
+    """Initializes the rate limiting `BACKEND`.
+
+    Args:
+        backend (str): Either `memory` to keep the token buckets per process or `database` to share them via the primary database.
+
+    Raises:
+        ValueError: Raised, if `backend` is not a supported backend.
+    """
+    global BACKEND
+    match backend:
+        case "memory":
+            BACKEND = InMemoryRateLimitBackend()
+        case "database":
+            BACKEND = DatabaseRateLimitBackend()
+        case _:
+            raise ValueError(f"Unsupported rate limit backend: '{backend}'")
+
+
+__all__ = [
+    "BACKEND",
+    "COST_BY_OPERATION_ID",
+    "DatabaseRateLimitBackend",
+    "InMemoryRateLimitBackend",
+    "RateLimitBackend",
+    "TokenBucket",
+    "acquire",
+    "get_cost",
+    "set_up_rate_limiter",
+]
@@ -1,8 +1,13 @@
-from . import alliances, collections, users
+from . import alliances, collections, events, exports, search, stats, tournaments, users
 
 
 __all__ = [
     "alliances",
     "collections",
+    "events",
+    "exports",
+    "search",
+    "stats",
+    "tournaments",
     "users",
 ]
@@ -1,18 +1,49 @@
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from .. import server_timing
 from ..database import crud, db
-from ..models import AllianceHistoryOut, exceptions
+from ..models import AllianceHistoriesOut, AllianceHistoryOut, EntityNameSpanOut, exceptions
 from ..models.converters import FromDB
-from ..models.enums import ParameterOnMissing
-from . import dependencies, endpoints
+from ..models.enums import EntityType, ParameterOnMissing
+from . import dependencies, endpoints, pagination
 
 
 router: APIRouter = APIRouter(tags=["allianceHistory"], prefix="/allianceHistory")
 
 
+@router.post("/batch", **endpoints.allianceHistory_batch_post)
+async def get_alliance_histories(
+    alliance_ids: Annotated[list[int], Depends(dependencies.alliance_ids)],
+    collection_id: Annotated[int | None, Depends(dependencies.optional_collection_id)],
+    datetime_filter: Annotated[dependencies.DatetimeFilter, Depends(dependencies.from_to_date_parameters)],
+    list_filter: Annotated[dependencies.ListFilter, Depends(dependencies.list_filter_parameters)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> list[AllianceHistoriesOut]:
+    histories = await crud.get_alliance_histories(
+        session,
+        alliance_ids,
+        True,
+        collection_id,
+        datetime_filter.from_date,
+        datetime_filter.to_date,
+        list_filter.interval,
+        list_filter.desc,
+        skip_take.skip,
+        skip_take.take,
+    )
+    with server_timing.phase("from_db"):
+        result = [
+            AllianceHistoriesOut(alliance_id=alliance_id, history=[FromDB.to_alliance_history(entry) for entry in history])
+            for alliance_id, history in histories.items()
+        ]
+    return result
+
+
 @router.get("/{allianceId}", **endpoints.allianceHistory_allianceId_get)
 async def get_alliance_history(
     alliance_id: Annotated[int, Depends(dependencies.alliance_id)],
@@ -20,9 +51,14 @@ async def get_alliance_history(
     list_filter: Annotated[dependencies.ListFilter, Depends(dependencies.list_filter_parameters)],
     skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
     on_missing: Annotated[ParameterOnMissing, Depends(dependencies.on_missing)],
+    start_after: Annotated[datetime | None, Depends(dependencies.cursor_parameter)],
+    division_design_id: Annotated[int | None, Depends(dependencies.optional_division_design_id)],
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(db.get_session),
-) -> list[AllianceHistoryOut]:
-    has_alliance_history = await crud.has_alliance_history(session, alliance_id)
+) -> list[AllianceHistoryOut | None]:
+    with server_timing.phase("has_alliance_history"):
+        has_alliance_history = await crud.has_alliance_history(session, alliance_id)
     if not has_alliance_history:
         raise exceptions.AllianceNotFoundError(
             details=f"There is no historic data for an Alliance with the ID '{alliance_id}' in any of the collections.",
@@ -39,8 +75,46 @@ async def get_alliance_history(
         list_filter.desc,
         skip_take.skip,
         skip_take.take,
+        on_missing=on_missing,
+        start_after=start_after,
+        division_design_id=division_design_id,
     )
-    result = [FromDB.to_alliance_history(entry) for entry in history]
+    if on_missing == ParameterOnMissing.SKIP:
+        collected_ats = [collection.collected_at for collection, _ in history]
+    else:
+        # The entity may be missing from some of the Collections of the page, so its entries don't tell, where the page ends.
+        collected_ats = await crud.get_page_timestamps(
+            session,
+            datetime_filter.from_date,
+            datetime_filter.to_date,
+            list_filter.interval,
+            list_filter.desc,
+            skip_take.skip,
+            skip_take.take,
+            on_missing,
+            start_after,
+        )
+    pagination.add_next_page_headers(request, response, collected_ats, skip_take.take, list_filter.desc)
+    with server_timing.phase("from_db"):
+        result = [FromDB.to_alliance_history(entry) if entry else None for entry in history]
+    return result
+
+
+@router.get("/{allianceId}/names", **endpoints.allianceHistory_allianceId_names_get)
+async def get_alliance_names(
+    alliance_id: Annotated[int, Depends(dependencies.alliance_id)],
+    desc: Annotated[bool, Depends(dependencies.timestamp_desc)],
+    session: AsyncSession = Depends(db.get_session),
+) -> list[EntityNameSpanOut]:
+    entity_names = await crud.get_entity_names(session, EntityType.ALLIANCE, alliance_id, desc)
+    if not entity_names:
+        raise exceptions.AllianceNotFoundError(
+            details=f"There is no historic data for an Alliance with the ID '{alliance_id}' in any of the collections.",
+            suggestion="Check the provided `allianceId` in the path.",
+        )
+
+    with server_timing.phase("from_db"):
+        result = [FromDB.to_entity_name_span(entity_name) for entity_name in entity_names]
     return result
 
 
@@ -1,14 +1,20 @@
 import json
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Body, Depends, File, UploadFile
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, File, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from .. import snapshot
 from ..database import crud, db
-from ..database.models import CollectionDB
+from ..database.models import CollectionDB, EntityChangeDB, TournamentDB
 from ..models import (
+    AllianceHistogramOut,
     AllianceHistoryOut,
+    AllianceLeaderboardOut,
     CollectionCreate3,
     CollectionCreate4,
     CollectionCreate5,
@@ -16,15 +22,23 @@ from ..models import (
     CollectionCreate7,
     CollectionCreate8,
     CollectionCreate9,
+    CollectionDiffOut,
     CollectionMetadataOut,
+    CollectionMoversOut,
     CollectionOut,
+    CollectionStatsOut,
     CollectionWithFleetsOut,
     CollectionWithUsersOut,
+    DivisionStandingsOut,
+    HistogramOut,
+    TournamentAlliancesOut,
+    TournamentUsersOut,
     UserHistoryOut,
+    UserLeaderboardOut,
 )
 from ..models.converters import FromDB, ToDB
-from ..models.enums import ParameterOnMissing
-from . import dependencies, endpoints, exceptions
+from ..models.enums import ParameterAllianceMetric, ParameterOnMissing, ParameterUserMetric
+from . import dependencies, endpoints, exceptions, pagination
 
 
 router: APIRouter = APIRouter(tags=["collections"], prefix="/collections")
@@ -36,18 +50,45 @@ async def get_collections(
     list_filter: Annotated[dependencies.ListFilter, Depends(dependencies.list_filter_parameters)],
     skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
     on_missing: Annotated[ParameterOnMissing, Depends(dependencies.on_missing)],
+    start_after: Annotated[datetime | None, Depends(dependencies.cursor_parameter)],
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(db.get_session),
-) -> list[CollectionMetadataOut]:
+) -> list[CollectionMetadataOut | None]:
     collections = await crud.get_collections(
-        session, datetime_filter.from_date, datetime_filter.to_date, list_filter.interval, list_filter.desc, skip_take.skip, skip_take.take
+        session,
+        datetime_filter.from_date,
+        datetime_filter.to_date,
+        list_filter.interval,
+        list_filter.desc,
+        skip_take.skip,
+        skip_take.take,
+        on_missing=on_missing,
+        start_after=start_after,
     )
-    result = [FromDB.to_collection(collection, False, False).meta for collection in collections]
+    if on_missing in (ParameterOnMissing.EMPTY, ParameterOnMissing.NULL):
+        # `null` entries have no timestamp, so the slots of the page are computed.
+        collected_ats = await crud.get_page_timestamps(
+            session,
+            datetime_filter.from_date,
+            datetime_filter.to_date,
+            list_filter.interval,
+            list_filter.desc,
+            skip_take.skip,
+            skip_take.take,
+            on_missing,
+            start_after,
+        )
+    else:
+        collected_ats = [collection.collected_at for collection in collections]
+    pagination.add_next_page_headers(request, response, collected_ats, skip_take.take, list_filter.desc)
+    result = [FromDB.to_collection(collection, False, False).meta if collection else None for collection in collections]
     return result
 
 
 @router.post("/", **endpoints.collections_post, dependencies=dependencies.authorization_dependencies)
 async def create_collection(
-    collection: Annotated[CollectionCreate9, Body()], session: AsyncSession = Depends(db.get_session)
+    collection: Annotated[CollectionCreate9, Body()], background_tasks: BackgroundTasks, session: AsyncSession = Depends(db.get_session)
 ) -> CollectionMetadataOut:
     collection_with_same_timestamp = await crud.get_collection_by_timestamp(session, collection.meta.timestamp)
     if collection_with_same_timestamp is not None:
@@ -55,19 +96,102 @@ async def create_collection(
 
     collection_db = ToDB.from_collection_9(collection)
     collection_db = await crud.save_collection(session, collection_db, True, True)
+    background_tasks.add_task(snapshot.refresh_snapshot)
     result = FromDB.to_collection(collection_db, False, False)
     return result.meta
 
 
+# Must be registered before the routes with the path parameter `collectionId`.
+@router.get("/movers", **endpoints.collections_movers_get)
+async def get_top_movers(
+    collection_pair: Annotated[dependencies.CollectionPairFilter, Depends(dependencies.collection_pair_parameters)],
+    datetime_filter: Annotated[dependencies.DatetimeFilter, Depends(dependencies.from_to_date_parameters)],
+    metric: Annotated[ParameterUserMetric, Depends(dependencies.user_metric)],
+    desc: Annotated[bool, Depends(dependencies.ranking_desc)],
+    alliance_id: Annotated[int | None, Depends(dependencies.optional_alliance_id)],
+    division_design_id: Annotated[int | None, Depends(dependencies.optional_division_design_id)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> CollectionMoversOut:
+    if not collection_pair.from_collection_id and not datetime_filter.from_date:
+        raise exceptions.from_collection_not_specified()
+
+    from_collection = await _get_collection_by_id_or_timestamp(session, collection_pair.from_collection_id, datetime_filter.from_date)
+    to_collection = await _get_collection_by_id_or_timestamp(session, collection_pair.to_collection_id, datetime_filter.to_date)
+    movers = await crud.get_top_movers(
+        session,
+        from_collection.collection_id,
+        to_collection.collection_id,
+        metric,
+        desc,
+        alliance_id,
+        division_design_id,
+        skip_take.skip,
+        skip_take.take,
+    )
+    result = FromDB.to_collection_movers(from_collection, to_collection, metric, movers)
+    return result
+
+
+# Must be registered before the routes with the path parameter `collectionId`.
+@router.get("/latest", **endpoints.collections_latest_get)
+async def get_latest_collection() -> CollectionOut:
+    latest_snapshot = await _get_latest_snapshot()
+    result = latest_snapshot.to_collection()
+    return result
+
+
+@router.get("/latest/alliances", **endpoints.collections_latest_alliances_get)
+async def get_alliances_from_latest_collection(
+    division_design_id: Annotated[int | None, Depends(dependencies.optional_division_design_id)],
+) -> CollectionWithFleetsOut:
+    latest_snapshot = await _get_latest_snapshot()
+    result = latest_snapshot.to_collection_with_fleets(division_design_id)
+    return result
+
+
+@router.get("/latest/alliances/{allianceId}", **endpoints.collections_latest_alliances_allianceId_get)
+async def get_alliance_from_latest_collection(alliance_id: Annotated[int, Depends(dependencies.alliance_id)]) -> AllianceHistoryOut:
+    latest_snapshot = await _get_latest_snapshot()
+    result = _get_alliance_from_snapshot(latest_snapshot, alliance_id)
+    return result
+
+
+@router.get("/latest/top100Users", **endpoints.collections_latest_top100Users_get)
+async def get_top_100_from_latest_collection(
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+) -> CollectionWithUsersOut:
+    latest_snapshot = await _get_latest_snapshot()
+    result = latest_snapshot.to_collection_with_top_users(skip_take.skip, skip_take.take)
+    return result
+
+
+@router.get("/latest/users", **endpoints.collections_latest_users_get)
+async def get_users_from_latest_collection() -> CollectionWithUsersOut:
+    latest_snapshot = await _get_latest_snapshot()
+    result = latest_snapshot.to_collection_with_users()
+    return result
+
+
+@router.get("/latest/users/{userId}", **endpoints.collections_latest_users_userId_get)
+async def get_user_from_latest_collection(user_id: Annotated[int, Depends(dependencies.user_id)]) -> UserHistoryOut:
+    latest_snapshot = await _get_latest_snapshot()
+    result = _get_user_from_snapshot(latest_snapshot, user_id)
+    return result
+
+
 @router.delete("/{collectionId}", **endpoints.collections_collectionId_delete, dependencies=dependencies.authorization_dependencies)
 async def delete_collection(
-    collection_id: Annotated[int, Depends(dependencies.collection_id)], session: AsyncSession = Depends(db.get_session)
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(db.get_session),
 ) -> None:
     collection_exists = await crud.has_collection(session, collection_id)
     if not collection_exists:
         raise exceptions.collection_not_found(collection_id)
 
     deleted = await crud.delete_collection(session, collection_id)
+    background_tasks.add_task(snapshot.refresh_snapshot)
 
     if not deleted:
         raise exceptions.collection_not_deleted(collection_id)
@@ -77,6 +201,10 @@ async def delete_collection(
 async def get_collection(
     collection_id: Annotated[int, Depends(dependencies.collection_id)], session: AsyncSession = Depends(db.get_session)
 ) -> CollectionOut:
+    collection_snapshot = snapshot.get_collection_snapshot(collection_id)
+    if collection_snapshot:
+        return collection_snapshot.to_collection()
+
     collection = await crud.get_collection(session, collection_id, True, True)
     if not collection:
         raise exceptions.collection_not_found(collection_id)
@@ -85,15 +213,35 @@ async def get_collection(
     return result
 
 
+@router.get(
+    "/{collectionId}/diff/{otherCollectionId}", **endpoints.collections_collectionId_diff_otherCollectionId_get, response_model=CollectionDiffOut
+)
+async def get_collection_diff(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    other_collection_id: Annotated[int, Depends(dependencies.other_collection_id)],
+    session: AsyncSession = Depends(db.get_session),
+) -> StreamingResponse:
+    from_collection = await _get_collection_by_id_or_timestamp(session, collection_id, None)
+    to_collection = await _get_collection_by_id_or_timestamp(session, other_collection_id, None)
+    content = _stream_collection_diff(session, from_collection, to_collection)
+    return StreamingResponse(content, media_type="application/json")
+
+
 @router.get("/{collectionId}/alliances", **endpoints.collections_collectionId_alliances_get)
 async def get_alliances_from_collection(
-    collection_id: Annotated[int, Depends(dependencies.collection_id)], session: AsyncSession = Depends(db.get_session)
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    division_design_id: Annotated[int | None, Depends(dependencies.optional_division_design_id)],
+    session: AsyncSession = Depends(db.get_session),
 ) -> CollectionWithFleetsOut:
+    collection_snapshot = snapshot.get_collection_snapshot(collection_id)
+    if collection_snapshot:
+        return collection_snapshot.to_collection_with_fleets(division_design_id)
+
     collection_exists = await crud.has_collection(session, collection_id)
     if not collection_exists:
         raise exceptions.collection_not_found(collection_id)
 
-    collection = await crud.get_collection(session, collection_id, True, False)
+    collection = await crud.get_collection(session, collection_id, True, False, division_design_id)
     result = FromDB.to_collection_with_fleets(collection)
     return result
 
@@ -104,6 +252,10 @@ async def get_alliance_from_collection(
     alliance_id: Annotated[int, Depends(dependencies.alliance_id)],
     session: AsyncSession = Depends(db.get_session),
 ) -> AllianceHistoryOut:
+    collection_snapshot = snapshot.get_collection_snapshot(collection_id)
+    if collection_snapshot:
+        return _get_alliance_from_snapshot(collection_snapshot, alliance_id)
+
     collection_exists = await crud.has_collection(session, collection_id)
     if not collection_exists:
         raise exceptions.collection_not_found(collection_id)
@@ -116,12 +268,132 @@ async def get_alliance_from_collection(
     return result
 
 
+@router.get("/{collectionId}/histogram", **endpoints.collections_collectionId_histogram_get)
+async def get_histogram(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    metric: Annotated[ParameterUserMetric, Depends(dependencies.user_metric)],
+    buckets: Annotated[int, Depends(dependencies.histogram_buckets)],
+    session: AsyncSession = Depends(db.get_session),
+) -> HistogramOut:
+    collection = await crud.get_collection(session, collection_id, False, False)
+    if not collection:
+        raise exceptions.collection_not_found(collection_id)
+
+    histogram = await crud.get_histogram(session, collection_id, metric, buckets)
+    result = FromDB.to_histogram(collection, metric, buckets, histogram)
+    return result
+
+
+@router.get("/{collectionId}/histogram/alliances", **endpoints.collections_collectionId_histogram_alliances_get)
+async def get_alliance_histogram(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    metric: Annotated[ParameterAllianceMetric, Depends(dependencies.alliance_metric)],
+    buckets: Annotated[int, Depends(dependencies.histogram_buckets)],
+    session: AsyncSession = Depends(db.get_session),
+) -> AllianceHistogramOut:
+    collection = await crud.get_collection(session, collection_id, False, False)
+    if not collection:
+        raise exceptions.collection_not_found(collection_id)
+
+    histogram = await crud.get_alliance_histogram(session, collection_id, metric, buckets)
+    result = FromDB.to_alliance_histogram(collection, metric, buckets, histogram)
+    return result
+
+
+@router.get("/{collectionId}/leaderboards/alliances", **endpoints.collections_collectionId_leaderboards_alliances_get)
+async def get_alliance_leaderboard(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    metric: Annotated[ParameterAllianceMetric, Depends(dependencies.alliance_metric)],
+    division_design_id: Annotated[int | None, Depends(dependencies.optional_division_design_id)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> AllianceLeaderboardOut:
+    collection = await crud.get_collection(session, collection_id, False, False)
+    if not collection:
+        raise exceptions.collection_not_found(collection_id)
+
+    ranks = await crud.get_alliance_leaderboard(session, collection_id, metric, division_design_id, skip_take.skip, skip_take.take)
+    result = FromDB.to_alliance_leaderboard(collection, metric, ranks)
+    return result
+
+
+@router.get("/{collectionId}/leaderboards/users", **endpoints.collections_collectionId_leaderboards_users_get)
+async def get_user_leaderboard(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    metric: Annotated[ParameterUserMetric, Depends(dependencies.user_metric)],
+    alliance_id: Annotated[int | None, Depends(dependencies.optional_alliance_id)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> UserLeaderboardOut:
+    collection = await crud.get_collection(session, collection_id, False, False)
+    if not collection:
+        raise exceptions.collection_not_found(collection_id)
+
+    ranks = await crud.get_user_leaderboard(session, collection_id, metric, alliance_id, skip_take.skip, skip_take.take)
+    result = FromDB.to_user_leaderboard(collection, metric, ranks)
+    return result
+
+
+@router.get("/{collectionId}/leaderboards/users/{userId}", **endpoints.collections_collectionId_leaderboards_users_userId_get)
+async def get_user_rank(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    user_id: Annotated[int, Depends(dependencies.user_id)],
+    metric: Annotated[ParameterUserMetric, Depends(dependencies.user_metric)],
+    alliance_id: Annotated[int | None, Depends(dependencies.optional_alliance_id)],
+    session: AsyncSession = Depends(db.get_session),
+) -> UserLeaderboardOut:
+    collection = await crud.get_collection(session, collection_id, False, False)
+    if not collection:
+        raise exceptions.collection_not_found(collection_id)
+
+    rank = await crud.get_user_rank(session, collection_id, user_id, metric, alliance_id)
+    if not rank:
+        raise exceptions.user_not_found_in_collection(collection_id, user_id)
+
+    result = FromDB.to_user_leaderboard(collection, metric, [rank])
+    return result
+
+
+@router.get("/{collectionId}/standings", **endpoints.collections_collectionId_standings_get)
+async def get_division_standings(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    division_design_id: Annotated[int, Depends(dependencies.division_design_id)],
+    session: AsyncSession = Depends(db.get_session),
+) -> DivisionStandingsOut:
+    collection = await crud.get_collection(session, collection_id, False, False)
+    if not collection:
+        raise exceptions.collection_not_found(collection_id)
+    if not collection.tournament_running:
+        raise exceptions.tournament_not_found(collection_id)
+
+    standings = await crud.get_division_standings(session, collection_id, division_design_id)
+    result = FromDB.to_division_standings(collection, division_design_id, standings)
+    return result
+
+
+@router.get("/{collectionId}/stats", **endpoints.collections_collectionId_stats_get)
+async def get_collection_stats(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    session: AsyncSession = Depends(db.get_session),
+) -> CollectionStatsOut:
+    collection_stats = await crud.get_collection_stats(session, collection_id)
+    if not collection_stats:
+        raise exceptions.collection_not_found(collection_id)
+
+    result = FromDB.to_collection_stats(collection_stats)
+    return result
+
+
 @router.get("/{collectionId}/top100Users", **endpoints.collections_collectionId_top100Users_get)
 async def get_top_100_from_collection(
     collection_id: Annotated[int, Depends(dependencies.collection_id)],
     skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
     session: AsyncSession = Depends(db.get_session),
 ) -> CollectionWithUsersOut:
+    collection_snapshot = snapshot.get_collection_snapshot(collection_id)
+    if collection_snapshot:
+        return collection_snapshot.to_collection_with_top_users(skip_take.skip, skip_take.take)
+
     collection_exists = await crud.has_collection(session, collection_id)
     if not collection_exists:
         raise exceptions.collection_not_found(collection_id)
@@ -133,10 +405,55 @@ async def get_top_100_from_collection(
     return result
 
 
+@router.get("/{collectionId}/tournament/alliances", **endpoints.collections_collectionId_tournament_alliances_get)
+async def get_tournament_alliances(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    alliance_id: Annotated[int | None, Depends(dependencies.optional_alliance_id)],
+    division_design_id: Annotated[int | None, Depends(dependencies.optional_division_design_id)],
+    session: AsyncSession = Depends(db.get_session),
+) -> TournamentAlliancesOut:
+    tournament = await _get_tournament(session, collection_id)
+    first_collection, last_collection, _ = tournament
+
+    progression = await crud.get_tournament_alliance_progression(
+        session, first_collection.collected_at, last_collection.collected_at, alliance_id, division_design_id
+    )
+    result = FromDB.to_tournament_alliances(tournament, progression)
+    return result
+
+
+@router.get("/{collectionId}/tournament/users", **endpoints.collections_collectionId_tournament_users_get)
+async def get_tournament_users(
+    collection_id: Annotated[int, Depends(dependencies.collection_id)],
+    alliance_id: Annotated[int | None, Depends(dependencies.optional_alliance_id)],
+    division_design_id: Annotated[int | None, Depends(dependencies.optional_division_design_id)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> TournamentUsersOut:
+    tournament = await _get_tournament(session, collection_id)
+    first_collection, last_collection, _ = tournament
+
+    deltas = await crud.get_tournament_user_deltas(
+        session,
+        first_collection.collection_id,
+        last_collection.collection_id,
+        alliance_id,
+        division_design_id,
+        skip_take.skip,
+        skip_take.take,
+    )
+    result = FromDB.to_tournament_users(tournament, deltas)
+    return result
+
+
 @router.get("/{collectionId}/users", **endpoints.collections_collectionId_users_get)
 async def get_users_from_collection(
     collection_id: Annotated[int, Depends(dependencies.collection_id)], session: AsyncSession = Depends(db.get_session)
 ) -> CollectionWithUsersOut:
+    collection_snapshot = snapshot.get_collection_snapshot(collection_id)
+    if collection_snapshot:
+        return collection_snapshot.to_collection_with_users()
+
     collection_exists = await crud.has_collection(session, collection_id)
     if not collection_exists:
         raise exceptions.collection_not_found(collection_id)
@@ -152,6 +469,10 @@ async def get_user_from_collection(
     user_id: Annotated[int, Depends(dependencies.user_id)],
     session: AsyncSession = Depends(db.get_session),
 ) -> UserHistoryOut:
+    collection_snapshot = snapshot.get_collection_snapshot(collection_id)
+    if collection_snapshot:
+        return _get_user_from_snapshot(collection_snapshot, user_id)
+
     collection_exists = await crud.has_collection(session, collection_id)
     if not collection_exists:
         raise exceptions.collection_not_found(collection_id)
@@ -187,7 +508,9 @@ schema_version_to_converter = {
 
 @router.post("/upload", **endpoints.collections_upload_post, dependencies=dependencies.authorization_dependencies)
 async def upload_collection(
-    collection_file: Annotated[UploadFile, File(media_type="application/json")], session: AsyncSession = Depends(db.get_session)
+    collection_file: Annotated[UploadFile, File(media_type="application/json")],
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(db.get_session),
 ) -> CollectionMetadataOut:
     collection_db = await convert_uploaded_file(collection_file)
 
@@ -196,6 +519,7 @@ async def upload_collection(
         raise exceptions.non_unique_timestamp(collection_db.collected_at, collection_with_same_timestamp.collection_id)
 
     collection_db = await crud.save_collection(session, collection_db, True, True)
+    background_tasks.add_task(snapshot.refresh_snapshot)
 
     result = FromDB.to_collection(collection_db, False, False).meta
     return result
@@ -205,6 +529,7 @@ async def upload_collection(
 async def update_collection(
     collection_id: Annotated[int, Depends(dependencies.collection_id)],
     collection_file: Annotated[UploadFile, File(media_type="application/json")],
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(db.get_session),
 ) -> CollectionMetadataOut:
     if not (await crud.has_collection(session, collection_id)):
@@ -217,6 +542,7 @@ async def update_collection(
         raise exceptions.collected_at_not_match(collection_in.collected_at, collection_db.collected_at, collection_id)
 
     collection_in = await crud.update_collection(session, collection_id, collection_in)
+    background_tasks.add_task(snapshot.refresh_snapshot, True)
 
     result = FromDB.to_collection(collection_in, False, False).meta
     return result
@@ -246,6 +572,120 @@ async def convert_uploaded_file(uploaded_file: UploadFile) -> CollectionDB:
     return collection_db
 
 
+def _get_alliance_from_snapshot(collection_snapshot: snapshot.CollectionSnapshot, alliance_id: int) -> AllianceHistoryOut:
+    alliance_history = collection_snapshot.to_alliance_history(alliance_id)
+    if not alliance_history:
+        raise exceptions.alliance_not_found_in_collection(collection_snapshot.collection_id, alliance_id)
+    return alliance_history
+
+
+async def _get_collection_by_id_or_timestamp(session: AsyncSession, collection_id: int | None, timestamp: datetime | None) -> CollectionDB:
+    """Retrieves the metadata of the Collection with the given `collection_id` or, if that's not specified, of the latest Collection collected at or before the given `timestamp`.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        collection_id (int | None): The ID of the Collection to retrieve.
+        timestamp (datetime | None): The point in time at or before which the Collection to retrieve has been collected. If neither this nor `collection_id` is specified, the latest Collection is retrieved.
+
+    Raises:
+        CollectionNotFoundError: Raised, if there's no such Collection.
+
+    Returns:
+        CollectionDB: The Collection without any Alliances or Users.
+    """
+    if collection_id:
+        collection = await crud.get_collection(session, collection_id, False, False)
+        if not collection:
+            raise exceptions.collection_not_found(collection_id)
+        return collection
+
+    collection = await crud.get_latest_collection(session, timestamp)
+    if not collection:
+        raise exceptions.collection_not_found_at(timestamp or datetime.now())
+    return collection
+
+
+async def _get_latest_snapshot() -> snapshot.CollectionSnapshot:
+    """Retrieves the latest Collection from the snapshot.
+
+    Raises:
+        CollectionNotFoundError: Raised, if there are no Collections.
+
+    Returns:
+        snapshot.CollectionSnapshot: The latest Collection.
+    """
+    shared_snapshot = await snapshot.get_snapshot()
+    latest_snapshot = shared_snapshot.latest if shared_snapshot else None
+    if not latest_snapshot:
+        raise exceptions.no_collections()
+    return latest_snapshot
+
+
+async def _get_tournament(session: AsyncSession, collection_id: int) -> TournamentDB:
+    tournament = await crud.get_tournament(session, collection_id)
+    if tournament:
+        return tournament
+
+    collection_exists = await crud.has_collection(session, collection_id)
+    if not collection_exists:
+        raise exceptions.collection_not_found(collection_id)
+    raise exceptions.tournament_not_found(collection_id)
+
+
+def _get_user_from_snapshot(collection_snapshot: snapshot.CollectionSnapshot, user_id: int) -> UserHistoryOut:
+    user_history = collection_snapshot.to_user_history(user_id)
+    if not user_history:
+        raise exceptions.user_not_found_in_collection(collection_snapshot.collection_id, user_id)
+    return user_history
+
+
+async def _stream_collection_diff(session: AsyncSession, from_collection: CollectionDB, to_collection: CollectionDB) -> AsyncIterator[bytes]:
+    """Streams the changes of Alliances and Users between two Collections as a JSON encoded `CollectionDiffOut`.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        from_collection (CollectionDB): The earlier Collection.
+        to_collection (CollectionDB): The later Collection.
+
+    Yields:
+        bytes: The next chunk of the JSON document.
+    """
+    from_collection_json = FromDB.to_collection_metadata(from_collection).model_dump_json().encode()
+    to_collection_json = FromDB.to_collection_metadata(to_collection).model_dump_json().encode()
+    yield b'{"from_collection":' + from_collection_json + b',"to_collection":' + to_collection_json + b',"alliances":'
+    async for chunk in _stream_json_array(crud.get_alliance_changes(session, from_collection.collection_id, to_collection.collection_id)):
+        yield chunk
+    yield b',"users":'
+    async for chunk in _stream_json_array(crud.get_user_changes(session, from_collection.collection_id, to_collection.collection_id)):
+        yield chunk
+    yield b"}"
+
+
+async def _stream_json_array(changes: AsyncIterator[EntityChangeDB], chunk_size: int = 1_000) -> AsyncIterator[bytes]:
+    """Encodes the changes as a JSON array in chunks of `chunk_size` changes.
+
+    Args:
+        changes (AsyncIterator[EntityChangeDB]): The changes to encode.
+        chunk_size (int, optional): The number of changes per chunk. Defaults to 1000.
+
+    Yields:
+        bytes: The next chunk of the JSON array.
+    """
+    prefix = b"["
+    chunk = []
+    async for change in changes:
+        chunk.append(orjson.dumps(change))
+        if len(chunk) == chunk_size:
+            yield prefix + b",".join(chunk)
+            prefix = b","
+            chunk = []
+
+    if chunk:
+        yield prefix + b",".join(chunk) + b"]"
+    else:
+        yield b"]" if prefix == b"," else b"[]"
+
+
 __all__ = [
     "router",
 ]
@@ -1,16 +1,32 @@
+import ipaddress
+import math
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import Depends, Header, Path, Query, Request
+from fastapi import Body, Depends, Header, Path, Query, Request
+from pydantic import Field
 
-from .. import utils
+from .. import rate_limiting, utils
 from ..config import CONSTANTS, SETTINGS
-from ..models.enums import ParameterInterval, ParameterOnMissing
+from ..models.enums import (
+    EntityEventType,
+    EntityType,
+    ExportTable,
+    ParameterAllianceMetric,
+    ParameterInterval,
+    ParameterOnMissing,
+    ParameterSearchMode,
+    ParameterUserMetric,
+)
 from ..models.exceptions import (
     FromDateAfterToDateError,
+    InvalidCursorError,
+    InvalidEntityIdError,
+    InvalidNameError,
     MissingAccessError,
     NotAuthenticatedError,
+    TooManyRequestsError,
 )
 
 
@@ -20,12 +36,32 @@ class ListFilter:
     desc: bool = False
 
 
+@dataclass(frozen=True)
+class CollectionPairFilter:
+    from_collection_id: int | None = None
+    to_collection_id: int | None = None
+
+
 @dataclass(frozen=True)
 class DatetimeFilter:
     from_date: datetime | None = None
     to_date: datetime | None = None
 
 
+@dataclass(frozen=True)
+class EntityEventFilter:
+    entity_type: EntityType | None
+    entity_id: int | None
+    event_types: list[EntityEventType]
+
+
+@dataclass(frozen=True)
+class NameSearchFilter:
+    name: str
+    entity_type: EntityType | None = None
+    mode: ParameterSearchMode = ParameterSearchMode.PREFIX
+
+
 @dataclass(frozen=True)
 class SkipTakeFilter:
     skip: int = 0
@@ -42,6 +78,54 @@ async def alliance_id(alliance_id: Annotated[int, Path(alias="allianceId", ge=1,
     return alliance_id
 
 
+async def alliance_metric(
+    metric: Annotated[
+        ParameterAllianceMetric, Query(description="The numeric property of the Alliance to evaluate.", examples=[ParameterAllianceMetric.SCORE])
+    ] = ParameterAllianceMetric.SCORE,
+) -> ParameterAllianceMetric:
+    """
+    Adds query parameter `metric` to a path.
+
+    Returns:
+        ParameterAllianceMetric: The specified metric or "score".
+    """
+    return metric
+
+
+async def alliance_ids(
+    alliance_ids: Annotated[
+        list[Annotated[int, Field(ge=1)]],
+        Body(alias="allianceIds", embed=True, min_length=1, max_length=100, description="The IDs of up to 100 PSS Alliances.", examples=[[21, 9343]]),
+    ],
+) -> list[int]:
+    """
+    Adds body parameter `allianceIds` to a path.
+
+    Returns:
+        list[int]: The AllianceIds without duplicates in the order provided.
+    """
+    return list(dict.fromkeys(alliance_ids))
+
+
+async def collection_pair_parameters(
+    from_collection_id: Annotated[
+        int | None,
+        Query(alias="fromCollectionId", ge=1, description="The ID of the PSS fleet data Collection to compare against.", examples=[1]),
+    ] = None,
+    to_collection_id: Annotated[
+        int | None,
+        Query(alias="toCollectionId", ge=1, description="The ID of the PSS fleet data Collection to compare.", examples=[2]),
+    ] = None,
+) -> CollectionPairFilter:
+    """
+    Adds query parameters `fromCollectionId` and `toCollectionId` to a path.
+
+    Returns:
+        CollectionPairFilter: An object encapsulating the added parameters.
+    """
+    return CollectionPairFilter(from_collection_id=from_collection_id, to_collection_id=to_collection_id)
+
+
 async def collection_id(
     collection_id: Annotated[int, Path(alias="collectionId", ge=1, description="The ID of a PSS fleet data Collection.", examples=[1])],
 ) -> int:
@@ -54,6 +138,46 @@ async def collection_id(
     return collection_id
 
 
+async def other_collection_id(
+    other_collection_id: Annotated[
+        int, Path(alias="otherCollectionId", ge=1, description="The ID of another PSS fleet data Collection.", examples=[2])
+    ],
+) -> int:
+    """
+    Adds path parameter `otherCollectionId` to a path.
+
+    Returns:
+        int: The CollectionId.
+    """
+    return other_collection_id
+
+
+async def export_month(
+    month: Annotated[
+        str, Path(alias="month", pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="A month in the format `YYYY-MM`.", examples=["2024-06"])
+    ],
+) -> str:
+    """
+    Adds path parameter `month` to a path.
+
+    Returns:
+        str: The month.
+    """
+    return month
+
+
+async def export_table(
+    table: Annotated[ExportTable, Path(alias="table", description="An exported table.", examples=[ExportTable.USERS])],
+) -> ExportTable:
+    """
+    Adds path parameter `table` to a path.
+
+    Returns:
+        ExportTable: The table.
+    """
+    return table
+
+
 async def division_design_id(
     division_design_id: Annotated[
         int, Query(alias="divisionDesignId", ge=0, description="The ID of the PSS Monthly Fleet Tournament Division.", examples=[1])
@@ -68,6 +192,69 @@ async def division_design_id(
     return division_design_id
 
 
+async def histogram_buckets(
+    buckets: Annotated[
+        int, Query(ge=1, le=1000, description="The number of buckets of equal width to divide the range of values into.", examples=[50])
+    ] = 50,
+) -> int:
+    """
+    Adds query parameter `buckets` to a path.
+
+    Returns:
+        int: The number of buckets or 50, if it hasn't been specified.
+    """
+    return buckets
+
+
+async def optional_alliance_id(
+    alliance_id: Annotated[
+        int | None, Query(alias="allianceId", ge=1, description="Only return data of members of the PSS Alliance with this ID.", examples=[21])
+    ] = None,
+) -> int | None:
+    """
+    Adds query parameter `allianceId` to a path.
+
+    Returns:
+        int | None: The AllianceId or None, if it hasn't been specified.
+    """
+    return alliance_id
+
+
+async def optional_collection_id(
+    collection_id: Annotated[
+        int | None,
+        Query(alias="collectionId", ge=1, description="Only return data from the PSS fleet data Collection with this ID.", examples=[1]),
+    ] = None,
+) -> int | None:
+    """
+    Adds query parameter `collectionId` to a path.
+
+    Returns:
+        int | None: The CollectionId or None, if it hasn't been specified.
+    """
+    return collection_id
+
+
+async def optional_division_design_id(
+    division_design_id: Annotated[
+        int | None,
+        Query(
+            alias="divisionDesignId",
+            ge=0,
+            description="Only return data related to Alliances in the PSS Monthly Fleet Tournament Division with this ID.",
+            examples=[1],
+        ),
+    ] = None,
+) -> int | None:
+    """
+    Adds query parameter `divisionDesignId` to a path.
+
+    Returns:
+        int | None: The DivisionDesignId or None, if it hasn't been specified.
+    """
+    return division_design_id
+
+
 async def on_missing(
     on_missing: Annotated[
         ParameterOnMissing,
@@ -97,6 +284,124 @@ async def user_id(user_id: Annotated[int, Path(alias="userId", ge=1, description
     return user_id
 
 
+async def user_ids(
+    user_ids: Annotated[
+        list[Annotated[int, Field(ge=1)]],
+        Body(alias="userIds", embed=True, min_length=1, max_length=100, description="The IDs of up to 100 PSS Users.", examples=[[4510693, 4510694]]),
+    ],
+) -> list[int]:
+    """
+    Adds body parameter `userIds` to a path.
+
+    Returns:
+        list[int]: The UserIds without duplicates in the order provided.
+    """
+    return list(dict.fromkeys(user_ids))
+
+
+async def user_metric(
+    metric: Annotated[
+        ParameterUserMetric, Query(description="The numeric property of the User to evaluate.", examples=[ParameterUserMetric.TROPHY])
+    ] = ParameterUserMetric.TROPHY,
+) -> ParameterUserMetric:
+    """
+    Adds query parameter `metric` to a path.
+
+    Returns:
+        ParameterUserMetric: The specified metric or "trophy".
+    """
+    return metric
+
+
+async def user_metrics(
+    metrics: Annotated[
+        list[ParameterUserMetric] | None,
+        Query(
+            description="The numeric properties of the User to return. Can be specified multiple times. Defaults to all properties.",
+            examples=[["trophy"]],
+        ),
+    ] = None,
+) -> list[ParameterUserMetric]:
+    """
+    Adds query parameter `metrics` to a path.
+
+    Returns:
+        list[ParameterUserMetric]: The specified metrics without duplicates in the order provided or all metrics, if none have been specified.
+    """
+    if not metrics:
+        return list(ParameterUserMetric)
+    return list(dict.fromkeys(metrics))
+
+
+async def entity_event_filter_parameters(
+    entity_type: Annotated[
+        EntityType | None,
+        Query(alias="entityType", description="Only return events of Alliances or of Users.", examples=[EntityType.USER]),
+    ] = None,
+    entity_id: Annotated[
+        int | None,
+        Query(
+            alias="entityId",
+            ge=1,
+            description="Only return events of the Alliance or User with this ID. Requires the parameter `entityType`.",
+            examples=[4510693],
+        ),
+    ] = None,
+    event_types: Annotated[
+        list[EntityEventType] | None,
+        Query(
+            alias="eventTypes",
+            description="Only return events of these types. Can be specified multiple times. Defaults to all types.",
+            examples=[[EntityEventType.JOINED_ALLIANCE]],
+        ),
+    ] = None,
+) -> EntityEventFilter:
+    """
+    Adds query parameters `entityType`, `entityId` and `eventTypes` to a path and also validates that `entityType` is specified, if `entityId` is.
+
+    Raises:
+        InvalidEntityIdError: Raised, if `entityId` has been specified without `entityType`.
+
+    Returns:
+        EntityEventFilter: An object encapsulating the added parameters.
+    """
+    if entity_id is not None and entity_type is None:
+        raise InvalidEntityIdError(
+            "The parameter `entityId` requires the parameter `entityType`.", suggestion="Specify the parameter `entityType`, too."
+        )
+
+    return EntityEventFilter(entity_type=entity_type, entity_id=entity_id, event_types=list(dict.fromkeys(event_types or [])))
+
+
+async def name_search_parameters(
+    name: Annotated[
+        str, Query(min_length=1, max_length=100, description="The name or part of a name to search for. Case-insensitive.", examples=["Trek"])
+    ],
+    entity_type: Annotated[
+        EntityType | None,
+        Query(alias="entityType", description="Only search the names of Alliances or of Users. Defaults to both.", examples=[EntityType.ALLIANCE]),
+    ] = None,
+    mode: Annotated[
+        ParameterSearchMode | None,
+        Query(description="Determines how names are matched. Defaults to `prefix`.", examples=[ParameterSearchMode.PREFIX]),
+    ] = ParameterSearchMode.PREFIX,
+) -> NameSearchFilter:
+    """
+    Adds query parameters `name`, `entityType` and `mode` to a path and also validates that `name` isn't blank.
+
+    Raises:
+        InvalidNameError: Raised, if `name` only consists of whitespace.
+
+    Returns:
+        NameSearchFilter: An object encapsulating the added parameters.
+    """
+    name = name.strip()
+    if not name:
+        raise InvalidNameError("The parameter `name` must not be blank.", suggestion="Provide at least one character other than whitespace.")
+
+    return NameSearchFilter(name=name, entity_type=entity_type, mode=mode or ParameterSearchMode.PREFIX)
+
+
 async def from_to_date_parameters(
     from_date: Annotated[
         datetime | None,
@@ -150,6 +455,67 @@ async def list_filter_parameters(
     return ListFilter(interval=interval, desc=desc)
 
 
+async def cursor_parameter(
+    list_filter: Annotated[ListFilter, Depends(list_filter_parameters)],
+    cursor: Annotated[
+        str | None,
+        Query(
+            max_length=256,
+            description="Continue after the last entry of the previous page. Use the value of the response header `X-Next-Cursor` of the previous page and keep all other parameters.",
+        ),
+    ] = None,
+) -> datetime | None:
+    """
+    Adds query parameter `cursor` to a path and decodes it.
+
+    Raises:
+        InvalidCursorError: Raised, if the cursor can't be decoded or if it has been created for the opposite sort order.
+
+    Returns:
+        datetime | None: The timestamp of the last entry of the previous page or None, if no cursor has been provided.
+    """
+    if not cursor:
+        return None
+
+    try:
+        start_after, desc = utils.decode_cursor(cursor)
+    except ValueError as exc:
+        raise InvalidCursorError(str(exc), suggestion="Use the value of the response header `X-Next-Cursor` of the previous page.") from exc
+
+    if desc != bool(list_filter.desc):
+        raise InvalidCursorError(
+            "The cursor has been created for the opposite sort order.", suggestion="Use the same value for the parameter `desc` on all pages."
+        )
+
+    return start_after
+
+
+async def ranking_desc(
+    desc: Annotated[
+        bool | None, Query(description="Return the biggest values first. Set to false to return the smallest values first.", examples=[True])
+    ] = True,
+) -> bool:
+    """
+    Adds query parameter `desc` for ordering a ranking to a path.
+
+    Returns:
+        bool: The specified sort order or True.
+    """
+    return desc is not False
+
+
+async def timestamp_desc(
+    desc: Annotated[bool | None, Query(description="Return the results in descending order by timestamp.", examples=[False])] = False,
+) -> bool:
+    """
+    Adds query parameter `desc` for ordering by timestamp to a path.
+
+    Returns:
+        bool: The specified sort order or False.
+    """
+    return bool(desc)
+
+
 async def skip_take_parameters(
     skip: Annotated[int | None, Query(ge=0, description="Skip this number of results from the result set.", examples=[0])] = 0,
     take: Annotated[int | None, Query(ge=1, le=100, description="Limit the number of results returned.", examples=[100])] = 100,
@@ -163,6 +529,29 @@ async def skip_take_parameters(
     return SkipTakeFilter(skip=skip, take=take)
 
 
+async def rate_limit(request: Request):
+    """Takes the cost of the requested endpoint from the token bucket of the client. The client is identified by `_get_client_key`.
+
+    Args:
+        request (Request): The request from the client.
+
+    Raises:
+        TooManyRequestsError: Raised, if the client's token bucket doesn't hold enough tokens for the request.
+    """
+    if not SETTINGS.rate_limit_enabled:
+        return
+
+    route = request.scope.get("route")
+    retry_after = await rate_limiting.acquire(_get_client_key(request), getattr(route, "operation_id", None))
+    if retry_after:
+        retry_after = math.ceil(retry_after)
+        raise TooManyRequestsError(
+            f"You've sent too many or too expensive requests to '{request.url.path}'.",
+            suggestion=f"Please try again in: {retry_after} seconds",
+            retry_after=retry_after,
+        )
+
+
 def root_api_key() -> str | None:
     return SETTINGS.root_api_key
 
@@ -204,6 +593,55 @@ def _check_is_authenticated(api_key: str) -> bool:
     return bool(api_key)
 
 
+def _get_client_key(request: Request) -> str:
+    """Identifies the client sending a request. The `X-Forwarded-For` header is only honored, if the request has been sent by one of the trusted proxies
+    configured in `SETTINGS.rate_limit_trusted_proxies`. In that case, the right-most address not belonging to a trusted proxy is the client, since any
+    addresses left of it may have been forged by the client.
+
+    Args:
+        request (Request): The request from the client.
+
+    Returns:
+        str: The IP address or host name of the client.
+    """
+    if not request.client:
+        return "unknown"
+
+    client_host = request.client.host
+    forwarded_for = request.headers.get("X-Forwarded-For")
+    if not forwarded_for or not _is_trusted_proxy(client_host):
+        return client_host
+
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else client_host
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    """Checks, if a host is one of the trusted proxies configured in `SETTINGS.rate_limit_trusted_proxies`.
+
+    Args:
+        host (str): The IP address or host name to check.
+
+    Returns:
+        bool: The result of the check.
+    """
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return host in SETTINGS.rate_limit_trusted_proxies
+
+    for proxy in SETTINGS.rate_limit_trusted_proxies:
+        try:
+            if address in ipaddress.ip_network(proxy, strict=False):
+                return True
+        except ValueError:
+            continue
+    return False
+
+
 def _check_is_authorized(request: Request, api_key: str, root_api_key: str) -> bool:
     """Checks, if the client is authorized.
 
@@ -222,17 +660,39 @@ authorization_dependencies: list[Any] = [Depends(verify_api_key)] if root_api_ke
 
 __all__ = [
     # classes
+    "CollectionPairFilter",
     "DatetimeFilter",
+    "EntityEventFilter",
     "ListFilter",
+    "NameSearchFilter",
     "SkipTakeFilter",
     # functions
     "alliance_id",
+    "alliance_ids",
+    "alliance_metric",
     "collection_id",
+    "collection_pair_parameters",
+    "cursor_parameter",
     "division_design_id",
+    "entity_event_filter_parameters",
+    "export_month",
+    "export_table",
     "from_to_date_parameters",
+    "histogram_buckets",
     "list_filter_parameters",
+    "name_search_parameters",
+    "optional_alliance_id",
+    "optional_collection_id",
+    "optional_division_design_id",
+    "other_collection_id",
+    "ranking_desc",
+    "rate_limit",
     "skip_take_parameters",
+    "timestamp_desc",
     "user_id",
+    "user_ids",
+    "user_metric",
+    "user_metrics",
     "verify_api_key",
     # conditional dependencies
     "authorization_dependencies",
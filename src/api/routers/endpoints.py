@@ -17,6 +17,17 @@ _collections_post_response_201 = {
     },
 }
 
+_next_page_headers = {
+    "X-Next-Cursor": {
+        "description": "Only present, if the page is full. Pass this value as the parameter `cursor` to retrieve the next page.",
+        "schema": {"type": "string"},
+    },
+    "Link": {
+        "description": 'Only present, if the page is full. The URL of the next page with `rel="next"`.',
+        "schema": {"type": "string"},
+    },
+}
+
 
 allianceHistory_allianceId_get = EndpointDefinition(
     summary="Get an Alliance's history.",
@@ -32,6 +43,7 @@ allianceHistory_allianceId_get = EndpointDefinition(
         ),
         status.HTTP_200_OK: {
             "description": "A list of objects denoting the requested Alliance at a specific point in time.",
+            "headers": _next_page_headers,
             "links": {
                 OperationId.GET_ALLIANCE_FROM_COLLECTION: links.allianceHistory_getAllianceFromCollection,
                 OperationId.GET_USER_FROM_COLLECTION: links.allianceHistory_getUserFromCollection,
@@ -43,6 +55,39 @@ allianceHistory_allianceId_get = EndpointDefinition(
 )
 
 
+allianceHistory_allianceId_names_get = EndpointDefinition(
+    summary="Get the names an Alliance has had.",
+    description="Get the names of a specific Alliance and the time frame each name has been seen in. A name the Alliance has returned to is only returned once, spanning from its first to its last use.",
+    operation_id=OperationId.GET_ALLIANCE_NAMES,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of the names of the requested Alliance ordered by the time they have been seen first.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Alliance could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "A list of the names of the requested Alliance ordered by the time they have been seen first.",
+        },
+    },
+)
+
+
+allianceHistory_batch_post = EndpointDefinition(
+    summary="Get the histories of multiple Alliances.",
+    description="Get the history of up to 100 Alliances at once, optionally from a single Collection only. The parameters `skip` and `take` apply to the history of each Alliance. If the parameter `collectionId` is specified, the parameters `fromDate`, `toDate` and `interval` are ignored. Missing Collections are skipped.",
+    operation_id=OperationId.GET_ALLIANCE_HISTORIES,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of the requested Alliances with their history in the order requested.",
+    responses={
+        **responses.get_default_responses_for_get(),
+        status.HTTP_200_OK: {
+            "description": "A list of the requested Alliances with their history in the order requested. The history is empty, if there's no data for an Alliance.",
+        },
+    },
+)
+
+
 collections_get = EndpointDefinition(
     summary="Get metadata of all Collections or a subset of Collections.",
     description="Get the metadata of a subset of all Collections. You can use the parameters to limit the result set.",
@@ -55,6 +100,7 @@ collections_get = EndpointDefinition(
         ),
         status.HTTP_200_OK: {
             "description": "A list of Collection Metadata objects.",
+            "headers": _next_page_headers,
             "links": {
                 OperationId.DELETE_COLLECTION: links.collections_deleteCollection,
                 OperationId.GET_ALLIANCES_FROM_COLLECTION: links.collections_getAlliancesFromCollection,
@@ -68,6 +114,161 @@ collections_get = EndpointDefinition(
 )
 
 
+_latest_collection_description = "The latest Collection is held in memory, so these requests are served without querying the database."
+
+
+collections_latest_get = EndpointDefinition(
+    summary="Get all data of the latest Collection.",
+    description=f"Get all data from the latest data Collection. {_latest_collection_description}",
+    operation_id=OperationId.GET_LATEST_COLLECTION,
+    status_code=status.HTTP_200_OK,
+    response_description="The latest Collection's metadata, Alliances and Users with the specified metadata, Alliance and User properties.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="There are no Collections.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "The latest Collection's metadata, Alliances and Users with the specified metadata, Alliance and User properties.",
+            "links": {
+                OperationId.GET_ALLIANCE_HISTORY: links.collection_getAllianceHistory,
+                OperationId.GET_USER_HISTORY: links.collection_getUserHistory,
+            },
+        },
+    },
+)
+
+
+collections_latest_alliances_get = EndpointDefinition(
+    summary="Get a list of Alliances from the latest Collection.",
+    description=f"Get all Alliance data of the latest Collection. {_latest_collection_description}",
+    operation_id=OperationId.GET_ALLIANCES_FROM_LATEST_COLLECTION,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the latest Collection with a list of Alliances. Does not include Users.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="There are no Collections.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the latest Collection with a list of Alliances. Does not include Users.",
+            "links": {
+                OperationId.GET_ALLIANCE_FROM_LATEST_COLLECTION: links.latest_alliances_getAllianceFromLatestCollection,
+                OperationId.GET_ALLIANCE_HISTORY: links.collection_alliances_getAllianceHistory,
+            },
+        },
+    },
+)
+
+
+collections_latest_alliances_allianceId_get = EndpointDefinition(
+    summary="Get a specific Alliance from the latest Collection.",
+    description=f"Get the data for a specific Alliance from the latest data Collection. Includes its members. {_latest_collection_description}",
+    operation_id=OperationId.GET_ALLIANCE_FROM_LATEST_COLLECTION,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the requested Alliance and related Users with the specified Alliance and User properties.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="There are no Collections or the requested Alliance could not be found in the latest Collection.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the requested Alliance and related Users with the specified Alliance and User properties.",
+            "links": {
+                OperationId.GET_ALLIANCE_HISTORY: links.collection_alliance_getAllianceHistory,
+                OperationId.GET_USER_FROM_LATEST_COLLECTION: links.latest_alliance_getUserFromLatestCollection,
+                OperationId.GET_USER_HISTORY: links.collection_alliance_getUserHistory,
+            },
+        },
+    },
+)
+
+
+collections_latest_top100Users_get = EndpointDefinition(
+    summary="Get top 100 Users from the latest Collection.",
+    description=f"Get top 100 Users or a subset of top 100 Users from the latest Collection. You can use the parameters to limit the result set. {_latest_collection_description}",
+    operation_id=OperationId.GET_TOP_100_USERS_FROM_LATEST_COLLECTION,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the latest Collection with a list of top 100 Users. Doesn't includes the Alliances.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="There are no Collections.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the latest Collection with a list of top 100 Users. Doesn't includes the Alliances.",
+            "links": {
+                OperationId.GET_USER_FROM_LATEST_COLLECTION: links.latest_users_getUserFromLatestCollection,
+                OperationId.GET_USER_HISTORY: links.collection_getUserHistory,
+            },
+        },
+    },
+)
+
+
+collections_latest_users_get = EndpointDefinition(
+    summary="Get a list of Users from the latest Collection.",
+    description=f"Get all User data of the latest Collection. {_latest_collection_description}",
+    operation_id=OperationId.GET_USERS_FROM_LATEST_COLLECTION,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the latest Collection with a list of Users. Does not include Alliances.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="There are no Collections.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the latest Collection with a list of Users. Does not include Alliances.",
+            "links": {
+                OperationId.GET_USER_FROM_LATEST_COLLECTION: links.latest_users_getUserFromLatestCollection,
+                OperationId.GET_USER_HISTORY: links.collection_getUserHistory,
+            },
+        },
+    },
+)
+
+
+collections_latest_users_userId_get = EndpointDefinition(
+    summary="Get a specific User from the latest Collection.",
+    description=f"Get the data for a specific User from the latest data Collection. {_latest_collection_description}",
+    operation_id=OperationId.GET_USER_FROM_LATEST_COLLECTION,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the requested User, its Alliance and the latest Collection's metadata.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="There are no Collections or the requested User could not be found in the latest Collection.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the requested User, its Alliance and the latest Collection's metadata.",
+            "links": {
+                OperationId.GET_ALLIANCE_FROM_LATEST_COLLECTION: links.latest_user_getAllianceFromLatestCollection,
+                OperationId.GET_ALLIANCE_HISTORY: links.collection_user_getAllianceHistory,
+                OperationId.GET_USER_HISTORY: links.collection_user_getUserHistory,
+            },
+        },
+    },
+)
+
+
+collections_movers_get = EndpointDefinition(
+    summary="Get the Users with the biggest change of a property between two Collections.",
+    description="Get the Users present in two Collections ranked by the change of a numeric property like trophies or PvP wins between these Collections. The Collections can be specified by their IDs or by timestamps, in which case the latest Collection collected at or before the timestamp is used. If the later Collection isn't specified, the latest Collection is used. You can filter the Users by their Alliance or by the tournament division of their Alliance in the later Collection.",
+    operation_id=OperationId.GET_TOP_MOVERS,
+    status_code=status.HTTP_200_OK,
+    response_description="The metadata of both Collections and the ranked Users.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="One of the requested Collections could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "The metadata of both Collections and the ranked Users.",
+        },
+    },
+)
+
+
 collections_post = EndpointDefinition(
     summary="Create a new Collection from data schema version 9.",
     description="Insert Collection data into the database that was created with data schema version 9. See https://github.com/Zukunftsmusik/pss-fleet-data/blob/master/readme.md for a description of the expected schema.",
@@ -102,6 +303,24 @@ collections_collectionId_delete = EndpointDefinition(
 )
 
 
+collections_collectionId_diff_otherCollectionId_get = EndpointDefinition(
+    summary="Get the changes of Alliances and Users between two Collections.",
+    description="Get the Alliances and Users, which appeared or disappeared between the first and the second Collection, which have been renamed and the Users, who changed their Alliance or their rank in the Alliance. The changes are reported from the first to the second Collection, regardless of their timestamps. The response is streamed.",
+    operation_id=OperationId.GET_COLLECTION_DIFF,
+    status_code=status.HTTP_200_OK,
+    response_description="The metadata of both Collections and the changes of Alliances and Users.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="One of the requested Collections could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "The metadata of both Collections and the changes of Alliances and Users.",
+        },
+    },
+)
+
+
 collections_collectionId_get = EndpointDefinition(
     summary="Get all data of a specific Collection.",
     description="Get all data from a specific data Collection.",
@@ -189,6 +408,168 @@ collections_collectionId_alliances_allianceId_get = EndpointDefinition(
 )
 
 
+collections_collectionId_histogram_get = EndpointDefinition(
+    summary="Get the distribution of a property of the Users of a specific Collection.",
+    description="Get the distribution of a numeric property like trophies or stars of the Users of a specific Collection. The range from the lowest to the highest value is divided into buckets of equal width. Returns the number of Users per bucket and the values at common percentiles. Both are computed in the database, so the Users don't need to be downloaded to chart the distribution.",
+    operation_id=OperationId.GET_HISTOGRAM,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the metadata of the Collection with the distribution of the property.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the metadata of the Collection with the distribution of the property.",
+        },
+    },
+)
+
+
+collections_collectionId_histogram_alliances_get = EndpointDefinition(
+    summary="Get the distribution of a property of the Alliances of a specific Collection.",
+    description="Get the distribution of a numeric property like stars or trophies of the Alliances of a specific Collection. The range from the lowest to the highest value is divided into buckets of equal width. Returns the number of Alliances per bucket and the values at common percentiles. Both are computed in the database, so the Alliances don't need to be downloaded to chart the distribution.",
+    operation_id=OperationId.GET_ALLIANCE_HISTOGRAM,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the metadata of the Collection with the distribution of the property.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the metadata of the Collection with the distribution of the property.",
+        },
+    },
+)
+
+
+collections_collectionId_leaderboards_alliances_get = EndpointDefinition(
+    summary="Get the Alliances of a specific Collection ranked by a property.",
+    description="Get the Alliances of a specific Collection ranked by a numeric property like stars or trophies. Alliances with equal values share a rank. You can filter the Alliances by their tournament division and use the parameters `skip` and `take` to page through the leaderboard.",
+    operation_id=OperationId.GET_ALLIANCE_LEADERBOARD,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the metadata of the Collection with the ranked Alliances.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the metadata of the Collection with the ranked Alliances.",
+        },
+    },
+)
+
+
+collections_collectionId_leaderboards_users_get = EndpointDefinition(
+    summary="Get the Users of a specific Collection ranked by a property.",
+    description="Get the Users of a specific Collection ranked by a numeric property like trophies, PvP wins or donated crew. Users with equal values share a rank. You can filter the Users by their Alliance and use the parameters `skip` and `take` to page through the leaderboard.",
+    operation_id=OperationId.GET_USER_LEADERBOARD,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the metadata of the Collection with the ranked Users.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the metadata of the Collection with the ranked Users.",
+        },
+    },
+)
+
+
+collections_collectionId_leaderboards_users_userId_get = EndpointDefinition(
+    summary="Get the rank of a User in a specific Collection.",
+    description="Get the rank of a User among the Users of a specific Collection ranked by a numeric property like trophies, PvP wins or donated crew. If an Alliance is specified, the User is ranked among its members.",
+    operation_id=OperationId.GET_USER_RANK,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the metadata of the Collection with the ranked User.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found or the requested User is not ranked in it.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the metadata of the Collection with the ranked User.",
+        },
+    },
+)
+
+
+collections_collectionId_stats_get = EndpointDefinition(
+    summary="Get the aggregated numbers of a specific Collection.",
+    description="Get numbers aggregated over the Users and Alliances of a specific Collection, like the total and average trophies, the number of active Users, the number of Users per tournament division and the number of Users per fleet rank. The numbers are computed when the Collection is saved or updated.",
+    operation_id=OperationId.GET_COLLECTION_STATS,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the metadata of the Collection with its aggregated numbers.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the metadata of the Collection with its aggregated numbers.",
+        },
+    },
+)
+
+
+collections_collectionId_standings_get = EndpointDefinition(
+    summary="Get the standings of a tournament division in a specific Collection.",
+    description="Get the Alliances in a tournament division of a Collection collected during a tournament, ranked by their stars. The properties of the members of each Alliance are aggregated: the number of members in the Collection and the sums of their stars and trophies.",
+    operation_id=OperationId.GET_DIVISION_STANDINGS,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the metadata of the Collection with the ranked Alliances of the division.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found or has not been collected during a tournament.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the metadata of the Collection with the ranked Alliances of the division.",
+        },
+    },
+)
+
+
+collections_collectionId_tournament_alliances_get = EndpointDefinition(
+    summary="Get the daily progression of the Alliances during a tournament.",
+    description="Get the stars and trophies of the Alliances at the start of the tournament, during which a specific Collection has been collected, and at the end of each of its days, together with their changes since the previous day. You can filter the Alliances by their ID or by their tournament division.",
+    operation_id=OperationId.GET_TOURNAMENT_ALLIANCES,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the tournament with the daily progression of its Alliances.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found or has not been collected during a tournament.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the tournament with the daily progression of its Alliances.",
+        },
+    },
+)
+
+
+collections_collectionId_tournament_users_get = EndpointDefinition(
+    summary="Get the changes of the tournament scores of the Users during a tournament.",
+    description="Get the tournament bonus score and the championship score of the Users in the last Collection of the tournament, during which a specific Collection has been collected, together with their changes since the first Collection of the tournament. The Users are ordered by the biggest changes. You can filter the Users by their Alliance or by the tournament division of their Alliance and use the parameters `skip` and `take` to page through the results.",
+    operation_id=OperationId.GET_TOURNAMENT_USERS,
+    status_code=status.HTTP_200_OK,
+    response_description="Returns the tournament with the changes of the tournament scores of its Users.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested Collection could not be found or has not been collected during a tournament.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "Returns the tournament with the changes of the tournament scores of its Users.",
+        },
+    },
+)
+
+
 collections_collectionId_top100Users_get = EndpointDefinition(
     summary="Get top 100 Users from a specific Collection.",
     description="Get top 100 Users or a subset of top 100 Users from a specific Collection. You can use the parameters to limit the result set.",
@@ -340,6 +721,29 @@ homepage_get = EndpointDefinition(
 )
 
 
+metrics_get = EndpointDefinition(
+    summary="Get the metrics of the API.",
+    description="Get request, database and ingest metrics of the API in the Prometheus text format. If the API runs with multiple worker processes, the metrics of all workers are aggregated.",
+    operation_id=OperationId.GET_METRICS,
+    status_code=status.HTTP_200_OK,
+    response_description="The metrics in the Prometheus text format.",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "The metrics in the Prometheus text format.",
+            "links": {},
+            "content": {
+                "text/plain": {
+                    "schema": {
+                        "type": "string",
+                        "example": "pss_fleet_data_api_http_requests_in_flight 1.0",
+                    }
+                }
+            },
+        },
+    },
+)
+
+
 ping_get = EndpointDefinition(
     summary="Ping the API.",
     description="Ping the API.",
@@ -363,6 +767,184 @@ ping_get = EndpointDefinition(
 )
 
 
+events_get = EndpointDefinition(
+    summary="Get the events of Alliances and Users.",
+    description="Get the changes of Alliances and Users recorded when saving Collections: Alliances being created, disbanded, renamed or moved to a different tournament division and Users being renamed, joining or leaving an Alliance or changing their rank. Alliances are only tracked while they're in the top 100 fleets, so an Alliance being created or disbanded may also mean that it entered or left the top 100. You can use the parameters to filter the events by entity, type and time range.",
+    operation_id=OperationId.GET_EVENTS,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of events ordered by timestamp.",
+    responses={
+        **responses.get_default_responses_for_get(),
+        status.HTTP_200_OK: {
+            "description": "A list of events ordered by timestamp.",
+        },
+    },
+)
+
+
+search_get = EndpointDefinition(
+    summary="Search the names of Alliances and Users.",
+    description="Find Alliances and Users by any name they've had in a Collection. Use the parameter `mode` to match names starting with (`prefix`), containing (`substring`) or being similar to (`similar`) the search term. Matching ignores case. The results are ranked by their similarity to the search term, so exact matches come first. Every name is returned with the time frame it has been seen in, so an entity may be returned multiple times, if it has been renamed.",
+    operation_id=OperationId.SEARCH_NAMES,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of matching names ordered by similarity to the search term.",
+    responses={
+        **responses.get_default_responses_for_get(),
+        status.HTTP_200_OK: {
+            "description": "A list of matching names ordered by similarity to the search term.",
+        },
+    },
+)
+
+
+stats_get = EndpointDefinition(
+    summary="Get the aggregated numbers of all Collections or a subset of Collections.",
+    description="Get the numbers aggregated over the Users and Alliances of a subset of all Collections as a time series. You can use the parameters to limit the result set.",
+    operation_id=OperationId.GET_STATS,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of the aggregated numbers of the Collections ordered by the collection date and time.",
+    responses={
+        **responses.get_default_responses_for_get(),
+        status.HTTP_200_OK: {
+            "description": "A list of the aggregated numbers of the Collections ordered by the collection date and time.",
+            "headers": _next_page_headers,
+        },
+    },
+)
+
+
+tournaments_get = EndpointDefinition(
+    summary="Get the monthly fleet tournaments.",
+    description="Get the tournaments detected from the Collections collected while a tournament was running. Consecutive Collections collected during a tournament belong to the same tournament, unless more than 7 days lie between them. You can use the parameters to limit the result set.",
+    operation_id=OperationId.GET_TOURNAMENTS,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of the tournaments with their first and last Collection ordered by their start.",
+    responses={
+        **responses.get_default_responses_for_get(),
+        status.HTTP_200_OK: {
+            "description": "A list of the tournaments with their first and last Collection ordered by their start.",
+        },
+    },
+)
+
+
+exports_get = EndpointDefinition(
+    summary="Get the available export files.",
+    description="Get the Parquet files the Collections have been exported to for offline analytics. Every month of Collections is exported to one file per table: `alliances`, `collections` (the metadata) and `users`.",
+    operation_id=OperationId.GET_EXPORTS,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of the export files ordered by month and table.",
+    responses={
+        **responses.get_default_responses_for_get(),
+        status.HTTP_200_OK: {
+            "description": "A list of the export files ordered by month and table.",
+            "links": {
+                OperationId.GET_EXPORT: links.exports_getExport,
+            },
+        },
+    },
+)
+
+
+exports_month_table_get = EndpointDefinition(
+    summary="Download an export file.",
+    description="Download the Parquet file containing a table of all Collections of a month. The files of all months can be read as a dataset partitioned by month, if they're stored in the directory layout `month={month}/{table}.parquet`.",
+    operation_id=OperationId.GET_EXPORT,
+    status_code=status.HTTP_200_OK,
+    response_description="The Parquet file.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="There is no export file for the requested month and table.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "The Parquet file.",
+            "links": {},
+            "content": {
+                "application/vnd.apache.parquet": {
+                    "schema": {
+                        "type": "string",
+                        "format": "binary",
+                    }
+                }
+            },
+        },
+    },
+)
+
+
+exports_post = EndpointDefinition(
+    summary="Export the Collections.",
+    description="Export the Collections, which haven't been exported yet, to Parquet files. Only the files of the months with new Collections are rewritten.",
+    operation_id=OperationId.CREATE_EXPORT,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of the written export files ordered by month and table. Empty, if there were no new Collections.",
+    responses={
+        **responses.get_default_responses_for_get(),
+        **responses.get_default_responses(
+            status.HTTP_409_CONFLICT,
+        ),
+        status.HTTP_200_OK: {
+            "description": "A list of the written export files ordered by month and table. Empty, if there were no new Collections.",
+            "links": {
+                OperationId.GET_EXPORT: links.exports_getExport,
+            },
+        },
+    },
+)
+
+
+userHistory_batch_post = EndpointDefinition(
+    summary="Get the histories of multiple Users.",
+    description="Get the history of up to 100 Users at once, optionally from a single Collection only. The parameters `skip` and `take` apply to the history of each User. If the parameter `collectionId` is specified, the parameters `fromDate`, `toDate` and `interval` are ignored. Missing Collections are skipped.",
+    operation_id=OperationId.GET_USER_HISTORIES,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of the requested Users with their history in the order requested.",
+    responses={
+        **responses.get_default_responses_for_get(),
+        status.HTTP_200_OK: {
+            "description": "A list of the requested Users with their history in the order requested. The history is empty, if there's no data for a User.",
+        },
+    },
+)
+
+
+userHistory_userId_deltas_get = EndpointDefinition(
+    summary="Get the changes of an User's numeric properties over time.",
+    description="Get the values of numeric properties of a specific User like trophies or PvP wins and how they changed since the previous entry in the User's history, in total and per day. You can use the parameters to limit the result set. Missing Collections are skipped.",
+    operation_id=OperationId.GET_USER_HISTORY_DELTAS,
+    status_code=status.HTTP_200_OK,
+    response_description="The requested properties of the User and their changes at specific points in time.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested User could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "The requested properties of the User and their changes at specific points in time.",
+        },
+    },
+)
+
+
+userHistory_userId_names_get = EndpointDefinition(
+    summary="Get the names an User has had.",
+    description="Get the names of a specific User and the time frame each name has been seen in. A name the User has returned to is only returned once, spanning from its first to its last use.",
+    operation_id=OperationId.GET_USER_NAMES,
+    status_code=status.HTTP_200_OK,
+    response_description="A list of the names of the requested User ordered by the time they have been seen first.",
+    responses={
+        **responses.get_default_responses_for_get(
+            include_404=True,
+            description_404="The requested User could not be found.",
+        ),
+        status.HTTP_200_OK: {
+            "description": "A list of the names of the requested User ordered by the time they have been seen first.",
+        },
+    },
+)
+
+
 userHistory_userId_get = EndpointDefinition(
     summary="Get an User's history.",
     description="Get the complete history or a subset of the history of a specific User. You can use the parameters to limit the result set.",
@@ -377,6 +959,7 @@ userHistory_userId_get = EndpointDefinition(
         ),
         status.HTTP_200_OK: {
             "description": "A list of objects denoting the requested User at a specific point in time.",
+            "headers": _next_page_headers,
             "links": {
                 OperationId.GET_ALLIANCE_HISTORY: links.userHistory_getAllianceHistory,
                 OperationId.GET_ALLIANCE_FROM_COLLECTION: links.userHistory_getAllianceFromCollection,
@@ -390,15 +973,44 @@ userHistory_userId_get = EndpointDefinition(
 
 __all__ = [
     "allianceHistory_allianceId_get",
+    "allianceHistory_allianceId_names_get",
+    "allianceHistory_batch_post",
     "collections_collectionId_alliances_allianceId_get",
     "collections_collectionId_alliances_get",
     "collections_collectionId_delete",
+    "collections_collectionId_diff_otherCollectionId_get",
     "collections_collectionId_get",
+    "collections_collectionId_histogram_alliances_get",
+    "collections_collectionId_histogram_get",
+    "collections_collectionId_leaderboards_alliances_get",
+    "collections_collectionId_leaderboards_users_get",
+    "collections_collectionId_leaderboards_users_userId_get",
+    "collections_collectionId_standings_get",
+    "collections_collectionId_stats_get",
     "collections_collectionId_top100Users_get",
+    "collections_collectionId_tournament_alliances_get",
+    "collections_collectionId_tournament_users_get",
     "collections_collectionId_users_get",
     "collections_collectionId_users_userId_get",
     "collections_get",
+    "collections_latest_alliances_allianceId_get",
+    "collections_latest_alliances_get",
+    "collections_latest_get",
+    "collections_latest_top100Users_get",
+    "collections_latest_users_get",
+    "collections_latest_users_userId_get",
+    "collections_movers_get",
     "collections_post",
     "collections_upload_post",
+    "events_get",
+    "exports_get",
+    "exports_month_table_get",
+    "exports_post",
+    "search_get",
+    "stats_get",
+    "tournaments_get",
+    "userHistory_batch_post",
+    "userHistory_userId_deltas_get",
     "userHistory_userId_get",
+    "userHistory_userId_names_get",
 ]
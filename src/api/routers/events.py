@@ -0,0 +1,42 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .. import server_timing
+from ..database import crud, db
+from ..models import EntityEventOut
+from ..models.converters import FromDB
+from . import dependencies, endpoints
+
+
+router: APIRouter = APIRouter(tags=["events"], prefix="/events")
+
+
+@router.get("", **endpoints.events_get)
+async def get_events(
+    event_filter: Annotated[dependencies.EntityEventFilter, Depends(dependencies.entity_event_filter_parameters)],
+    datetime_filter: Annotated[dependencies.DatetimeFilter, Depends(dependencies.from_to_date_parameters)],
+    desc: Annotated[bool, Depends(dependencies.timestamp_desc)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> list[EntityEventOut]:
+    events = await crud.get_events(
+        session,
+        event_filter.entity_type,
+        event_filter.entity_id,
+        event_filter.event_types,
+        datetime_filter.from_date,
+        datetime_filter.to_date,
+        desc,
+        skip_take.skip,
+        skip_take.take,
+    )
+    with server_timing.phase("from_db"):
+        result = [FromDB.to_entity_event(event) for event in events]
+    return result
+
+
+__all__ = [
+    "router",
+]
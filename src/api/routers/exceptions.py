@@ -8,9 +8,13 @@ from ..models.exceptions import (
     CollectionNotDeletedError,
     CollectionNotFoundError,
     ConflictError,
+    ExportNotFoundError,
+    ExportRunningError,
+    InvalidCollectionIdError,
     InvalidJsonUpload,
     NonUniqueTimestampError,
     SchemaVersionMismatch,
+    TournamentNotFoundError,
     UnsupportedSchemaError,
     UserNotFoundError,
 )
@@ -62,6 +66,61 @@ def collection_not_found(collection_id: int) -> CollectionNotFoundError:
     )
 
 
+def collection_not_found_at(timestamp: datetime) -> CollectionNotFoundError:
+    """Creates an `CollectionNotFoundError` based on the given parameters.
+
+    Args:
+        timestamp (datetime): The timestamp at or before which no Collection was found.
+
+    Returns:
+        CollectionNotFoundError: An exception to be raised.
+    """
+    return CollectionNotFoundError(
+        details=f"There is no Collection collected at or before {timestamp.strftime('%Y-%m-%d %H:%M:%S')}.",
+        suggestion="Check the provided `fromDate` and `toDate` parameters in the query.",
+    )
+
+
+def export_not_found(month: str, table: str) -> ExportNotFoundError:
+    """Creates an `ExportNotFoundError` based on the given parameters.
+
+    Args:
+        month (str): The month of the requested export file.
+        table (str): The table of the requested export file.
+
+    Returns:
+        ExportNotFoundError: An exception to be raised.
+    """
+    return ExportNotFoundError(
+        details=f"There is no export of the table '{table}' for the month '{month}'.",
+        suggestion="Check the provided `month` and `table` parameters in the path. The available export files are listed at the endpoint `/exports`.",
+    )
+
+
+def export_running() -> ExportRunningError:
+    """Creates an `ExportRunningError`.
+
+    Returns:
+        ExportRunningError: An exception to be raised.
+    """
+    return ExportRunningError(
+        details="The Collections are being exported at the moment.",
+        suggestion="Try again after the running export has finished.",
+    )
+
+
+def from_collection_not_specified() -> InvalidCollectionIdError:
+    """Creates an `InvalidCollectionIdError` for a request that doesn't specify the Collection to compare against.
+
+    Returns:
+        InvalidCollectionIdError: An exception to be raised.
+    """
+    return InvalidCollectionIdError(
+        details="The Collection to compare against has not been specified.",
+        suggestion="Provide either the query parameter `fromCollectionId` or the query parameter `fromDate`.",
+    )
+
+
 def invalid_json_upload(error: JSONDecodeError) -> InvalidJsonUpload:
     """Creates an `InvalidJsonUpload` based on the given parameters.
 
@@ -77,6 +136,18 @@ def invalid_json_upload(error: JSONDecodeError) -> InvalidJsonUpload:
     )
 
 
+def no_collections() -> CollectionNotFoundError:
+    """Creates a `CollectionNotFoundError` for when there are no Collections at all.
+
+    Returns:
+        CollectionNotFoundError: An exception to be raised.
+    """
+    return CollectionNotFoundError(
+        details="There are no Collections, yet.",
+        suggestion="Try again after a Collection has been created.",
+    )
+
+
 def non_unique_timestamp(timestamp: datetime, collection_id: int) -> NonUniqueTimestampError:
     """Creates a `NonUniqueTimestampError` based on the given parameters.
 
@@ -135,6 +206,21 @@ def collected_at_not_match(collected_at: datetime, expected: datetime, collectio
     )
 
 
+def tournament_not_found(collection_id: int) -> TournamentNotFoundError:
+    """Creates a `TournamentNotFoundError` based on the given parameters.
+
+    Args:
+        collection_id (int): The ID of the Collection that hasn't been collected during a tournament.
+
+    Returns:
+        TournamentNotFoundError: An exception to be raised.
+    """
+    return TournamentNotFoundError(
+        details=f"The Collection with the ID '{collection_id}' has not been collected during a tournament.",
+        suggestion="Check the provided `collectionId` parameter in the path.",
+    )
+
+
 def user_not_found_in_collection(collection_id: int, user_id: int) -> UserNotFoundError:
     """Creates an `UserNotFoundError` based on the given parameters.
 
@@ -155,9 +241,13 @@ __all__ = [
     "alliance_not_found_in_collection",
     "collection_not_deleted",
     "collection_not_found",
+    "export_not_found",
+    "export_running",
     "invalid_json_upload",
+    "no_collections",
     "non_unique_timestamp",
     "schema_version_mismatch",
+    "tournament_not_found",
     "unsupported_schema",
     "user_not_found_in_collection",
 ]
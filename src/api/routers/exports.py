@@ -0,0 +1,54 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .. import export
+from ..config import SETTINGS
+from ..database import db
+from ..models import ExportFileOut
+from ..models.enums import ExportTable
+from . import dependencies, endpoints, exceptions
+
+
+router: APIRouter = APIRouter(tags=["exports"], prefix="/exports")
+
+
+@router.get("", **endpoints.exports_get)
+async def get_exports() -> list[ExportFileOut]:
+    export_files = export.get_export_files(SETTINGS.export_directory)
+    result = [_to_export_file_out(export_file) for export_file in export_files]
+    return result
+
+
+@router.post("", **endpoints.exports_post, dependencies=dependencies.authorization_dependencies)
+async def create_export(session: AsyncSession = Depends(db.get_session)) -> list[ExportFileOut]:
+    if export.EXPORT_LOCK.locked():
+        raise exceptions.export_running()
+
+    async with export.EXPORT_LOCK:
+        export_files = await export.export_collections(session, SETTINGS.export_directory)
+    result = [_to_export_file_out(export_file) for export_file in export_files]
+    return result
+
+
+@router.get("/{month}/{table}", **endpoints.exports_month_table_get)
+async def get_export(
+    month: Annotated[str, Depends(dependencies.export_month)],
+    table: Annotated[ExportTable, Depends(dependencies.export_table)],
+) -> FileResponse:
+    export_file = export.get_export_file(SETTINGS.export_directory, month, table)
+    if not export_file:
+        raise exceptions.export_not_found(month, table)
+
+    return FileResponse(export_file.path, media_type=export.MEDIA_TYPE_PARQUET, filename=f"{month}_{table}.parquet")
+
+
+def _to_export_file_out(export_file: export.ExportFile) -> ExportFileOut:
+    return ExportFileOut(month=export_file.month, table=export_file.table, row_count=export_file.row_count, size=export_file.size)
+
+
+__all__ = [
+    "router",
+]
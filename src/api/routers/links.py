@@ -403,6 +403,58 @@ history_putUpdateCollection = LinkDefinition(
 )
 
 
+# /exports
+
+
+exports_getExport = LinkDefinition(
+    description="The `month` and `table` values in the response can be used as the `month` and `table` parameters in `GET /exports/{month}/{table}`.",
+    operationId=OperationId.GET_EXPORT,
+    parameters={
+        "month": "$response.body#/0/month",
+        "table": "$response.body#/0/table",
+    },
+)
+
+
+# /collections/latest
+
+
+latest_alliance_getUserFromLatestCollection = LinkDefinition(
+    description="A `user_id` value in the response can be used as the `userId` parameter in `GET /collections/latest/users/{userId}`.",
+    operationId=OperationId.GET_USER_FROM_LATEST_COLLECTION,
+    parameters={
+        "userId": "$response.body#/users/0/0",
+    },
+)
+
+
+latest_alliances_getAllianceFromLatestCollection = LinkDefinition(
+    description="An `alliance_id` value in the response can be used as the `allianceId` parameter in `GET /collections/latest/alliances/{allianceId}`.",
+    operationId=OperationId.GET_ALLIANCE_FROM_LATEST_COLLECTION,
+    parameters={
+        "allianceId": "$response.body#/fleets/0/0",
+    },
+)
+
+
+latest_user_getAllianceFromLatestCollection = LinkDefinition(
+    description="The `alliance_id` value in the response can be used as the `allianceId` parameter in `GET /collections/latest/alliances/{allianceId}`.",
+    operationId=OperationId.GET_ALLIANCE_FROM_LATEST_COLLECTION,
+    parameters={
+        "allianceId": "$response.body#/fleet/0",
+    },
+)
+
+
+latest_users_getUserFromLatestCollection = LinkDefinition(
+    description="A `user_id` value in the response can be used as the `userId` parameter in `GET /collections/latest/users/{userId}`.",
+    operationId=OperationId.GET_USER_FROM_LATEST_COLLECTION,
+    parameters={
+        "userId": "$response.body#/users/0/0",
+    },
+)
+
+
 # /
 
 
@@ -491,6 +543,7 @@ __all__ = [
     "collections_getUsersFromCollectionAfterInsert",
     "collections_putUpdateCollection",
     "default_entity_history_links",
+    "exports_getExport",
     "history_deleteCollection",
     "history_getAlliancesFromCollection",
     "history_getCollection",
@@ -498,6 +551,10 @@ __all__ = [
     "history_getUsersFromCollection",
     "history_putUpdateCollection",
     "homepage_getCollections",
+    "latest_alliance_getUserFromLatestCollection",
+    "latest_alliances_getAllianceFromLatestCollection",
+    "latest_user_getAllianceFromLatestCollection",
+    "latest_users_getUserFromLatestCollection",
     "userHistory_getAllianceFromCollection",
     "userHistory_getAllianceHistory",
     "userHistory_getUserFromCollection",
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Sequence
+
+from fastapi import Request, Response
+
+from .. import utils
+
+
+NEXT_CURSOR_HEADER: str = "X-Next-Cursor"
+
+
+def add_next_page_headers(request: Request, response: Response, collected_ats: Sequence[datetime], take: int, desc: bool):
+    """Adds the headers `X-Next-Cursor` and `Link` pointing to the next page to the `response`, if the current page is full.
+
+    Args:
+        request (Request): The request for the current page.
+        response (Response): The response to add the headers to.
+        collected_ats (Sequence[datetime]): The timestamps of the entries of the current page in the returned order. If missing Collections are filled in, the timestamps of the slots of the page as returned by `crud.get_page_timestamps`.
+        take (int): The requested page size.
+        desc (bool): Whether the entries are sorted in descending order.
+    """
+    if not collected_ats or len(collected_ats) < take:
+        return
+
+    cursor = utils.encode_cursor(collected_ats[-1], bool(desc))
+    next_url = request.url.remove_query_params("skip").include_query_params(cursor=cursor)
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+
+__all__ = [
+    "NEXT_CURSOR_HEADER",
+    "add_next_page_headers",
+]
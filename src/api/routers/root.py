@@ -1,6 +1,7 @@
 from fastapi import APIRouter
-from starlette.responses import HTMLResponse
+from starlette.responses import HTMLResponse, Response
 
+from .. import metrics
 from . import endpoints
 
 
@@ -13,6 +14,11 @@ async def get_home() -> HTMLResponse:
         return HTMLResponse(content=fp.read())
 
 
+@router.get("/metrics", **endpoints.metrics_get)
+async def get_metrics() -> Response:
+    return Response(content=metrics.generate_metrics(), media_type=metrics.CONTENT_TYPE_LATEST)
+
+
 @router.get("/ping", **endpoints.ping_get)
 async def get_ping() -> dict[str, str]:
     return {"ping": "Pong!"}
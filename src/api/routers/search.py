@@ -0,0 +1,30 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .. import server_timing
+from ..database import crud, db
+from ..models import EntityNameOut
+from ..models.converters import FromDB
+from . import dependencies, endpoints
+
+
+router: APIRouter = APIRouter(tags=["search"], prefix="/search")
+
+
+@router.get("", **endpoints.search_get)
+async def search_names(
+    name_search: Annotated[dependencies.NameSearchFilter, Depends(dependencies.name_search_parameters)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> list[EntityNameOut]:
+    matches = await crud.search_entity_names(session, name_search.name, name_search.entity_type, name_search.mode, skip_take.skip, skip_take.take)
+    with server_timing.phase("from_db"):
+        result = [FromDB.to_entity_name(match) for match in matches]
+    return result
+
+
+__all__ = [
+    "router",
+]
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .. import server_timing
+from ..database import crud, db
+from ..models import CollectionStatsOut
+from ..models.converters import FromDB
+from . import dependencies, endpoints, pagination
+
+
+router: APIRouter = APIRouter(tags=["stats"], prefix="/stats")
+
+
+@router.get("", **endpoints.stats_get)
+async def get_stats(
+    datetime_filter: Annotated[dependencies.DatetimeFilter, Depends(dependencies.from_to_date_parameters)],
+    list_filter: Annotated[dependencies.ListFilter, Depends(dependencies.list_filter_parameters)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    start_after: Annotated[datetime | None, Depends(dependencies.cursor_parameter)],
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(db.get_session),
+) -> list[CollectionStatsOut]:
+    stats = await crud.get_collection_stats_history(
+        session,
+        datetime_filter.from_date,
+        datetime_filter.to_date,
+        list_filter.interval,
+        list_filter.desc,
+        skip_take.skip,
+        skip_take.take,
+        start_after=start_after,
+    )
+    pagination.add_next_page_headers(request, response, [collection.collected_at for collection, _ in stats], skip_take.take, list_filter.desc)
+    with server_timing.phase("from_db"):
+        result = [FromDB.to_collection_stats(collection_stats) for collection_stats in stats]
+    return result
+
+
+__all__ = [
+    "router",
+]
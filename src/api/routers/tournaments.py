@@ -0,0 +1,31 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .. import server_timing
+from ..database import crud, db
+from ..models import TournamentOut
+from ..models.converters import FromDB
+from . import dependencies, endpoints
+
+
+router: APIRouter = APIRouter(tags=["tournaments"], prefix="/tournaments")
+
+
+@router.get("", **endpoints.tournaments_get)
+async def get_tournaments(
+    datetime_filter: Annotated[dependencies.DatetimeFilter, Depends(dependencies.from_to_date_parameters)],
+    desc: Annotated[bool, Depends(dependencies.timestamp_desc)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> list[TournamentOut]:
+    tournaments = await crud.get_tournaments(session, datetime_filter.from_date, datetime_filter.to_date, desc, skip_take.skip, skip_take.take)
+    with server_timing.phase("from_db"):
+        result = [FromDB.to_tournament(tournament) for tournament in tournaments]
+    return result
+
+
+__all__ = [
+    "router",
+]
@@ -1,18 +1,48 @@
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from .. import server_timing
 from ..database import crud, db
-from ..models import UserHistoryOut, exceptions
+from ..models import EntityNameSpanOut, UserHistoriesOut, UserHistoryDeltasOut, UserHistoryOut, exceptions
 from ..models.converters import FromDB
-from ..models.enums import ParameterOnMissing
-from . import dependencies, endpoints
+from ..models.enums import EntityType, ParameterOnMissing, ParameterUserMetric
+from . import dependencies, endpoints, pagination
 
 
 router: APIRouter = APIRouter(tags=["userHistory"], prefix="/userHistory")
 
 
+@router.post("/batch", **endpoints.userHistory_batch_post)
+async def get_user_histories(
+    user_ids: Annotated[list[int], Depends(dependencies.user_ids)],
+    collection_id: Annotated[int | None, Depends(dependencies.optional_collection_id)],
+    datetime_filter: Annotated[dependencies.DatetimeFilter, Depends(dependencies.from_to_date_parameters)],
+    list_filter: Annotated[dependencies.ListFilter, Depends(dependencies.list_filter_parameters)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> list[UserHistoriesOut]:
+    histories = await crud.get_user_histories(
+        session,
+        user_ids,
+        True,
+        collection_id,
+        datetime_filter.from_date,
+        datetime_filter.to_date,
+        list_filter.interval,
+        list_filter.desc,
+        skip_take.skip,
+        skip_take.take,
+    )
+    with server_timing.phase("from_db"):
+        result = [
+            UserHistoriesOut(user_id=user_id, history=[FromDB.to_user_history(entry) for entry in history]) for user_id, history in histories.items()
+        ]
+    return result
+
+
 @router.get("/{userId}", **endpoints.userHistory_userId_get)
 async def get_user_history(
     user_id: Annotated[int, Depends(dependencies.user_id)],
@@ -20,9 +50,13 @@ async def get_user_history(
     list_filter: Annotated[dependencies.ListFilter, Depends(dependencies.list_filter_parameters)],
     skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
     on_missing: Annotated[ParameterOnMissing, Depends(dependencies.on_missing)],
+    start_after: Annotated[datetime | None, Depends(dependencies.cursor_parameter)],
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(db.get_session),
-) -> list[UserHistoryOut]:
-    has_user_history = await crud.has_user_history(session, user_id)
+) -> list[UserHistoryOut | None]:
+    with server_timing.phase("has_user_history"):
+        has_user_history = await crud.has_user_history(session, user_id)
     if not has_user_history:
         raise exceptions.UserNotFoundError(
             details=f"There is no historic data for a User with the ID '{user_id}' in any of the collections.",
@@ -39,8 +73,78 @@ async def get_user_history(
         list_filter.desc,
         skip_take.skip,
         skip_take.take,
+        on_missing=on_missing,
+        start_after=start_after,
+    )
+    if on_missing == ParameterOnMissing.SKIP:
+        collected_ats = [collection.collected_at for collection, _ in history]
+    else:
+        # The entity may be missing from some of the Collections of the page, so its entries don't tell, where the page ends.
+        collected_ats = await crud.get_page_timestamps(
+            session,
+            datetime_filter.from_date,
+            datetime_filter.to_date,
+            list_filter.interval,
+            list_filter.desc,
+            skip_take.skip,
+            skip_take.take,
+            on_missing,
+            start_after,
+        )
+    pagination.add_next_page_headers(request, response, collected_ats, skip_take.take, list_filter.desc)
+    with server_timing.phase("from_db"):
+        result = [FromDB.to_user_history(entry) if entry else None for entry in history]
+    return result
+
+
+@router.get("/{userId}/deltas", **endpoints.userHistory_userId_deltas_get)
+async def get_user_history_deltas(
+    user_id: Annotated[int, Depends(dependencies.user_id)],
+    metrics: Annotated[list[ParameterUserMetric], Depends(dependencies.user_metrics)],
+    datetime_filter: Annotated[dependencies.DatetimeFilter, Depends(dependencies.from_to_date_parameters)],
+    list_filter: Annotated[dependencies.ListFilter, Depends(dependencies.list_filter_parameters)],
+    skip_take: Annotated[dependencies.SkipTakeFilter, Depends(dependencies.skip_take_parameters)],
+    session: AsyncSession = Depends(db.get_session),
+) -> UserHistoryDeltasOut:
+    with server_timing.phase("has_user_history"):
+        has_user_history = await crud.has_user_history(session, user_id)
+    if not has_user_history:
+        raise exceptions.UserNotFoundError(
+            details=f"There is no historic data for a User with the ID '{user_id}' in any of the collections.",
+            suggestion="Check the provided `userId` in the path.",
+        )
+
+    deltas = await crud.get_user_history_deltas(
+        session,
+        user_id,
+        metrics,
+        datetime_filter.from_date,
+        datetime_filter.to_date,
+        list_filter.interval,
+        list_filter.desc,
+        skip_take.skip,
+        skip_take.take,
     )
-    result = [FromDB.to_user_history(entry) for entry in history]
+    with server_timing.phase("from_db"):
+        result = UserHistoryDeltasOut(user_id=user_id, metrics=metrics, entries=[FromDB.to_user_history_delta(entry) for entry in deltas])
+    return result
+
+
+@router.get("/{userId}/names", **endpoints.userHistory_userId_names_get)
+async def get_user_names(
+    user_id: Annotated[int, Depends(dependencies.user_id)],
+    desc: Annotated[bool, Depends(dependencies.timestamp_desc)],
+    session: AsyncSession = Depends(db.get_session),
+) -> list[EntityNameSpanOut]:
+    entity_names = await crud.get_entity_names(session, EntityType.USER, user_id, desc)
+    if not entity_names:
+        raise exceptions.UserNotFoundError(
+            details=f"There is no historic data for a User with the ID '{user_id}' in any of the collections.",
+            suggestion="Check the provided `userId` in the path.",
+        )
+
+    with server_timing.phase("from_db"):
+        result = [FromDB.to_entity_name_span(entity_name) for entity_name in entity_names]
     return result
 
 
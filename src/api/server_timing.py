@@ -0,0 +1,152 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import SETTINGS
+
+
+REQUEST_HEADER: str = "X-Server-Timing"
+"""Trusted clients can send this header with the value `true` to receive a `Server-Timing` header, even if it's not enabled for all requests."""
+
+
+@dataclass
+class ServerTiming:
+    """
+    Collects the durations of the phases of a single request and the SQL statements executed while processing it.
+    """
+
+    phases: dict[str, float] = field(default_factory=dict)
+    sql_count: int = 0
+    sql_duration: float = 0.0
+    last_phase_ended_at: float | None = None
+
+    def add_phase(self, name: str, duration: float):
+        self.phases[name] = self.phases.get(name, 0.0) + duration
+
+    def to_header_value(self, total: float) -> str:
+        """Renders the collected timings as the value of a `Server-Timing` header. Durations are given in milliseconds.
+
+        Args:
+            total (float): The number of seconds the whole request took.
+
+        Returns:
+            str: The header value.
+        """
+        entries = [f"{name};dur={duration * 1000:.2f}" for name, duration in self.phases.items()]
+        entries.append(f'sql;dur={self.sql_duration * 1000:.2f};desc="{self.sql_count} statements"')
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_CURRENT: ContextVar[ServerTiming | None] = ContextVar("server_timing", default=None)
+
+
+class ServerTimingMiddleware:
+    """
+    Adds a `Server-Timing` header to responses, if enabled via `SETTINGS.server_timing_enabled` or requested by a trusted client via the `X-Server-Timing` header.
+
+    The header contains the phases recorded with `phase()`, the number and total duration of SQL statements and the total duration of the request.
+    The `serialize` phase spans from the end of the last recorded phase to the start of the response, which is dominated by encoding the response body.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not _is_enabled_for(Headers(scope=scope)):
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        timing = ServerTiming()
+        token = _CURRENT.set(timing)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                if timing.last_phase_ended_at is not None:
+                    timing.add_phase("serialize", now - timing.last_phase_ended_at)
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.to_header_value(now - started_at))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _CURRENT.reset(token)
+
+
+def instrument_engine(engine: AsyncEngine):
+    """Registers SQLAlchemy event listeners on the `engine` to count and time the SQL statements executed for requests with server timing enabled.
+
+    Args:
+        engine (AsyncEngine): The engine to be instrumented.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+        if _CURRENT.get() is not None:
+            context._server_timing_started_at = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+        timing = _CURRENT.get()
+        if timing is not None:
+            timing.sql_count += 1
+            timing.sql_duration += time.perf_counter() - context._server_timing_started_at
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Records the duration of the enclosed code as a phase of the current request, if server timing is enabled for it. Durations of phases with the same name add up.
+
+    Args:
+        name (str): The name of the phase as it'll appear in the `Server-Timing` header.
+    """
+    timing = _CURRENT.get()
+    if timing is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        ended_at = time.perf_counter()
+        timing.add_phase(name, ended_at - started_at)
+        timing.last_phase_ended_at = ended_at
+
+
+def _is_enabled_for(headers: Headers) -> bool:
+    """Checks, if server timing is enabled for all requests or has been requested by a trusted client. If a `ROOT_API_KEY` is set, a client is trusted, if it sends that key in the `Authorization` header.
+
+    Args:
+        headers (Headers): The headers of the request.
+
+    Returns:
+        bool: `True`, if a `Server-Timing` header should be added to the response.
+    """
+    if SETTINGS.server_timing_enabled:
+        return True
+
+    if headers.get(REQUEST_HEADER, "").lower() != "true":
+        return False
+
+    return not SETTINGS.root_api_key or headers.get("Authorization") == SETTINGS.root_api_key
+
+
+__all__ = [
+    "REQUEST_HEADER",
+    "ServerTiming",
+    "ServerTimingMiddleware",
+    "instrument_engine",
+    "phase",
+]
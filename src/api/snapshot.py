@@ -0,0 +1,567 @@
+"""A snapshot of the hot read set shared by all worker processes: the metadata of all Collections (the catalog) and the Alliances and Users of the latest Collections.
+
+The snapshot is stored as Arrow IPC files in a versioned directory `{SNAPSHOT_DIRECTORY}/v{version}`. The file `{SNAPSHOT_DIRECTORY}/CURRENT` holds the name of the current version and is replaced atomically after a new version has been written completely.
+Every worker process memory-maps the files of the current version, so the data is read from the page cache shared by all processes without being copied or converted.
+
+Only one process writes a new version at a time, guarded by an exclusive lock on the file `{SNAPSHOT_DIRECTORY}/.lock`. The process that saved, updated or deleted a Collection writes a new version right away, the other processes check `CURRENT` periodically and map the new version.
+The Alliances and Users are stored with their values already converted to the format returned by the API in the order of `AllianceOut` and `UserOut`, one record batch per Collection, ordered by `alliance_id` and `user_id`.
+"""
+
+import asyncio
+import os
+import shutil
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Sequence
+
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import col, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .config import SETTINGS
+from .database import crud, db
+from .database.models import CollectionDB
+from .export import get_arrow_schema
+from .models import (
+    AllianceHistoryOut,
+    AllianceOut,
+    CollectionMetadataOut,
+    CollectionOut,
+    CollectionWithFleetsOut,
+    CollectionWithUsersOut,
+    UserHistoryOut,
+    UserOut,
+)
+from .models.converters import FromDB
+
+
+try:
+    import fcntl
+except ImportError:  # Windows: there's no file locking across processes, so every process may write the snapshot
+    fcntl = None
+
+
+ALLIANCE_SCHEMA: pa.Schema = pa.schema(
+    [
+        pa.field("alliance_id", pa.int32(), nullable=False),
+        pa.field("alliance_name", pa.string()),
+        pa.field("score", pa.int32()),
+        pa.field("division_design_id", pa.int32()),
+        pa.field("trophy", pa.int32()),
+        pa.field("championship_score", pa.int32()),
+        pa.field("number_of_members", pa.int32()),
+        pa.field("number_of_approved_members", pa.int32()),
+    ]
+)
+"""The columns of the Alliances in the order of `AllianceOut`."""
+USER_SCHEMA: pa.Schema = pa.schema(
+    [pa.field("user_id", pa.int32(), nullable=False), pa.field("user_name", pa.string())]
+    + [
+        pa.field(name, pa.int32())
+        for name in (
+            "alliance_id",
+            "trophy",
+            "alliance_score",
+            "alliance_membership",
+            "alliance_join_date",
+            "last_login_date",
+            "last_heartbeat_date",
+            "crew_donated",
+            "crew_received",
+            "pvp_attack_wins",
+            "pvp_attack_losses",
+            "pvp_attack_draws",
+            "pvp_defence_wins",
+            "pvp_defence_losses",
+            "pvp_defence_draws",
+            "championship_score",
+            "highest_trophy",
+            "tournament_bonus_score",
+        )
+    ]
+)
+"""The columns of the Users in the order of `UserOut`."""
+USER_INDEX_SCHEMA: pa.Schema = pa.schema(
+    [
+        pa.field("row_by_trophy", pa.int32(), nullable=False),
+        pa.field("row_by_alliance_id", pa.int32(), nullable=False),
+        pa.field("alliance_id_by_alliance_id", pa.int32(), nullable=False),
+    ]
+)
+"""The columns stored after the columns of the Users: the rows ordered descending by trophies, the rows ordered by `alliance_id` and the sorted `alliance_id`s to look up the members of an Alliance."""
+USER_BATCH_SCHEMA: pa.Schema = pa.schema(list(USER_SCHEMA) + list(USER_INDEX_SCHEMA))
+CATALOG_SCHEMA: pa.Schema = get_arrow_schema(CollectionDB.__table__)
+"""The columns of the metadata of the Collections."""
+
+ALLIANCE_DIVISION_DESIGN_ID_COLUMN: int = 3
+USER_ALLIANCE_ID_COLUMN: int = 2
+USER_TROPHY_COLUMN: int = 3
+
+ALLIANCES_FILE_NAME: str = "alliances.arrow"
+CATALOG_FILE_NAME: str = "collections.arrow"
+USERS_FILE_NAME: str = "users.arrow"
+CURRENT_FILE_NAME: str = "CURRENT"
+LOCK_FILE_NAME: str = ".lock"
+WRITER_LOCK_POLL_INTERVAL: float = 0.1
+"""The number of seconds to wait between two attempts to acquire the lock for writing the snapshot."""
+
+SNAPSHOT: "SharedSnapshot | None" = None
+"""The version of the snapshot mapped by this process. Is `None`, if no version has been written, yet."""
+
+_refresh_lock: asyncio.Lock = asyncio.Lock()
+
+
+@dataclass(frozen=True)
+class ColumnTable:
+    """
+    Rows of values stored in the columns of a record batch, ordered by the ID in the first column. Only the first `column_count` columns are values of the rows.
+    """
+
+    batch: pa.RecordBatch
+    column_count: int
+
+    def __len__(self) -> int:
+        return self.batch.num_rows
+
+    def find_row(self, row_id: int) -> int | None:
+        """Looks up the row with the given ID.
+
+        Args:
+            row_id (int): The ID of the row.
+
+        Returns:
+            int | None: The index of the row, if there's a row with that ID. Else, `None`.
+        """
+        ids = self.batch.column(0).to_numpy()
+        row = int(np.searchsorted(ids, row_id))
+        return row if row < len(ids) and ids[row] == row_id else None
+
+    def get_row(self, row: int) -> tuple:
+        """Returns the values of a row."""
+        return self.get_rows(self.batch.slice(row, 1))[0]
+
+    def get_rows(self, rows: np.ndarray | pa.RecordBatch | None = None) -> list[tuple]:
+        """Returns the values of multiple rows.
+
+        Args:
+            rows (np.ndarray | pa.RecordBatch, optional): The indexes of the rows to return in order or a slice of the batch. Defaults to None (all rows).
+
+        Returns:
+            list[tuple]: The values of the rows.
+        """
+        if rows is None:
+            batch = self.batch
+        elif isinstance(rows, pa.RecordBatch):
+            batch = rows
+        else:
+            batch = self.batch.take(pa.array(rows, type=pa.int32()))
+        return list(zip(*(batch.column(column).to_pylist() for column in range(self.column_count)), strict=True))
+
+
+@dataclass(frozen=True)
+class CollectionSnapshot:
+    """
+    A Collection with its Alliances and Users.
+    """
+
+    meta: CollectionMetadataOut
+    alliances: ColumnTable
+    users: ColumnTable
+
+    @property
+    def collection_id(self) -> int:
+        return self.meta.collection_id
+
+    def get_alliance(self, alliance_id: int) -> AllianceOut | None:
+        row = self.alliances.find_row(alliance_id)
+        return None if row is None else self.alliances.get_row(row)
+
+    def get_alliance_members(self, alliance_id: int) -> list[UserOut]:
+        alliance_ids = self.users.batch.column("alliance_id_by_alliance_id").to_numpy()
+        start, end = _find_range(alliance_ids, alliance_id)
+        rows = self.users.batch.column("row_by_alliance_id").to_numpy()[start:end]
+        return self.users.get_rows(rows)
+
+    def get_user(self, user_id: int) -> UserOut | None:
+        row = self.users.find_row(user_id)
+        return None if row is None else self.users.get_row(row)
+
+    def to_alliance_history(self, alliance_id: int) -> AllianceHistoryOut | None:
+        """Returns an Alliance with its members.
+
+        Args:
+            alliance_id (int): The `alliance_id` of the Alliance.
+
+        Returns:
+            AllianceHistoryOut | None: The Alliance, if it's part of the Collection. Else, `None`.
+        """
+        alliance = self.get_alliance(alliance_id)
+        if alliance is None:
+            return None
+        return AllianceHistoryOut(collection=self.meta, fleet=alliance, users=self.get_alliance_members(alliance_id))
+
+    def to_collection(self) -> CollectionOut:
+        return CollectionOut(meta=self.meta, fleets=self.alliances.get_rows(), users=self.users.get_rows())
+
+    def to_collection_with_fleets(self, division_design_id: int | None = None) -> CollectionWithFleetsOut:
+        """Returns the Alliances ordered by `alliance_id`.
+
+        Args:
+            division_design_id (int, optional): Only return the Alliances in this tournament division. Defaults to None.
+
+        Returns:
+            CollectionWithFleetsOut: The Collection with the requested Alliances.
+        """
+        if division_design_id is None:
+            return CollectionWithFleetsOut(meta=self.meta, fleets=self.alliances.get_rows())
+
+        division_design_ids = pc.fill_null(self.alliances.batch.column(ALLIANCE_DIVISION_DESIGN_ID_COLUMN), -1).to_numpy()
+        rows = np.flatnonzero(division_design_ids == division_design_id)
+        return CollectionWithFleetsOut(meta=self.meta, fleets=self.alliances.get_rows(rows))
+
+    def to_collection_with_top_users(self, skip: int = 0, take: int = 100) -> CollectionWithUsersOut:
+        """Returns the Users ordered descending by trophies.
+
+        Args:
+            skip (int, optional): Skip this number of Users. Defaults to 0.
+            take (int, optional): Limit the number of Users returned. Defaults to 100.
+
+        Returns:
+            CollectionWithUsersOut: The Collection with the requested Users.
+        """
+        rows = self.users.batch.column("row_by_trophy").to_numpy()[skip : skip + take]
+        return CollectionWithUsersOut(meta=self.meta, users=self.users.get_rows(rows))
+
+    def to_collection_with_users(self) -> CollectionWithUsersOut:
+        return CollectionWithUsersOut(meta=self.meta, users=self.users.get_rows())
+
+    def to_user_history(self, user_id: int) -> UserHistoryOut | None:
+        """Returns a User with their Alliance.
+
+        Args:
+            user_id (int): The `user_id` of the User.
+
+        Returns:
+            UserHistoryOut | None: The User, if they're part of the Collection. Else, `None`.
+        """
+        user = self.get_user(user_id)
+        if user is None:
+            return None
+        alliance_id = user[USER_ALLIANCE_ID_COLUMN]
+        return UserHistoryOut(collection=self.meta, user=user, fleet=None if alliance_id is None else self.get_alliance(alliance_id))
+
+
+@dataclass(frozen=True)
+class SharedSnapshot:
+    """
+    A version of the snapshot mapped from the files written to the snapshot directory.
+    """
+
+    version: str
+    catalog: pa.RecordBatch
+    """The metadata of all Collections ordered by `collection_id`."""
+    collections: dict[int, CollectionSnapshot]
+    """The latest Collections by `collection_id` ordered descending by `collected_at`."""
+
+    @property
+    def latest(self) -> CollectionSnapshot | None:
+        return next(iter(self.collections.values()), None)
+
+    @classmethod
+    def read(cls, directory: str | Path, version: str) -> "SharedSnapshot":
+        """Memory-maps the files of a version of the snapshot.
+
+        Args:
+            directory (str | Path): The snapshot directory.
+            version (str): The version to map.
+
+        Returns:
+            SharedSnapshot: The mapped snapshot.
+        """
+        path = Path(directory) / version
+        catalog_reader = _open_file(path / CATALOG_FILE_NAME)
+        alliance_reader = _open_file(path / ALLIANCES_FILE_NAME)
+        user_reader = _open_file(path / USERS_FILE_NAME)
+
+        catalog = catalog_reader.get_batch(0)
+        collection_ids = orjson.loads(catalog_reader.schema.metadata[b"collection_ids"])
+        collections = {}
+        for index, collection_id in enumerate(collection_ids):
+            meta = _get_collection_metadata(catalog, collection_id)
+            alliances = ColumnTable(alliance_reader.get_batch(index), len(ALLIANCE_SCHEMA))
+            users = ColumnTable(user_reader.get_batch(index), len(USER_SCHEMA))
+            collections[collection_id] = CollectionSnapshot(meta, alliances, users)
+        return cls(version, catalog, collections)
+
+    def get_collection(self, collection_id: int) -> CollectionSnapshot | None:
+        return self.collections.get(collection_id)
+
+    def get_collection_metadata(self, collection_id: int) -> CollectionMetadataOut | None:
+        """Looks up the metadata of a Collection in the catalog.
+
+        Args:
+            collection_id (int): The `collection_id` of the Collection.
+
+        Returns:
+            CollectionMetadataOut | None: The metadata of the Collection, if it's part of the catalog. Else, `None`.
+        """
+        return _get_collection_metadata(self.catalog, collection_id)
+
+
+def get_collection_snapshot(collection_id: int) -> CollectionSnapshot | None:
+    """Returns a Collection from the snapshot mapped by this process without loading the snapshot.
+
+    Args:
+        collection_id (int): The `collection_id` of the Collection.
+
+    Returns:
+        CollectionSnapshot | None: The Collection, if it's one of the latest Collections in the snapshot. Else, `None`.
+    """
+    return SNAPSHOT.get_collection(collection_id) if SNAPSHOT else None
+
+
+async def get_snapshot() -> SharedSnapshot | None:
+    """Returns the snapshot mapped by this process. Writes and maps it, if it hasn't been mapped, yet.
+
+    Returns:
+        SharedSnapshot | None: The snapshot.
+    """
+    if SNAPSHOT is not None:
+        return SNAPSHOT
+    return await refresh_snapshot()
+
+
+def read_snapshot(directory: str | Path, current: SharedSnapshot | None = None) -> SharedSnapshot | None:
+    """Maps the current version of the snapshot.
+
+    Args:
+        directory (str | Path): The snapshot directory.
+        current (SharedSnapshot, optional): The snapshot mapped currently. Is returned instead of mapping the files again, if it's still the current version. Defaults to None.
+
+    Returns:
+        SharedSnapshot | None: The current version of the snapshot or `None`, if no version has been written, yet.
+    """
+    current_file = Path(directory) / CURRENT_FILE_NAME
+    if not current_file.is_file():
+        return None
+
+    version = current_file.read_text().strip()
+    if current and current.version == version:
+        return current
+    return SharedSnapshot.read(directory, version)
+
+
+async def write_snapshot(session: AsyncSession, directory: str | Path, collection_count: int, previous: SharedSnapshot | None = None) -> str:
+    """Writes a new version of the snapshot and makes it the current version. Only the Collections not in the `previous` snapshot are read from the database.
+
+    Args:
+        session (AsyncSession): The database session to use.
+        directory (str | Path): The snapshot directory.
+        collection_count (int): The number of latest Collections to include with their Alliances and Users.
+        previous (SharedSnapshot, optional): The current version of the snapshot. Defaults to None.
+
+    Returns:
+        str: The new version.
+    """
+    async with session:
+        catalog_rows = (await session.exec(select(*CollectionDB.__table__.columns).order_by(col(CollectionDB.collection_id)))).all()
+        query = select(CollectionDB.collection_id).order_by(col(CollectionDB.collected_at).desc()).limit(collection_count)
+        collection_ids = list((await session.exec(query)).all())
+
+    alliance_batches = []
+    user_batches = []
+    for collection_id in collection_ids:
+        collection_snapshot = previous.get_collection(collection_id) if previous else None
+        if collection_snapshot:
+            alliance_batches.append(collection_snapshot.alliances.batch)
+            user_batches.append(collection_snapshot.users.batch)
+            continue
+
+        collection = await crud.get_collection(session, collection_id, True, True)
+        alliance_batch, user_batch = await asyncio.to_thread(_to_record_batches, collection)
+        alliance_batches.append(alliance_batch)
+        user_batches.append(user_batch)
+
+    catalog = await asyncio.to_thread(_to_record_batch, catalog_rows, CATALOG_SCHEMA)
+    version = f"v{time.time_ns()}"
+    await asyncio.to_thread(_write_version, Path(directory), version, catalog, collection_ids, alliance_batches, user_batches)
+    return version
+
+
+async def refresh_snapshot(force: bool = False, wait: bool = True) -> SharedSnapshot | None:
+    """Writes a new version of the snapshot, if the current version doesn't contain the latest Collections in the database, and maps the current version.
+
+    Args:
+        force (bool, optional): Read all Collections from the database again, e.g. after a Collection in the snapshot has been updated. Defaults to False.
+        wait (bool, optional): Wait for another process writing the snapshot. If `False`, the current version is mapped without checking the database. Defaults to True.
+
+    Returns:
+        SharedSnapshot | None: The current version of the snapshot.
+    """
+    global SNAPSHOT
+    directory = Path(SETTINGS.snapshot_directory)
+    async with _refresh_lock, _acquire_writer_lock(directory, wait) as is_writer:
+        SNAPSHOT = await asyncio.to_thread(read_snapshot, directory, SNAPSHOT)
+        if not is_writer:
+            return SNAPSHOT
+
+        async with AsyncSession(db.ENGINE) as session:
+            if force or await _is_outdated(session, SNAPSHOT, SETTINGS.snapshot_collection_count):
+                await write_snapshot(session, directory, SETTINGS.snapshot_collection_count, None if force else SNAPSHOT)
+                SNAPSHOT = await asyncio.to_thread(read_snapshot, directory, SNAPSHOT)
+    return SNAPSHOT
+
+
+async def monitor_snapshot(interval: float):
+    """Periodically maps new versions of the snapshot written by other worker processes and writes a new version, if the snapshot is outdated, until cancelled.
+
+    Args:
+        interval (float): The number of seconds to wait between two checks.
+    """
+    while True:
+        try:
+            await refresh_snapshot(wait=False)
+        except (DBAPIError, OSError) as exc:
+            print(f"Could not refresh the snapshot:\n{exc}")
+        await asyncio.sleep(interval)
+
+
+# ----- Helper functions -----
+
+
+@asynccontextmanager
+async def _acquire_writer_lock(directory: Path, wait: bool) -> AsyncIterator[bool]:
+    """Acquires the exclusive lock for writing the snapshot shared by all processes.
+
+    Args:
+        directory (Path): The snapshot directory.
+        wait (bool): Wait until the lock has been released by another process.
+
+    Yields:
+        bool: `True`, if the lock has been acquired. Else, `False`.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / LOCK_FILE_NAME, "a") as lock_file:
+        acquired = _try_lock(lock_file)
+        while wait and not acquired:
+            await asyncio.sleep(WRITER_LOCK_POLL_INTERVAL)
+            acquired = _try_lock(lock_file)
+
+        try:
+            yield acquired
+        finally:
+            if acquired and fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _find_range(values: np.ndarray, value: int) -> tuple[int, int]:
+    """Returns the start and end index of the occurrences of a value in sorted values."""
+    return int(np.searchsorted(values, value, side="left")), int(np.searchsorted(values, value, side="right"))
+
+
+def _get_collection_metadata(catalog: pa.RecordBatch, collection_id: int) -> CollectionMetadataOut | None:
+    row = ColumnTable(catalog, catalog.num_columns).find_row(collection_id)
+    if row is None:
+        return None
+    return FromDB.to_collection_metadata(CollectionDB(**catalog.slice(row, 1).to_pylist()[0]))
+
+
+async def _is_outdated(session: AsyncSession, snapshot: SharedSnapshot | None, collection_count: int) -> bool:
+    """Checks, if the snapshot lacks any of the latest Collections in the database or if Collections have been deleted."""
+    if snapshot is None:
+        return True
+
+    async with session:
+        query = select(CollectionDB.collection_id).order_by(col(CollectionDB.collected_at).desc()).limit(collection_count)
+        collection_ids = list((await session.exec(query)).all())
+        collection_count_total = (await session.exec(select(func.count()).select_from(CollectionDB))).one()
+    return collection_ids != list(snapshot.collections) or collection_count_total != snapshot.catalog.num_rows
+
+
+def _open_file(path: Path) -> pa.ipc.RecordBatchFileReader:
+    return pa.ipc.open_file(pa.memory_map(str(path), "r"))
+
+
+def _to_record_batch(rows: Sequence[Sequence], schema: pa.Schema) -> pa.RecordBatch:
+    columns = zip(*rows, strict=True) if rows else [()] * len(schema)
+    return pa.RecordBatch.from_arrays([pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)], schema=schema)
+
+
+def _to_record_batches(collection: CollectionDB) -> tuple[pa.RecordBatch, pa.RecordBatch]:
+    """Converts the Alliances and Users of a Collection to record batches ordered by `alliance_id` and `user_id`. The Users are stored with the columns of the `USER_INDEX_SCHEMA`."""
+    alliances = _to_record_batch(sorted(FromDB.to_alliance(alliance) for alliance in collection.alliances), ALLIANCE_SCHEMA)
+    users = _to_record_batch(sorted(FromDB.to_user(user) for user in collection.users), USER_SCHEMA)
+
+    trophies = pc.fill_null(users.column(USER_TROPHY_COLUMN), 0).to_numpy().astype(np.int64)
+    row_by_trophy = np.argsort(-trophies, kind="stable")
+    alliance_ids = pc.fill_null(users.column(USER_ALLIANCE_ID_COLUMN), -1).to_numpy()
+    row_by_alliance_id = np.argsort(alliance_ids, kind="stable")
+    index_columns = [
+        pa.array(row_by_trophy, type=pa.int32()),
+        pa.array(row_by_alliance_id, type=pa.int32()),
+        pa.array(alliance_ids[row_by_alliance_id], type=pa.int32()),
+    ]
+    return alliances, pa.RecordBatch.from_arrays(users.columns + index_columns, schema=USER_BATCH_SCHEMA)
+
+
+def _try_lock(lock_file) -> bool:
+    if not fcntl:
+        return True
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _write_version(
+    directory: Path,
+    version: str,
+    catalog: pa.RecordBatch,
+    collection_ids: list[int],
+    alliance_batches: list[pa.RecordBatch],
+    user_batches: list[pa.RecordBatch],
+):
+    """Writes the files of a new version, replaces the file `CURRENT` and deletes the versions before the previous one. The previous version is kept for processes, that are just mapping it."""
+    path = directory / version
+    path.mkdir(parents=True)
+
+    catalog_schema = CATALOG_SCHEMA.with_metadata({b"collection_ids": orjson.dumps(collection_ids)})
+    for file_name, schema, batches in (
+        (CATALOG_FILE_NAME, catalog_schema, [catalog]),
+        (ALLIANCES_FILE_NAME, ALLIANCE_SCHEMA, alliance_batches),
+        (USERS_FILE_NAME, USER_BATCH_SCHEMA, user_batches),
+    ):
+        with pa.OSFile(str(path / file_name), "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+
+    current_file = directory / CURRENT_FILE_NAME
+    previous_version = current_file.read_text().strip() if current_file.is_file() else None
+    temp_file = directory / f"{CURRENT_FILE_NAME}.tmp"
+    temp_file.write_text(version)
+    os.replace(temp_file, current_file)
+
+    for old_path in directory.glob("v*"):
+        if old_path.name not in (version, previous_version):
+            shutil.rmtree(old_path, ignore_errors=True)
+
+
+__all__ = [
+    "SNAPSHOT",
+    "CollectionSnapshot",
+    "ColumnTable",
+    "SharedSnapshot",
+    "get_collection_snapshot",
+    "get_snapshot",
+    "monitor_snapshot",
+    "read_snapshot",
+    "refresh_snapshot",
+    "write_snapshot",
+]
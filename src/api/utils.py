@@ -1,3 +1,6 @@
+import base64
+import binascii
+import json
 from datetime import datetime, timedelta, timezone
 
 import dateutil
@@ -95,6 +98,31 @@ def decode_alliance_membership(membership: int | UserAllianceMembershipEncoded)
     return ALLIANCE_MEMBERSHIP_DECODE_LOOKUP.get(membership, UserAllianceMembership.NONE)
 
 
+def decode_cursor(cursor: str) -> tuple[datetime, bool]:
+    """Decodes a pagination cursor created by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor.
+
+    Raises:
+        ValueError: Raised, if `cursor` is not a valid cursor.
+
+    Returns:
+        tuple[datetime, bool]: The timezone-naive timestamp of the last entry of the previous page and whether the pages are sorted in descending order.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        collected_at = datetime.fromisoformat(data["collected_at"])
+        desc = data["desc"]
+    except (binascii.Error, KeyError, TypeError, UnicodeError, ValueError) as exc:
+        raise ValueError(f"The cursor '{cursor}' is invalid.") from exc
+
+    if not isinstance(desc, bool):
+        raise ValueError(f"The cursor '{cursor}' is invalid.")
+
+    return remove_timezone(collected_at), desc
+
+
 def encode_alliance_membership(membership: str | UserAllianceMembership) -> int:
     """Converts a `str` or `UserAllianceMembership` enum into an `int`.
 
@@ -120,6 +148,20 @@ def encode_alliance_membership(membership: str | UserAllianceMembership) -> int:
     return int(ALLIANCE_MEMBERSHIP_ENCODE_LOOKUP.get(membership, UserAllianceMembershipEncoded.NONE))
 
 
+def encode_cursor(collected_at: datetime, desc: bool) -> str:
+    """Encodes the position of the last entry of a page as an opaque pagination cursor.
+
+    Args:
+        collected_at (datetime): The timestamp of the Collection of the last entry of the page.
+        desc (bool): Whether the pages are sorted in descending order.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    data = json.dumps({"collected_at": remove_timezone(collected_at).isoformat(), "desc": desc}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
 def localize_to_utc(dt: datetime | None) -> datetime:
     """Takes a `datetime` and converts it to a timezone-aware UTC `datetime`.
 
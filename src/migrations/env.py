@@ -5,7 +5,15 @@ from sqlalchemy import engine_from_config, pool
 from sqlmodel import SQLModel
 
 from src.api.config import SETTINGS
-from src.api.database.models import AllianceDB, CollectionDB, UserDB  # noqa: F401
+from src.api.database.models import (  # noqa: F401
+    AllianceDB,
+    CollectionDB,
+    EntityEventDB,
+    EntityNameDB,
+    RateLimitBucketDB,
+    UserCarriedForwardDB,
+    UserDB,
+)
 
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,35 @@
+"""Add rate_limit_bucket table
+
+Revision ID: 3f9c2a71d5e4
+Revises: 864bb00bc205
+Create Date: 2026-10-19 12:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a71d5e4"
+down_revision: str | None = "864bb00bc205"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_bucket",
+        sa.Column("bucket_key", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("bucket_key"),
+        prefixes=["UNLOGGED"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rate_limit_bucket")
@@ -0,0 +1,48 @@
+"""Add entity_event table
+
+Revision ID: a4d81c6e2b90
+Revises: 3f9c2a71d5e4
+Create Date: 2026-10-19 13:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d81c6e2b90"
+down_revision: str | None = "3f9c2a71d5e4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entity_event",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("collection_id", sa.Integer(), nullable=False),
+        sa.Column("collected_at", sa.DateTime(), nullable=False),
+        sa.Column("entity_type", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("old_value", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("new_value", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.ForeignKeyConstraint(["collection_id"], ["collection.collection_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id"),
+    )
+    op.create_index(op.f("ix_entity_event_collected_at"), "entity_event", ["collected_at"], unique=False)
+    op.create_index(op.f("ix_entity_event_collection_id"), "entity_event", ["collection_id"], unique=False)
+    op.create_index("ix_entity_event_entity_type_entity_id_collected_at", "entity_event", ["entity_type", "entity_id", "collected_at"], unique=False)
+    op.create_index("ix_entity_event_event_type_collected_at", "entity_event", ["event_type", "collected_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entity_event_event_type_collected_at", table_name="entity_event")
+    op.drop_index("ix_entity_event_entity_type_entity_id_collected_at", table_name="entity_event")
+    op.drop_index(op.f("ix_entity_event_collection_id"), table_name="entity_event")
+    op.drop_index(op.f("ix_entity_event_collected_at"), table_name="entity_event")
+    op.drop_table("entity_event")
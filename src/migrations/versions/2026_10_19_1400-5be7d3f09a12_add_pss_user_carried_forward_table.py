@@ -0,0 +1,40 @@
+"""Add pss_user_carried_forward table
+
+Revision ID: 5be7d3f09a12
+Revises: a4d81c6e2b90
+Create Date: 2026-10-19 14:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5be7d3f09a12"
+down_revision: str | None = "a4d81c6e2b90"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pss_user_carried_forward",
+        sa.Column("collection_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("source_collection_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["collection_id"], ["collection.collection_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["source_collection_id", "user_id"], ["pss_user.collection_id", "pss_user.user_id"]),
+        sa.PrimaryKeyConstraint("collection_id", "user_id"),
+    )
+    op.create_index(op.f("ix_pss_user_carried_forward_source_collection_id"), "pss_user_carried_forward", ["source_collection_id"], unique=False)
+    op.create_index(op.f("ix_pss_user_carried_forward_user_id"), "pss_user_carried_forward", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    # Users carried forward are lost. Run `python -m src.api.database.delta_storage expand` before downgrading.
+    op.drop_index(op.f("ix_pss_user_carried_forward_user_id"), table_name="pss_user_carried_forward")
+    op.drop_index(op.f("ix_pss_user_carried_forward_source_collection_id"), table_name="pss_user_carried_forward")
+    op.drop_table("pss_user_carried_forward")
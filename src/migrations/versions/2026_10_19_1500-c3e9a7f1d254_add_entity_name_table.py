@@ -0,0 +1,70 @@
+"""Add entity_name table
+
+Revision ID: c3e9a7f1d254
+Revises: 5be7d3f09a12
+Create Date: 2026-10-19 15:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e9a7f1d254"
+down_revision: str | None = "5be7d3f09a12"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table(
+        "entity_name",
+        sa.Column("entity_type", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("first_seen_at", sa.DateTime(), nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("entity_type", "entity_id", "name"),
+    )
+
+    # Records the names of the existing Collections, including the Users carried forward by delta storage.
+    op.execute(
+        """
+        INSERT INTO entity_name (entity_type, entity_id, name, first_seen_at, last_seen_at)
+        SELECT 'alliance', a.alliance_id, a.alliance_name, MIN(c.collected_at), MAX(c.collected_at)
+        FROM pss_alliance a JOIN collection c ON c.collection_id = a.collection_id
+        GROUP BY a.alliance_id, a.alliance_name
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO entity_name (entity_type, entity_id, name, first_seen_at, last_seen_at)
+        SELECT 'user', u.user_id, u.user_name, MIN(u.collected_at), MAX(u.collected_at)
+        FROM (
+            SELECT pu.user_id, pu.user_name, c.collected_at
+            FROM pss_user pu JOIN collection c ON c.collection_id = pu.collection_id
+            UNION ALL
+            SELECT pu.user_id, pu.user_name, c.collected_at
+            FROM pss_user_carried_forward cf
+            JOIN pss_user pu ON pu.collection_id = cf.source_collection_id AND pu.user_id = cf.user_id
+            JOIN collection c ON c.collection_id = cf.collection_id
+        ) u
+        GROUP BY u.user_id, u.user_name
+        """
+    )
+
+    op.create_index("ix_entity_name_entity_type_entity_id", "entity_name", ["entity_type", "entity_id"], unique=False)
+    op.create_index(
+        "ix_entity_name_name_trgm", "entity_name", ["name"], unique=False, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+    )
+
+
+def downgrade() -> None:
+    # The extension `pg_trgm` is kept, as other objects may depend on it.
+    op.drop_index("ix_entity_name_name_trgm", table_name="entity_name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"})
+    op.drop_index("ix_entity_name_entity_type_entity_id", table_name="entity_name")
+    op.drop_table("entity_name")
@@ -0,0 +1,26 @@
+"""Add index on pss_alliance collection_id and division_design_id
+
+Revision ID: d71f2b8c4e63
+Revises: c3e9a7f1d254
+Create Date: 2026-10-19 16:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d71f2b8c4e63"
+down_revision: str | None = "c3e9a7f1d254"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_pss_alliance_collection_id_division_design_id", "pss_alliance", ["collection_id", "division_design_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pss_alliance_collection_id_division_design_id", table_name="pss_alliance")
@@ -0,0 +1,32 @@
+"""Add leaderboard indexes on pss_user
+
+Revision ID: e4a2c9d05b17
+Revises: d71f2b8c4e63
+Create Date: 2026-10-19 17:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a2c9d05b17"
+down_revision: str | None = "d71f2b8c4e63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_pss_user_collection_id_alliance_score", "pss_user", ["collection_id", "alliance_score"], unique=False)
+    op.create_index("ix_pss_user_collection_id_highest_trophy", "pss_user", ["collection_id", "highest_trophy"], unique=False)
+    op.create_index("ix_pss_user_collection_id_pvp_attack_wins", "pss_user", ["collection_id", "pvp_attack_wins"], unique=False)
+    op.create_index("ix_pss_user_collection_id_trophy", "pss_user", ["collection_id", "trophy"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pss_user_collection_id_trophy", table_name="pss_user")
+    op.drop_index("ix_pss_user_collection_id_pvp_attack_wins", table_name="pss_user")
+    op.drop_index("ix_pss_user_collection_id_highest_trophy", table_name="pss_user")
+    op.drop_index("ix_pss_user_collection_id_alliance_score", table_name="pss_user")
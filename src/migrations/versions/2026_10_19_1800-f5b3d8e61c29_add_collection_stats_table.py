@@ -0,0 +1,112 @@
+"""Add collection_stats table
+
+Revision ID: f5b3d8e61c29
+Revises: e4a2c9d05b17
+Create Date: 2026-10-19 18:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f5b3d8e61c29"
+down_revision: str | None = "e4a2c9d05b17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_stats",
+        sa.Column("collection_id", sa.Integer(), nullable=False),
+        sa.Column("user_count", sa.Integer(), nullable=False),
+        sa.Column("alliance_count", sa.Integer(), nullable=False),
+        sa.Column("trophy_total", sa.BigInteger(), nullable=False),
+        sa.Column("trophy_average", sa.Float(), nullable=True),
+        sa.Column("alliance_score_total", sa.BigInteger(), nullable=False),
+        sa.Column("active_user_count_day", sa.Integer(), nullable=False),
+        sa.Column("active_user_count_week", sa.Integer(), nullable=False),
+        sa.Column("active_user_count_month", sa.Integer(), nullable=False),
+        sa.Column("users_by_division", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("users_by_membership", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.ForeignKeyConstraint(["collection_id"], ["collection.collection_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("collection_id"),
+    )
+
+    # Computes the numbers of the existing Collections, including the Users carried forward by delta storage.
+    op.execute(
+        """
+        INSERT INTO collection_stats (
+            collection_id, user_count, alliance_count, trophy_total, trophy_average, alliance_score_total,
+            active_user_count_day, active_user_count_week, active_user_count_month, users_by_division, users_by_membership
+        )
+        WITH u AS (
+            SELECT pu.collection_id, pu.alliance_id, pu.trophy, pu.alliance_score, pu.alliance_membership, pu.last_login_date
+            FROM pss_user pu
+            UNION ALL
+            SELECT cf.collection_id, pu.alliance_id, pu.trophy, pu.alliance_score, pu.alliance_membership, pu.last_login_date
+            FROM pss_user_carried_forward cf
+            JOIN pss_user pu ON pu.collection_id = cf.source_collection_id AND pu.user_id = cf.user_id
+        ),
+        totals AS (
+            SELECT
+                u.collection_id,
+                COUNT(*) AS user_count,
+                SUM(u.trophy) AS trophy_total,
+                AVG(u.trophy) AS trophy_average,
+                SUM(u.alliance_score) AS alliance_score_total,
+                COUNT(*) FILTER (WHERE u.last_login_date >= c.collected_at - INTERVAL '1 day') AS active_user_count_day,
+                COUNT(*) FILTER (WHERE u.last_login_date >= c.collected_at - INTERVAL '7 days') AS active_user_count_week,
+                COUNT(*) FILTER (WHERE u.last_login_date >= c.collected_at - INTERVAL '30 days') AS active_user_count_month
+            FROM u JOIN collection c ON c.collection_id = u.collection_id
+            GROUP BY u.collection_id
+        ),
+        alliances AS (
+            SELECT collection_id, COUNT(*) AS alliance_count FROM pss_alliance GROUP BY collection_id
+        ),
+        divisions AS (
+            SELECT d.collection_id, jsonb_object_agg(d.division_design_id::text, d.user_count) AS users_by_division
+            FROM (
+                SELECT u.collection_id, a.division_design_id, COUNT(*) AS user_count
+                FROM u JOIN pss_alliance a ON a.collection_id = u.collection_id AND a.alliance_id = u.alliance_id
+                GROUP BY u.collection_id, a.division_design_id
+            ) d
+            GROUP BY d.collection_id
+        ),
+        memberships AS (
+            SELECT m.collection_id, jsonb_object_agg(m.alliance_membership, m.user_count) AS users_by_membership
+            FROM (
+                SELECT u.collection_id, COALESCE(u.alliance_membership, 'None') AS alliance_membership, COUNT(*) AS user_count
+                FROM u
+                GROUP BY u.collection_id, COALESCE(u.alliance_membership, 'None')
+            ) m
+            GROUP BY m.collection_id
+        )
+        SELECT
+            c.collection_id,
+            COALESCE(t.user_count, 0),
+            COALESCE(a.alliance_count, 0),
+            COALESCE(t.trophy_total, 0),
+            t.trophy_average,
+            COALESCE(t.alliance_score_total, 0),
+            COALESCE(t.active_user_count_day, 0),
+            COALESCE(t.active_user_count_week, 0),
+            COALESCE(t.active_user_count_month, 0),
+            COALESCE(d.users_by_division, '{}'::jsonb),
+            COALESCE(m.users_by_membership, '{}'::jsonb)
+        FROM collection c
+        LEFT JOIN totals t ON t.collection_id = c.collection_id
+        LEFT JOIN alliances a ON a.collection_id = c.collection_id
+        LEFT JOIN divisions d ON d.collection_id = c.collection_id
+        LEFT JOIN memberships m ON m.collection_id = c.collection_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("collection_stats")
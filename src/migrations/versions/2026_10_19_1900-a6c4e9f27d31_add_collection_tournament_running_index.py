@@ -0,0 +1,29 @@
+"""Add partial index on collection for tournament_running
+
+Revision ID: a6c4e9f27d31
+Revises: f5b3d8e61c29
+Create Date: 2026-10-19 19:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6c4e9f27d31"
+down_revision: str | None = "f5b3d8e61c29"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_collection_collected_at_tournament_running", "collection", ["collected_at"], unique=False, postgresql_where=sa.text("tournament_running")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_collection_collected_at_tournament_running", table_name="collection", postgresql_where=sa.text("tournament_running"))
@@ -0,0 +1,27 @@
+"""Add modified_at column to collection
+
+Revision ID: b8d1f4a6c352
+Revises: a6c4e9f27d31
+Create Date: 2026-10-19 20:00:00.000000+00:00
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d1f4a6c352"
+down_revision: str | None = "a6c4e9f27d31"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("collection", sa.Column("modified_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("collection", "modified_at")
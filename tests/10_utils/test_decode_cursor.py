@@ -0,0 +1,39 @@
+from contextlib import AbstractContextManager
+from datetime import datetime
+
+import pytest
+
+from src.api.utils import decode_cursor, encode_cursor
+
+
+test_cases_invalid = [
+    # cursor, expected_exception
+    pytest.param("", pytest.raises(ValueError), id="empty"),
+    pytest.param("abc", pytest.raises(ValueError), id="not_base64"),
+    pytest.param("W10", pytest.raises(ValueError), id="list"),
+    pytest.param("eyJjb2xsZWN0ZWRfYXQiOiJhYmMiLCJkZXNjIjpmYWxzZX0", pytest.raises(ValueError), id="invalid_datetime"),
+    pytest.param("eyJjb2xsZWN0ZWRfYXQiOiIyMDI0LTAxLTAxVDAwOjAwOjAwIn0", pytest.raises(ValueError), id="missing_desc"),
+    pytest.param("eyJjb2xsZWN0ZWRfYXQiOiIyMDI0LTAxLTAxVDAwOjAwOjAwIiwiZGVzYyI6MX0", pytest.raises(ValueError), id="desc_not_bool"),
+]
+
+
+test_cases_valid = [
+    # cursor, expected_collected_at, expected_desc
+    pytest.param(encode_cursor(datetime(2024, 1, 31, 23, 59), False), datetime(2024, 1, 31, 23, 59), False, id="asc"),
+    pytest.param(encode_cursor(datetime(2024, 1, 31, 23, 59), True), datetime(2024, 1, 31, 23, 59), True, id="desc"),
+    pytest.param("eyJjb2xsZWN0ZWRfYXQiOiIyMDI0LTAxLTAxVDAwOjAwOjAwWiIsImRlc2MiOmZhbHNlfQ", datetime(2024, 1, 1), False, id="timezone_utc"),
+]
+
+
+@pytest.mark.parametrize(["cursor", "expected_exception"], test_cases_invalid)
+def test_decode_cursor_invalid(cursor: str, expected_exception: AbstractContextManager):
+    with expected_exception:
+        _ = decode_cursor(cursor)
+
+
+@pytest.mark.parametrize(["cursor", "expected_collected_at", "expected_desc"], test_cases_valid)
+def test_decode_cursor_valid(cursor: str, expected_collected_at: datetime, expected_desc: bool):
+    collected_at, desc = decode_cursor(cursor)
+    assert collected_at == expected_collected_at
+    assert collected_at.tzinfo is None
+    assert desc == expected_desc
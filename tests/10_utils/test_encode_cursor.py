@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api.utils import encode_cursor
+
+
+test_cases_valid = [
+    # collected_at, desc, expected_result
+    pytest.param(datetime(2024, 1, 1), False, "eyJjb2xsZWN0ZWRfYXQiOiIyMDI0LTAxLTAxVDAwOjAwOjAwIiwiZGVzYyI6ZmFsc2V9", id="asc"),
+    pytest.param(
+        datetime(2024, 1, 1, tzinfo=timezone.utc), True, "eyJjb2xsZWN0ZWRfYXQiOiIyMDI0LTAxLTAxVDAwOjAwOjAwIiwiZGVzYyI6dHJ1ZX0", id="desc_timezone_utc"
+    ),
+]
+
+
+@pytest.mark.parametrize(["collected_at", "desc", "expected_result"], test_cases_valid)
+def test_encode_cursor(collected_at: datetime, desc: bool, expected_result: str):
+    result = encode_cursor(collected_at, desc)
+    assert result == expected_result
+    assert "=" not in result
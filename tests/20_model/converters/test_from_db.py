@@ -2,11 +2,21 @@ from datetime import timezone
 
 import pytest
 
-from src.api.database.models import AllianceDB, AllianceHistoryDB, CollectionDB, UserDB, UserHistoryDB
+from src.api.database.models import (
+    AllianceDB,
+    AllianceHistoryDB,
+    CollectionDB,
+    EntityEventDB,
+    UserDB,
+    UserHistoryDB,
+    UserHistoryDeltaDB,
+    UserMoverDB,
+)
 from src.api.models import (
     AllianceHistoryOut,
     AllianceOut,
     CollectionMetadataOut,
+    CollectionMoversOut,
     CollectionOut,
     CollectionWithFleetsOut,
     CollectionWithUsersOut,
@@ -14,6 +24,7 @@ from src.api.models import (
     UserOut,
 )
 from src.api.models.converters import FromDB
+from src.api.models.enums import EntityEventType, EntityType, ParameterUserMetric
 
 
 @pytest.mark.usefixtures("alliance_db")
@@ -65,6 +76,17 @@ def test_to_collection_metadata(collection_db: CollectionDB):
     _check_collection_metadata_out(collection_metadata)
 
 
+@pytest.mark.usefixtures("collection_db", "user_mover_db")
+def test_to_collection_movers(collection_db: CollectionDB, user_mover_db: UserMoverDB):
+    collection_movers = FromDB.to_collection_movers(collection_db, collection_db, ParameterUserMetric.TROPHY, [user_mover_db])
+
+    assert isinstance(collection_movers, CollectionMoversOut)
+    _check_collection_metadata_out(collection_movers.from_collection)
+    _check_collection_metadata_out(collection_movers.to_collection)
+    assert collection_movers.metric == ParameterUserMetric.TROPHY
+    assert collection_movers.users == [user_mover_db]
+
+
 @pytest.mark.usefixtures("collection_db")
 def test_to_collection_with_fleets(collection_db: CollectionDB):
     collection = FromDB.to_collection_with_fleets(collection_db)
@@ -79,6 +101,15 @@ def test_to_collection_with_users(collection_db: CollectionDB):
     _check_collection_with_users_out(collection)
 
 
+@pytest.mark.usefixtures("entity_event_db")
+def test_to_entity_event(entity_event_db: EntityEventDB):
+    entity_event = FromDB.to_entity_event(entity_event_db)
+
+    assert entity_event == (1, entity_event_db.collected_at, EntityType.USER, 1, EntityEventType.JOINED_ALLIANCE, None, "1")
+    assert isinstance(entity_event[2], EntityType)
+    assert isinstance(entity_event[4], EntityEventType)
+
+
 @pytest.mark.usefixtures("user_db")
 def test_to_user(user_db: UserDB):
     user = FromDB.to_user(user_db)
@@ -108,6 +139,17 @@ def test_to_user_history_with_alliance(user_history_db_with_alliance: UserHistor
     _check_alliance_out(user_history.fleet)
 
 
+@pytest.mark.usefixtures("user_history_delta_db")
+def test_to_user_history_delta(user_history_delta_db: UserHistoryDeltaDB):
+    collection_id, timestamp, values, deltas, rates = FromDB.to_user_history_delta(user_history_delta_db)
+
+    assert collection_id == user_history_delta_db[0]
+    assert timestamp.tzinfo == timezone.utc
+    assert values == user_history_delta_db[2]
+    assert deltas == user_history_delta_db[3]
+    assert all(rate == 3.333 for rate in rates)
+
+
 # Helpers
 
 
@@ -5,7 +5,15 @@ from fastapi.exceptions import RequestValidationError
 
 from src.api.exception_handlers import _raise_path_parameter_error
 from src.api.models.error import RequestValidationErrorOut
-from src.api.models.exceptions import ApiError, InvalidAllianceIdError, InvalidCollectionIdError, InvalidUserIdError, ServerError
+from src.api.models.exceptions import (
+    ApiError,
+    InvalidAllianceIdError,
+    InvalidCollectionIdError,
+    InvalidMonthError,
+    InvalidTableError,
+    InvalidUserIdError,
+    ServerError,
+)
 
 
 test_cases = [
@@ -50,6 +58,36 @@ test_cases = [
         InvalidUserIdError,
         id="alliance_id_error",
     ),
+    pytest.param(
+        {
+            "type": "greater_than_equal",
+            "loc": ("path", "otherCollectionId"),
+            "msg": "Input should be greater than or equal to 1",
+            "input": "0",
+        },
+        InvalidCollectionIdError,
+        id="other_collection_id_error",
+    ),
+    pytest.param(
+        {
+            "type": "string_pattern_mismatch",
+            "loc": ("path", "month"),
+            "msg": "String should match pattern '^\\d{4}-(0[1-9]|1[0-2])$'",
+            "input": "2024-13",
+        },
+        InvalidMonthError,
+        id="month_error",
+    ),
+    pytest.param(
+        {
+            "type": "enum",
+            "loc": ("path", "table"),
+            "msg": "Input should be 'alliances', 'collections' or 'users'",
+            "input": "ships",
+        },
+        InvalidTableError,
+        id="table_error",
+    ),
 ]
 """error, expected_exception"""
 
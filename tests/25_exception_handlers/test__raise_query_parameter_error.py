@@ -8,10 +8,21 @@ from src.api.models.error import RequestValidationErrorOut
 from src.api.models.exceptions import (
     ApiError,
     FromDateTooEarlyError,
+    InvalidAllianceIdError,
+    InvalidBucketsError,
+    InvalidCollectionIdError,
+    InvalidCursorError,
     InvalidDescError,
+    InvalidDivisionDesignIdError,
+    InvalidEntityIdError,
+    InvalidEntityTypeError,
+    InvalidEventTypeError,
     InvalidFromDateError,
     InvalidIntervalError,
+    InvalidMetricError,
+    InvalidNameError,
     InvalidOnMissingError,
+    InvalidSearchModeError,
     InvalidSkipError,
     InvalidTakeError,
     InvalidToDateError,
@@ -142,6 +153,146 @@ test_cases = [
         InvalidOnMissingError,
         id="on_missing_invalid",
     ),
+    pytest.param(
+        {
+            "type": "query parameter",
+            "loc": ("query", "cursor"),
+            "msg": "invalid cursor",
+            "input": "cursor_invalid",
+        },
+        InvalidCursorError,
+        id="cursor_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "greater_than_equal",
+            "loc": ("query", "collectionId"),
+            "msg": "Input should be greater than or equal to 1",
+            "input": "0",
+        },
+        InvalidCollectionIdError,
+        id="collection_id_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "enum",
+            "loc": ("query", "metrics", 1),
+            "msg": "Input should be 'alliance_score', 'crew_donated', ...",
+            "input": "abc",
+        },
+        InvalidMetricError,
+        id="metrics_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "enum",
+            "loc": ("query", "metric"),
+            "msg": "Input should be 'alliance_score', 'crew_donated', ...",
+            "input": "abc",
+        },
+        InvalidMetricError,
+        id="metric_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "greater_than_equal",
+            "loc": ("query", "fromCollectionId"),
+            "msg": "Input should be greater than or equal to 1",
+            "input": "0",
+        },
+        InvalidCollectionIdError,
+        id="from_collection_id_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "int_parsing",
+            "loc": ("query", "toCollectionId"),
+            "msg": "Input should be a valid integer, unable to parse string as an integer",
+            "input": "abc",
+        },
+        InvalidCollectionIdError,
+        id="to_collection_id_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "greater_than_equal",
+            "loc": ("query", "allianceId"),
+            "msg": "Input should be greater than or equal to 1",
+            "input": "0",
+        },
+        InvalidAllianceIdError,
+        id="alliance_id_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "greater_than_equal",
+            "loc": ("query", "divisionDesignId"),
+            "msg": "Input should be greater than or equal to 0",
+            "input": "-1",
+        },
+        InvalidDivisionDesignIdError,
+        id="division_design_id_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "greater_than_equal",
+            "loc": ("query", "entityId"),
+            "msg": "Input should be greater than or equal to 1",
+            "input": "0",
+        },
+        InvalidEntityIdError,
+        id="entity_id_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "enum",
+            "loc": ("query", "entityType"),
+            "msg": "Input should be 'alliance' or 'user'",
+            "input": "fleet",
+        },
+        InvalidEntityTypeError,
+        id="entity_type_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "enum",
+            "loc": ("query", "eventTypes", 1),
+            "msg": "Input should be a valid event type",
+            "input": "promoted",
+        },
+        InvalidEventTypeError,
+        id="event_types_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "string_too_short",
+            "loc": ("query", "name"),
+            "msg": "String should have at least 1 character",
+            "input": "",
+        },
+        InvalidNameError,
+        id="name_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "enum",
+            "loc": ("query", "mode"),
+            "msg": "Input should be 'prefix', 'similar' or 'substring'",
+            "input": "exact",
+        },
+        InvalidSearchModeError,
+        id="mode_invalid",
+    ),
+    pytest.param(
+        {
+            "type": "less_than_equal",
+            "loc": ("query", "buckets"),
+            "msg": "Input should be less than or equal to 1000",
+            "input": "1001",
+        },
+        InvalidBucketsError,
+        id="buckets_invalid",
+    ),
     pytest.param(
         {
             "type": "query parameter",
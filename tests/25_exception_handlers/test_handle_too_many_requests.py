@@ -0,0 +1,38 @@
+import json
+
+import pytest
+from fastapi import Request, status
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import URL
+
+from src.api.exception_handlers import handle_too_many_requests
+from src.api.models.enums import ErrorCode
+from src.api.models.exceptions import TooManyRequestsError
+
+
+class RequestMock(Request):
+    def __init__(self):
+        pass
+
+    @property
+    def url(self) -> URL:
+        return URL("https://example.com/collections/1")
+
+
+test_cases = [
+    # retry_after
+    pytest.param(1, id="one_second"),
+    pytest.param(17, id="many_seconds"),
+]
+"""retry_after"""
+
+
+@pytest.mark.parametrize(["retry_after"], test_cases)
+async def test_handle_too_many_requests(retry_after: int):
+    exception = TooManyRequestsError("Slow down.", retry_after=retry_after)
+
+    response = await handle_too_many_requests(RequestMock(), exception)
+    assert isinstance(response, ORJSONResponse)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == str(retry_after)
+    assert json.loads(response.body)["code"] == ErrorCode.RATE_LIMITED
@@ -1,3 +1,4 @@
+from typing import Any
 from unittest import mock
 
 import pytest
@@ -5,7 +6,47 @@ from fastapi.exceptions import RequestValidationError
 
 from src.api.exception_handlers import _raise_body_parameter_error
 from src.api.models.error import RequestValidationErrorOut
-from src.api.models.exceptions import ServerError
+from src.api.models.exceptions import ApiError, InvalidAllianceIdError, InvalidUserIdError, ServerError
+
+
+test_cases_id_lists = [
+    # error, expected_exception
+    pytest.param(
+        {"type": "missing", "loc": ("body", "allianceIds"), "msg": "Field required", "input": None},
+        InvalidAllianceIdError,
+        id="alliance_ids_missing",
+    ),
+    pytest.param(
+        {"type": "too_long", "loc": ("body", "allianceIds"), "msg": "List should have at most 100 items after validation", "input": [1] * 101},
+        InvalidAllianceIdError,
+        id="alliance_ids_too_long",
+    ),
+    pytest.param(
+        {"type": "greater_than_equal", "loc": ("body", "allianceIds", 1), "msg": "Input should be greater than or equal to 1", "input": 0},
+        InvalidAllianceIdError,
+        id="alliance_ids_value_invalid",
+    ),
+    pytest.param(
+        {"type": "too_short", "loc": ("body", "userIds"), "msg": "List should have at least 1 item after validation", "input": []},
+        InvalidUserIdError,
+        id="user_ids_empty",
+    ),
+    pytest.param(
+        {"type": "int_parsing", "loc": ("body", "userIds", 0), "msg": "Input should be a valid integer", "input": "abc"},
+        InvalidUserIdError,
+        id="user_ids_value_invalid",
+    ),
+]
+"""error, expected_exception"""
+
+
+@pytest.mark.parametrize(["error", "expected_exception"], test_cases_id_lists)
+def test__raise_body_parameter_error_id_lists(error: dict[str, Any], expected_exception: ApiError):
+    exc = RequestValidationError([error])
+    raised_error = RequestValidationErrorOut(**error)
+
+    with pytest.raises(expected_exception):
+        _raise_body_parameter_error(raised_error, exc)
 
 
 def test__raise_body_parameter_error_raises_server_error_on_onhandled_validation_error():
@@ -0,0 +1,72 @@
+from contextlib import AbstractContextManager
+from datetime import datetime
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.api.models.exceptions import InvalidCursorError
+from src.api.routers import dependencies, pagination
+from src.api.utils import encode_cursor
+
+
+test_cases_invalid = [
+    # cursor, desc, expected_exception
+    pytest.param("invalid", False, pytest.raises(InvalidCursorError), id="invalid"),
+    pytest.param(encode_cursor(datetime(2024, 1, 1), True), False, pytest.raises(InvalidCursorError), id="desc_mismatch"),
+]
+
+test_cases_valid = [
+    # cursor, desc, expected_result
+    pytest.param(None, False, None, id="none"),
+    pytest.param("", False, None, id="empty"),
+    pytest.param(encode_cursor(datetime(2024, 1, 1, 23, 59), False), False, datetime(2024, 1, 1, 23, 59), id="asc"),
+    pytest.param(encode_cursor(datetime(2024, 1, 1, 23, 59), True), True, datetime(2024, 1, 1, 23, 59), id="desc"),
+]
+
+test_cases_next_page_headers = [
+    # page_size, take, expected_header
+    pytest.param(0, 2, False, id="empty_page"),
+    pytest.param(1, 2, False, id="last_page"),
+    pytest.param(2, 2, True, id="full_page"),
+]
+
+
+@pytest.mark.parametrize(["cursor", "desc", "expected_exception"], test_cases_invalid)
+async def test_cursor_parameter_invalid(cursor: str, desc: bool, expected_exception: AbstractContextManager):
+    with expected_exception:
+        _ = await dependencies.cursor_parameter(dependencies.ListFilter(desc=desc), cursor)
+
+
+@pytest.mark.parametrize(["cursor", "desc", "expected_result"], test_cases_valid)
+async def test_cursor_parameter_valid(cursor: str | None, desc: bool, expected_result: datetime | None):
+    result = await dependencies.cursor_parameter(dependencies.ListFilter(desc=desc), cursor)
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(["page_size", "take", "expected_header"], test_cases_next_page_headers)
+async def test_add_next_page_headers(page_size: int, take: int, expected_header: bool):
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("test", 80),
+            "path": "/collections/",
+            "query_string": b"skip=5&take=2",
+            "headers": [],
+        }
+    )
+    response = Response()
+    collected_ats = [datetime(2024, 1, 1, hour, 59) for hour in range(page_size)]
+
+    pagination.add_next_page_headers(request, response, collected_ats, take, False)
+
+    if not expected_header:
+        assert pagination.NEXT_CURSOR_HEADER not in response.headers
+        assert "Link" not in response.headers
+        return
+
+    cursor = response.headers[pagination.NEXT_CURSOR_HEADER]
+    assert await dependencies.cursor_parameter(dependencies.ListFilter(desc=False), cursor) == collected_ats[-1]
+    assert response.headers["Link"] == f'<http://test/collections/?take=2&cursor={cursor}>; rel="next"'
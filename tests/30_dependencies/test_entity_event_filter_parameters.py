@@ -0,0 +1,54 @@
+import pytest
+
+from src.api.models.enums import EntityEventType, EntityType
+from src.api.models.exceptions import InvalidEntityIdError
+from src.api.routers import dependencies
+
+
+test_cases_valid = [
+    # entity_type, entity_id, event_types, expected_event_types
+    pytest.param(
+        None,
+        None,
+        None,
+        [],
+        id="none",
+    ),
+    pytest.param(
+        EntityType.USER,
+        None,
+        None,
+        [],
+        id="only_entity_type",
+    ),
+    pytest.param(
+        EntityType.ALLIANCE,
+        1,
+        None,
+        [],
+        id="entity_type_and_entity_id",
+    ),
+    pytest.param(
+        None,
+        None,
+        [EntityEventType.RENAMED, EntityEventType.JOINED_ALLIANCE, EntityEventType.RENAMED],
+        [EntityEventType.RENAMED, EntityEventType.JOINED_ALLIANCE],
+        id="event_types_without_duplicates",
+    ),
+]
+"""entity_type, entity_id, event_types, expected_event_types"""
+
+
+async def test_entity_event_filter_parameters_entity_id_without_entity_type():
+    with pytest.raises(InvalidEntityIdError):
+        _ = await dependencies.entity_event_filter_parameters(entity_type=None, entity_id=1, event_types=None)
+
+
+@pytest.mark.parametrize(["entity_type", "entity_id", "event_types", "expected_event_types"], test_cases_valid)
+async def test_entity_event_filter_parameters_valid(
+    entity_type: EntityType | None, entity_id: int | None, event_types: list[EntityEventType] | None, expected_event_types: list[EntityEventType]
+):
+    event_filter = await dependencies.entity_event_filter_parameters(entity_type=entity_type, entity_id=entity_id, event_types=event_types)
+    assert event_filter.entity_type == entity_type
+    assert event_filter.entity_id == entity_id
+    assert event_filter.event_types == expected_event_types
@@ -0,0 +1,94 @@
+import dataclasses
+
+import pytest
+from fastapi import Request
+
+from src.api import rate_limiting
+from src.api.config import SETTINGS
+from src.api.models.enums import OperationId
+from src.api.models.exceptions import TooManyRequestsError
+from src.api.routers import dependencies
+
+
+class RouteMock:
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+
+def _create_request(operation_id: str, client_host: str = "127.0.0.1", forwarded_for: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/collections/1",
+        "query_string": b"",
+        "headers": headers,
+        "client": (client_host, 12345),
+        "server": ("testserver", 80),
+        "scheme": "http",
+        "route": RouteMock(operation_id),
+    }
+    return Request(scope)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def rate_limit_settings(monkeypatch):
+    settings = dataclasses.replace(
+        SETTINGS,
+        rate_limit_enabled=True,
+        rate_limit_capacity=100,
+        rate_limit_refill_rate=1.0,
+        rate_limit_trusted_proxies=("127.0.0.1", "10.1.0.0/16"),
+    )
+    monkeypatch.setattr(dependencies, "SETTINGS", settings)
+    monkeypatch.setattr(rate_limiting, "SETTINGS", settings)
+    monkeypatch.setattr(rate_limiting, "BACKEND", rate_limiting.InMemoryRateLimitBackend())
+    monkeypatch.setattr(rate_limiting, "COST_BY_OPERATION_ID", {OperationId.GET_COLLECTION: 50, OperationId.GET_PING: 1})
+
+
+test_cases_client_key = [
+    # client_host, forwarded_for, expected_client_key
+    pytest.param("127.0.0.1", None, "127.0.0.1", id="client_host"),
+    pytest.param("127.0.0.1", "10.0.0.1", "10.0.0.1", id="forwarded_for"),
+    pytest.param("127.0.0.1", "10.0.0.1, 10.0.0.2", "10.0.0.2", id="forwarded_for_multiple"),
+    pytest.param("127.0.0.1", "10.0.0.1, 10.0.0.2, 10.1.0.1", "10.0.0.2", id="forwarded_for_multiple_proxies"),
+    pytest.param("127.0.0.1", "10.1.0.1", "10.1.0.1", id="forwarded_for_only_proxies"),
+    pytest.param("192.168.0.1", "10.0.0.1", "192.168.0.1", id="forwarded_for_untrusted_peer"),
+]
+"""client_host, forwarded_for, expected_client_key"""
+
+
+@pytest.mark.parametrize(["client_host", "forwarded_for", "expected_client_key"], test_cases_client_key)
+def test_get_client_key(client_host: str, forwarded_for: str | None, expected_client_key: str):
+    request = _create_request(OperationId.GET_PING, client_host, forwarded_for)
+    assert dependencies._get_client_key(request) == expected_client_key
+
+
+async def test_rate_limit_weighted_cost():
+    await dependencies.rate_limit(_create_request(OperationId.GET_COLLECTION))
+    await dependencies.rate_limit(_create_request(OperationId.GET_COLLECTION))
+
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        await dependencies.rate_limit(_create_request(OperationId.GET_COLLECTION))
+    assert exc_info.value.retry_after == 50
+
+
+async def test_rate_limit_cheap_requests_pass_after_expensive_ones():
+    await dependencies.rate_limit(_create_request(OperationId.GET_COLLECTION))
+    for _ in range(50):
+        await dependencies.rate_limit(_create_request(OperationId.GET_PING))
+
+    with pytest.raises(TooManyRequestsError):
+        await dependencies.rate_limit(_create_request(OperationId.GET_PING))
+
+
+async def test_rate_limit_separate_clients():
+    await dependencies.rate_limit(_create_request(OperationId.GET_COLLECTION, "10.0.0.1"))
+    await dependencies.rate_limit(_create_request(OperationId.GET_COLLECTION, "10.0.0.1"))
+    await dependencies.rate_limit(_create_request(OperationId.GET_COLLECTION, "10.0.0.2"))
+
+
+async def test_rate_limit_disabled(monkeypatch):
+    monkeypatch.setattr(dependencies, "SETTINGS", dataclasses.replace(SETTINGS, rate_limit_enabled=False))
+    for _ in range(10):
+        await dependencies.rate_limit(_create_request(OperationId.GET_COLLECTION))
@@ -0,0 +1,177 @@
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+from src.api import snapshot
+from src.api.database import db
+from src.api.database.models import CollectionDB
+from src.api.models.converters import FromDB
+from src.api.snapshot import CollectionSnapshot, ColumnTable, SharedSnapshot
+from tests import conftest
+
+
+test_cases_find_row = [
+    # row_id, expected_result
+    pytest.param(1, 0, id="first"),
+    pytest.param(5, 2, id="last"),
+    pytest.param(3, 1, id="middle"),
+    pytest.param(2, None, id="missing_between"),
+    pytest.param(6, None, id="missing_after"),
+    pytest.param(0, None, id="missing_before"),
+]
+"""row_id, expected_result"""
+
+test_cases_top_users = [
+    # skip, take
+    pytest.param(0, 100, id="first_page"),
+    pytest.param(2, 3, id="skip_and_take"),
+    pytest.param(0, 0, id="take_none"),
+    pytest.param(10_000, 100, id="skip_all"),
+]
+"""skip, take"""
+
+
+@pytest.fixture(scope="module")
+def collection() -> CollectionDB:
+    return _create_collection(1)
+
+
+@pytest.fixture(scope="module")
+def shared_snapshot(collection: CollectionDB, tmp_path_factory: pytest.TempPathFactory) -> SharedSnapshot:
+    older_collection = _create_collection(2)
+    older_collection.collected_at -= timedelta(hours=1)
+    return conftest._create_shared_snapshot(tmp_path_factory.mktemp("snapshot"), [older_collection, collection])
+
+
+@pytest.fixture(scope="module")
+def collection_snapshot(shared_snapshot: SharedSnapshot) -> CollectionSnapshot:
+    return shared_snapshot.latest
+
+
+# ----- Test functions -----
+
+
+@pytest.mark.parametrize(["row_id", "expected_result"], test_cases_find_row)
+def test_column_table_find_row(row_id: int, expected_result: int | None):
+    batch = pa.RecordBatch.from_pydict({"id": pa.array([1, 3, 5], type=pa.int32()), "name": ["a", None, "c"]})
+    table = ColumnTable(batch, 2)
+    assert table.find_row(row_id) == expected_result
+
+
+def test_column_table_get_rows():
+    batch = pa.RecordBatch.from_pydict({"id": pa.array([1, 3, 5], type=pa.int32()), "name": ["a", None, "c"], "index": [2, 1, 0]})
+    table = ColumnTable(batch, 2)
+    assert table.get_rows() == [(1, "a"), (3, None), (5, "c")]
+    assert table.get_rows(batch.column("index").to_numpy()) == [(5, "c"), (3, None), (1, "a")]
+    assert table.get_row(1) == (3, None)
+
+
+def test_read_snapshot(shared_snapshot: SharedSnapshot, tmp_path: Path):
+    assert list(shared_snapshot.collections) == [1, 2]
+    assert shared_snapshot.latest.collection_id == 1
+    assert shared_snapshot.get_collection(3) is None
+    assert snapshot.read_snapshot(tmp_path) is None
+
+
+def test_read_snapshot_unchanged_version(collection: CollectionDB, tmp_path: Path):
+    shared_snapshot = conftest._create_shared_snapshot(tmp_path, [collection])
+    assert snapshot.read_snapshot(tmp_path, shared_snapshot) is shared_snapshot
+    assert snapshot.read_snapshot(tmp_path) is not shared_snapshot
+
+
+def test_write_version_keeps_previous_version(collection: CollectionDB, tmp_path: Path):
+    shared_snapshot = conftest._create_shared_snapshot(tmp_path, [collection])
+    batches = (shared_snapshot.latest.alliances.batch, shared_snapshot.latest.users.batch)
+    for version in ("v2", "v3"):
+        snapshot._write_version(tmp_path, version, shared_snapshot.catalog, [1], [batches[0]], [batches[1]])
+
+    assert sorted(path.name for path in tmp_path.glob("v*")) == ["v2", "v3"]
+    assert snapshot.read_snapshot(tmp_path).version == "v3"
+    assert snapshot.read_snapshot(tmp_path).latest.to_collection() == shared_snapshot.latest.to_collection()
+
+
+def test_get_collection_metadata(collection: CollectionDB, shared_snapshot: SharedSnapshot):
+    assert shared_snapshot.get_collection_metadata(1) == FromDB.to_collection_metadata(collection)
+    assert shared_snapshot.get_collection_metadata(2).collection_id == 2
+    assert shared_snapshot.get_collection_metadata(3) is None
+
+
+def test_to_collection(collection: CollectionDB, collection_snapshot: CollectionSnapshot):
+    expected_alliances = sorted(FromDB.to_alliance(alliance) for alliance in collection.alliances)
+    expected_users = sorted(FromDB.to_user(user) for user in collection.users)
+
+    result = collection_snapshot.to_collection()
+    assert result.meta == FromDB.to_collection_metadata(collection)
+    assert result.fleets == expected_alliances
+    assert result.users == expected_users
+    assert collection_snapshot.to_collection_with_fleets().fleets == expected_alliances
+    assert collection_snapshot.to_collection_with_users().users == expected_users
+
+
+def test_to_collection_with_fleets_by_division(collection: CollectionDB, collection_snapshot: CollectionSnapshot):
+    division_design_id = next(alliance.division_design_id for alliance in collection.alliances if alliance.division_design_id is not None)
+    expected_alliances = sorted(
+        FromDB.to_alliance(alliance) for alliance in collection.alliances if alliance.division_design_id == division_design_id
+    )
+
+    result = collection_snapshot.to_collection_with_fleets(division_design_id)
+    assert result.meta == FromDB.to_collection_metadata(collection)
+    assert result.fleets == expected_alliances
+
+
+def test_get_alliance_and_user(collection: CollectionDB, collection_snapshot: CollectionSnapshot):
+    for alliance in collection.alliances:
+        assert collection_snapshot.get_alliance(alliance.alliance_id) == FromDB.to_alliance(alliance)
+    for user in collection.users:
+        assert collection_snapshot.get_user(user.user_id) == FromDB.to_user(user)
+
+
+def test_to_alliance_history(collection: CollectionDB, collection_snapshot: CollectionSnapshot):
+    alliance = collection.alliances[0]
+    expected_users = sorted(FromDB.to_user(user) for user in collection.users if user.alliance_id == alliance.alliance_id)
+
+    result = collection_snapshot.to_alliance_history(alliance.alliance_id)
+    assert result.collection == collection_snapshot.meta
+    assert result.fleet == FromDB.to_alliance(alliance)
+    assert result.users == expected_users
+
+
+def test_to_user_history(collection: CollectionDB, collection_snapshot: CollectionSnapshot):
+    user = next(user for user in collection.users if user.alliance_id)
+    alliance = next(alliance for alliance in collection.alliances if alliance.alliance_id == user.alliance_id)
+
+    result = collection_snapshot.to_user_history(user.user_id)
+    assert result.collection == collection_snapshot.meta
+    assert result.user == FromDB.to_user(user)
+    assert result.fleet == FromDB.to_alliance(alliance)
+
+
+@pytest.mark.parametrize(["skip", "take"], test_cases_top_users)
+def test_to_collection_with_top_users(skip: int, take: int, collection: CollectionDB, collection_snapshot: CollectionSnapshot):
+    users = sorted(FromDB.to_user(user) for user in collection.users)
+    expected_users = sorted(users, key=lambda user: user[snapshot.USER_TROPHY_COLUMN], reverse=True)[skip : skip + take]
+
+    result = collection_snapshot.to_collection_with_top_users(skip, take)
+    assert result.meta == collection_snapshot.meta
+    assert result.users == expected_users
+
+
+def test_not_found(collection_snapshot: CollectionSnapshot):
+    assert collection_snapshot.get_alliance(0) is None
+    assert collection_snapshot.get_user(0) is None
+    assert collection_snapshot.get_alliance_members(0) == []
+    assert collection_snapshot.to_alliance_history(0) is None
+    assert collection_snapshot.to_user_history(0) is None
+
+
+# ----- Helper functions -----
+
+
+def _create_collection(collection_id: int) -> CollectionDB:
+    with open("tests/test_data/test_data.json", "r") as fp:
+        collection = db.create_collections_from_dummy_data(json.load(fp))[0]
+    collection.collection_id = collection_id
+    return collection
@@ -0,0 +1,115 @@
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import Table
+
+from src.api import export
+from src.api.database.models import AllianceDB, CollectionDB, UserDB
+from src.api.models.enums import ExportTable
+
+
+test_cases_get_month = [
+    # collected_at, expected_result
+    pytest.param(datetime(2024, 6, 1, 0, 0), "2024-06", id="first_hour_of_month"),
+    pytest.param(datetime(2024, 6, 30, 23, 59, 59), "2024-06", id="last_hour_of_month"),
+    pytest.param(datetime(2024, 12, 15, 12, 0), "2024-12", id="december"),
+]
+"""collected_at, expected_result"""
+
+test_cases_get_arrow_schema = [
+    # table
+    pytest.param(AllianceDB.__table__, id="alliances"),
+    pytest.param(CollectionDB.__table__, id="collections"),
+    pytest.param(UserDB.__table__, id="users"),
+]
+"""table"""
+
+
+@pytest.mark.parametrize(["collected_at", "expected_result"], test_cases_get_month)
+def test_get_month(collected_at: datetime, expected_result: str):
+    assert export.get_month(collected_at) == expected_result
+
+
+@pytest.mark.parametrize(["table"], test_cases_get_arrow_schema)
+def test_get_arrow_schema(table: Table):
+    schema = export.get_arrow_schema(table)
+    assert schema.names == [column.name for column in table.columns]
+    assert schema.field("collection_id").type == pa.int32()
+    assert not schema.field("collection_id").nullable
+
+
+def test_get_arrow_schema_types():
+    schema = export.get_arrow_schema(CollectionDB.__table__)
+    assert schema.field("collected_at").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("tournament_running").type == pa.bool_()
+    assert schema.field("duration").type == pa.float64()
+
+
+def test_to_record_batch():
+    schema = export.get_arrow_schema(CollectionDB.__table__)
+    rows = [
+        (1, 9, datetime(2024, 6, 1, 0, 0), 12.5, 100, 1000, False, None, None),
+        (2, 9, datetime(2024, 6, 1, 1, 0), 13.0, 100, 1000, True, 6, datetime(2024, 6, 2, 0, 0)),
+    ]
+
+    batch = export._to_record_batch(rows, schema)
+    assert batch.schema == schema
+    assert batch.num_rows == 2
+    assert batch.column("collection_id").to_pylist() == [1, 2]
+    assert batch.column("max_tournament_battle_attempts").to_pylist() == [None, 6]
+
+
+def test_get_export_files(tmp_path: Path):
+    assert export.get_export_files(tmp_path / "missing") == []
+
+    for month, table in (("2024-07", ExportTable.USERS), ("2024-06", ExportTable.USERS), ("2024-06", ExportTable.ALLIANCES)):
+        path = export.get_export_path(tmp_path, month, table)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(pa.table({"collection_id": [1, 2, 3]}), path)
+
+    export_files = export.get_export_files(tmp_path)
+    assert [(export_file.month, export_file.table, export_file.row_count) for export_file in export_files] == [
+        ("2024-06", ExportTable.ALLIANCES, 3),
+        ("2024-06", ExportTable.USERS, 3),
+        ("2024-07", ExportTable.USERS, 3),
+    ]
+    assert export.get_export_file(tmp_path, "2024-07", ExportTable.ALLIANCES) is None
+
+
+def test_get_exported_collections(tmp_path: Path):
+    assert export._get_exported_collections(tmp_path, "2024-06") == {}
+
+    schema = export.get_arrow_schema(CollectionDB.__table__)
+    rows = [
+        (1, 9, datetime(2024, 6, 1, 0, 0), 12.5, 100, 1000, False, None, None),
+        (2, 9, datetime(2024, 6, 1, 1, 0), 13.0, 100, 1000, True, 6, datetime(2024, 6, 2, 0, 0)),
+    ]
+    path = export.get_export_path(tmp_path, "2024-06", ExportTable.COLLECTIONS)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.Table.from_batches([export._to_record_batch(rows, schema)]), path)
+
+    assert export._get_exported_collections(tmp_path, "2024-06") == {1: None, 2: datetime(2024, 6, 2, 0, 0)}
+
+
+def test_get_exported_collections_without_modified_at(tmp_path: Path):
+    """Files exported before `modified_at` had been added are read as not modified."""
+    path = export.get_export_path(tmp_path, "2024-06", ExportTable.COLLECTIONS)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.table({"collection_id": pa.array([1, 2], type=pa.int32())}), path)
+
+    assert export._get_exported_collections(tmp_path, "2024-06") == {1: None, 2: None}
+
+
+def test_remove_deleted_months(tmp_path: Path):
+    export._remove_deleted_months(tmp_path / "missing", set())
+
+    for month in ("2024-06", "2024-07"):
+        path = export.get_export_path(tmp_path, month, ExportTable.USERS)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(pa.table({"collection_id": [1]}), path)
+
+    export._remove_deleted_months(tmp_path, {"2024-07"})
+    assert [export_file.month for export_file in export.get_export_files(tmp_path)] == ["2024-07"]
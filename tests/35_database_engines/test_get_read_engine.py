@@ -0,0 +1,100 @@
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.api.database import db
+
+
+def _create_engine(host: str) -> AsyncEngine:
+    return create_async_engine(f"postgresql+asyncpg://user:password@{host}:5432/pss-fleet-data")
+
+
+@pytest.fixture(scope="function")
+def primary(monkeypatch) -> AsyncEngine:
+    engine = _create_engine("primary")
+    monkeypatch.setattr(db, "ENGINE", engine)
+    return engine
+
+
+@pytest.fixture(scope="function")
+def replicas(monkeypatch) -> list[db.ReadReplica]:
+    replicas = [db.ReadReplica(engine=_create_engine("replica-1")), db.ReadReplica(engine=_create_engine("replica-2"))]
+    monkeypatch.setattr(db, "READ_REPLICAS", replicas)
+    return replicas
+
+
+def test_get_read_engine_without_replicas(primary: AsyncEngine, monkeypatch):
+    monkeypatch.setattr(db, "READ_REPLICAS", [])
+    assert db.get_read_engine() is primary
+
+
+def test_get_read_engine_rotates_healthy_replicas(primary: AsyncEngine, replicas: list[db.ReadReplica]):
+    engines = {db.get_read_engine() for _ in range(4)}
+    assert engines == {replica.engine for replica in replicas}
+
+
+def test_get_read_engine_skips_unhealthy_replicas(primary: AsyncEngine, replicas: list[db.ReadReplica]):
+    replicas[0].healthy = False
+    assert all(db.get_read_engine() is replicas[1].engine for _ in range(4))
+
+
+def test_get_read_engine_falls_back_to_primary(primary: AsyncEngine, replicas: list[db.ReadReplica]):
+    for replica in replicas:
+        replica.healthy = False
+    assert db.get_read_engine() is primary
+
+
+def test_get_read_engine_pinned_primary(primary: AsyncEngine, replicas: list[db.ReadReplica]):
+    assert db.get_read_engine(time.time() + 60.0) is primary
+
+
+def test_get_read_engine_pin_expired(primary: AsyncEngine, replicas: list[db.ReadReplica]):
+    assert db.get_read_engine(time.time() - 1.0) is not primary
+
+
+def _create_request(cookie: str | None) -> Request:
+    headers = [(b"cookie", f"{db.READ_YOUR_WRITES_COOKIE}={cookie}".encode())] if cookie is not None else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    ["cookie", "expected_pinned"],
+    [
+        pytest.param(None, False, id="missing"),
+        pytest.param("invalid", False, id="invalid"),
+        pytest.param("0", False, id="expired"),
+        pytest.param(str(time.time() + 3600.0), True, id="valid"),
+    ],
+)
+def test_get_primary_pinned_until(cookie: str | None, expected_pinned: bool):
+    """Reads the pin from the cookie and caps it to the read-your-writes window."""
+    now = time.time()
+    pinned_until = db._get_primary_pinned_until(_create_request(cookie))
+    assert (pinned_until > now) == expected_pinned
+    assert pinned_until <= time.time() + db.SETTINGS.read_your_writes_window
+
+
+@pytest.mark.parametrize(
+    ["method", "committed", "expected_cookie"],
+    [
+        pytest.param("POST", True, True, id="write_committed"),
+        pytest.param("POST", False, False, id="write_not_committed"),
+        pytest.param("GET", True, False, id="read"),
+    ],
+)
+def test_read_your_writes_middleware(replicas: list[db.ReadReplica], method: str, committed: bool, expected_cookie: bool):
+    """Sets the cookie only on responses to requests, which committed a write."""
+    app = FastAPI()
+    app.add_middleware(db.ReadYourWritesMiddleware)
+
+    @app.api_route("/", methods=["GET", "POST"])
+    async def endpoint():
+        if committed:
+            db._pin_primary(None)
+        return {}
+
+    response = TestClient(app).request(method, "/")
+    assert (db.READ_YOUR_WRITES_COOKIE in response.cookies) == expected_cookie
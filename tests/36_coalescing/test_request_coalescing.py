@@ -0,0 +1,146 @@
+import asyncio
+import dataclasses
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from src.api import server_timing
+from src.api.coalescing import RequestCoalescingMiddleware, SingleFlight
+from src.api.config import SETTINGS
+from src.api.database import db
+from src.api.routers import dependencies
+
+
+@pytest.fixture(scope="function")
+def calls() -> list[str]:
+    return []
+
+
+@pytest.fixture(scope="function")
+def client(calls: list[str], monkeypatch) -> AsyncClient:
+    monkeypatch.setattr(server_timing, "SETTINGS", dataclasses.replace(SETTINGS, server_timing_enabled=True))
+
+    app = FastAPI()
+    app.add_middleware(RequestCoalescingMiddleware)
+    app.add_middleware(GZipMiddleware, minimum_size=1)
+    app.add_middleware(server_timing.ServerTimingMiddleware)
+
+    @app.get("/collections/{collectionId}/top100Users")
+    async def get_top_100(collectionId: int, skip: int = 0, take: int = 100) -> dict:
+        calls.append(f"{collectionId}:{skip}:{take}")
+        await asyncio.sleep(0.05)
+        return {"collectionId": collectionId, "skip": skip, "take": take, "call": len(calls)}
+
+    @app.get("/collections/{collectionId}/diff/{otherId}")
+    async def get_diff(collectionId: int, otherId: int) -> StreamingResponse:
+        calls.append(f"{collectionId}:{otherId}")
+
+        async def content():
+            await asyncio.sleep(0.05)
+            yield b"[]"
+
+        return StreamingResponse(content(), media_type="application/json")
+
+    @app.post("/collections")
+    async def create_collection() -> dict:
+        calls.append("post")
+        await asyncio.sleep(0.05)
+        return {"call": len(calls)}
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+test_cases = [
+    # urls, expected_call_count
+    pytest.param(["/collections/1/top100Users"] * 5, 1, id="identical"),
+    pytest.param(["/collections/1/top100Users?skip=0&take=10", "/collections/1/top100Users?take=10&skip=0"], 1, id="reordered_query"),
+    pytest.param(["/collections/1/top100Users", "/collections/2/top100Users"], 2, id="different_path_params"),
+    pytest.param(["/collections/1/top100Users?take=10", "/collections/1/top100Users?take=20"], 2, id="different_query_params"),
+]
+"""urls, expected_call_count"""
+
+
+@pytest.mark.parametrize(["urls", "expected_call_count"], test_cases)
+async def test_request_coalescing(client: AsyncClient, calls: list[str], urls: list[str], expected_call_count: int):
+    responses = await asyncio.gather(*(client.get(url) for url in urls))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len(calls) == expected_call_count
+    if expected_call_count == 1:
+        assert len({response.content for response in responses}) == 1
+
+
+async def test_request_coalescing_copies_messages(client: AsyncClient, calls: list[str]):
+    """Each coalesced response is compressed and timed on its own, according to the request."""
+    responses = await asyncio.gather(
+        *(
+            client.get("/collections/1/top100Users", headers={"Accept-Encoding": accept_encoding})
+            for accept_encoding in ["identity", "gzip", "gzip", "gzip"]
+        )
+    )
+
+    assert len(calls) == 2
+    assert "Content-Encoding" not in responses[0].headers
+    assert all(response.headers["Content-Encoding"] == "gzip" for response in responses[1:])
+    assert all(len(response.headers.get_list("Server-Timing")) == 1 for response in responses)
+    assert len({response.content for response in responses}) == 1
+
+
+async def test_request_coalescing_ignores_streaming_responses(client: AsyncClient, calls: list[str]):
+    responses = await asyncio.gather(client.get("/collections/1/diff/2"), client.get("/collections/1/diff/2"))
+    assert all(response.content == b"[]" for response in responses)
+    assert len(calls) == 2
+
+
+async def test_request_coalescing_ignores_primary_pinned_clients(client: AsyncClient, calls: list[str]):
+    await asyncio.gather(
+        client.get("/collections/1/top100Users"), client.get("/collections/1/top100Users", headers={"Cookie": f"{db.READ_YOUR_WRITES_COOKIE}=1"})
+    )
+    assert len(calls) == 2
+
+
+async def test_request_coalescing_charges_only_joined_requests(client: AsyncClient, calls: list[str], monkeypatch):
+    """A joined request is charged once, even if the first request finishes while the rate limit is being checked."""
+    charged_routes = []
+
+    async def mock_rate_limit(request: Request):
+        charged_routes.append(request.scope["route"].path)
+        await asyncio.sleep(0.1)
+
+    monkeypatch.setattr(dependencies, dependencies.rate_limit.__name__, mock_rate_limit)
+
+    responses = await asyncio.gather(*(client.get("/collections/1/top100Users") for _ in range(3)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len(calls) == 1
+    assert charged_routes == ["/collections/{collectionId}/top100Users"] * 2
+
+
+async def test_request_coalescing_sequential(client: AsyncClient, calls: list[str]):
+    await client.get("/collections/1/top100Users")
+    await client.get("/collections/1/top100Users")
+    assert len(calls) == 2
+
+
+async def test_request_coalescing_ignores_post(client: AsyncClient, calls: list[str]):
+    await asyncio.gather(client.post("/collections"), client.post("/collections"))
+    assert len(calls) == 2
+
+
+async def test_single_flight_shares_exception():
+    single_flight = SingleFlight()
+    call_count = 0
+
+    async def fail():
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("Oops.")
+
+    results = await asyncio.gather(single_flight.do("key", fail), single_flight.do("key", fail), return_exceptions=True)
+    assert call_count == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not single_flight.is_in_flight("key")
@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from src.api import metrics
+from src.api.coalescing import RequestCoalescingMiddleware
+
+
+test_cases_sql_operation = [
+    # statement, expected_operation
+    pytest.param("SELECT 1", "SELECT", id="select"),
+    pytest.param("\n        select count(*) from pss_user", "SELECT", id="select_lowercase_indented"),
+    pytest.param("INSERT INTO collection (collected_at) VALUES ($1)", "INSERT", id="insert"),
+    pytest.param("UPDATE pss_user SET trophy = $1", "UPDATE", id="update"),
+    pytest.param("DELETE FROM collection WHERE collection_id = $1", "DELETE", id="delete"),
+    pytest.param("WITH cte AS (SELECT 1) SELECT * FROM cte", "WITH", id="with"),
+    pytest.param("BEGIN", "OTHER", id="other"),
+]
+"""statement, expected_operation"""
+
+
+@pytest.mark.parametrize(["statement", "expected_operation"], test_cases_sql_operation)
+def test_get_sql_operation(statement: str, expected_operation: str):
+    assert metrics.get_sql_operation(statement) == expected_operation
+
+
+async def test_metrics_middleware():
+    app = FastAPI()
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    @app.get("/metrics-test/{itemId}")
+    async def get_item(itemId: int) -> dict:
+        return {"itemId": itemId}
+
+    labels = {"method": "GET", "route": "/metrics-test/{itemId}", "status": "200"}
+    count_before = REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_http_request_duration_seconds_count", labels) or 0
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/metrics-test/1")
+        await client.get("/metrics-test/2")
+
+    count_after = REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_http_request_duration_seconds_count", labels)
+    assert count_after == count_before + 2
+    size_sum = REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_http_response_size_bytes_sum", {"method": "GET", "route": labels["route"]})
+    assert size_sum >= len(b'{"itemId":1}') * 2
+    assert REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_http_requests_in_flight") == 0
+
+
+async def test_metrics_middleware_coalesced_requests():
+    app = FastAPI()
+    app.add_middleware(RequestCoalescingMiddleware)
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    @app.get("/metrics-test/coalesced/{itemId}")
+    async def get_item(itemId: int) -> dict:
+        await asyncio.sleep(0.05)
+        return {"itemId": itemId}
+
+    labels = {"method": "GET", "route": "/metrics-test/coalesced/{itemId}", "status": "200"}
+    count_before = REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_http_request_duration_seconds_count", labels) or 0
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await asyncio.gather(*(client.get("/metrics-test/coalesced/1") for _ in range(3)))
+
+    assert REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_http_request_duration_seconds_count", labels) == count_before + 3
+
+
+def test_observe_ingest():
+    users_before = REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_ingested_rows_total", {"table": "pss_user"}) or 0
+
+    metrics.observe_ingest({"collection": 1, "pss_alliance": 99, "pss_user": 100}, 2.0)
+
+    assert REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_ingested_rows_total", {"table": "pss_user"}) == users_before + 100
+    assert REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_ingest_rows_per_second") == 100.0
+    assert b"pss_fleet_data_api_ingested_rows_total" in metrics.generate_metrics()
+
+
+def test_instrument_engine():
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(SimpleNamespace(sync_engine=engine), "test")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_db_pool_checked_out_connections", {"database": "test"}) == 1
+
+    labels = {"database": "test", "operation": "SELECT"}
+    assert REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_db_query_duration_seconds_count", labels) == 1
+    assert REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_db_pool_checked_out_connections", {"database": "test"}) == 0
+    assert REGISTRY.get_sample_value(f"{metrics.METRICS_PREFIX}_db_pool_connections", {"database": "test"}) == 1
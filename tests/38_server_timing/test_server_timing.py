@@ -0,0 +1,97 @@
+import dataclasses
+import re
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+
+from src.api import server_timing
+from src.api.config import SETTINGS
+
+
+@pytest.fixture(scope="function")
+def client() -> AsyncClient:
+    app = FastAPI()
+    app.add_middleware(server_timing.ServerTimingMiddleware)
+
+    @app.get("/history")
+    async def get_history() -> list[int]:
+        with server_timing.phase("has_user_history"):
+            pass
+        with server_timing.phase("query"):
+            pass
+        with server_timing.phase("query"):
+            pass
+        return [1, 2, 3]
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+test_cases = [
+    # server_timing_enabled, root_api_key, headers, expected_header
+    pytest.param(True, None, {}, True, id="enabled_by_setting"),
+    pytest.param(False, None, {}, False, id="disabled"),
+    pytest.param(False, None, {"X-Server-Timing": "true"}, True, id="requested_without_root_api_key"),
+    pytest.param(False, "abcdef", {"X-Server-Timing": "true", "Authorization": "abcdef"}, True, id="requested_by_trusted_client"),
+    pytest.param(False, "abcdef", {"X-Server-Timing": "true", "Authorization": "xyz"}, False, id="requested_by_untrusted_client"),
+    pytest.param(False, "abcdef", {"X-Server-Timing": "true"}, False, id="requested_without_authorization"),
+]
+"""server_timing_enabled, root_api_key, headers, expected_header"""
+
+
+@pytest.mark.parametrize(["server_timing_enabled", "root_api_key", "headers", "expected_header"], test_cases)
+async def test_server_timing_enabled(
+    client: AsyncClient, monkeypatch, server_timing_enabled: bool, root_api_key: str | None, headers: dict[str, str], expected_header: bool
+):
+    monkeypatch.setattr(
+        server_timing, "SETTINGS", dataclasses.replace(SETTINGS, server_timing_enabled=server_timing_enabled, root_api_key=root_api_key)
+    )
+
+    response = await client.get("/history", headers=headers)
+    assert response.status_code == 200
+    assert ("Server-Timing" in response.headers) == expected_header
+
+
+async def test_server_timing_header(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(server_timing, "SETTINGS", dataclasses.replace(SETTINGS, server_timing_enabled=True))
+
+    response = await client.get("/history")
+    entries = [entry.split(";")[0] for entry in response.headers["Server-Timing"].split(", ")]
+    assert entries == ["has_user_history", "query", "serialize", "sql", "total"]
+    assert re.search(r'sql;dur=\d+\.\d{2};desc="0 statements"', response.headers["Server-Timing"])
+
+
+def test_phase_without_server_timing():
+    with server_timing.phase("query"):
+        result = 1
+    assert result == 1
+
+
+def test_to_header_value():
+    timing = server_timing.ServerTiming(sql_count=3, sql_duration=0.0125)
+    timing.add_phase("get_collections", 0.002)
+    timing.add_phase("get_collections", 0.001)
+
+    assert timing.to_header_value(0.05) == 'get_collections;dur=3.00, sql;dur=12.50;desc="3 statements", total;dur=50.00'
+
+
+def test_instrument_engine():
+    engine = create_engine("sqlite://")
+    server_timing.instrument_engine(SimpleNamespace(sync_engine=engine))
+    timing = server_timing.ServerTiming()
+
+    token = server_timing._CURRENT.set(timing)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+    finally:
+        server_timing._CURRENT.reset(token)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 3"))
+
+    assert timing.sql_count == 2
+    assert timing.sql_duration > 0
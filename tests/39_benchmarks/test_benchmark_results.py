@@ -0,0 +1,51 @@
+import pytest
+
+from benchmarks.results import BenchmarkResult, compare_results, load_results, percentile, save_results
+
+
+test_cases_percentile = [
+    # values, p, expected_result
+    pytest.param([], 50, 0.0, id="empty"),
+    pytest.param([1.0], 99, 1.0, id="single_value"),
+    pytest.param([1.0, 2.0, 3.0, 4.0, 5.0], 50, 3.0, id="median"),
+    pytest.param([1.0, 2.0, 3.0, 4.0], 50, 2.5, id="median_interpolated"),
+    pytest.param([1.0, 2.0, 3.0, 4.0, 5.0], 100, 5.0, id="max"),
+    pytest.param([1.0, 2.0, 3.0, 4.0, 5.0], 0, 1.0, id="min"),
+]
+"""values, p, expected_result"""
+
+
+@pytest.mark.parametrize(["values", "p", "expected_result"], test_cases_percentile)
+def test_percentile(values: list[float], p: float, expected_result: float):
+    assert percentile(values, p) == pytest.approx(expected_result)
+
+
+def test_benchmark_result_from_durations():
+    result = BenchmarkResult.from_durations("get_collection", [0.3, 0.1, 0.2], rows=600)
+    assert result.iterations == 3
+    assert result.p50_ms == pytest.approx(200.0)
+    assert result.max_ms == pytest.approx(300.0)
+    assert result.rows_per_second == pytest.approx(1000.0)
+    assert result.throughput == pytest.approx(5.0)
+
+
+def test_save_and_load_results(tmp_path):
+    file_path = str(tmp_path / "results.json")
+    results = [BenchmarkResult.from_durations("get_collection", [0.1, 0.2], rows=10)]
+
+    save_results(file_path, {"commit": "abc123"}, results)
+    metadata, loaded_results = load_results(file_path)
+
+    assert metadata == {"commit": "abc123"}
+    assert loaded_results == results
+
+
+def test_compare_results():
+    baseline = [BenchmarkResult.from_durations("get_collection", [0.2], rows=100), BenchmarkResult.from_durations("removed", [0.1])]
+    candidate = [BenchmarkResult.from_durations("get_collection", [0.1], rows=100), BenchmarkResult.from_durations("added", [0.1])]
+
+    lines = compare_results(baseline, candidate).splitlines()
+    assert len(lines) == 2
+    assert lines[1].startswith("get_collection")
+    assert "100.00 (-50.0%)" in lines[1]
+    assert "1000 (+100.0%)" in lines[1]
@@ -0,0 +1,116 @@
+import random
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from benchmarks.load_test import (
+    RequestSpec,
+    Scenario,
+    TargetInfo,
+    get_read_scenarios,
+    parse_metrics,
+    pick_scenario,
+    run_load,
+    summarize_server_metrics,
+    to_results,
+    to_upload_payload,
+)
+from benchmarks.synthetic_data import SyntheticDataConfig, generate_collections
+from src.api.metrics import METRICS_PREFIX
+from src.api.models import CollectionCreate9
+
+
+TARGET = TargetInfo(
+    first_collected_at=datetime(2020, 1, 1, tzinfo=timezone.utc),
+    last_collected_at=datetime(2021, 1, 1, tzinfo=timezone.utc),
+    collection_ids=[1, 2, 3],
+    alliance_ids=[1000, 1001],
+    user_ids=[1000000, 1000001],
+)
+
+
+def get_metrics_text(requests: int, request_seconds: float, statements: int, statement_seconds: float) -> str:
+    user_history = 'method="GET",route="/userHistory/{userId}",status="200"'
+    metrics = 'method="GET",route="/metrics",status="200"'
+    return "\n".join(
+        [
+            f"# TYPE {METRICS_PREFIX}_http_request_duration_seconds histogram",
+            f"{METRICS_PREFIX}_http_request_duration_seconds_count{{{user_history}}} {requests}",
+            f"{METRICS_PREFIX}_http_request_duration_seconds_sum{{{user_history}}} {request_seconds}",
+            f"{METRICS_PREFIX}_http_request_duration_seconds_count{{{metrics}}} {requests}",
+            f"{METRICS_PREFIX}_http_request_duration_seconds_sum{{{metrics}}} {request_seconds}",
+            f"# TYPE {METRICS_PREFIX}_db_query_duration_seconds histogram",
+            f'{METRICS_PREFIX}_db_query_duration_seconds_count{{database="primary",operation="select"}} {statements}',
+            f'{METRICS_PREFIX}_db_query_duration_seconds_sum{{database="primary",operation="select"}} {statement_seconds}',
+            "",
+        ]
+    )
+
+
+def test_get_read_scenarios():
+    rng = random.Random(1)
+    for scenario in get_read_scenarios():
+        spec = scenario.build(rng, TARGET)
+        assert spec.method == "GET"
+        if "fromDate" in spec.params:
+            assert datetime.fromisoformat(spec.params["fromDate"]) <= datetime.fromisoformat(spec.params["toDate"])
+            assert datetime.fromisoformat(spec.params["fromDate"]) >= TARGET.first_collected_at
+
+
+def test_pick_scenario_respects_weights():
+    scenarios = [Scenario("rare", 1.0, lambda *_: RequestSpec("GET", "/")), Scenario("common", 9.0, lambda *_: RequestSpec("GET", "/"))]
+    rng = random.Random(1)
+    picks = [pick_scenario(scenarios, rng).name for _ in range(1000)]
+    assert 850 < picks.count("common") < 950
+
+
+def test_to_upload_payload():
+    collection = next(generate_collections(SyntheticDataConfig(years=1 / 8760, alliance_count=5, user_count=100))).to_collection_db()
+    collection.collection_id = 1
+
+    payload = to_upload_payload(collection)
+
+    assert payload["meta"]["schema_version"] == 9
+    assert "collection_id" not in payload["meta"]
+    assert len(CollectionCreate9(**payload).users) == len(collection.users)
+
+
+def test_summarize_server_metrics():
+    before = parse_metrics(get_metrics_text(10, 1.0, 20, 0.2))
+    after = parse_metrics(get_metrics_text(30, 2.0, 80, 0.8))
+
+    summary = summarize_server_metrics(before, after)
+
+    assert summary["requests"] == pytest.approx(20)
+    assert summary["mean_request_ms"] == pytest.approx(50.0)
+    assert summary["sql_statements_per_request"] == pytest.approx(3.0)
+    assert summary["mean_sql_ms"] == pytest.approx(10.0)
+
+
+def test_summarize_server_metrics_unavailable():
+    assert summarize_server_metrics({}, {}) == {}
+
+
+async def test_run_load():
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/collections"):
+            return httpx.Response(500)
+        return httpx.Response(200, content=b"[]")
+
+    scenarios = [
+        Scenario("ok", 1.0, lambda *_: RequestSpec("GET", "/userHistory/1")),
+        Scenario("failing", 1.0, lambda *_: RequestSpec("GET", "/collections/")),
+    ]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle), base_url="http://test") as client:
+        measurements, total_seconds, uploaded_collection_ids = await run_load(client, scenarios, TARGET, 4, None, 100, 1)
+
+    assert sum(len(measurement.durations) for measurement in measurements.values()) == 100
+    assert measurements["failing"].errors == len(measurements["failing"].durations)
+    assert measurements["ok"].errors == 0
+    assert measurements["ok"].response_bytes == 2 * len(measurements["ok"].durations)
+    assert uploaded_collection_ids == []
+
+    results = to_results(measurements, total_seconds)
+    assert [result.name for result in results] == ["failing", "ok", "total"]
+    assert results[-1].iterations == 100
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from benchmarks.synthetic_data import ALLIANCE_COLUMNS, COLLECTION_COLUMNS, USER_COLUMNS, SyntheticDataConfig, generate_collections
+
+
+@pytest.fixture(scope="module")
+def config() -> SyntheticDataConfig:
+    return SyntheticDataConfig(start=datetime(2020, 1, 28), years=5 / 365, alliance_count=20, user_count=1_500, hourly_user_churn=0.01)
+
+
+def test_generate_collections_deterministic(config: SyntheticDataConfig):
+    first_run = list(generate_collections(config))
+    second_run = list(generate_collections(config))
+    assert first_run == second_run
+
+
+def test_generate_collections_hourly(config: SyntheticDataConfig):
+    collections = list(generate_collections(config))
+    assert len(collections) == 5 * 24
+    assert [collection.collection[0] for collection in collections] == list(range(1, 5 * 24 + 1))
+    assert all(
+        later.collection[2] - earlier.collection[2] == timedelta(hours=1) for earlier, later in zip(collections, collections[1:], strict=False)
+    )
+
+
+def test_generate_collections_row_shapes(config: SyntheticDataConfig):
+    collection = next(generate_collections(config))
+    assert len(collection.collection) == len(COLLECTION_COLUMNS)
+    assert all(len(row) == len(ALLIANCE_COLUMNS) for row in collection.alliances)
+    assert all(len(row) == len(USER_COLUMNS) for row in collection.users)
+    assert collection.collection[COLLECTION_COLUMNS.index("fleet_count")] == 20
+    assert collection.collection[COLLECTION_COLUMNS.index("user_count")] == len(collection.users)
+
+
+def test_generate_collections_churn(config: SyntheticDataConfig):
+    collections = list(generate_collections(config))
+    alliance_id_index = USER_COLUMNS.index("alliance_id")
+    first_memberships = {row[1]: row[alliance_id_index] for row in collections[0].users}
+    last_memberships = {row[1]: row[alliance_id_index] for row in collections[-1].users}
+    changed = [user_id for user_id, alliance_id in last_memberships.items() if first_memberships.get(user_id) != alliance_id]
+    assert changed
+
+
+def test_generate_collections_tournament(config: SyntheticDataConfig):
+    collections = list(generate_collections(config))
+    tournament_running_index = COLLECTION_COLUMNS.index("tournament_running")
+    division_design_id_index = ALLIANCE_COLUMNS.index("division_design_id")
+
+    january = [collection for collection in collections if collection.collection[2].month == 1]
+    february = [collection for collection in collections if collection.collection[2].month == 2]
+    assert all(collection.collection[tournament_running_index] for collection in january)
+    assert not any(collection.collection[tournament_running_index] for collection in february)
+    assert {row[division_design_id_index] for row in january[0].alliances} == {1, 2}
+    assert {row[division_design_id_index] for row in february[0].alliances} == {0}
+
+
+def test_to_collection_db(config: SyntheticDataConfig):
+    synthetic_collection = next(generate_collections(config))
+    collection = synthetic_collection.to_collection_db()
+    assert collection.collection_id is None
+    assert len(collection.alliances) == len(synthetic_collection.alliances)
+    assert len(collection.users) == len(synthetic_collection.users)
+    assert collection.users[0].user_id == synthetic_collection.users[0][1]
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_collection, get_collection_stats, get_collection_stats_history, get_collections, save_collection
+from src.api.database.models import CollectionDB
+from src.api.models.enums import ParameterInterval
+
+
+# ----- Test functions -----
+
+
+async def test_get_collection_stats(session: AsyncSession):
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=1)
+    collection = await get_collection(session, collections[0].collection_id, True, True)
+
+    collection_db, stats = await get_collection_stats(session, collection.collection_id)
+
+    assert collection_db.collection_id == collection.collection_id
+    assert stats.user_count == len(collection.users)
+    assert stats.alliance_count == len(collection.alliances)
+    assert stats.trophy_total == sum(user.trophy for user in collection.users)
+    assert stats.alliance_score_total == sum(user.alliance_score for user in collection.users)
+    assert sum(stats.users_by_membership.values()) == len(collection.users)
+    assert stats.active_user_count_day <= stats.active_user_count_week <= stats.active_user_count_month <= stats.user_count
+
+
+async def test_get_collection_stats_non_existing_id(session: AsyncSession):
+    assert await get_collection_stats(session, 999_999_999) is None
+
+
+async def test_collection_stats_computed_on_save(session: AsyncSession, new_collection: CollectionDB):
+    new_collection.collected_at += timedelta(days=3650)
+    user_count = len(new_collection.users)
+    trophy_total = sum(user.trophy for user in new_collection.users)
+    new_collection = await save_collection(session, new_collection, True, True)
+
+    _, stats = await get_collection_stats(session, new_collection.collection_id)
+
+    assert stats.user_count == user_count
+    assert stats.trophy_total == trophy_total
+
+
+async def test_get_collection_stats_history(session: AsyncSession):
+    collections = await get_collections(session, interval=ParameterInterval.DAILY, desc=True, take=10)
+
+    stats_history = await get_collection_stats_history(session, interval=ParameterInterval.DAILY, desc=True, take=10)
+
+    assert [collection.collection_id for collection, _ in stats_history] == [collection.collection_id for collection in collections]
+    assert all(stats.collection_id == collection.collection_id for collection, stats in stats_history)
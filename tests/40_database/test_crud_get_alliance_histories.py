@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_alliance_histories, get_alliance_history, get_collections
+from src.api.database.models import AllianceDB, CollectionDB
+from src.api.models.enums import ParameterInterval
+
+
+test_cases_alliance_ids = [
+    # alliance_ids
+    pytest.param([201549], id="single"),
+    pytest.param([201549, 205906], id="multiple"),
+    pytest.param([201549, 1], id="unknown_id"),
+    pytest.param([201549, 201549], id="duplicate_id"),
+]
+"""alliance_ids"""
+
+test_cases_filter = [
+    # from_date, to_date, interval, desc, skip, take
+    pytest.param(None, None, ParameterInterval.HOURLY, False, 0, 100, id="hourly"),
+    pytest.param(None, None, ParameterInterval.DAILY, True, 0, 100, id="daily_desc"),
+    pytest.param(None, None, ParameterInterval.MONTHLY, False, 0, 100, id="monthly"),
+    pytest.param(datetime(2024, 4, 2), datetime(2024, 6, 1), ParameterInterval.HOURLY, False, 0, 100, id="from_April_2nd_to_June_1st"),
+    pytest.param(None, None, ParameterInterval.HOURLY, True, 5, 5, id="skip_5_take_5"),
+    pytest.param(None, None, ParameterInterval.HOURLY, False, 0, 0, id="take_0"),
+]
+"""from_date, to_date, interval, desc, skip, take"""
+
+
+# ----- Test functions -----
+
+
+@pytest.mark.parametrize(["alliance_ids"], test_cases_alliance_ids)
+async def test_get_alliance_histories_grouped_by_id(alliance_ids: list[int], session: AsyncSession):
+    alliance_histories = await get_alliance_histories(session, alliance_ids, interval=ParameterInterval.HOURLY)
+
+    assert list(alliance_histories.keys()) == list(dict.fromkeys(alliance_ids))
+    for alliance_id, alliance_history in alliance_histories.items():
+        __assert_correct_types(alliance_history)
+        for collection, alliance in alliance_history:
+            assert alliance.alliance_id == alliance_id
+            assert alliance.collection_id == collection.collection_id
+    assert alliance_histories.get(1, []) == []
+
+
+@pytest.mark.parametrize(["from_date", "to_date", "interval", "desc", "skip", "take"], test_cases_filter)
+async def test_get_alliance_histories_equals_alliance_history(
+    from_date: datetime | None, to_date: datetime | None, interval: ParameterInterval, desc: bool, skip: int, take: int, session: AsyncSession
+):
+    alliance_ids = [201549, 205906]
+    alliance_histories = await get_alliance_histories(session, alliance_ids, False, None, from_date, to_date, interval, desc, skip, take)
+
+    for alliance_id in alliance_ids:
+        expected_alliance_history = await get_alliance_history(session, alliance_id, False, from_date, to_date, interval, desc, skip, take)
+        assert [collection.collected_at for collection, _ in alliance_histories[alliance_id]] == [
+            collection.collected_at for collection, _ in expected_alliance_history
+        ]
+
+
+async def test_get_alliance_histories_by_collection_id(session: AsyncSession):
+    collection = (await get_collections(session, interval=ParameterInterval.HOURLY, take=1))[0]
+    alliance_histories = await get_alliance_histories(session, [201549, 205906], collection_id=collection.collection_id)
+
+    for alliance_history in alliance_histories.values():
+        __assert_correct_types(alliance_history)
+        assert len(alliance_history) == 1
+        assert alliance_history[0][0].collection_id == collection.collection_id
+
+
+# ----- Helpers -----
+
+
+def __assert_correct_types(alliance_history: list[tuple[CollectionDB, AllianceDB]]):
+    assert isinstance(alliance_history, list)
+    for entry in alliance_history:
+        assert isinstance(entry, tuple)
+        assert len(entry) == 2
+        assert isinstance(entry[0], CollectionDB)
+        assert isinstance(entry[1], AllianceDB)
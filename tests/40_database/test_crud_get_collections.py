@@ -4,7 +4,7 @@ import pytest
 import test_cases_db
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.api.database.crud import get_collections
+from src.api.database.crud import get_collections, get_page_timestamps
 from src.api.database.models import CollectionDB
 from src.api.models.enums import ParameterInterval, ParameterOnMissing
 
@@ -218,6 +218,77 @@ async def test_get_collections_onMissing_empty(
     __assert_dummy_collection(collections[empty_collection_index])
 
 
+test_cases_start_after = [
+    # interval, on_missing, desc
+    pytest.param(ParameterInterval.HOURLY, ParameterOnMissing.SKIP, False, id="hourly_skip_asc"),
+    pytest.param(ParameterInterval.HOURLY, ParameterOnMissing.EMPTY, True, id="hourly_empty_desc"),
+    pytest.param(ParameterInterval.DAILY, ParameterOnMissing.SKIP, True, id="daily_skip_desc"),
+    pytest.param(ParameterInterval.DAILY, ParameterOnMissing.EMPTY, False, id="daily_empty_asc"),
+    pytest.param(ParameterInterval.DAILY, ParameterOnMissing.LAST, False, id="daily_last_asc"),
+    pytest.param(ParameterInterval.DAILY, ParameterOnMissing.LAST, True, id="daily_last_desc"),
+    pytest.param(ParameterInterval.MONTHLY, ParameterOnMissing.LAST, True, id="monthly_last_desc"),
+    pytest.param(ParameterInterval.MONTHLY, ParameterOnMissing.EMPTY, True, id="monthly_empty_desc"),
+]
+"""interval, on_missing, desc"""
+
+test_cases_page_timestamps = [
+    # interval, on_missing, desc
+    pytest.param(ParameterInterval.HOURLY, ParameterOnMissing.NULL, False, id="hourly_null_asc"),
+    pytest.param(ParameterInterval.HOURLY, ParameterOnMissing.EMPTY, True, id="hourly_empty_desc"),
+    pytest.param(ParameterInterval.DAILY, ParameterOnMissing.NULL, True, id="daily_null_desc"),
+    pytest.param(ParameterInterval.DAILY, ParameterOnMissing.LAST, False, id="daily_last_asc"),
+    pytest.param(ParameterInterval.MONTHLY, ParameterOnMissing.NULL, False, id="monthly_null_asc"),
+]
+"""interval, on_missing, desc"""
+
+DATE_RANGE_BY_INTERVAL = {
+    ParameterInterval.HOURLY: (datetime(2025, 9, 30, 10, 0, 0), datetime(2025, 9, 30, 20, 0, 0)),
+    ParameterInterval.DAILY: (datetime(2025, 9, 20, 0, 0, 0), datetime(2025, 9, 30, 0, 0, 0)),
+    ParameterInterval.MONTHLY: (datetime(2025, 3, 1, 0, 0, 0), datetime(2025, 10, 1, 0, 0, 0)),
+}
+
+
+@pytest.mark.parametrize(["interval", "on_missing", "desc"], test_cases_start_after)
+async def test_get_collections_start_after(interval: ParameterInterval, on_missing: ParameterOnMissing, desc: bool, session: AsyncSession):
+    from_date, to_date = DATE_RANGE_BY_INTERVAL[interval]
+    expected_collections = await get_collections(session, from_date, to_date, interval, desc, 0, 100, on_missing)
+
+    collections = []
+    start_after = None
+    while True:
+        page = await get_collections(session, from_date, to_date, interval, desc, 0, 2, on_missing, start_after)
+        collections.extend(page)
+        if len(page) < 2:
+            break
+        start_after = page[-1].collected_at
+
+    assert expected_collections
+    assert [collection.collected_at for collection in collections] == [collection.collected_at for collection in expected_collections]
+
+
+@pytest.mark.parametrize(["interval", "on_missing", "desc"], test_cases_page_timestamps)
+async def test_get_page_timestamps(interval: ParameterInterval, on_missing: ParameterOnMissing, desc: bool, session: AsyncSession):
+    """Paging with the last slot of a page as the cursor returns every slot once, even if the page ends with `null` entries."""
+    from_date, to_date = DATE_RANGE_BY_INTERVAL[interval]
+    expected_collections = await get_collections(session, from_date, to_date, interval, desc, 0, 100, on_missing)
+
+    collections = []
+    start_after = None
+    while True:
+        page = await get_collections(session, from_date, to_date, interval, desc, 0, 2, on_missing, start_after)
+        page_timestamps = await get_page_timestamps(session, from_date, to_date, interval, desc, 0, 2, on_missing, start_after)
+        assert len(page_timestamps) == len(page)
+        collections.extend(page)
+        if len(page_timestamps) < 2:
+            break
+        start_after = page_timestamps[-1]
+
+    assert expected_collections
+    assert [collection and collection.collected_at for collection in collections] == [
+        collection and collection.collected_at for collection in expected_collections
+    ]
+
+
 # ----- Helpers -----
 
 
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_alliance_history, get_collection, get_collections, get_division_standings
+from src.api.database.models import CollectionDB
+from src.api.models.enums import ParameterInterval
+
+
+# ----- Test functions -----
+
+
+async def test_get_division_standings(session: AsyncSession):
+    collection = await __get_any_tournament_collection(session)
+    division_design_id = next(alliance.division_design_id for alliance in collection.alliances if alliance.division_design_id)
+
+    standings = await get_division_standings(session, collection.collection_id, division_design_id)
+    division_alliance_ids = {alliance.alliance_id for alliance in collection.alliances if alliance.division_design_id == division_design_id}
+
+    assert {standing[1] for standing in standings} == division_alliance_ids
+    assert [standing[3] for standing in standings] == sorted((standing[3] for standing in standings), reverse=True)
+    assert standings[0][0] == 1
+    for rank, alliance_id, _, _, _, _, member_count, _, _ in standings:
+        assert rank >= 1
+        assert member_count == sum(1 for user in collection.users if user.alliance_id == alliance_id)
+
+
+async def test_get_division_standings_non_existing_division(session: AsyncSession):
+    collection = await __get_any_tournament_collection(session)
+
+    assert await get_division_standings(session, collection.collection_id, 999_999) == []
+
+
+async def test_get_collection_by_division(session: AsyncSession):
+    collection = await __get_any_tournament_collection(session)
+    division_design_id = next(alliance.division_design_id for alliance in collection.alliances if alliance.division_design_id)
+
+    result = await get_collection(session, collection.collection_id, True, False, division_design_id)
+
+    assert result.alliances
+    assert all(alliance.division_design_id == division_design_id for alliance in result.alliances)
+
+
+async def test_get_alliance_history_by_division(session: AsyncSession):
+    collection = await __get_any_tournament_collection(session)
+    alliance = next(alliance for alliance in collection.alliances if alliance.division_design_id)
+
+    history = await get_alliance_history(session, alliance.alliance_id, False, division_design_id=alliance.division_design_id)
+
+    assert history
+    assert all(alliance_db.division_design_id == alliance.division_design_id for _, alliance_db in history)
+
+
+# ----- Helpers -----
+
+
+async def __get_any_tournament_collection(session: AsyncSession) -> CollectionDB:
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=1000)
+    collection_id = next(collection.collection_id for collection in collections if collection.tournament_running)
+    return await get_collection(session, collection_id, True, True)
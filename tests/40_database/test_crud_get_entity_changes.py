@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_alliance_changes, get_collection, get_collections, get_user_changes
+from src.api.database.models import CollectionDB, EntityChangeDB
+from src.api.models.enums import EntityChange, ParameterInterval
+
+
+# ----- Test functions -----
+
+
+async def test_get_alliance_changes(session: AsyncSession):
+    from_collection, to_collection = await __get_first_and_last_collection(session)
+
+    changes = [change async for change in get_alliance_changes(session, from_collection.collection_id, to_collection.collection_id)]
+
+    assert changes == __get_expected_changes(
+        {alliance.alliance_id: alliance for alliance in from_collection.alliances},
+        {alliance.alliance_id: alliance for alliance in to_collection.alliances},
+        {"alliance_name": EntityChange.RENAMED},
+    )
+
+
+async def test_get_user_changes(session: AsyncSession):
+    from_collection, to_collection = await __get_first_and_last_collection(session)
+
+    changes = [change async for change in get_user_changes(session, from_collection.collection_id, to_collection.collection_id)]
+
+    assert changes
+    assert changes == __get_expected_changes(
+        {user.user_id: user for user in from_collection.users},
+        {user.user_id: user for user in to_collection.users},
+        {"user_name": EntityChange.RENAMED, "alliance_id": EntityChange.ALLIANCE_CHANGED, "alliance_membership": EntityChange.MEMBERSHIP_CHANGED},
+    )
+
+
+async def test_get_user_changes_reversed(session: AsyncSession):
+    from_collection, to_collection = await __get_first_and_last_collection(session)
+
+    changes = [change async for change in get_user_changes(session, from_collection.collection_id, to_collection.collection_id)]
+    reversed_changes = [change async for change in get_user_changes(session, to_collection.collection_id, from_collection.collection_id)]
+
+    assert len(changes) == len(reversed_changes)
+    assert sum(change == EntityChange.APPEARED for _, change, _, _ in changes) == sum(
+        change == EntityChange.DISAPPEARED for _, change, _, _ in reversed_changes
+    )
+
+
+async def test_get_user_changes_same_collection(session: AsyncSession):
+    _, to_collection = await __get_first_and_last_collection(session)
+
+    changes = [change async for change in get_user_changes(session, to_collection.collection_id, to_collection.collection_id)]
+
+    assert changes == []
+
+
+# ----- Helpers -----
+
+
+async def __get_first_and_last_collection(session: AsyncSession) -> tuple[CollectionDB, CollectionDB]:
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=100)
+    from_collection = await get_collection(session, collections[0].collection_id, True, True)
+    to_collection = await get_collection(session, collections[-1].collection_id, True, True)
+    return from_collection, to_collection
+
+
+def __get_expected_changes(old_entities: dict, new_entities: dict, change_by_property: dict[str, EntityChange]) -> list[EntityChangeDB]:
+    name_property = next(iter(change_by_property))
+    result = []
+    for entity_id in sorted(old_entities.keys() | new_entities.keys()):
+        old = old_entities.get(entity_id)
+        new = new_entities.get(entity_id)
+        if old is None:
+            result.append((entity_id, EntityChange.APPEARED, None, getattr(new, name_property)))
+        elif new is None:
+            result.append((entity_id, EntityChange.DISAPPEARED, getattr(old, name_property), None))
+        else:
+            for property_name, change in change_by_property.items():
+                if getattr(old, property_name) != getattr(new, property_name):
+                    result.append((entity_id, change, getattr(old, property_name), getattr(new, property_name)))
+    return result
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database import db
+from src.api.database.crud import get_collection, get_collections, get_entity_names, save_collection
+from src.api.database.models import CollectionDB
+from src.api.models.enums import EntityType, ParameterInterval
+
+
+# ----- Test functions -----
+
+
+async def test_get_entity_names(session: AsyncSession):
+    user = await __get_any_user(session)
+
+    entity_names = await get_entity_names(session, EntityType.USER, user.user_id)
+
+    assert user.user_name in [name for name, _, _ in entity_names]
+    assert [first_seen_at for _, first_seen_at, _ in entity_names] == sorted(first_seen_at for _, first_seen_at, _ in entity_names)
+    assert all(first_seen_at <= last_seen_at for _, first_seen_at, last_seen_at in entity_names)
+    assert all(previous[2] < current[1] for previous, current in zip(entity_names, entity_names[1:], strict=False))
+
+
+async def test_get_entity_names_desc(session: AsyncSession):
+    user = await __get_any_user(session)
+
+    entity_names = await get_entity_names(session, EntityType.USER, user.user_id, desc=True)
+
+    assert [first_seen_at for _, first_seen_at, _ in entity_names] == sorted((first_seen_at for _, first_seen_at, _ in entity_names), reverse=True)
+
+
+async def test_get_entity_names_non_existing_id(session: AsyncSession):
+    assert await get_entity_names(session, EntityType.ALLIANCE, 999_999_999) == []
+
+
+async def test_get_entity_names_after_rename(session: AsyncSession, new_collection: CollectionDB):
+    new_collection.collected_at += timedelta(days=3650)
+    user = new_collection.users[0]
+    user_id, old_name = user.user_id, user.user_name
+    user.user_name = f"{old_name} (renamed)"
+    new_collection = await save_collection(session, new_collection, True, True)
+
+    entity_names = await get_entity_names(session, EntityType.USER, user_id, desc=True)
+
+    name, first_seen_at, last_seen_at = entity_names[0]
+    assert name == f"{old_name} (renamed)"
+    assert first_seen_at == last_seen_at == new_collection.collected_at
+
+
+async def test_get_entity_names_after_returning_to_name(session: AsyncSession, test_data: dict):
+    collected_ats = []
+    for days, suffix in ((3660, " (renamed)"), (3670, "")):
+        collection = db.create_collections_from_dummy_data(test_data)[0]
+        collection.collected_at += timedelta(days=days)
+        user = collection.users[0]
+        user_id, original_name = user.user_id, user.user_name
+        user.user_name = f"{original_name}{suffix}"
+        collection = await save_collection(session, collection, True, True)
+        collected_ats.append(collection.collected_at)
+
+    entity_names = await get_entity_names(session, EntityType.USER, user_id, desc=True)
+
+    assert entity_names[0] == (original_name, collected_ats[1], collected_ats[1])
+    assert entity_names[1] == (f"{original_name} (renamed)", collected_ats[0], collected_ats[0])
+    assert entity_names[2][0] == original_name
+    assert entity_names[2][2] < collected_ats[0]
+
+
+# ----- Helpers -----
+
+
+async def __get_any_user(session: AsyncSession):
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=1)
+    collection = await get_collection(session, collections[0].collection_id, False, True)
+    return collection.users[0]
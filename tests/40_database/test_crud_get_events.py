@@ -0,0 +1,163 @@
+from datetime import datetime
+
+from sqlalchemy import delete
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import delete_collection, get_collection, get_collections, get_events, record_entity_events, save_collection
+from src.api.database.models import CollectionDB, EntityEventDB
+from src.api.models.enums import EntityEventType, EntityType, ParameterInterval
+
+
+# ----- Test functions -----
+
+
+async def test_get_events(session: AsyncSession):
+    events = await get_events(session, take=10_000)
+
+    assert events
+    assert [(event.collected_at, event.event_id) for event in events] == sorted((event.collected_at, event.event_id) for event in events)
+
+
+async def test_get_events_desc(session: AsyncSession):
+    events = await get_events(session, desc=True, take=10_000)
+
+    assert [(event.collected_at, event.event_id) for event in events] == sorted(
+        ((event.collected_at, event.event_id) for event in events), reverse=True
+    )
+
+
+async def test_get_events_filtered(session: AsyncSession):
+    all_events = await get_events(session, take=10_000)
+    user_event = next(event for event in all_events if event.entity_type == EntityType.USER)
+
+    events = await get_events(
+        session,
+        EntityType.USER,
+        user_event.entity_id,
+        [user_event.event_type],
+        user_event.collected_at,
+        user_event.collected_at,
+        take=10_000,
+    )
+
+    assert user_event.event_id in [event.event_id for event in events]
+    for event in events:
+        assert event.entity_type == EntityType.USER
+        assert event.entity_id == user_event.entity_id
+        assert event.event_type == user_event.event_type
+        assert event.collected_at == user_event.collected_at
+
+
+async def test_get_events_skip_take(session: AsyncSession):
+    events = await get_events(session, take=10)
+    skipped_events = await get_events(session, skip=5, take=5)
+
+    assert [event.event_id for event in skipped_events] == [event.event_id for event in events[5:]]
+
+
+async def test_get_events_recorded_on_save(session: AsyncSession):
+    collections = await __get_collections(session)
+    previous_collection, collection = collections[0], collections[1]
+
+    events = await get_events(session, from_date=collection.collected_at, to_date=collection.collected_at, take=10_000)
+
+    assert __to_comparable(events) == __get_expected_events(previous_collection, collection)
+
+
+async def test_get_events_refreshed_on_save(session: AsyncSession, new_collection: CollectionDB):
+    new_collection = await save_collection(session, new_collection, True, True)
+    collections = await __get_collections(session)
+    index = [collection.collection_id for collection in collections].index(new_collection.collection_id)
+    previous_collection, collection, next_collection = collections[index - 1 : index + 2]
+
+    events = await get_events(session, from_date=collection.collected_at, to_date=collection.collected_at, take=10_000)
+    next_events = await get_events(session, from_date=next_collection.collected_at, to_date=next_collection.collected_at, take=10_000)
+
+    assert __to_comparable(events) == __get_expected_events(previous_collection, collection)
+    assert __to_comparable(next_events) == __get_expected_events(collection, next_collection)
+
+
+async def test_get_events_refreshed_on_delete(session: AsyncSession):
+    collections = await __get_collections(session)
+    first_collection, second_collection, third_collection = collections[:3]
+
+    assert await delete_collection(session, second_collection.collection_id)
+    events = await get_events(session, from_date=third_collection.collected_at, to_date=third_collection.collected_at, take=10_000)
+
+    assert __to_comparable(events) == __get_expected_events(first_collection, third_collection)
+
+
+async def test_record_entity_events(session: AsyncSession):
+    collections = await __get_collections(session)
+    previous_collection, collection = collections[0], collections[1]
+
+    await session.exec(delete(EntityEventDB).where(col(EntityEventDB.collection_id) == collection.collection_id))
+    event_count = await record_entity_events(session, previous_collection.collection_id, collection.collection_id, collection.collected_at)
+    await session.commit()
+    events = await get_events(session, from_date=collection.collected_at, to_date=collection.collected_at, take=10_000)
+
+    assert event_count == len(events)
+    assert __to_comparable(events) == __get_expected_events(previous_collection, collection)
+
+
+# ----- Helpers -----
+
+
+async def __get_collections(session: AsyncSession) -> list[CollectionDB]:
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=100)
+    return [await get_collection(session, collection.collection_id, True, True) for collection in collections]
+
+
+def __to_comparable(events: list) -> set[tuple]:
+    return {(event.entity_type, event.entity_id, event.event_type, event.old_value, event.new_value) for event in events}
+
+
+def __get_expected_events(previous_collection: CollectionDB, collection: CollectionDB) -> set[tuple]:
+    return __get_expected_alliance_events(previous_collection, collection) | __get_expected_user_events(previous_collection, collection)
+
+
+def __get_expected_alliance_events(previous_collection: CollectionDB, collection: CollectionDB) -> set[tuple]:
+    result = set()
+    old_alliances = {alliance.alliance_id: alliance for alliance in previous_collection.alliances}
+    new_alliances = {alliance.alliance_id: alliance for alliance in collection.alliances}
+    for alliance_id in old_alliances.keys() | new_alliances.keys():
+        old = old_alliances.get(alliance_id)
+        new = new_alliances.get(alliance_id)
+        if old is None:
+            result.add((EntityType.ALLIANCE, alliance_id, EntityEventType.ALLIANCE_CREATED, None, new.alliance_name))
+        elif new is None:
+            result.add((EntityType.ALLIANCE, alliance_id, EntityEventType.ALLIANCE_DISBANDED, old.alliance_name, None))
+        else:
+            if old.alliance_name != new.alliance_name:
+                result.add((EntityType.ALLIANCE, alliance_id, EntityEventType.RENAMED, old.alliance_name, new.alliance_name))
+            if old.division_design_id != new.division_design_id:
+                result.add(
+                    (EntityType.ALLIANCE, alliance_id, EntityEventType.DIVISION_CHANGED, str(old.division_design_id), str(new.division_design_id))
+                )
+    return result
+
+
+def __get_expected_user_events(previous_collection: CollectionDB, collection: CollectionDB) -> set[tuple]:
+    result = set()
+    old_users = {user.user_id: user for user in previous_collection.users}
+    new_users = {user.user_id: user for user in collection.users}
+    for user_id in old_users.keys() | new_users.keys():
+        old = old_users.get(user_id)
+        new = new_users.get(user_id)
+        if old and new and old.user_name != new.user_name:
+            result.add((EntityType.USER, user_id, EntityEventType.RENAMED, old.user_name, new.user_name))
+        if old is None or new is None or old.alliance_id != new.alliance_id:
+            result |= __get_expected_membership_events(user_id, old.alliance_id if old else None, new.alliance_id if new else None)
+        elif old.alliance_membership != new.alliance_membership:
+            result.add((EntityType.USER, user_id, EntityEventType.RANK_CHANGED, old.alliance_membership, new.alliance_membership))
+    return result
+
+
+def __get_expected_membership_events(user_id: int, old_alliance_id: int | None, new_alliance_id: int | None) -> set[tuple]:
+    result = set()
+    if old_alliance_id:
+        result.add((EntityType.USER, user_id, EntityEventType.LEFT_ALLIANCE, str(old_alliance_id), None))
+    if new_alliance_id:
+        result.add((EntityType.USER, user_id, EntityEventType.JOINED_ALLIANCE, None, str(new_alliance_id)))
+    return result
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import HISTOGRAM_PERCENTILES, get_alliance_histogram, get_collection, get_collections, get_histogram
+from src.api.models.enums import ParameterAllianceMetric, ParameterInterval, ParameterUserMetric
+
+
+test_cases_histogram = [
+    # metric, buckets
+    pytest.param(ParameterUserMetric.TROPHY, 50, id="trophy"),
+    pytest.param(ParameterUserMetric.ALLIANCE_SCORE, 10, id="alliance_score"),
+    pytest.param(ParameterUserMetric.CREW_DONATED, 1, id="crew_donated_single_bucket"),
+]
+"""metric, buckets"""
+
+test_cases_alliance_histogram = [
+    # metric, buckets
+    pytest.param(ParameterAllianceMetric.SCORE, 50, id="score"),
+    pytest.param(ParameterAllianceMetric.TROPHY, 10, id="trophy"),
+    pytest.param(ParameterAllianceMetric.NUMBER_OF_MEMBERS, 1, id="number_of_members_single_bucket"),
+]
+"""metric, buckets"""
+
+
+# ----- Test functions -----
+
+
+@pytest.mark.parametrize(["metric", "buckets"], test_cases_histogram)
+async def test_get_histogram(metric: ParameterUserMetric, buckets: int, session: AsyncSession):
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=1)
+    collection = await get_collection(session, collections[0].collection_id, False, True)
+    values = sorted(getattr(user, metric.value) for user in collection.users if getattr(user, metric.value) is not None)
+
+    count, min_value, max_value, percentiles, bucket_counts = await get_histogram(session, collection.collection_id, metric, buckets)
+
+    assert count == len(values)
+    assert (min_value, max_value) == (values[0], values[-1])
+    assert len(bucket_counts) == buckets
+    assert sum(bucket_counts) == count
+    assert [fraction for fraction, _ in percentiles] == list(HISTOGRAM_PERCENTILES)
+    assert all(value in values for _, value in percentiles)
+
+
+async def test_get_histogram_non_existing_collection(session: AsyncSession):
+    assert await get_histogram(session, 999_999_999, ParameterUserMetric.TROPHY) == (0, None, None, [], [])
+
+
+@pytest.mark.parametrize(["metric", "buckets"], test_cases_alliance_histogram)
+async def test_get_alliance_histogram(metric: ParameterAllianceMetric, buckets: int, session: AsyncSession):
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=1)
+    collection = await get_collection(session, collections[0].collection_id, True, False)
+    values = sorted(getattr(alliance, metric.value) for alliance in collection.alliances if getattr(alliance, metric.value) is not None)
+
+    count, min_value, max_value, percentiles, bucket_counts = await get_alliance_histogram(session, collection.collection_id, metric, buckets)
+
+    assert count == len(values)
+    assert (min_value, max_value) == (values[0], values[-1])
+    assert len(bucket_counts) == buckets
+    assert sum(bucket_counts) == count
+    assert [fraction for fraction, _ in percentiles] == list(HISTOGRAM_PERCENTILES)
+    assert all(value in values for _, value in percentiles)
+
+
+async def test_get_alliance_histogram_non_existing_collection(session: AsyncSession):
+    assert await get_alliance_histogram(session, 999_999_999, ParameterAllianceMetric.SCORE) == (0, None, None, [], [])
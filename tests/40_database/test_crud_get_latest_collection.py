@@ -0,0 +1,40 @@
+from datetime import datetime
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_collections, get_latest_collection
+from src.api.models.enums import ParameterInterval
+
+
+test_cases_not_existing = [
+    # collected_at
+    pytest.param(datetime(2016, 1, 6, 0, 0, 0), id="before_first_collection"),
+]
+
+test_cases_existing = [
+    # collected_at, expected_collected_at
+    pytest.param(datetime(2024, 3, 31, 12, 59, 0), datetime(2024, 3, 31, 12, 59, 0), id="exact_timestamp"),
+    pytest.param(datetime(2024, 3, 31, 13, 30, 0), datetime(2024, 3, 31, 12, 59, 0), id="after_timestamp"),
+]
+
+
+@pytest.mark.parametrize(["collected_at"], test_cases_not_existing)
+async def test_get_latest_collection_not_existing(collected_at: datetime, session: AsyncSession):
+    collection = await get_latest_collection(session, collected_at)
+    assert collection is None
+
+
+@pytest.mark.parametrize(["collected_at", "expected_collected_at"], test_cases_existing)
+async def test_get_latest_collection_existing(collected_at: datetime, expected_collected_at: datetime, session: AsyncSession):
+    collection = await get_latest_collection(session, collected_at)
+    assert collection
+    assert collection.collected_at == expected_collected_at
+
+
+async def test_get_latest_collection_overall(session: AsyncSession):
+    latest_collections = await get_collections(session, interval=ParameterInterval.HOURLY, desc=True, take=1)
+
+    collection = await get_latest_collection(session)
+    assert collection
+    assert collection.collection_id == latest_collections[0].collection_id
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_alliance_leaderboard, get_collection, get_collections, get_user_leaderboard, get_user_rank
+from src.api.database.models import CollectionDB
+from src.api.models.enums import ParameterAllianceMetric, ParameterInterval, ParameterUserMetric
+
+
+test_cases_user_metrics = [
+    # metric
+    pytest.param(ParameterUserMetric.TROPHY, id="trophy"),
+    pytest.param(ParameterUserMetric.ALLIANCE_SCORE, id="alliance_score"),
+    pytest.param(ParameterUserMetric.PVP_ATTACK_WINS, id="pvp_attack_wins"),
+    pytest.param(ParameterUserMetric.CREW_DONATED, id="crew_donated"),
+]
+"""metric"""
+
+
+# ----- Test functions -----
+
+
+@pytest.mark.parametrize(["metric"], test_cases_user_metrics)
+async def test_get_user_leaderboard(metric: ParameterUserMetric, session: AsyncSession):
+    collection = await __get_any_collection(session)
+    expected_values = sorted((getattr(user, metric.value) for user in collection.users if getattr(user, metric.value) is not None), reverse=True)
+
+    leaderboard = await get_user_leaderboard(session, collection.collection_id, metric)
+
+    assert [value for *_, value in leaderboard] == expected_values[:100]
+    for rank, *_, value in leaderboard:
+        assert rank == 1 + sum(1 for expected_value in expected_values if expected_value > value)
+
+
+async def test_get_user_leaderboard_skip_take_keeps_ranks(session: AsyncSession):
+    collection = await __get_any_collection(session)
+
+    leaderboard = await get_user_leaderboard(session, collection.collection_id, ParameterUserMetric.ALLIANCE_SCORE, take=20)
+    page = await get_user_leaderboard(session, collection.collection_id, ParameterUserMetric.ALLIANCE_SCORE, skip=10, take=10)
+
+    assert page == leaderboard[10:20]
+
+
+async def test_get_user_leaderboard_alliance_id(session: AsyncSession):
+    collection = await __get_any_collection(session)
+    alliance_id = next(user.alliance_id for user in collection.users if user.alliance_id)
+
+    leaderboard = await get_user_leaderboard(session, collection.collection_id, ParameterUserMetric.TROPHY, alliance_id=alliance_id)
+
+    assert leaderboard
+    assert all(user_alliance_id == alliance_id for _, _, _, user_alliance_id, _ in leaderboard)
+    assert leaderboard[0][0] == 1
+
+
+async def test_get_user_rank(session: AsyncSession):
+    collection = await __get_any_collection(session)
+    leaderboard = await get_user_leaderboard(session, collection.collection_id, ParameterUserMetric.TROPHY)
+
+    for user_rank in leaderboard[:10]:
+        assert await get_user_rank(session, collection.collection_id, user_rank[1], ParameterUserMetric.TROPHY) == user_rank
+
+
+async def test_get_user_rank_non_existing_user(session: AsyncSession):
+    collection = await __get_any_collection(session)
+
+    assert await get_user_rank(session, collection.collection_id, 999_999_999, ParameterUserMetric.TROPHY) is None
+
+
+async def test_get_alliance_leaderboard(session: AsyncSession):
+    collection = await __get_any_collection(session)
+    division_design_id = next(alliance.division_design_id for alliance in collection.alliances)
+
+    leaderboard = await get_alliance_leaderboard(session, collection.collection_id, ParameterAllianceMetric.SCORE, division_design_id)
+    expected_scores = sorted((alliance.score for alliance in collection.alliances if alliance.division_design_id == division_design_id), reverse=True)
+
+    assert [value for *_, value in leaderboard] == expected_scores
+    assert all(alliance_division_design_id == division_design_id for _, _, _, alliance_division_design_id, _ in leaderboard)
+
+
+# ----- Helpers -----
+
+
+async def __get_any_collection(session: AsyncSession) -> CollectionDB:
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=1)
+    return await get_collection(session, collections[0].collection_id, True, True)
@@ -0,0 +1,116 @@
+from datetime import datetime
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_collection, get_collections, get_top_movers
+from src.api.database.models import CollectionDB, UserDB
+from src.api.models.enums import ParameterInterval, ParameterUserMetric
+
+
+test_cases_metric_desc = [
+    # metric, desc
+    pytest.param(ParameterUserMetric.TROPHY, True, id="trophy_desc"),
+    pytest.param(ParameterUserMetric.TROPHY, False, id="trophy_asc"),
+    pytest.param(ParameterUserMetric.PVP_ATTACK_WINS, True, id="pvp_attack_wins_desc"),
+    pytest.param(ParameterUserMetric.CREW_DONATED, False, id="crew_donated_asc"),
+]
+
+test_cases_skip_take = [
+    # skip, take
+    pytest.param(0, 5, id="skip_0_take_5"),
+    pytest.param(5, 5, id="skip_5_take_5"),
+]
+
+
+# ----- Test functions -----
+
+
+@pytest.mark.parametrize(["metric", "desc"], test_cases_metric_desc)
+async def test_get_top_movers(metric: ParameterUserMetric, desc: bool, session: AsyncSession):
+    from_collection, to_collection = await __get_first_and_last_collection(session)
+    expected_changes = __get_expected_changes(from_collection, to_collection, metric)
+
+    movers = await get_top_movers(session, from_collection.collection_id, to_collection.collection_id, metric, desc=desc, take=100)
+
+    assert len(movers) == min(len(expected_changes), 100)
+    changes = [change for *_, change in movers]
+    assert changes == sorted(changes, reverse=desc)
+    for user_id, _, _, from_value, to_value, change in movers:
+        assert change == to_value - from_value
+        assert change == expected_changes[user_id]
+
+
+@pytest.mark.parametrize(["skip", "take"], test_cases_skip_take)
+async def test_get_top_movers_by_skip_take(skip: int, take: int, session: AsyncSession):
+    from_collection, to_collection = await __get_first_and_last_collection(session)
+
+    all_movers = await get_top_movers(session, from_collection.collection_id, to_collection.collection_id, ParameterUserMetric.TROPHY)
+    movers = await get_top_movers(
+        session, from_collection.collection_id, to_collection.collection_id, ParameterUserMetric.TROPHY, skip=skip, take=take
+    )
+
+    assert movers == all_movers[skip : skip + take]
+
+
+async def test_get_top_movers_by_alliance(session: AsyncSession):
+    from_collection, to_collection = await __get_first_and_last_collection(session)
+    alliance_id = next(user.alliance_id for user in to_collection.users if user.alliance_id)
+
+    movers = await get_top_movers(
+        session, from_collection.collection_id, to_collection.collection_id, ParameterUserMetric.TROPHY, alliance_id=alliance_id
+    )
+
+    assert movers
+    assert all(mover[2] == alliance_id for mover in movers)
+
+
+async def test_get_top_movers_by_division(session: AsyncSession):
+    from_collection, to_collection = await __get_first_and_last_collection(session)
+    to_collection = await get_collection(session, to_collection.collection_id, True, True)
+    alliance = next(alliance for alliance in to_collection.alliances if any(user.alliance_id == alliance.alliance_id for user in to_collection.users))
+    alliance_ids = {other.alliance_id for other in to_collection.alliances if other.division_design_id == alliance.division_design_id}
+
+    movers = await get_top_movers(
+        session,
+        from_collection.collection_id,
+        to_collection.collection_id,
+        ParameterUserMetric.TROPHY,
+        division_design_id=alliance.division_design_id,
+    )
+
+    assert movers
+    assert all(mover[2] in alliance_ids for mover in movers)
+
+
+async def test_get_top_movers_same_collection(session: AsyncSession):
+    _, to_collection = await __get_first_and_last_collection(session)
+
+    movers = await get_top_movers(session, to_collection.collection_id, to_collection.collection_id, ParameterUserMetric.TROPHY)
+
+    assert movers
+    assert all(mover[5] == 0 for mover in movers)
+
+
+# ----- Helpers -----
+
+
+async def __get_first_and_last_collection(session: AsyncSession) -> tuple[CollectionDB, CollectionDB]:
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=100)
+    from_collection = await get_collection(session, collections[0].collection_id, False, True)
+    to_collection = await get_collection(session, collections[-1].collection_id, False, True)
+    return from_collection, to_collection
+
+
+def __get_expected_changes(from_collection: CollectionDB, to_collection: CollectionDB, metric: ParameterUserMetric) -> dict[int, int]:
+    from_users: dict[int, UserDB] = {user.user_id: user for user in from_collection.users}
+    result = {}
+    for user in to_collection.users:
+        from_user = from_users.get(user.user_id)
+        if from_user is None:
+            continue
+        from_value = getattr(from_user, metric.value)
+        to_value = getattr(user, metric.value)
+        if from_value is not None and to_value is not None:
+            result[user.user_id] = to_value - from_value
+    return result
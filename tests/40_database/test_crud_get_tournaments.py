@@ -0,0 +1,94 @@
+from datetime import datetime
+from itertools import pairwise
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import (
+    TOURNAMENT_GAP,
+    get_collection,
+    get_collections,
+    get_tournament,
+    get_tournament_alliance_progression,
+    get_tournament_user_deltas,
+    get_tournaments,
+)
+from src.api.models.enums import ParameterInterval
+
+
+# ----- Test functions -----
+
+
+async def test_get_tournaments(session: AsyncSession):
+    collections = await get_collections(session, interval=ParameterInterval.HOURLY, take=100_000)
+    tournament_collections = [collection for collection in collections if collection.tournament_running]
+
+    tournaments = await get_tournaments(session, take=100)
+
+    assert tournaments
+    assert sum(collection_count for _, _, collection_count in tournaments) == len(tournament_collections)
+    for first_collection, last_collection, _ in tournaments:
+        assert first_collection.tournament_running and last_collection.tournament_running
+        assert first_collection.collected_at <= last_collection.collected_at
+    for (_, previous_last_collection, _), (next_first_collection, _, _) in pairwise(tournaments):
+        assert next_first_collection.collected_at - previous_last_collection.collected_at > TOURNAMENT_GAP
+
+
+async def test_get_tournaments_desc(session: AsyncSession):
+    tournaments = await get_tournaments(session)
+    tournaments_desc = await get_tournaments(session, desc=True)
+
+    assert [first_collection.collection_id for first_collection, _, _ in tournaments_desc] == [
+        first_collection.collection_id for first_collection, _, _ in reversed(tournaments)
+    ]
+
+
+async def test_get_tournament(session: AsyncSession):
+    first_collection, last_collection, collection_count = (await get_tournaments(session, take=1))[0]
+
+    assert await get_tournament(session, first_collection.collection_id) == (first_collection, last_collection, collection_count)
+    assert await get_tournament(session, last_collection.collection_id) == (first_collection, last_collection, collection_count)
+
+
+async def test_get_tournament_no_tournament(session: AsyncSession):
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=1000)
+    collection_id = next(collection.collection_id for collection in collections if not collection.tournament_running)
+
+    assert await get_tournament(session, collection_id) is None
+    assert await get_tournament(session, 999_999_999) is None
+
+
+async def test_get_tournament_alliance_progression(session: AsyncSession):
+    first_collection, last_collection, _ = (await get_tournaments(session, take=1))[0]
+    last_alliances = (await get_collection(session, last_collection.collection_id, True, False)).alliances
+
+    progression = await get_tournament_alliance_progression(session, first_collection.collected_at, last_collection.collected_at)
+
+    assert progression
+    assert progression[0][5] is None
+    assert {entry[1] for entry in progression} >= {alliance.alliance_id for alliance in last_alliances}
+    assert all(first_collection.collected_at <= entry[0] <= last_collection.collected_at for entry in progression)
+    for previous_entry, entry in pairwise(progression):
+        if previous_entry[1] == entry[1]:
+            assert previous_entry[0] < entry[0]
+            assert entry[5] == entry[4] - previous_entry[4]
+        else:
+            assert entry[5] is None
+
+
+async def test_get_tournament_user_deltas(session: AsyncSession):
+    first_collection, last_collection, _ = (await get_tournaments(session, take=1))[0]
+    first_users = {user.user_id: user for user in (await get_collection(session, first_collection.collection_id, False, True)).users}
+
+    deltas = await get_tournament_user_deltas(session, first_collection.collection_id, last_collection.collection_id)
+
+    assert deltas
+    for user_id, _, _, tournament_bonus_score, tournament_bonus_score_change, championship_score, championship_score_change in deltas:
+        first_user = first_users.get(user_id)
+        if first_user is None or first_user.championship_score is None or championship_score is None:
+            assert championship_score_change is None
+        else:
+            assert championship_score_change == championship_score - first_user.championship_score
+        if first_user is None or first_user.tournament_bonus_score is None or tournament_bonus_score is None:
+            assert tournament_bonus_score_change is None
+        else:
+            assert tournament_bonus_score_change == tournament_bonus_score - first_user.tournament_bonus_score
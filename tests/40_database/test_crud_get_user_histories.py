@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_collections, get_user_histories, get_user_history
+from src.api.database.models import CollectionDB, UserDB
+from src.api.models.enums import ParameterInterval
+
+
+test_cases_user_ids = [
+    # user_ids
+    pytest.param([20013541], id="single"),
+    pytest.param([20013541, 20416720], id="multiple"),
+    pytest.param([20013541, 1], id="unknown_id"),
+    pytest.param([20013541, 20013541], id="duplicate_id"),
+]
+"""user_ids"""
+
+test_cases_filter = [
+    # from_date, to_date, interval, desc, skip, take
+    pytest.param(None, None, ParameterInterval.HOURLY, False, 0, 100, id="hourly"),
+    pytest.param(None, None, ParameterInterval.DAILY, True, 0, 100, id="daily_desc"),
+    pytest.param(None, None, ParameterInterval.MONTHLY, False, 0, 100, id="monthly"),
+    pytest.param(datetime(2024, 4, 2), datetime(2024, 6, 1), ParameterInterval.HOURLY, False, 0, 100, id="from_April_2nd_to_June_1st"),
+    pytest.param(None, None, ParameterInterval.HOURLY, True, 5, 5, id="skip_5_take_5"),
+    pytest.param(None, None, ParameterInterval.HOURLY, False, 0, 0, id="take_0"),
+]
+"""from_date, to_date, interval, desc, skip, take"""
+
+
+# ----- Test functions -----
+
+
+@pytest.mark.parametrize(["user_ids"], test_cases_user_ids)
+async def test_get_user_histories_grouped_by_id(user_ids: list[int], session: AsyncSession):
+    user_histories = await get_user_histories(session, user_ids, interval=ParameterInterval.HOURLY)
+
+    assert list(user_histories.keys()) == list(dict.fromkeys(user_ids))
+    for user_id, user_history in user_histories.items():
+        __assert_correct_types(user_history)
+        for collection, user in user_history:
+            assert user.user_id == user_id
+            assert user.collection_id == collection.collection_id
+    assert user_histories.get(1, []) == []
+
+
+@pytest.mark.parametrize(["from_date", "to_date", "interval", "desc", "skip", "take"], test_cases_filter)
+async def test_get_user_histories_equals_user_history(
+    from_date: datetime | None, to_date: datetime | None, interval: ParameterInterval, desc: bool, skip: int, take: int, session: AsyncSession
+):
+    user_ids = [20013541, 20416720]
+    user_histories = await get_user_histories(session, user_ids, False, None, from_date, to_date, interval, desc, skip, take)
+
+    for user_id in user_ids:
+        expected_user_history = await get_user_history(session, user_id, False, from_date, to_date, interval, desc, skip, take)
+        assert [collection.collected_at for collection, _ in user_histories[user_id]] == [
+            collection.collected_at for collection, _ in expected_user_history
+        ]
+
+
+async def test_get_user_histories_by_collection_id(session: AsyncSession):
+    collection = (await get_collections(session, interval=ParameterInterval.HOURLY, take=1))[0]
+    user_histories = await get_user_histories(session, [20013541, 20416720], collection_id=collection.collection_id)
+
+    for user_history in user_histories.values():
+        __assert_correct_types(user_history)
+        assert len(user_history) == 1
+        assert user_history[0][0].collection_id == collection.collection_id
+
+
+# ----- Helpers -----
+
+
+def __assert_correct_types(user_history: list[tuple[CollectionDB, UserDB]]):
+    assert isinstance(user_history, list)
+    for entry in user_history:
+        assert isinstance(entry, tuple)
+        assert len(entry) == 2
+        assert isinstance(entry[0], CollectionDB)
+        assert isinstance(entry[1], UserDB)
@@ -5,7 +5,7 @@ import pytest
 import test_cases_db
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.api.database.crud import get_user_history
+from src.api.database.crud import get_page_timestamps, get_user_history
 from src.api.database.models import CollectionDB, UserDB
 from src.api.models.enums import ParameterInterval, ParameterOnMissing
 
@@ -246,3 +246,45 @@ def __assert_dummy_collection(user_history_collection: tuple[CollectionDB, UserD
     assert user_history_collection[0].fleet_count == 0
     assert user_history_collection[0].user_count == 0
     assert user_history_collection[1] is None
+
+
+@pytest.mark.parametrize(["desc"], [pytest.param(False, id="asc"), pytest.param(True, id="desc")])
+async def test_get_user_history_start_after(desc: bool, session: AsyncSession):
+    expected_user_history = await get_user_history(session, 20013541, include_alliance=False, interval=ParameterInterval.HOURLY, desc=desc)
+
+    user_history = []
+    start_after = None
+    while True:
+        page = await get_user_history(
+            session, 20013541, include_alliance=False, interval=ParameterInterval.HOURLY, desc=desc, take=5, start_after=start_after
+        )
+        user_history.extend(page)
+        if len(page) < 5:
+            break
+        start_after = page[-1][0].collected_at
+
+    assert len(user_history) == 18
+    assert [collection.collected_at for collection, _ in user_history] == [collection.collected_at for collection, _ in expected_user_history]
+
+
+@pytest.mark.parametrize(["on_missing"], [pytest.param(ParameterOnMissing.EMPTY, id="empty"), pytest.param(ParameterOnMissing.NULL, id="null")])
+async def test_get_user_history_start_after_on_missing(on_missing: ParameterOnMissing, session: AsyncSession):
+    """Pages of Collections the User is missing from are full as well, so paging continues with the slots of the page."""
+    from_date, to_date = datetime(2025, 9, 30, 10, 0, 0), datetime(2025, 9, 30, 20, 0, 0)
+    expected_user_history = await get_user_history(
+        session, 20013541, include_alliance=False, from_date=from_date, to_date=to_date, interval=ParameterInterval.HOURLY, on_missing=on_missing
+    )
+
+    user_history = []
+    start_after = None
+    while True:
+        page_parameters = (from_date, to_date, ParameterInterval.HOURLY, False, 0, 2)
+        page = await get_user_history(session, 20013541, False, *page_parameters, on_missing=on_missing, start_after=start_after)
+        page_timestamps = await get_page_timestamps(session, *page_parameters, on_missing, start_after)
+        user_history.extend(page)
+        if len(page_timestamps) < 2:
+            break
+        start_after = page_timestamps[-1]
+
+    assert expected_user_history
+    assert [entry and entry[0].collected_at for entry in user_history] == [entry and entry[0].collected_at for entry in expected_user_history]
@@ -0,0 +1,78 @@
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_user_history, get_user_history_deltas
+from src.api.models.enums import ParameterInterval, ParameterUserMetric
+
+
+test_cases_interval = [
+    # user_id, interval, expected_length
+    pytest.param(20013541, ParameterInterval.HOURLY, 18, id="hourly"),
+    pytest.param(20013541, ParameterInterval.DAILY, 9, id="daily"),
+    pytest.param(20013541, ParameterInterval.MONTHLY, 3, id="monthly"),
+]
+
+test_cases_metrics = [
+    # metrics
+    pytest.param([ParameterUserMetric.TROPHY], id="single_metric"),
+    pytest.param([ParameterUserMetric.CREW_DONATED, ParameterUserMetric.TROPHY], id="two_metrics"),
+    pytest.param(list(ParameterUserMetric), id="all_metrics"),
+]
+
+test_cases_skip_take = [
+    # user_id, skip, take, expected_length
+    pytest.param(20013541, 0, 100, 18, id="skip_0_take_100"),
+    pytest.param(20013541, 5, 5, 5, id="skip_5_take_5"),
+    pytest.param(20013541, 18, 100, 0, id="skip_18_take_100"),
+]
+
+
+# ----- Test functions -----
+
+
+@pytest.mark.parametrize(["user_id", "interval", "expected_length"], test_cases_interval)
+@pytest.mark.parametrize(["metrics"], test_cases_metrics)
+async def test_get_user_history_deltas_match_history(
+    user_id: int, interval: ParameterInterval, expected_length: int, metrics: list[ParameterUserMetric], session: AsyncSession
+):
+    user_history = await get_user_history(session, user_id, include_alliance=False, interval=interval)
+    deltas = await get_user_history_deltas(session, user_id, metrics, interval=interval)
+
+    assert len(deltas) == expected_length
+    previous_values = None
+    for (collection, user), (collection_id, collected_at, values, changes, rates) in zip(user_history, deltas, strict=True):
+        assert collection_id == collection.collection_id
+        assert collected_at == collection.collected_at
+        assert values == [getattr(user, metric.value) for metric in metrics]
+        assert len(rates) == len(metrics)
+        if previous_values is None:
+            assert changes == [None] * len(metrics)
+            assert rates == [None] * len(metrics)
+        else:
+            assert changes == [__subtract(value, previous) for value, previous in zip(values, previous_values, strict=True)]
+        previous_values = values
+
+
+@pytest.mark.parametrize(["user_id", "skip", "take", "expected_length"], test_cases_skip_take)
+async def test_get_user_history_deltas_by_skip_take(user_id: int, skip: int, take: int, expected_length: int, session: AsyncSession):
+    all_deltas = await get_user_history_deltas(session, user_id, [ParameterUserMetric.TROPHY], interval=ParameterInterval.HOURLY)
+    deltas = await get_user_history_deltas(session, user_id, [ParameterUserMetric.TROPHY], interval=ParameterInterval.HOURLY, skip=skip, take=take)
+
+    assert len(deltas) == expected_length
+    assert deltas == all_deltas[skip : skip + take]
+
+
+async def test_get_user_history_deltas_desc(session: AsyncSession):
+    deltas_asc = await get_user_history_deltas(session, 20013541, [ParameterUserMetric.TROPHY], interval=ParameterInterval.HOURLY)
+    deltas_desc = await get_user_history_deltas(session, 20013541, [ParameterUserMetric.TROPHY], interval=ParameterInterval.HOURLY, desc=True)
+
+    assert deltas_desc == list(reversed(deltas_asc))
+
+
+# ----- Helpers -----
+
+
+def __subtract(value: int | None, previous: int | None) -> int | None:
+    if value is None or previous is None:
+        return None
+    return value - previous
@@ -3,9 +3,97 @@ from datetime import datetime, timezone
 import pytest
 
 from src.api import utils
-from src.api.database.crud import _get_date_defaults
+from src.api.database.crud import _get_alliance_events, _get_date_defaults, _get_expected_timestamps, _get_user_events
+from src.api.models.enums import EntityEventType, ParameterInterval
 
 
+test_cases__get_alliance_events = [
+    # values, expected_result
+    pytest.param(
+        {"old_id": None, "new_id": 1, "old_alliance_name": None, "new_alliance_name": "A1"},
+        [(EntityEventType.ALLIANCE_CREATED, None, "A1")],
+        id="created",
+    ),
+    pytest.param(
+        {"old_id": 1, "new_id": None, "old_alliance_name": "A1", "new_alliance_name": None},
+        [(EntityEventType.ALLIANCE_DISBANDED, "A1", None)],
+        id="disbanded",
+    ),
+    pytest.param(
+        {"old_id": 1, "new_id": 1, "old_alliance_name": "A1", "new_alliance_name": "A2", "old_division_design_id": 1, "new_division_design_id": 2},
+        [(EntityEventType.RENAMED, "A1", "A2"), (EntityEventType.DIVISION_CHANGED, 1, 2)],
+        id="renamed_and_division_changed",
+    ),
+]
+"""values, expected_result"""
+
+test_cases__get_user_events = [
+    # values, expected_result
+    pytest.param(
+        {"old_id": None, "new_id": 1, "old_alliance_id": None, "new_alliance_id": 0},
+        [],
+        id="appeared",
+    ),
+    pytest.param(
+        {"old_id": None, "new_id": 1, "old_alliance_id": None, "new_alliance_id": 1},
+        [(EntityEventType.JOINED_ALLIANCE, None, 1)],
+        id="appeared_in_alliance",
+    ),
+    pytest.param(
+        {"old_id": 1, "new_id": None, "old_alliance_id": 0, "new_alliance_id": None},
+        [],
+        id="disappeared",
+    ),
+    pytest.param(
+        {"old_id": 1, "new_id": None, "old_alliance_id": 1, "new_alliance_id": None},
+        [(EntityEventType.LEFT_ALLIANCE, 1, None)],
+        id="disappeared_from_alliance",
+    ),
+    pytest.param(
+        {
+            "old_id": 1,
+            "new_id": 1,
+            "old_user_name": "U1",
+            "new_user_name": "U2",
+            "old_alliance_id": 0,
+            "new_alliance_id": 1,
+            "old_alliance_membership": "None",
+            "new_alliance_membership": "Candidate",
+        },
+        [(EntityEventType.RENAMED, "U1", "U2"), (EntityEventType.JOINED_ALLIANCE, None, 1)],
+        id="renamed_and_joined",
+    ),
+    pytest.param(
+        {
+            "old_id": 1,
+            "new_id": 1,
+            "old_user_name": "U1",
+            "new_user_name": "U1",
+            "old_alliance_id": 1,
+            "new_alliance_id": 2,
+            "old_alliance_membership": "Major",
+            "new_alliance_membership": "Candidate",
+        },
+        [(EntityEventType.LEFT_ALLIANCE, 1, None), (EntityEventType.JOINED_ALLIANCE, None, 2)],
+        id="switched_alliance",
+    ),
+    pytest.param(
+        {
+            "old_id": 1,
+            "new_id": 1,
+            "old_user_name": "U1",
+            "new_user_name": "U1",
+            "old_alliance_id": 1,
+            "new_alliance_id": 1,
+            "old_alliance_membership": "Major",
+            "new_alliance_membership": "Commander",
+        },
+        [(EntityEventType.RANK_CHANGED, "Major", "Commander")],
+        id="rank_changed",
+    ),
+]
+"""values, expected_result"""
+
 test_cases__get_date_defaults = [
     # from_date, to_date, expected_from_date, expected_to_date
     pytest.param(
@@ -95,3 +183,102 @@ def test__get_date_defaults(
         assert to_date_result > utc_start and to_date_result < utc_end
     else:
         assert to_date_result == expected_to_date
+
+
+test_cases__get_expected_timestamps = [
+    # from_date, to_date, interval, desc, skip, take, expected_result
+    pytest.param(
+        datetime(2019, 1, 1),
+        datetime(2019, 1, 1, 3),
+        ParameterInterval.HOURLY,
+        False,
+        0,
+        100,
+        [datetime(2019, 1, 1, 0, 59), datetime(2019, 1, 1, 1, 59), datetime(2019, 1, 1, 2, 59)],
+        id="hourly",
+    ),
+    pytest.param(
+        datetime(2019, 1, 1),
+        datetime(2019, 1, 1, 3),
+        ParameterInterval.HOURLY,
+        True,
+        1,
+        1,
+        [datetime(2019, 1, 1, 1, 59)],
+        id="hourly_desc_skip_take",
+    ),
+    pytest.param(
+        datetime(2019, 1, 1, 12),
+        datetime(2019, 1, 4),
+        ParameterInterval.DAILY,
+        False,
+        0,
+        100,
+        [datetime(2019, 1, 1, 23, 59), datetime(2019, 1, 2, 23, 59), datetime(2019, 1, 3, 23, 59)],
+        id="daily",
+    ),
+    pytest.param(
+        datetime(2019, 1, 1),
+        datetime(2019, 3, 31, 23, 58),
+        ParameterInterval.MONTHLY,
+        False,
+        0,
+        100,
+        [datetime(2019, 1, 31, 23, 59), datetime(2019, 2, 28, 23, 59)],
+        id="monthly",
+    ),
+    pytest.param(
+        datetime(2016, 1, 6),
+        datetime(2024, 3, 1),
+        ParameterInterval.MONTHLY,
+        True,
+        0,
+        2,
+        [datetime(2024, 2, 29, 23, 59), datetime(2024, 1, 31, 23, 59)],
+        id="monthly_desc_leap_year",
+    ),
+    pytest.param(
+        datetime(2019, 1, 1),
+        datetime(2019, 1, 1, 0, 30),
+        ParameterInterval.HOURLY,
+        False,
+        0,
+        100,
+        [],
+        id="empty",
+    ),
+    pytest.param(
+        datetime(2019, 1, 1),
+        datetime(2019, 1, 1, 3),
+        ParameterInterval.HOURLY,
+        False,
+        5,
+        100,
+        [],
+        id="skip_beyond_end",
+    ),
+]
+"""from_date, to_date, interval, desc, skip, take, expected_result"""
+
+
+@pytest.mark.parametrize(["from_date", "to_date", "interval", "desc", "skip", "take", "expected_result"], test_cases__get_expected_timestamps)
+def test__get_expected_timestamps(
+    from_date: datetime,
+    to_date: datetime,
+    interval: ParameterInterval,
+    desc: bool,
+    skip: int,
+    take: int,
+    expected_result: list[datetime],
+):
+    assert _get_expected_timestamps(from_date, to_date, interval, desc, skip, take) == expected_result
+
+
+@pytest.mark.parametrize(["values", "expected_result"], test_cases__get_alliance_events)
+def test__get_alliance_events(values: dict, expected_result: list[tuple]):
+    assert _get_alliance_events(values) == expected_result
+
+
+@pytest.mark.parametrize(["values", "expected_result"], test_cases__get_user_events)
+def test__get_user_events(values: dict, expected_result: list[tuple]):
+    assert _get_user_events(values) == expected_result
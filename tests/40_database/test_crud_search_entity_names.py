@@ -0,0 +1,96 @@
+from datetime import datetime
+
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database.crud import get_collection, get_collections, save_collection, search_entity_names
+from src.api.database.models import CollectionDB, EntityNameDB
+from src.api.models.enums import EntityType, ParameterInterval, ParameterSearchMode
+
+
+# ----- Test functions -----
+
+
+async def test_search_entity_names_prefix(session: AsyncSession):
+    user = await __get_any_user(session)
+    prefix = user.user_name[:3].upper()
+
+    matches = await search_entity_names(session, prefix, EntityType.USER, ParameterSearchMode.PREFIX, take=100)
+
+    assert matches
+    assert all(entity_name.name.upper().startswith(prefix) for entity_name, _ in matches)
+    assert all(entity_name.entity_type == EntityType.USER for entity_name, _ in matches)
+
+
+async def test_search_entity_names_substring(session: AsyncSession):
+    user = await __get_any_user(session)
+    substring = user.user_name[1:4].lower()
+
+    matches = await search_entity_names(session, substring, mode=ParameterSearchMode.SUBSTRING, take=100)
+
+    assert all(substring in entity_name.name.lower() for entity_name, _ in matches)
+
+
+async def test_search_entity_names_similar_ranks_exact_match_first(session: AsyncSession):
+    user = await __get_any_user(session)
+
+    matches = await search_entity_names(session, user.user_name, EntityType.USER, ParameterSearchMode.SIMILAR)
+
+    assert matches[0][0].name == user.user_name
+    assert matches[0][1] == 1
+    assert [score for _, score in matches] == sorted((score for _, score in matches), reverse=True)
+
+
+async def test_search_entity_names_escapes_wildcards(session: AsyncSession):
+    matches = await search_entity_names(session, "%", mode=ParameterSearchMode.SUBSTRING)
+
+    assert all("%" in entity_name.name for entity_name, _ in matches)
+
+
+async def test_search_entity_names_skip_take(session: AsyncSession):
+    user = await __get_any_user(session)
+
+    matches = await search_entity_names(session, user.user_name[:1], take=10)
+    skipped_matches = await search_entity_names(session, user.user_name[:1], skip=5, take=5)
+
+    assert __to_keys(skipped_matches) == __to_keys(matches[5:])
+
+
+async def test_entity_names_recorded_on_save(session: AsyncSession):
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=100)
+    collection = await get_collection(session, collections[0].collection_id, True, True)
+    user = collection.users[0]
+
+    entity_name = await __get_entity_name(session, EntityType.USER, user.user_id, user.user_name)
+
+    assert entity_name.first_seen_at <= collection.collected_at <= entity_name.last_seen_at
+
+
+async def test_entity_names_time_frame_widened_on_save(session: AsyncSession, new_collection: CollectionDB):
+    user_id, user_name = new_collection.users[0].user_id, new_collection.users[0].user_name
+    new_collection = await save_collection(session, new_collection, True, True)
+
+    entity_name = await __get_entity_name(session, EntityType.USER, user_id, user_name)
+
+    assert entity_name.first_seen_at <= new_collection.collected_at <= entity_name.last_seen_at
+
+
+# ----- Helpers -----
+
+
+async def __get_any_user(session: AsyncSession):
+    collections = await get_collections(session, to_date=datetime(2025, 1, 1), interval=ParameterInterval.HOURLY, take=1)
+    collection = await get_collection(session, collections[0].collection_id, False, True)
+    return next(user for user in collection.users if len(user.user_name) >= 4)
+
+
+async def __get_entity_name(session: AsyncSession, entity_type: EntityType, entity_id: int, name: str) -> EntityNameDB:
+    query = select(EntityNameDB).where(
+        col(EntityNameDB.entity_type) == entity_type, col(EntityNameDB.entity_id) == entity_id, col(EntityNameDB.name) == name
+    )
+    async with session:
+        return (await session.exec(query)).one()
+
+
+def __to_keys(matches: list) -> list[tuple]:
+    return [(entity_name.entity_type, entity_name.entity_id, entity_name.name) for entity_name, _ in matches]
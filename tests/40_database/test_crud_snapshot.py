@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api import snapshot
+from src.api.database import crud
+from src.api.database.models import CollectionDB
+
+
+async def test_write_snapshot_no_collections(session: AsyncSession, tmp_path: Path):
+    await snapshot.write_snapshot(session, tmp_path, 3)
+
+    shared_snapshot = snapshot.read_snapshot(tmp_path)
+    assert shared_snapshot.latest is None
+    assert shared_snapshot.catalog.num_rows == 0
+    assert not await snapshot._is_outdated(session, shared_snapshot, 3)
+
+
+async def test_write_snapshot(session: AsyncSession, new_collection: CollectionDB, tmp_path: Path):
+    alliance_count = len(new_collection.alliances)
+    user_count = len(new_collection.users)
+    collection = await crud.save_collection(session, new_collection, True, True)
+    collection_id = collection.collection_id
+
+    version = await snapshot.write_snapshot(session, tmp_path, 3)
+    shared_snapshot = snapshot.read_snapshot(tmp_path)
+    assert shared_snapshot.version == version
+    assert shared_snapshot.latest.collection_id == collection_id
+    assert len(shared_snapshot.latest.alliances) == alliance_count
+    assert len(shared_snapshot.latest.users) == user_count
+    assert not await snapshot._is_outdated(session, shared_snapshot, 3)
+
+    await snapshot.write_snapshot(session, tmp_path, 3, shared_snapshot)
+    assert snapshot.read_snapshot(tmp_path).latest.to_collection() == shared_snapshot.latest.to_collection()
+
+
+async def test_is_outdated(session: AsyncSession, new_collection: CollectionDB, tmp_path: Path):
+    await snapshot.write_snapshot(session, tmp_path, 3)
+    shared_snapshot = snapshot.read_snapshot(tmp_path)
+
+    await crud.save_collection(session, new_collection, True, True)
+    assert await snapshot._is_outdated(session, shared_snapshot, 3)
+    assert await snapshot._is_outdated(session, None, 3)
@@ -0,0 +1,115 @@
+import dataclasses
+from datetime import timedelta
+from typing import Iterable
+
+import pytest
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.database import crud, db, delta_storage
+from src.api.database.models import CollectionDB, UserCarriedForwardDB, UserDB
+
+
+test_cases_get_unchanged_users = [
+    # previous_users, users, expected_result
+    pytest.param({}, [(1, (10, "a"))], {}, id="no_previous_users"),
+    pytest.param({1: ((10, "a"), 5)}, [(1, (10, "a"))], {1: 5}, id="unchanged"),
+    pytest.param({1: ((10, "a"), 5)}, [(1, (11, "a"))], {}, id="changed"),
+    pytest.param({1: ((10, "a"), 5), 2: ((20, "b"), 3)}, [(1, (10, "a")), (2, (20, "c")), (3, (30, "d"))], {1: 5}, id="mixed"),
+]
+"""previous_users, users, expected_result"""
+
+
+@pytest.fixture(scope="function")
+def delta_storage_enabled(monkeypatch: pytest.MonkeyPatch):
+    settings = dataclasses.replace(delta_storage.SETTINGS, user_delta_storage_enabled=True)
+    monkeypatch.setattr(delta_storage, "SETTINGS", settings)
+    monkeypatch.setattr(crud, "SETTINGS", settings)
+
+
+# ----- Test functions -----
+
+
+@pytest.mark.parametrize(["previous_users", "users", "expected_result"], test_cases_get_unchanged_users)
+def test_get_unchanged_users(previous_users: delta_storage.UserSnapshot, users: list[tuple[int, tuple]], expected_result: dict[int, int]):
+    assert delta_storage.get_unchanged_users(previous_users, users) == expected_result
+
+
+@pytest.mark.usefixtures("delta_storage_enabled")
+async def test_save_collection_carries_forward_unchanged_users(session: AsyncSession, test_data: dict):
+    first_collection, second_collection = __create_consecutive_collections(test_data)
+    expected_users = __get_user_values(__create_consecutive_collections(test_data)[0].users)
+
+    await crud.save_collection(session, first_collection, True, True)
+    second_collection = await crud.save_collection(session, second_collection, True, True)
+    collection_id = second_collection.collection_id
+
+    assert await __count(session, UserDB, collection_id) == 0
+    assert await __count(session, UserCarriedForwardDB, collection_id) == len(expected_users)
+
+    collection = await crud.get_collection(session, collection_id, False, True)
+    assert __get_user_values(collection.users) == expected_users
+
+    top_100 = await crud.get_top_100_from_collection(session, collection_id)
+    assert [user.trophy for user in top_100] == sorted((user.trophy for user in collection.users), reverse=True)[:100]
+
+    user_id = next(iter(expected_users))
+    collection_user = await crud.get_user_from_collection(session, collection_id, user_id)
+    assert delta_storage.get_user_values(collection_user[1]) == expected_users[user_id]
+
+
+async def test_compress_and_expand_users(session: AsyncSession, test_data: dict):
+    first_collection, second_collection = __create_consecutive_collections(test_data)
+    expected_users = __get_user_values(__create_consecutive_collections(test_data)[0].users)
+
+    first_collection = await crud.save_collection(session, first_collection, True, True)
+    second_collection = await crud.save_collection(session, second_collection, True, True)
+    first_collection_id = first_collection.collection_id
+    collection_id = second_collection.collection_id
+
+    previous_users = await delta_storage.get_user_snapshot(session, first_collection_id)
+    snapshot, carried_forward_count = await delta_storage.compress_users(session, collection_id, previous_users)
+    assert carried_forward_count == len(expected_users)
+    assert all(source_collection_id == first_collection_id for _, source_collection_id in snapshot.values())
+    assert await __count(session, UserDB, collection_id) == 0
+    assert {user_id: values for user_id, (values, _) in (await delta_storage.get_user_snapshot(session, collection_id)).items()} == expected_users
+
+    expanded_count = await delta_storage.expand_users(session, collection_id)
+    assert expanded_count == len(expected_users)
+    assert await __count(session, UserDB, collection_id) == len(expected_users)
+    assert await __count(session, UserCarriedForwardDB, collection_id) == 0
+
+
+@pytest.mark.usefixtures("delta_storage_enabled")
+async def test_delete_collection_expands_dependent_users(session: AsyncSession, test_data: dict):
+    first_collection, second_collection = __create_consecutive_collections(test_data)
+    expected_users = __get_user_values(__create_consecutive_collections(test_data)[0].users)
+
+    first_collection = await crud.save_collection(session, first_collection, True, True)
+    second_collection = await crud.save_collection(session, second_collection, True, True)
+    first_collection_id = first_collection.collection_id
+    collection_id = second_collection.collection_id
+
+    assert await crud.delete_collection(session, first_collection_id)
+
+    assert await __count(session, UserDB, collection_id) == len(expected_users)
+    collection = await crud.get_collection(session, collection_id, False, True)
+    assert __get_user_values(collection.users) == expected_users
+
+
+# ----- Helper functions -----
+
+
+async def __count(session: AsyncSession, table: type[UserDB] | type[UserCarriedForwardDB], collection_id: int) -> int:
+    return (await session.exec(select(func.count()).select_from(table).where(table.collection_id == collection_id))).one()
+
+
+def __create_consecutive_collections(test_data: dict) -> tuple[CollectionDB, CollectionDB]:
+    first_collection = db.create_collections_from_dummy_data(test_data)[0]
+    second_collection = db.create_collections_from_dummy_data(test_data)[0]
+    second_collection.collected_at += timedelta(hours=1)
+    return first_collection, second_collection
+
+
+def __get_user_values(users: Iterable[UserDB]) -> dict[int, tuple]:
+    return {user.user_id: delta_storage.get_user_values(user) for user in users}
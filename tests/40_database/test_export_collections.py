@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import pyarrow.parquet as pq
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api import export
+from src.api.database import crud, db
+from src.api.database.models import CollectionDB, UserDB
+from src.api.models.enums import ExportTable
+
+
+async def test_export_collections(session: AsyncSession, tmp_path: Path):
+    collections = (await session.exec(select(CollectionDB.collection_id, CollectionDB.collected_at))).all()
+    months = {export.get_month(collected_at) for _, collected_at in collections}
+    user_count = (await session.exec(select(func.count()).select_from(UserDB))).one()
+
+    export_files = await export.export_collections(session, tmp_path)
+    assert {export_file.month for export_file in export_files} == months
+    assert len(export_files) == len(months) * len(ExportTable)
+    assert sum(export_file.row_count for export_file in export_files if export_file.table == ExportTable.COLLECTIONS) == len(collections)
+    assert sum(export_file.row_count for export_file in export_files if export_file.table == ExportTable.USERS) == user_count
+
+    users = pq.read_table(export_files[-1].path)
+    assert users.schema == export.get_arrow_schema(UserDB.__table__)
+
+
+async def test_export_collections_incremental(session: AsyncSession, tmp_path: Path, test_data: dict):
+    await export.export_collections(session, tmp_path)
+    assert await export.export_collections(session, tmp_path) == []
+
+    collection = db.create_collections_from_dummy_data(test_data)[0]
+    collection.collected_at = collection.collected_at.replace(year=2030)
+    month = export.get_month(collection.collected_at)
+    collection = await crud.save_collection(session, collection, True, True)
+    collection_id = collection.collection_id
+
+    export_files = await export.export_collections(session, tmp_path)
+    assert {export_file.month for export_file in export_files} == {month}
+
+    collections_file = next(export_file for export_file in export_files if export_file.table == ExportTable.COLLECTIONS)
+    assert pq.read_table(collections_file.path).column("collection_id").to_pylist() == [collection_id]
+
+
+async def test_export_collections_updated(session: AsyncSession, tmp_path: Path):
+    await export.export_collections(session, tmp_path)
+
+    collection_id, collected_at = (await session.exec(select(CollectionDB.collection_id, CollectionDB.collected_at))).first()
+    new_collection = await crud.get_collection(session, collection_id, True, True)
+    new_collection.duration = 1234.5
+    await crud.update_collection(session, collection_id, new_collection)
+
+    export_files = await export.export_collections(session, tmp_path)
+    assert {export_file.month for export_file in export_files} == {export.get_month(collected_at)}
+
+    collections_file = next(export_file for export_file in export_files if export_file.table == ExportTable.COLLECTIONS)
+    exported = pq.read_table(collections_file.path).to_pylist()
+    assert [row["duration"] for row in exported if row["collection_id"] == collection_id] == [1234.5]
+    assert await export.export_collections(session, tmp_path) == []
+
+
+async def test_export_collections_deleted(session: AsyncSession, tmp_path: Path, test_data: dict):
+    collection_ids = []
+    for day in (1, 2):
+        collection = db.create_collections_from_dummy_data(test_data)[0]
+        collection.collected_at = collection.collected_at.replace(year=2031, month=1, day=day)
+        collection = await crud.save_collection(session, collection, True, True)
+        collection_ids.append(collection.collection_id)
+    month = export.get_month(collection.collected_at)
+    await export.export_collections(session, tmp_path)
+
+    await crud.delete_collection(session, collection_ids[0])
+    export_files = await export.export_collections(session, tmp_path)
+    assert {export_file.month for export_file in export_files} == {month}
+    for export_file in export_files:
+        assert set(pq.read_table(export_file.path).column("collection_id").to_pylist()) == {collection_ids[1]}
+
+    await crud.delete_collection(session, collection_ids[1])
+    assert await export.export_collections(session, tmp_path) == []
+    assert month not in {export_file.month for export_file in export.get_export_files(tmp_path)}
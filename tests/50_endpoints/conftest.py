@@ -1,21 +1,50 @@
+import dataclasses
 import json
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Callable
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from fastapi import Request
 from fastapi.testclient import TestClient
 from httpx import Response as HttpXResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.api import main
+from src.api import export, main, snapshot
 from src.api.database import crud
-from src.api.database.models import CollectionDB
+from src.api.database.models import (
+    AllianceRankDB,
+    CollectionDB,
+    CollectionStatsDB,
+    DivisionStandingDB,
+    EntityEventDB,
+    EntityNameDB,
+    EntityNameSpanDB,
+    HistogramDB,
+    TournamentAllianceProgressDB,
+    TournamentDB,
+    TournamentUserDeltaDB,
+    UserRankDB,
+)
 from src.api.models import AllianceHistoryOut, AllianceOut, CollectionOut, CollectionWithFleetsOut, CollectionWithUsersOut, UserHistoryOut, UserOut
 from src.api.models.converters import FromDB
-from src.api.models.enums import ErrorCode, ParameterInterval
+from src.api.models.enums import (
+    EntityChange,
+    EntityEventType,
+    EntityType,
+    ErrorCode,
+    ExportTable,
+    ParameterAllianceMetric,
+    ParameterInterval,
+    ParameterOnMissing,
+    ParameterSearchMode,
+    ParameterUserMetric,
+)
 from src.api.models.error import ErrorOut
-from src.api.routers import dependencies
+from src.api.routers import dependencies, exports
+from tests import conftest
 
 
 # Response objects
@@ -159,6 +188,85 @@ def patch_delete_collection_true(monkeypatch):
     monkeypatch.setattr(crud, crud.delete_collection.__name__, mock_delete_collection)
 
 
+@pytest.fixture(scope="function")
+def patch_export_collections(monkeypatch):
+    async def mock_export_collections(session: AsyncSession, directory: str | Path, full: bool = False):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(directory, (str, Path))
+        assert isinstance(full, bool)
+
+        return [export.ExportFile("2024-06", ExportTable.USERS, Path(directory, "month=2024-06", "users.parquet"), 3, 1024)]
+
+    monkeypatch.setattr(export, export.export_collections.__name__, mock_export_collections)
+
+
+@pytest.fixture(scope="function")
+def patch_export_directory(tmp_path: Path, monkeypatch) -> Path:
+    path = export.get_export_path(tmp_path, "2024-06", ExportTable.COLLECTIONS)
+    path.parent.mkdir(parents=True)
+    pq.write_table(pa.table({"collection_id": [1, 2]}), path)
+
+    monkeypatch.setattr(exports, "SETTINGS", dataclasses.replace(exports.SETTINGS, export_directory=str(tmp_path)))
+    return path
+
+
+@pytest.fixture(scope="function")
+def patch_get_alliance_changes(monkeypatch):
+    async def mock_get_alliance_changes(session: AsyncSession, from_collection_id: int, to_collection_id: int):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(from_collection_id, int)
+        assert isinstance(to_collection_id, int)
+
+        yield (1, EntityChange.APPEARED, None, "Test Alliance")
+
+    monkeypatch.setattr(crud, crud.get_alliance_changes.__name__, mock_get_alliance_changes)
+
+
+@pytest.fixture(scope="function")
+def patch_get_alliance_histogram(histogram_db: HistogramDB, monkeypatch):
+    async def mock_get_alliance_histogram(session: AsyncSession, collection_id: int, metric: ParameterAllianceMetric, buckets: int = 50):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+        assert isinstance(metric, ParameterAllianceMetric)
+        assert isinstance(buckets, int)
+
+        return histogram_db
+
+    monkeypatch.setattr(crud, crud.get_alliance_histogram.__name__, mock_get_alliance_histogram)
+
+
+@pytest.fixture(scope="function")
+def patch_get_alliance_histories(alliance_history_db, monkeypatch):
+    async def mock_get_alliance_histories(
+        session: AsyncSession,
+        alliance_ids: list[int],
+        include_users: bool = True,
+        collection_id: int | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        interval: ParameterInterval = ParameterInterval.MONTHLY,
+        desc: bool = False,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(alliance_ids, list)
+        assert all(isinstance(alliance_id, int) for alliance_id in alliance_ids)
+        assert len(alliance_ids) == len(set(alliance_ids))
+        assert isinstance(include_users, bool)
+        assert not collection_id or isinstance(collection_id, int)
+        assert not from_date or isinstance(from_date, datetime)
+        assert not to_date or isinstance(to_date, datetime)
+        assert isinstance(interval, ParameterInterval)
+        assert isinstance(desc, bool)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return {alliance_id: [alliance_history_db] for alliance_id in alliance_ids}
+
+    monkeypatch.setattr(crud, crud.get_alliance_histories.__name__, mock_get_alliance_histories)
+
+
 @pytest.fixture(scope="function")
 def patch_get_alliance_history(alliance_history_db, monkeypatch):
     async def mock_get_alliance_history(
@@ -171,6 +279,9 @@ def patch_get_alliance_history(alliance_history_db, monkeypatch):
         desc: bool = False,
         skip: int = 0,
         take: int = 100,
+        on_missing: ParameterOnMissing = ParameterOnMissing.SKIP,
+        start_after: datetime | None = None,
+        division_design_id: int | None = None,
     ):
         assert isinstance(session, AsyncSession)
         assert isinstance(alliance_id, int)
@@ -181,12 +292,40 @@ def patch_get_alliance_history(alliance_history_db, monkeypatch):
         assert isinstance(desc, bool)
         assert not skip or isinstance(skip, int)
         assert not take or isinstance(take, int)
+        assert isinstance(on_missing, ParameterOnMissing)
+        assert not start_after or isinstance(start_after, datetime)
+        assert division_design_id is None or isinstance(division_design_id, int)
 
-        return [alliance_history_db]
+        return [
+            alliance_history_db,
+            *[(collection, None) if collection else None for collection in _create_missing_collections(on_missing, alliance_history_db[0])],
+        ]
 
     monkeypatch.setattr(crud, crud.get_alliance_history.__name__, mock_get_alliance_history)
 
 
+@pytest.fixture(scope="function")
+def patch_get_alliance_leaderboard(alliance_rank_db: AllianceRankDB, monkeypatch):
+    async def mock_get_alliance_leaderboard(
+        session: AsyncSession,
+        collection_id: int,
+        metric: ParameterAllianceMetric,
+        division_design_id: int | None = None,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+        assert isinstance(metric, ParameterAllianceMetric)
+        assert division_design_id is None or isinstance(division_design_id, int)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return [alliance_rank_db]
+
+    monkeypatch.setattr(crud, crud.get_alliance_leaderboard.__name__, mock_get_alliance_leaderboard)
+
+
 @pytest.fixture(scope="function")
 def patch_get_alliance_from_collection(alliance_history_db, monkeypatch):
     async def mock_get_alliance_from_collection(session: AsyncSession, collection_id: int, alliance_id: int):
@@ -201,11 +340,14 @@ def patch_get_alliance_from_collection(alliance_history_db, monkeypatch):
 
 @pytest.fixture(scope="function")
 def patch_get_collection_none(monkeypatch):
-    async def mock_get_collection(session: AsyncSession, collection_id: int, include_alliances: bool, include_users: bool):
+    async def mock_get_collection(
+        session: AsyncSession, collection_id: int, include_alliances: bool, include_users: bool, division_design_id: int | None = None
+    ):
         assert isinstance(session, AsyncSession)
         assert isinstance(collection_id, int)
         assert isinstance(include_alliances, bool)
         assert isinstance(include_users, bool)
+        assert division_design_id is None or isinstance(division_design_id, int)
 
         return None
 
@@ -214,11 +356,14 @@ def patch_get_collection_none(monkeypatch):
 
 @pytest.fixture(scope="function")
 def patch_get_collection(collection_db: CollectionDB, monkeypatch):
-    async def mock_get_collection(session: AsyncSession, collection_id: int, include_alliances: bool, include_users: bool):
+    async def mock_get_collection(
+        session: AsyncSession, collection_id: int, include_alliances: bool, include_users: bool, division_design_id: int | None = None
+    ):
         assert isinstance(session, AsyncSession)
         assert isinstance(collection_id, int)
         assert isinstance(include_alliances, bool)
         assert isinstance(include_users, bool)
+        assert division_design_id is None or isinstance(division_design_id, int)
 
         if not include_alliances:
             collection_db.alliances = []
@@ -229,6 +374,11 @@ def patch_get_collection(collection_db: CollectionDB, monkeypatch):
     monkeypatch.setattr(crud, crud.get_collection.__name__, mock_get_collection)
 
 
+@pytest.fixture(scope="function")
+def patch_get_collection_tournament(collection_db: CollectionDB, patch_get_collection):
+    collection_db.tournament_running = True
+
+
 @pytest.fixture(scope="function")
 def patch_get_collection_by_timestamp(collection_db: CollectionDB, monkeypatch):
     async def mock_get_collection_by_timestamp(session: AsyncSession, collected_at: datetime):
@@ -251,6 +401,52 @@ def patch_get_collection_by_timestamp_none(monkeypatch):
     monkeypatch.setattr(crud, crud.get_collection_by_timestamp.__name__, mock_get_collection_by_timestamp)
 
 
+@pytest.fixture(scope="function")
+def patch_get_collection_stats(collection_db: CollectionDB, collection_stats_db: CollectionStatsDB, monkeypatch):
+    async def mock_get_collection_stats(session: AsyncSession, collection_id: int):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+
+        return (collection_db, collection_stats_db)
+
+    monkeypatch.setattr(crud, crud.get_collection_stats.__name__, mock_get_collection_stats)
+
+
+@pytest.fixture(scope="function")
+def patch_get_collection_stats_none(monkeypatch):
+    async def mock_get_collection_stats(session: AsyncSession, collection_id: int):
+        assert isinstance(session, AsyncSession)
+        return None
+
+    monkeypatch.setattr(crud, crud.get_collection_stats.__name__, mock_get_collection_stats)
+
+
+@pytest.fixture(scope="function")
+def patch_get_collection_stats_history(collection_db: CollectionDB, collection_stats_db: CollectionStatsDB, monkeypatch):
+    async def mock_get_collection_stats_history(
+        session: AsyncSession,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        interval: ParameterInterval = ParameterInterval.MONTHLY,
+        desc: bool = False,
+        skip: int = 0,
+        take: int = 100,
+        start_after: datetime | None = None,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert not from_date or isinstance(from_date, datetime)
+        assert not to_date or isinstance(to_date, datetime)
+        assert isinstance(interval, ParameterInterval)
+        assert isinstance(desc, bool)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+        assert not start_after or isinstance(start_after, datetime)
+
+        return [(collection_db, collection_stats_db)]
+
+    monkeypatch.setattr(crud, crud.get_collection_stats_history.__name__, mock_get_collection_stats_history)
+
+
 @pytest.fixture(scope="function")
 def patch_get_collections(collection_db, monkeypatch):
     async def mock_get_collections(
@@ -261,6 +457,8 @@ def patch_get_collections(collection_db, monkeypatch):
         desc: bool = False,
         skip: int = 0,
         take: int = 100,
+        on_missing: ParameterOnMissing = ParameterOnMissing.SKIP,
+        start_after: datetime | None = None,
     ):
         assert isinstance(session, AsyncSession)
         assert not from_date or isinstance(from_date, datetime)
@@ -269,12 +467,111 @@ def patch_get_collections(collection_db, monkeypatch):
         assert isinstance(desc, bool)
         assert isinstance(skip, int)
         assert isinstance(take, int)
+        assert isinstance(on_missing, ParameterOnMissing)
+        assert not start_after or isinstance(start_after, datetime)
 
-        return [collection_db]
+        return [collection_db, *_create_missing_collections(on_missing, collection_db)]
 
     monkeypatch.setattr(crud, crud.get_collections.__name__, mock_get_collections)
 
 
+@pytest.fixture(scope="function")
+def patch_get_division_standings(division_standing_db: DivisionStandingDB, monkeypatch):
+    async def mock_get_division_standings(session: AsyncSession, collection_id: int, division_design_id: int):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+        assert isinstance(division_design_id, int)
+
+        return [division_standing_db]
+
+    monkeypatch.setattr(crud, crud.get_division_standings.__name__, mock_get_division_standings)
+
+
+@pytest.fixture(scope="function")
+def patch_get_entity_names(entity_name_span_db: EntityNameSpanDB, monkeypatch):
+    async def mock_get_entity_names(session: AsyncSession, entity_type: EntityType, entity_id: int, desc: bool = False):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(entity_type, EntityType)
+        assert isinstance(entity_id, int)
+        assert isinstance(desc, bool)
+
+        return [entity_name_span_db]
+
+    monkeypatch.setattr(crud, crud.get_entity_names.__name__, mock_get_entity_names)
+
+
+@pytest.fixture(scope="function")
+def patch_get_entity_names_empty(monkeypatch):
+    async def mock_get_entity_names(session: AsyncSession, entity_type: EntityType, entity_id: int, desc: bool = False):
+        assert isinstance(session, AsyncSession)
+        return []
+
+    monkeypatch.setattr(crud, crud.get_entity_names.__name__, mock_get_entity_names)
+
+
+@pytest.fixture(scope="function")
+def patch_get_events(entity_event_db: EntityEventDB, monkeypatch):
+    async def mock_get_events(
+        session: AsyncSession,
+        entity_type: EntityType | None = None,
+        entity_id: int | None = None,
+        event_types: list[EntityEventType] | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        desc: bool = False,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert entity_type is None or isinstance(entity_type, EntityType)
+        assert entity_id is None or isinstance(entity_id, int)
+        assert all(isinstance(event_type, EntityEventType) for event_type in event_types)
+        assert from_date is None or isinstance(from_date, datetime)
+        assert to_date is None or isinstance(to_date, datetime)
+        assert isinstance(desc, bool)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return [entity_event_db]
+
+    monkeypatch.setattr(crud, crud.get_events.__name__, mock_get_events)
+
+
+@pytest.fixture(scope="function")
+def patch_get_histogram(histogram_db: HistogramDB, monkeypatch):
+    async def mock_get_histogram(session: AsyncSession, collection_id: int, metric: ParameterUserMetric, buckets: int = 50):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+        assert isinstance(metric, ParameterUserMetric)
+        assert isinstance(buckets, int)
+
+        return histogram_db
+
+    monkeypatch.setattr(crud, crud.get_histogram.__name__, mock_get_histogram)
+
+
+@pytest.fixture(scope="function")
+def patch_get_latest_collection(collection_db: CollectionDB, monkeypatch):
+    async def mock_get_latest_collection(session: AsyncSession, collected_at: datetime | None = None):
+        assert isinstance(session, AsyncSession)
+        assert not collected_at or isinstance(collected_at, datetime)
+
+        return collection_db
+
+    monkeypatch.setattr(crud, crud.get_latest_collection.__name__, mock_get_latest_collection)
+
+
+@pytest.fixture(scope="function")
+def patch_get_latest_collection_none(monkeypatch):
+    async def mock_get_latest_collection(session: AsyncSession, collected_at: datetime | None = None):
+        assert isinstance(session, AsyncSession)
+        assert not collected_at or isinstance(collected_at, datetime)
+
+        return None
+
+    monkeypatch.setattr(crud, crud.get_latest_collection.__name__, mock_get_latest_collection)
+
+
 @pytest.fixture(scope="function")
 def patch_get_top_100_from_collection(user_db, monkeypatch):
     async def mock_get_top_100_from_collection(session: AsyncSession, collection_id: int, skip: int = 0, take: int = 100):
@@ -288,6 +585,47 @@ def patch_get_top_100_from_collection(user_db, monkeypatch):
     monkeypatch.setattr(crud, crud.get_top_100_from_collection.__name__, mock_get_top_100_from_collection)
 
 
+@pytest.fixture(scope="function")
+def patch_get_top_movers(user_mover_db, monkeypatch):
+    async def mock_get_top_movers(
+        session: AsyncSession,
+        from_collection_id: int,
+        to_collection_id: int,
+        metric: ParameterUserMetric,
+        desc: bool = True,
+        alliance_id: int | None = None,
+        division_design_id: int | None = None,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(from_collection_id, int)
+        assert isinstance(to_collection_id, int)
+        assert isinstance(metric, ParameterUserMetric)
+        assert isinstance(desc, bool)
+        assert alliance_id is None or isinstance(alliance_id, int)
+        assert division_design_id is None or isinstance(division_design_id, int)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return [user_mover_db]
+
+    monkeypatch.setattr(crud, crud.get_top_movers.__name__, mock_get_top_movers)
+
+
+@pytest.fixture(scope="function")
+def patch_get_user_changes(monkeypatch):
+    async def mock_get_user_changes(session: AsyncSession, from_collection_id: int, to_collection_id: int):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(from_collection_id, int)
+        assert isinstance(to_collection_id, int)
+
+        yield (1, EntityChange.RENAMED, "Old Name", "New Name")
+        yield (1, EntityChange.ALLIANCE_CHANGED, 1, 2)
+
+    monkeypatch.setattr(crud, crud.get_user_changes.__name__, mock_get_user_changes)
+
+
 @pytest.fixture(scope="function")
 def patch_get_user_from_collection(user_history_db, monkeypatch):
     async def mock_get_user_from_collection(session: AsyncSession, collection_id: int, user_id: int):
@@ -300,6 +638,38 @@ def patch_get_user_from_collection(user_history_db, monkeypatch):
     monkeypatch.setattr(crud, crud.get_user_from_collection.__name__, mock_get_user_from_collection)
 
 
+@pytest.fixture(scope="function")
+def patch_get_user_histories(user_history_db, monkeypatch):
+    async def mock_get_user_histories(
+        session: AsyncSession,
+        user_ids: list[int],
+        include_alliance: bool = True,
+        collection_id: int | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        interval: ParameterInterval = ParameterInterval.MONTHLY,
+        desc: bool = False,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(user_ids, list)
+        assert all(isinstance(user_id, int) for user_id in user_ids)
+        assert len(user_ids) == len(set(user_ids))
+        assert isinstance(include_alliance, bool)
+        assert not collection_id or isinstance(collection_id, int)
+        assert not from_date or isinstance(from_date, datetime)
+        assert not to_date or isinstance(to_date, datetime)
+        assert isinstance(interval, ParameterInterval)
+        assert isinstance(desc, bool)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return {user_id: [user_history_db] for user_id in user_ids}
+
+    monkeypatch.setattr(crud, crud.get_user_histories.__name__, mock_get_user_histories)
+
+
 @pytest.fixture(scope="function")
 def patch_get_user_history(user_history_db, monkeypatch):
     async def mock_get_user_history(
@@ -312,6 +682,8 @@ def patch_get_user_history(user_history_db, monkeypatch):
         desc: bool = False,
         skip: int = 0,
         take: int = 100,
+        on_missing: ParameterOnMissing = ParameterOnMissing.SKIP,
+        start_after: datetime | None = None,
     ):
         assert isinstance(session, AsyncSession)
         assert isinstance(user_id, int)
@@ -322,12 +694,95 @@ def patch_get_user_history(user_history_db, monkeypatch):
         assert isinstance(desc, bool)
         assert isinstance(skip, int)
         assert isinstance(take, int)
+        assert isinstance(on_missing, ParameterOnMissing)
+        assert not start_after or isinstance(start_after, datetime)
 
-        return [user_history_db]
+        return [
+            user_history_db,
+            *[(collection, None) if collection else None for collection in _create_missing_collections(on_missing, user_history_db[0])],
+        ]
 
     monkeypatch.setattr(crud, crud.get_user_history.__name__, mock_get_user_history)
 
 
+@pytest.fixture(scope="function")
+def patch_get_user_history_deltas(user_history_delta_db, monkeypatch):
+    async def mock_get_user_history_deltas(
+        session: AsyncSession,
+        user_id: int,
+        metrics: list[ParameterUserMetric],
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        interval: ParameterInterval = ParameterInterval.MONTHLY,
+        desc: bool = False,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(user_id, int)
+        assert metrics and all(isinstance(metric, ParameterUserMetric) for metric in metrics)
+        assert not from_date or isinstance(from_date, datetime)
+        assert not to_date or isinstance(to_date, datetime)
+        assert isinstance(interval, ParameterInterval)
+        assert isinstance(desc, bool)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        collection_id, collected_at, values, deltas, rates = user_history_delta_db
+        return [(collection_id, collected_at, values[: len(metrics)], deltas[: len(metrics)], rates[: len(metrics)])]
+
+    monkeypatch.setattr(crud, crud.get_user_history_deltas.__name__, mock_get_user_history_deltas)
+
+
+@pytest.fixture(scope="function")
+def patch_get_user_leaderboard(user_rank_db: UserRankDB, monkeypatch):
+    async def mock_get_user_leaderboard(
+        session: AsyncSession,
+        collection_id: int,
+        metric: ParameterUserMetric,
+        alliance_id: int | None = None,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+        assert isinstance(metric, ParameterUserMetric)
+        assert alliance_id is None or isinstance(alliance_id, int)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return [user_rank_db]
+
+    monkeypatch.setattr(crud, crud.get_user_leaderboard.__name__, mock_get_user_leaderboard)
+
+
+@pytest.fixture(scope="function")
+def patch_get_user_rank(user_rank_db: UserRankDB, monkeypatch):
+    async def mock_get_user_rank(
+        session: AsyncSession, collection_id: int, user_id: int, metric: ParameterUserMetric, alliance_id: int | None = None
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+        assert isinstance(user_id, int)
+        assert isinstance(metric, ParameterUserMetric)
+        assert alliance_id is None or isinstance(alliance_id, int)
+
+        return user_rank_db
+
+    monkeypatch.setattr(crud, crud.get_user_rank.__name__, mock_get_user_rank)
+
+
+@pytest.fixture(scope="function")
+def patch_get_user_rank_none(monkeypatch):
+    async def mock_get_user_rank(
+        session: AsyncSession, collection_id: int, user_id: int, metric: ParameterUserMetric, alliance_id: int | None = None
+    ):
+        assert isinstance(session, AsyncSession)
+        return None
+
+    monkeypatch.setattr(crud, crud.get_user_rank.__name__, mock_get_user_rank)
+
+
 @pytest.fixture(scope="function")
 def patch_has_alliance_history_true(monkeypatch):
     async def mock_has_alliance_history(session: AsyncSession, alliance_id: int):
@@ -350,6 +805,95 @@ def patch_has_alliance_history_false(monkeypatch):
     monkeypatch.setattr(crud, crud.has_alliance_history.__name__, mock_has_alliance_history)
 
 
+@pytest.fixture(scope="function")
+def patch_get_tournament(tournament_db: TournamentDB, monkeypatch):
+    async def mock_get_tournament(session: AsyncSession, collection_id: int):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+
+        return tournament_db
+
+    monkeypatch.setattr(crud, crud.get_tournament.__name__, mock_get_tournament)
+
+
+@pytest.fixture(scope="function")
+def patch_get_tournament_none(monkeypatch):
+    async def mock_get_tournament(session: AsyncSession, collection_id: int):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(collection_id, int)
+
+        return None
+
+    monkeypatch.setattr(crud, crud.get_tournament.__name__, mock_get_tournament)
+
+
+@pytest.fixture(scope="function")
+def patch_get_tournament_alliance_progression(tournament_alliance_progress_db: TournamentAllianceProgressDB, monkeypatch):
+    async def mock_get_tournament_alliance_progression(
+        session: AsyncSession,
+        started_at: datetime,
+        ended_at: datetime,
+        alliance_id: int | None = None,
+        division_design_id: int | None = None,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(started_at, datetime)
+        assert isinstance(ended_at, datetime)
+        assert started_at <= ended_at
+        assert alliance_id is None or isinstance(alliance_id, int)
+        assert division_design_id is None or isinstance(division_design_id, int)
+
+        return [tournament_alliance_progress_db]
+
+    monkeypatch.setattr(crud, crud.get_tournament_alliance_progression.__name__, mock_get_tournament_alliance_progression)
+
+
+@pytest.fixture(scope="function")
+def patch_get_tournament_user_deltas(tournament_user_delta_db: TournamentUserDeltaDB, monkeypatch):
+    async def mock_get_tournament_user_deltas(
+        session: AsyncSession,
+        from_collection_id: int,
+        to_collection_id: int,
+        alliance_id: int | None = None,
+        division_design_id: int | None = None,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(from_collection_id, int)
+        assert isinstance(to_collection_id, int)
+        assert alliance_id is None or isinstance(alliance_id, int)
+        assert division_design_id is None or isinstance(division_design_id, int)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return [tournament_user_delta_db]
+
+    monkeypatch.setattr(crud, crud.get_tournament_user_deltas.__name__, mock_get_tournament_user_deltas)
+
+
+@pytest.fixture(scope="function")
+def patch_get_tournaments(tournament_db: TournamentDB, monkeypatch):
+    async def mock_get_tournaments(
+        session: AsyncSession,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        desc: bool = False,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert not from_date or isinstance(from_date, datetime)
+        assert not to_date or isinstance(to_date, datetime)
+        assert isinstance(desc, bool)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return [tournament_db]
+
+    monkeypatch.setattr(crud, crud.get_tournaments.__name__, mock_get_tournaments)
+
+
 @pytest.fixture(scope="function")
 def patch_has_collection_true(monkeypatch):
     async def mock_has_collection(session: AsyncSession, collection_id: int):
@@ -430,6 +974,45 @@ def patch_save_collection(collection_db: CollectionDB, monkeypatch):
     monkeypatch.setattr(crud, crud.save_collection.__name__, mock_save_collection)
 
 
+@pytest.fixture(scope="function")
+def patch_search_entity_names(entity_name_db: EntityNameDB, monkeypatch):
+    async def mock_search_entity_names(
+        session: AsyncSession,
+        name: str,
+        entity_type: EntityType | None = None,
+        mode: ParameterSearchMode = ParameterSearchMode.PREFIX,
+        skip: int = 0,
+        take: int = 100,
+    ):
+        assert isinstance(session, AsyncSession)
+        assert isinstance(name, str) and name == name.strip()
+        assert entity_type is None or isinstance(entity_type, EntityType)
+        assert isinstance(mode, ParameterSearchMode)
+        assert isinstance(skip, int)
+        assert isinstance(take, int)
+
+        return [(entity_name_db, 0.5)]
+
+    monkeypatch.setattr(crud, crud.search_entity_names.__name__, mock_search_entity_names)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def patch_refresh_snapshot(monkeypatch):
+    async def mock_refresh_snapshot(force: bool = False, wait: bool = True):
+        assert isinstance(force, bool)
+        assert isinstance(wait, bool)
+
+        return snapshot.SNAPSHOT
+
+    monkeypatch.setattr(snapshot, "SNAPSHOT", None)
+    monkeypatch.setattr(snapshot, snapshot.refresh_snapshot.__name__, mock_refresh_snapshot)
+
+
+@pytest.fixture(scope="function")
+def patch_snapshot(collection_db: CollectionDB, tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT", conftest._create_shared_snapshot(tmp_path, [collection_db]))
+
+
 @pytest.fixture(scope="function")
 def patch_update_collection(monkeypatch):
     async def mock_update_collection(session: AsyncSession, collection_id: int, collection: CollectionDB):
@@ -486,3 +1069,13 @@ def assert_error_code() -> Callable[[HttpXResponse, ErrorCode], None]:
         assert error.code == str(error_code)
 
     return assert_error_code_func
+
+
+def _create_missing_collections(on_missing: ParameterOnMissing, collection: CollectionDB) -> list[CollectionDB | None]:
+    """Creates the entry filling in for a missing Collection after `collection` the way `crud` does, if `on_missing` is `empty` or `null`."""
+    if on_missing == ParameterOnMissing.NULL:
+        return [None]
+    if on_missing == ParameterOnMissing.EMPTY:
+        collected_at = collection.collected_at.replace(year=collection.collected_at.year + 1)
+        return [CollectionDB(collected_at=collected_at, data_version=0, duration=0.0, fleet_count=0, user_count=0, tournament_running=False)]
+    return []
@@ -0,0 +1,74 @@
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.models.enums import ErrorCode
+
+
+invalid_parameters = [
+    # parameters, expected_error_code
+    pytest.param({"metric": "alliance_score"}, ErrorCode.PARAMETER_METRIC_INVALID, id="metric_of_users"),
+    pytest.param({"buckets": 0}, ErrorCode.PARAMETER_BUCKETS_INVALID, id="buckets_zero"),
+    pytest.param({"buckets": 1001}, ErrorCode.PARAMETER_BUCKETS_INVALID, id="buckets_too_big"),
+    pytest.param({"buckets": "a"}, ErrorCode.PARAMETER_BUCKETS_INVALID, id="buckets_not_a_number"),
+]
+"""parameters, expected_error_code"""
+
+valid_parameters = [
+    # parameters
+    pytest.param({"buckets": 3}, id="buckets"),
+    pytest.param({"metric": "trophy", "buckets": 3}, id="metric_trophy"),
+    pytest.param({"metric": "number_of_members", "buckets": 3}, id="metric_number_of_members"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_parameters)
+def test_get_alliance_histogram_invalid_parameters(
+    parameters: dict[str, Any],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/collections/1/histogram/alliances", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_get_alliance_histogram_invalid_id(collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(f"/collections/{collection_id}/histogram/alliances")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection_none")
+def test_get_alliance_histogram_non_existing_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/histogram/alliances")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_collection", "patch_get_alliance_histogram")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_alliance_histogram_valid_parameters(parameters: dict[str, Any], client: TestClient):
+    with client:
+        response = client.get("/collections/1/histogram/alliances", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["metric"] == parameters.get("metric", "score")
+        assert result["count"] == 3
+        assert result["min_value"] == 1000
+        assert result["max_value"] == 1009
+        assert result["percentiles"] == [[0.5, 1004]]
+        assert result["buckets"] == [[1000.0, 1003.333, 1], [1003.333, 1006.667, 0], [1006.667, 1010.0, 2]]
@@ -1,12 +1,14 @@
 from datetime import datetime
-from typing import Callable
+from typing import Any, Callable
 
 import pytest
 import test_cases
 from fastapi.testclient import TestClient
 from httpx import Response as HttpXResponse
 
-from src.api.models.enums import ErrorCode, ParameterInterval
+from src.api import utils
+from src.api.models.enums import ErrorCode, ParameterInterval, ParameterOnMissing
+from src.api.routers import pagination
 
 
 @pytest.mark.usefixtures("assert_error_code")
@@ -18,7 +20,7 @@ def test_get_alliance_history_invalid_parameters(
     client: TestClient,
 ):
     with client:
-        response = client.get("/allianceHistory/1", params=parameters)
+        response = client.get("/allianceHistory/1", params={"fromDate": "2024-01-01T00:00:00Z", "interval": "hour", **parameters})
         assert response.status_code == 422
         assert_error_code(response, expected_error_code)
 
@@ -59,3 +61,40 @@ def test_get_alliance_history_valid_parameters(
         )
         assert response.status_code == 200
         assert response.json() == [alliance_history_out_json]
+
+
+@pytest.mark.usefixtures("assert_error_code")
+def test_get_alliance_history_invalid_division_design_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/allianceHistory/1", params={"divisionDesignId": -1})
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_DIVISION_DESIGN_ID_INVALID)
+
+
+@pytest.mark.usefixtures("alliance_history_out_json")
+@pytest.mark.usefixtures("patch_has_alliance_history_true", "patch_get_alliance_history")
+def test_get_alliance_history_division_design_id(alliance_history_out_json, client: TestClient):
+    with client:
+        response = client.get("/allianceHistory/1", params={"divisionDesignId": 1})
+        assert response.status_code == 200
+        assert response.json() == [alliance_history_out_json]
+
+
+@pytest.mark.usefixtures("patch_has_alliance_history_true", "patch_get_alliance_history")
+@pytest.mark.parametrize(["parameters", "expected_cursor"], test_cases.valid_on_missing_parameters)
+def test_get_alliance_history_on_missing_pagination(
+    parameters: dict[str, int | str], expected_cursor: datetime, alliance_history_out_json: Any, client: TestClient
+):
+    """Fills in missing Collections according to `onMissing`. The cursor points to the last slot of a full page."""
+    with client:
+        response = client.get("/allianceHistory/1", params={"fromDate": "2024-01-01T00:00:00Z", "interval": "hour", **parameters})
+        assert response.status_code == 200
+
+        entries = response.json()
+        assert entries[0] == alliance_history_out_json
+        if parameters["onMissing"] == ParameterOnMissing.NULL:
+            assert entries[1] is None
+        else:
+            assert entries[1]["fleet"] is None and entries[1]["collection"]["collection_id"] is None
+
+        assert utils.decode_cursor(response.headers[pagination.NEXT_CURSOR_HEADER]) == (expected_cursor, False)
@@ -0,0 +1,73 @@
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import AllianceRankDB
+from src.api.models.enums import ErrorCode
+
+
+invalid_parameters = [
+    # parameters, expected_error_code
+    pytest.param({"metric": "alliance_score"}, ErrorCode.PARAMETER_METRIC_INVALID, id="metric_of_users"),
+    pytest.param({"divisionDesignId": -1}, ErrorCode.PARAMETER_DIVISION_DESIGN_ID_INVALID, id="division_design_id_negative"),
+    pytest.param({"skip": -1}, ErrorCode.PARAMETER_SKIP_INVALID, id="skip_negative"),
+    pytest.param({"take": 101}, ErrorCode.PARAMETER_TAKE_INVALID, id="take_too_big"),
+]
+"""parameters, expected_error_code"""
+
+valid_parameters = [
+    # parameters
+    pytest.param({}, id="no_params"),
+    pytest.param({"metric": "trophy"}, id="metric_trophy"),
+    pytest.param({"metric": "championship_score", "divisionDesignId": 1}, id="metric_and_division_design_id"),
+    pytest.param({"skip": 10, "take": 10}, id="skip_take"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_parameters)
+def test_get_alliance_leaderboard_invalid_parameters(
+    parameters: dict[str, Any],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/collections/1/leaderboards/alliances", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_get_alliance_leaderboard_invalid_id(collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(f"/collections/{collection_id}/leaderboards/alliances")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection_none")
+def test_get_alliance_leaderboard_non_existing_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/leaderboards/alliances")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_collection", "patch_get_alliance_leaderboard")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_alliance_leaderboard_valid_parameters(parameters: dict[str, Any], alliance_rank_db: AllianceRankDB, client: TestClient):
+    with client:
+        response = client.get("/collections/1/leaderboards/alliances", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["meta"]["collection_id"] == 1
+        assert result["metric"] == parameters.get("metric", "score")
+        assert result["alliances"] == [list(alliance_rank_db)]
@@ -0,0 +1,55 @@
+from typing import Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import EntityNameSpanDB
+from src.api.models.enums import ErrorCode
+
+
+valid_parameters = [
+    # parameters
+    pytest.param({}, id="no_parameters"),
+    pytest.param({"desc": True}, id="desc"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["alliance_id"], test_cases.invalid_ids)
+def test_get_alliance_names_invalid_alliance_id(alliance_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(f"/allianceHistory/{alliance_id}/names")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_ALLIANCE_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+def test_get_alliance_names_invalid_desc(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/allianceHistory/1/names", params={"desc": "abc"})
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_DESC_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_entity_names_empty")
+def test_get_alliance_names_non_existing_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/allianceHistory/1/names")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.ALLIANCE_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_entity_names")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_alliance_names_valid_parameters(parameters: dict[str, bool], entity_name_span_db: EntityNameSpanDB, client: TestClient):
+    with client:
+        response = client.get("/allianceHistory/1/names", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        name, first_seen_at, last_seen_at = entity_name_span_db
+        assert result == [[name, first_seen_at.isoformat(), last_seen_at.isoformat()]]
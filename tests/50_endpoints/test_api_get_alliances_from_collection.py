@@ -36,3 +36,18 @@ def test_get_alliances_from_collection_valid_id(collection_id: int, collection_w
         response = client.get(f"/collections/{collection_id}/alliances")
         assert response.status_code == 200
         assert response.json() == collection_with_fleets_out_json
+
+
+@pytest.mark.usefixtures("assert_error_code")
+def test_get_alliances_from_collection_invalid_division_design_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/alliances", params={"divisionDesignId": -1})
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_DIVISION_DESIGN_ID_INVALID)
+
+
+@pytest.mark.usefixtures("patch_get_collection", "patch_has_collection_true")
+def test_get_alliances_from_collection_division_design_id(client: TestClient):
+    with client:
+        response = client.get("/collections/1/alliances", params={"divisionDesignId": 0})
+        assert response.status_code == 200
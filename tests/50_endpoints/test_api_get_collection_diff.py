@@ -0,0 +1,54 @@
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.models.enums import ErrorCode
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_get_collection_diff_invalid_collection_id(
+    collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.get(f"/collections/{collection_id}/diff/1")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_get_collection_diff_invalid_other_collection_id(
+    collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.get(f"/collections/1/diff/{collection_id}")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection_none")
+def test_get_collection_diff_non_existing_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/diff/2")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_collection", "patch_get_alliance_changes", "patch_get_user_changes")
+@pytest.mark.parametrize(["collection_id", "other_collection_id"], test_cases.valid_collection_and_child_ids)
+def test_get_collection_diff_valid_ids(collection_id: int, other_collection_id: int, collection_metadata_out_json: Any, client: TestClient):
+    with client:
+        response = client.get(f"/collections/{collection_id}/diff/{other_collection_id}")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "from_collection": collection_metadata_out_json,
+            "to_collection": collection_metadata_out_json,
+            "alliances": [[1, "appeared", None, "Test Alliance"]],
+            "users": [[1, "renamed", "Old Name", "New Name"], [1, "alliance_changed", 1, 2]],
+        }
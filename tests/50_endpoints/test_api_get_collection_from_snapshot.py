@@ -0,0 +1,82 @@
+from typing import Any, Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import CollectionDB
+from src.api.models.converters import FromDB
+from src.api.models.enums import ErrorCode
+
+
+test_cases_non_existing_child_ids = [
+    # path, expected_error_code
+    pytest.param("/collections/1/alliances/2", ErrorCode.ALLIANCE_NOT_FOUND, id="alliance_missing"),
+    pytest.param("/collections/1/users/2", ErrorCode.USER_NOT_FOUND, id="user_missing"),
+]
+"""path, expected_error_code"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_snapshot")
+@pytest.mark.parametrize(["path", "expected_error_code"], test_cases_non_existing_child_ids)
+def test_get_from_collection_in_snapshot_non_existing_ids(
+    path: str, expected_error_code: ErrorCode, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.get(path)
+        assert response.status_code == 404
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("collection_out_with_children_json")
+@pytest.mark.usefixtures("patch_snapshot", "patch_get_collection_none")
+def test_get_collection_in_snapshot(collection_out_with_children_json: Any, client: TestClient):
+    with client:
+        response = client.get("/collections/1")
+        assert response.status_code == 200
+        assert response.json() == collection_out_with_children_json
+
+
+@pytest.mark.usefixtures("collection_with_fleets_out_json")
+@pytest.mark.usefixtures("patch_snapshot", "patch_has_collection_false")
+def test_get_alliances_from_collection_in_snapshot(collection_with_fleets_out_json: Any, client: TestClient):
+    with client:
+        response = client.get("/collections/1/alliances")
+        assert response.status_code == 200
+        assert response.json() == collection_with_fleets_out_json
+
+
+@pytest.mark.usefixtures("collection_with_users_out_json")
+@pytest.mark.usefixtures("patch_snapshot", "patch_has_collection_false")
+@pytest.mark.parametrize(["path"], [pytest.param("/collections/1/users", id="users"), pytest.param("/collections/1/top100Users", id="top_100")])
+def test_get_users_from_collection_in_snapshot(path: str, collection_with_users_out_json: Any, client: TestClient):
+    with client:
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.json() == collection_with_users_out_json
+
+
+@pytest.mark.usefixtures("patch_snapshot", "patch_has_collection_false")
+def test_get_alliance_from_collection_in_snapshot(collection_db: CollectionDB, client: TestClient):
+    with client:
+        response = client.get("/collections/1/alliances/1")
+        assert response.status_code == 200
+        assert response.json()["fleet"] == list(FromDB.to_alliance(collection_db.alliances[0]))
+
+
+@pytest.mark.usefixtures("patch_snapshot", "patch_has_collection_false")
+def test_get_user_from_collection_in_snapshot(collection_db: CollectionDB, client: TestClient):
+    with client:
+        response = client.get("/collections/1/users/1")
+        assert response.status_code == 200
+        assert response.json()["user"] == list(FromDB.to_user(collection_db.users[0]))
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_snapshot", "patch_has_collection_false")
+def test_get_users_from_collection_not_in_snapshot(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/2/users")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
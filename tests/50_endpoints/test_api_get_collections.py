@@ -6,7 +6,9 @@ import test_cases
 from fastapi.testclient import TestClient
 from httpx import Response as HttpXResponse
 
-from src.api.models.enums import ErrorCode, ParameterInterval
+from src.api import utils
+from src.api.models.enums import ErrorCode, ParameterInterval, ParameterOnMissing
+from src.api.routers import pagination
 
 
 @pytest.mark.usefixtures("assert_error_code")
@@ -18,7 +20,7 @@ def test_get_collections_invalid_parameters(
     client: TestClient,
 ):
     with client:
-        response = client.get("/collections", params=parameters)
+        response = client.get("/collections", params={"fromDate": "2024-01-01T00:00:00Z", "interval": "hour", **parameters})
         assert response.status_code == 422
         assert_error_code(response, expected_error_code)
 
@@ -41,3 +43,23 @@ def test_get_collections_valid_parameters(
         )
         assert response.status_code == 200
         assert response.json() == [collection_metadata_out_json]
+
+
+@pytest.mark.usefixtures("patch_get_collections")
+@pytest.mark.parametrize(["parameters", "expected_cursor"], test_cases.valid_on_missing_parameters)
+def test_get_collections_on_missing_pagination(
+    parameters: dict[str, int | str], expected_cursor: datetime, collection_metadata_out_json: Any, client: TestClient
+):
+    """Fills in missing Collections according to `onMissing`. The cursor points to the last slot of a full page."""
+    with client:
+        response = client.get("/collections", params={"fromDate": "2024-01-01T00:00:00Z", "interval": "hour", **parameters})
+        assert response.status_code == 200
+
+        entries = response.json()
+        assert entries[0] == collection_metadata_out_json
+        if parameters["onMissing"] == ParameterOnMissing.NULL:
+            assert entries[1] is None
+        else:
+            assert entries[1]["collection_id"] is None
+
+        assert utils.decode_cursor(response.headers[pagination.NEXT_CURSOR_HEADER]) == (expected_cursor, False)
@@ -0,0 +1,70 @@
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import DivisionStandingDB
+from src.api.models.enums import ErrorCode
+
+
+invalid_division_design_ids = [
+    # parameters
+    pytest.param({}, id="division_design_id_missing"),
+    pytest.param({"divisionDesignId": -1}, id="division_design_id_negative"),
+    pytest.param({"divisionDesignId": "a"}, id="division_design_id_not_a_number"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters"], invalid_division_design_ids)
+def test_get_division_standings_invalid_division_design_id(
+    parameters: dict[str, Any], assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.get("/collections/1/standings", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_DIVISION_DESIGN_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_get_division_standings_invalid_id(collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(f"/collections/{collection_id}/standings", params={"divisionDesignId": 1})
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection_none")
+def test_get_division_standings_non_existing_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/standings", params={"divisionDesignId": 1})
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection")
+def test_get_division_standings_no_tournament(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/standings", params={"divisionDesignId": 1})
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.TOURNAMENT_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_collection_tournament", "patch_get_division_standings")
+@pytest.mark.parametrize(["collection_id"], test_cases.valid_ids)
+def test_get_division_standings_valid_id(collection_id: int, division_standing_db: DivisionStandingDB, client: TestClient):
+    with client:
+        response = client.get(f"/collections/{collection_id}/standings", params={"divisionDesignId": 1})
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["meta"]["collection_id"] == 1
+        assert result["meta"]["tourney_running"] is True
+        assert result["division_design_id"] == 1
+        assert result["standings"] == [list(division_standing_db)]
@@ -0,0 +1,73 @@
+from typing import Any, Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import EntityEventDB
+from src.api.models.enums import ErrorCode
+
+
+invalid_parameters = [
+    # parameters, expected_error_code
+    pytest.param({"entityType": "fleet"}, ErrorCode.PARAMETER_ENTITY_TYPE_INVALID, id="entity_type_invalid"),
+    pytest.param({"entityType": "user", "entityId": 0}, ErrorCode.PARAMETER_ENTITY_ID_INVALID, id="entity_id_invalid"),
+    pytest.param({"entityId": 1}, ErrorCode.PARAMETER_ENTITY_ID_INVALID, id="entity_id_without_entity_type"),
+    pytest.param({"eventTypes": ["renamed", "promoted"]}, ErrorCode.PARAMETER_EVENT_TYPE_INVALID, id="event_types_invalid"),
+    pytest.param({"fromDate": "abc"}, ErrorCode.PARAMETER_FROM_DATE_INVALID, id="from_date_invalid"),
+    pytest.param({"fromDate": "2016-01-01T00:00:00"}, ErrorCode.PARAMETER_FROM_DATE_TOO_EARLY, id="from_date_too_early"),
+    pytest.param({"toDate": "abc"}, ErrorCode.PARAMETER_TO_DATE_INVALID, id="to_date_invalid"),
+    pytest.param(
+        {"fromDate": "2020-02-01T00:00:00Z", "toDate": "2020-01-01T00:00:00Z"}, ErrorCode.FROM_DATE_AFTER_TO_DATE, id="from_date_after_to_date"
+    ),
+    pytest.param({"desc": "abc"}, ErrorCode.PARAMETER_DESC_INVALID, id="desc_invalid"),
+    pytest.param({"skip": -1}, ErrorCode.PARAMETER_SKIP_INVALID, id="skip_negative"),
+    pytest.param({"take": 101}, ErrorCode.PARAMETER_TAKE_INVALID, id="take_too_big"),
+]
+"""parameters, expected_error_code"""
+
+valid_parameters = [
+    # parameters
+    pytest.param({}, id="no_parameters"),
+    pytest.param({"entityType": "alliance"}, id="entity_type"),
+    pytest.param({"entityType": "user", "entityId": 1}, id="entity_type_and_entity_id"),
+    pytest.param({"eventTypes": ["joined_alliance", "left_alliance"]}, id="event_types"),
+    pytest.param({"fromDate": "2020-02-01T00:00:00Z", "toDate": "2020-03-01T00:00:00Z"}, id="from_and_to_date"),
+    pytest.param({"desc": True, "skip": 5, "take": 5}, id="desc_skip_take"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_parameters)
+def test_get_events_invalid_parameters(
+    parameters: dict[str, Any],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/events", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("patch_get_events")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_events_valid_parameters(parameters: dict[str, Any], entity_event_db: EntityEventDB, client: TestClient):
+    with client:
+        response = client.get("/events", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result == [
+            [
+                entity_event_db.collection_id,
+                entity_event_db.collected_at.isoformat(),
+                entity_event_db.entity_type,
+                entity_event_db.entity_id,
+                entity_event_db.event_type,
+                entity_event_db.old_value,
+                entity_event_db.new_value,
+            ]
+        ]
@@ -0,0 +1,44 @@
+import io
+from typing import Callable
+
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.models.enums import ErrorCode
+
+
+invalid_paths = [
+    # path, expected_status_code, expected_error_code
+    pytest.param("/exports/2024-13/users", 422, ErrorCode.PARAMETER_MONTH_INVALID, id="month_invalid"),
+    pytest.param("/exports/202406/users", 422, ErrorCode.PARAMETER_MONTH_INVALID, id="month_format_invalid"),
+    pytest.param("/exports/2024-06/ships", 422, ErrorCode.PARAMETER_TABLE_INVALID, id="table_invalid"),
+    pytest.param("/exports/2024-05/collections", 404, ErrorCode.EXPORT_NOT_FOUND, id="month_not_exported"),
+    pytest.param("/exports/2024-06/users", 404, ErrorCode.EXPORT_NOT_FOUND, id="table_not_exported"),
+]
+"""path, expected_status_code, expected_error_code"""
+
+
+@pytest.mark.usefixtures("assert_error_code", "patch_export_directory")
+@pytest.mark.parametrize(["path", "expected_status_code", "expected_error_code"], invalid_paths)
+def test_get_export_invalid(
+    path: str,
+    expected_status_code: int,
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get(path)
+        assert response.status_code == expected_status_code
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("patch_export_directory")
+def test_get_export(client: TestClient):
+    with client:
+        response = client.get("/exports/2024-06/collections")
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == "application/vnd.apache.parquet"
+        assert pq.read_table(io.BytesIO(response.content)).column("collection_id").to_pylist() == [1, 2]
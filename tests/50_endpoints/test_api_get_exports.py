@@ -0,0 +1,19 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.usefixtures("patch_export_directory")
+def test_get_exports(patch_export_directory: Path, client: TestClient):
+    with client:
+        response = client.get("/exports")
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "month": "2024-06",
+                "table": "collections",
+                "row_count": 2,
+                "size": patch_export_directory.stat().st_size,
+            }
+        ]
@@ -0,0 +1,119 @@
+from typing import Any, Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import CollectionDB
+from src.api.models.converters import FromDB
+from src.api.models.enums import ErrorCode
+
+
+test_cases_latest_collection_paths = [
+    # path
+    pytest.param("/collections/latest", id="collection"),
+    pytest.param("/collections/latest/alliances", id="alliances"),
+    pytest.param("/collections/latest/alliances/1", id="alliance"),
+    pytest.param("/collections/latest/top100Users", id="top_100_users"),
+    pytest.param("/collections/latest/users", id="users"),
+    pytest.param("/collections/latest/users/1", id="user"),
+]
+"""path"""
+
+test_cases_invalid_child_ids = [
+    # path, expected_error_code
+    pytest.param("/collections/latest/alliances/0", ErrorCode.PARAMETER_ALLIANCE_ID_INVALID, id="alliance_id_invalid"),
+    pytest.param("/collections/latest/users/0", ErrorCode.PARAMETER_USER_ID_INVALID, id="user_id_invalid"),
+]
+"""path, expected_error_code"""
+
+test_cases_non_existing_child_ids = [
+    # path, expected_error_code
+    pytest.param("/collections/latest/alliances/2", ErrorCode.ALLIANCE_NOT_FOUND, id="alliance_missing"),
+    pytest.param("/collections/latest/users/2", ErrorCode.USER_NOT_FOUND, id="user_missing"),
+]
+"""path, expected_error_code"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["path", "expected_error_code"], test_cases_invalid_child_ids)
+def test_get_from_latest_collection_invalid_ids(
+    path: str, expected_error_code: ErrorCode, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.get(path)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_snapshot")
+@pytest.mark.parametrize(["path", "expected_error_code"], test_cases_non_existing_child_ids)
+def test_get_from_latest_collection_non_existing_ids(
+    path: str, expected_error_code: ErrorCode, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.get(path)
+        assert response.status_code == 404
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["path"], test_cases_latest_collection_paths)
+def test_get_from_latest_collection_no_collections(path: str, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(path)
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("collection_out_with_children_json")
+@pytest.mark.usefixtures("patch_snapshot")
+def test_get_latest_collection(collection_out_with_children_json: Any, client: TestClient):
+    with client:
+        response = client.get("/collections/latest")
+        assert response.status_code == 200
+        assert response.json() == collection_out_with_children_json
+
+
+@pytest.mark.usefixtures("collection_with_fleets_out_json")
+@pytest.mark.usefixtures("patch_snapshot")
+def test_get_alliances_from_latest_collection(collection_with_fleets_out_json: Any, client: TestClient):
+    with client:
+        response = client.get("/collections/latest/alliances")
+        assert response.status_code == 200
+        assert response.json() == collection_with_fleets_out_json
+
+
+@pytest.mark.usefixtures("collection_with_users_out_json")
+@pytest.mark.usefixtures("patch_snapshot")
+@pytest.mark.parametrize(
+    ["path"], [pytest.param("/collections/latest/users", id="users"), pytest.param("/collections/latest/top100Users", id="top_100")]
+)
+def test_get_users_from_latest_collection(path: str, collection_with_users_out_json: Any, client: TestClient):
+    with client:
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.json() == collection_with_users_out_json
+
+
+@pytest.mark.usefixtures("patch_snapshot")
+def test_get_alliance_from_latest_collection(collection_db: CollectionDB, client: TestClient):
+    with client:
+        response = client.get("/collections/latest/alliances/1")
+        assert response.status_code == 200
+        result = response.json()
+        assert result["collection"]["collection_id"] == collection_db.collection_id
+        assert result["fleet"] == list(FromDB.to_alliance(collection_db.alliances[0]))
+        assert result["users"] == [list(FromDB.to_user(user)) for user in collection_db.users]
+
+
+@pytest.mark.usefixtures("patch_snapshot")
+def test_get_user_from_latest_collection(collection_db: CollectionDB, client: TestClient):
+    with client:
+        response = client.get("/collections/latest/users/1")
+        assert response.status_code == 200
+        result = response.json()
+        assert result["collection"]["collection_id"] == collection_db.collection_id
+        assert result["user"] == list(FromDB.to_user(collection_db.users[0]))
+        assert result["fleet"] == list(FromDB.to_alliance(collection_db.alliances[0]))
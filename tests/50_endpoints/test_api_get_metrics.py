@@ -0,0 +1,10 @@
+from fastapi.testclient import TestClient
+
+
+def test_get_metrics(client: TestClient):
+    with client:
+        client.get("/ping")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'pss_fleet_data_api_http_request_duration_seconds_count{method="GET",route="/ping",status="200"}' in response.text
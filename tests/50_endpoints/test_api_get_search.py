@@ -0,0 +1,68 @@
+from typing import Any, Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import EntityNameDB
+from src.api.models.enums import ErrorCode
+
+
+invalid_parameters = [
+    # parameters, expected_error_code
+    pytest.param({}, ErrorCode.PARAMETER_NAME_INVALID, id="name_missing"),
+    pytest.param({"name": ""}, ErrorCode.PARAMETER_NAME_INVALID, id="name_empty"),
+    pytest.param({"name": "   "}, ErrorCode.PARAMETER_NAME_INVALID, id="name_blank"),
+    pytest.param({"name": "a" * 101}, ErrorCode.PARAMETER_NAME_INVALID, id="name_too_long"),
+    pytest.param({"name": "Trek", "entityType": "fleet"}, ErrorCode.PARAMETER_ENTITY_TYPE_INVALID, id="entity_type_invalid"),
+    pytest.param({"name": "Trek", "mode": "exact"}, ErrorCode.PARAMETER_SEARCH_MODE_INVALID, id="mode_invalid"),
+    pytest.param({"name": "Trek", "skip": -1}, ErrorCode.PARAMETER_SKIP_INVALID, id="skip_negative"),
+    pytest.param({"name": "Trek", "take": 101}, ErrorCode.PARAMETER_TAKE_INVALID, id="take_too_big"),
+]
+"""parameters, expected_error_code"""
+
+valid_parameters = [
+    # parameters
+    pytest.param({"name": "Trek"}, id="name"),
+    pytest.param({"name": " Trek "}, id="name_with_whitespace"),
+    pytest.param({"name": "Trek", "entityType": "alliance"}, id="entity_type"),
+    pytest.param({"name": "Trek", "mode": "prefix"}, id="mode_prefix"),
+    pytest.param({"name": "Fed", "mode": "substring"}, id="mode_substring"),
+    pytest.param({"name": "Trak", "mode": "similar"}, id="mode_similar"),
+    pytest.param({"name": "Trek", "skip": 5, "take": 5}, id="skip_take"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_parameters)
+def test_search_names_invalid_parameters(
+    parameters: dict[str, Any],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/search", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("patch_search_entity_names")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_search_names_valid_parameters(parameters: dict[str, Any], entity_name_db: EntityNameDB, client: TestClient):
+    with client:
+        response = client.get("/search", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result == [
+            [
+                entity_name_db.entity_type,
+                entity_name_db.entity_id,
+                entity_name_db.name,
+                entity_name_db.first_seen_at.isoformat(),
+                entity_name_db.last_seen_at.isoformat(),
+                0.5,
+            ]
+        ]
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.models.enums import ErrorCode, ParameterInterval
+
+
+invalid_filter_parameters = [param for param in test_cases.invalid_filter_parameters if "onMissing" not in param.values[0]]
+"""parameters, expected_error_code"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_filter_parameters)
+def test_get_stats_invalid_parameters(
+    parameters: dict[str, bool | datetime | int | ParameterInterval],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/stats", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("patch_get_collection_stats_history")
+@pytest.mark.parametrize(["_", "parameters", "headers"], test_cases.valid_id_and_filter_parameters)
+def test_get_stats_valid_parameters(
+    _,
+    parameters: dict[str, bool | datetime | int | ParameterInterval],
+    headers: dict[str, str],
+    collection_metadata_out_json: Any,
+    client: TestClient,
+):
+    with client:
+        response = client.get("/stats", params=parameters, headers=headers)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert len(result) == 1
+        assert result[0]["meta"] == collection_metadata_out_json
+        assert result[0]["user_count"] == 1
@@ -0,0 +1,90 @@
+from typing import Any, Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import UserMoverDB
+from src.api.models.enums import ErrorCode
+
+
+invalid_parameters = [
+    # parameters, expected_error_code
+    pytest.param({}, ErrorCode.PARAMETER_COLLECTION_ID_INVALID, id="from_collection_missing"),
+    pytest.param({"toCollectionId": 2}, ErrorCode.PARAMETER_COLLECTION_ID_INVALID, id="only_to_collection_id"),
+    pytest.param({"fromCollectionId": 0}, ErrorCode.PARAMETER_COLLECTION_ID_INVALID, id="from_collection_id_invalid"),
+    pytest.param({"fromCollectionId": 1, "toCollectionId": "abc"}, ErrorCode.PARAMETER_COLLECTION_ID_INVALID, id="to_collection_id_invalid"),
+    pytest.param({"fromDate": "abc"}, ErrorCode.PARAMETER_FROM_DATE_INVALID, id="from_date_invalid"),
+    pytest.param({"fromDate": "2016-01-01T00:00:00"}, ErrorCode.PARAMETER_FROM_DATE_TOO_EARLY, id="from_date_too_early"),
+    pytest.param(
+        {"fromDate": "2020-02-01T00:00:00Z", "toDate": "2020-01-01T00:00:00Z"}, ErrorCode.FROM_DATE_AFTER_TO_DATE, id="from_date_after_to_date"
+    ),
+    pytest.param({"fromCollectionId": 1, "metric": "trophies"}, ErrorCode.PARAMETER_METRIC_INVALID, id="metric_invalid"),
+    pytest.param({"fromCollectionId": 1, "desc": "abc"}, ErrorCode.PARAMETER_DESC_INVALID, id="desc_invalid"),
+    pytest.param({"fromCollectionId": 1, "allianceId": 0}, ErrorCode.PARAMETER_ALLIANCE_ID_INVALID, id="alliance_id_invalid"),
+    pytest.param({"fromCollectionId": 1, "divisionDesignId": -1}, ErrorCode.PARAMETER_DIVISION_DESIGN_ID_INVALID, id="division_design_id_invalid"),
+    pytest.param({"fromCollectionId": 1, "skip": -1}, ErrorCode.PARAMETER_SKIP_INVALID, id="skip_negative"),
+    pytest.param({"fromCollectionId": 1, "take": 101}, ErrorCode.PARAMETER_TAKE_INVALID, id="take_too_big"),
+]
+"""parameters, expected_error_code"""
+
+valid_parameters = [
+    # parameters
+    pytest.param({"fromCollectionId": 1}, id="from_collection_id"),
+    pytest.param({"fromCollectionId": 1, "toCollectionId": 2}, id="from_and_to_collection_id"),
+    pytest.param({"fromDate": "2020-02-01T00:00:00Z"}, id="from_date"),
+    pytest.param({"fromDate": "2020-02-01T00:00:00Z", "toDate": "2020-03-01T00:00:00Z"}, id="from_and_to_date"),
+    pytest.param({"fromCollectionId": 1, "toDate": "2020-03-01T00:00:00Z"}, id="from_collection_id_and_to_date"),
+    pytest.param({"fromCollectionId": 1, "metric": "pvp_attack_wins", "desc": False}, id="metric_and_desc"),
+    pytest.param({"fromCollectionId": 1, "allianceId": 1, "divisionDesignId": 0}, id="alliance_and_division"),
+    pytest.param({"fromCollectionId": 1, "skip": 5, "take": 5}, id="skip_take"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_parameters)
+def test_get_top_movers_invalid_parameters(
+    parameters: dict[str, Any],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/collections/movers", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection_none", "patch_get_latest_collection")
+def test_get_top_movers_non_existing_collection_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/movers", params={"fromCollectionId": 1})
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_latest_collection_none")
+def test_get_top_movers_no_collection_at_timestamp(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/movers", params={"fromDate": "2020-02-01T00:00:00Z"})
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_collection", "patch_get_latest_collection", "patch_get_top_movers")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_top_movers_valid_parameters(
+    parameters: dict[str, Any], collection_metadata_out_json: Any, user_mover_db: UserMoverDB, client: TestClient
+):
+    with client:
+        response = client.get("/collections/movers", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["from_collection"] == collection_metadata_out_json
+        assert result["to_collection"] == collection_metadata_out_json
+        assert result["metric"] == parameters.get("metric", "trophy")
+        assert result["users"] == [list(user_mover_db)]
@@ -0,0 +1,79 @@
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.models.enums import ErrorCode
+
+
+invalid_parameters = [
+    # parameters, expected_error_code
+    pytest.param({"allianceId": 0}, ErrorCode.PARAMETER_ALLIANCE_ID_INVALID, id="alliance_id_invalid"),
+    pytest.param({"divisionDesignId": -1}, ErrorCode.PARAMETER_DIVISION_DESIGN_ID_INVALID, id="division_design_id_negative"),
+    pytest.param({"divisionDesignId": "a"}, ErrorCode.PARAMETER_DIVISION_DESIGN_ID_INVALID, id="division_design_id_not_a_number"),
+]
+"""parameters, expected_error_code"""
+
+valid_parameters = [
+    # parameters
+    pytest.param({}, id="no_parameters"),
+    pytest.param({"allianceId": 1}, id="alliance_id"),
+    pytest.param({"divisionDesignId": 1}, id="division_design_id"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_parameters)
+def test_get_tournament_alliances_invalid_parameters(
+    parameters: dict[str, Any],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/collections/1/tournament/alliances", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_get_tournament_alliances_invalid_id(collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(f"/collections/{collection_id}/tournament/alliances")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_tournament_none", "patch_has_collection_false")
+def test_get_tournament_alliances_non_existing_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/tournament/alliances")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_tournament_none", "patch_has_collection_true")
+def test_get_tournament_alliances_no_tournament(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/tournament/alliances")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.TOURNAMENT_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_tournament", "patch_get_tournament_alliance_progression")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_tournament_alliances_valid_parameters(parameters: dict[str, Any], client: TestClient):
+    with client:
+        response = client.get("/collections/1/tournament/alliances", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["tournament"]["first_collection"]["collection_id"] == 1
+        assert result["tournament"]["last_collection"]["collection_id"] == 2
+        assert result["alliances"] == [["2016-01-25T23:59:00Z", 1, "Trek Federation", 1, 120, 40, 4800, 150]]
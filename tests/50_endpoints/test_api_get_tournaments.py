@@ -0,0 +1,59 @@
+from typing import Any, Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.models.enums import ErrorCode
+
+
+invalid_parameters = [
+    # parameters, expected_error_code
+    pytest.param({"fromDate": "abc"}, ErrorCode.PARAMETER_FROM_DATE_INVALID, id="from_date_invalid"),
+    pytest.param({"fromDate": "2016-01-01T00:00:00"}, ErrorCode.PARAMETER_FROM_DATE_TOO_EARLY, id="from_date_too_early"),
+    pytest.param(
+        {"fromDate": "2020-02-01T00:00:00Z", "toDate": "2020-01-01T00:00:00Z"}, ErrorCode.FROM_DATE_AFTER_TO_DATE, id="from_date_after_to_date"
+    ),
+    pytest.param({"desc": "abc"}, ErrorCode.PARAMETER_DESC_INVALID, id="desc_invalid"),
+    pytest.param({"skip": -1}, ErrorCode.PARAMETER_SKIP_INVALID, id="skip_negative"),
+    pytest.param({"take": 101}, ErrorCode.PARAMETER_TAKE_INVALID, id="take_too_big"),
+]
+"""parameters, expected_error_code"""
+
+valid_parameters = [
+    # parameters
+    pytest.param({}, id="no_parameters"),
+    pytest.param({"fromDate": "2020-02-01T00:00:00Z", "toDate": "2020-03-01T00:00:00Z"}, id="from_and_to_date"),
+    pytest.param({"desc": True}, id="desc"),
+    pytest.param({"skip": 5, "take": 5}, id="skip_take"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_parameters)
+def test_get_tournaments_invalid_parameters(
+    parameters: dict[str, Any],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/tournaments", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("patch_get_tournaments")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_tournaments_valid_parameters(parameters: dict[str, Any], client: TestClient):
+    with client:
+        response = client.get("/tournaments", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert len(result) == 1
+        assert result[0]["first_collection"]["collection_id"] == 1
+        assert result[0]["last_collection"]["collection_id"] == 2
+        assert result[0]["last_collection"]["tourney_running"] is True
+        assert result[0]["collection_count"] == 168
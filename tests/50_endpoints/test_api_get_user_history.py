@@ -6,7 +6,9 @@ import test_cases
 from fastapi.testclient import TestClient
 from httpx import Response as HttpXResponse
 
-from src.api.models.enums import ErrorCode, ParameterInterval
+from src.api import utils
+from src.api.models.enums import ErrorCode, ParameterInterval, ParameterOnMissing
+from src.api.routers import pagination
 
 
 @pytest.mark.usefixtures("assert_error_code")
@@ -18,7 +20,7 @@ def test_get_user_history_invalid_parameters(
     client: TestClient,
 ):
     with client:
-        response = client.get("/userHistory/1", params=parameters)
+        response = client.get("/userHistory/1", params={"fromDate": "2024-01-01T00:00:00Z", "interval": "hour", **parameters})
         assert response.status_code == 422
         assert_error_code(response, expected_error_code)
 
@@ -59,3 +61,23 @@ def test_get_user_history_valid_parameters(
         )
         assert response.status_code == 200
         assert response.json() == [user_history_out_json]
+
+
+@pytest.mark.usefixtures("patch_has_user_history_true", "patch_get_user_history")
+@pytest.mark.parametrize(["parameters", "expected_cursor"], test_cases.valid_on_missing_parameters)
+def test_get_user_history_on_missing_pagination(
+    parameters: dict[str, int | str], expected_cursor: datetime, user_history_out_json: Any, client: TestClient
+):
+    """Fills in missing Collections according to `onMissing`. The cursor points to the last slot of a full page."""
+    with client:
+        response = client.get("/userHistory/1", params={"fromDate": "2024-01-01T00:00:00Z", "interval": "hour", **parameters})
+        assert response.status_code == 200
+
+        entries = response.json()
+        assert entries[0] == user_history_out_json
+        if parameters["onMissing"] == ParameterOnMissing.NULL:
+            assert entries[1] is None
+        else:
+            assert entries[1]["user"] is None and entries[1]["collection"]["collection_id"] is None
+
+        assert utils.decode_cursor(response.headers[pagination.NEXT_CURSOR_HEADER]) == (expected_cursor, False)
@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import UserHistoryDeltaDB
+from src.api.models.enums import ErrorCode, ParameterInterval, ParameterUserMetric
+
+
+invalid_filter_parameters = [param for param in test_cases.invalid_filter_parameters if not {"cursor", "onMissing"} & param.values[0].keys()]
+"""parameters, expected_error_code"""
+
+invalid_metrics = [
+    # metrics
+    pytest.param(["trophies"], id="unknown_metric"),
+    pytest.param(["trophy", "fleet_name"], id="unknown_second_metric"),
+    pytest.param([""], id="empty_metric"),
+]
+"""metrics"""
+
+valid_metrics = [
+    # metrics, expected_metrics
+    pytest.param(None, list(ParameterUserMetric), id="no_metrics"),
+    pytest.param(["trophy"], [ParameterUserMetric.TROPHY], id="single_metric"),
+    pytest.param(["trophy", "crew_donated", "trophy"], [ParameterUserMetric.TROPHY, ParameterUserMetric.CREW_DONATED], id="duplicate_metrics"),
+]
+"""metrics, expected_metrics"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_filter_parameters)
+def test_get_user_history_deltas_invalid_parameters(
+    parameters: dict[str, bool | datetime | int | ParameterInterval],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/userHistory/1/deltas", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["metrics"], invalid_metrics)
+def test_get_user_history_deltas_invalid_metrics(
+    metrics: list[str], assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.get("/userHistory/1/deltas", params={"metrics": metrics})
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_METRIC_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["user_id"], test_cases.invalid_ids)
+def test_get_user_history_deltas_invalid_user_id(user_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(f"/userHistory/{user_id}/deltas")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_USER_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_has_user_history_false")
+def test_get_user_history_deltas_non_existing_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/userHistory/1/deltas")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.USER_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_has_user_history_true", "patch_get_user_history_deltas")
+@pytest.mark.parametrize(["user_id", "parameters", "headers"], test_cases.valid_id_and_filter_parameters)
+@pytest.mark.parametrize(["metrics", "expected_metrics"], valid_metrics)
+def test_get_user_history_deltas_valid_parameters(
+    user_id: int,
+    parameters: dict[str, bool | datetime | int | ParameterInterval],
+    headers: dict[str, str],
+    metrics: list[str] | None,
+    expected_metrics: list[ParameterUserMetric],
+    user_history_delta_db: UserHistoryDeltaDB,
+    client: TestClient,
+):
+    if metrics:
+        parameters = {**parameters, "metrics": metrics}
+    with client:
+        response = client.get(f"/userHistory/{user_id}/deltas", params=parameters, headers=headers)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["user_id"] == user_id
+        assert result["metrics"] == [metric.value for metric in expected_metrics]
+        assert len(result["entries"]) == 1
+        collection_id, _, values, deltas, rates = result["entries"][0]
+        assert collection_id == user_history_delta_db[0]
+        assert len(values) == len(deltas) == len(rates) == len(expected_metrics)
@@ -0,0 +1,74 @@
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import UserRankDB
+from src.api.models.enums import ErrorCode
+
+
+invalid_parameters = [
+    # parameters, expected_error_code
+    pytest.param({"metric": "stars"}, ErrorCode.PARAMETER_METRIC_INVALID, id="metric_invalid"),
+    pytest.param({"allianceId": 0}, ErrorCode.PARAMETER_ALLIANCE_ID_INVALID, id="alliance_id_zero"),
+    pytest.param({"skip": -1}, ErrorCode.PARAMETER_SKIP_INVALID, id="skip_negative"),
+    pytest.param({"take": 101}, ErrorCode.PARAMETER_TAKE_INVALID, id="take_too_big"),
+]
+"""parameters, expected_error_code"""
+
+valid_parameters = [
+    # parameters
+    pytest.param({}, id="no_params"),
+    pytest.param({"metric": "pvp_attack_wins"}, id="metric_pvp_attack_wins"),
+    pytest.param({"metric": "highest_trophy"}, id="metric_highest_trophy"),
+    pytest.param({"metric": "championship_score", "allianceId": 1}, id="metric_and_alliance_id"),
+    pytest.param({"skip": 100, "take": 50}, id="skip_take"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_parameters)
+def test_get_user_leaderboard_invalid_parameters(
+    parameters: dict[str, Any],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.get("/collections/1/leaderboards/users", params=parameters)
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_get_user_leaderboard_invalid_id(collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(f"/collections/{collection_id}/leaderboards/users")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection_none")
+def test_get_user_leaderboard_non_existing_id(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/leaderboards/users")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_collection", "patch_get_user_leaderboard")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_user_leaderboard_valid_parameters(parameters: dict[str, Any], user_rank_db: UserRankDB, client: TestClient):
+    with client:
+        response = client.get("/collections/1/leaderboards/users", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["meta"]["collection_id"] == 1
+        assert result["metric"] == parameters.get("metric", "trophy")
+        assert result["users"] == [list(user_rank_db)]
@@ -0,0 +1,65 @@
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.database.models import UserRankDB
+from src.api.models.enums import ErrorCode
+
+
+valid_parameters = [
+    # parameters
+    pytest.param({}, id="no_params"),
+    pytest.param({"metric": "crew_donated"}, id="metric"),
+    pytest.param({"metric": "alliance_score", "allianceId": 1}, id="metric_and_alliance_id"),
+]
+"""parameters"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["user_id"], test_cases.invalid_ids)
+def test_get_user_rank_invalid_id(user_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get(f"/collections/1/leaderboards/users/{user_id}")
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_USER_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+def test_get_user_rank_invalid_metric(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/leaderboards/users/1", params={"metric": "stars"})
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_METRIC_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection_none")
+def test_get_user_rank_non_existing_collection(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/leaderboards/users/1")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.COLLECTION_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_get_collection", "patch_get_user_rank_none")
+def test_get_user_rank_non_existing_user(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient):
+    with client:
+        response = client.get("/collections/1/leaderboards/users/1")
+        assert response.status_code == 404
+        assert_error_code(response, ErrorCode.USER_NOT_FOUND)
+
+
+@pytest.mark.usefixtures("patch_get_collection", "patch_get_user_rank")
+@pytest.mark.parametrize(["parameters"], valid_parameters)
+def test_get_user_rank_valid_parameters(parameters: dict[str, Any], user_rank_db: UserRankDB, client: TestClient):
+    with client:
+        response = client.get("/collections/1/leaderboards/users/1", params=parameters)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["metric"] == parameters.get("metric", "trophy")
+        assert result["users"] == [list(user_rank_db)]
@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.models.enums import ErrorCode, ParameterInterval
+
+
+invalid_filter_parameters = [param for param in test_cases.invalid_filter_parameters if not {"cursor", "onMissing"} & param.values[0].keys()]
+"""parameters, expected_error_code"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_filter_parameters)
+def test_post_alliance_histories_invalid_parameters(
+    parameters: dict[str, bool | datetime | int | ParameterInterval],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.post("/allianceHistory/batch", params=parameters, json={"allianceIds": [1]})
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_post_alliance_histories_invalid_collection_id(
+    collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.post("/allianceHistory/batch", params={"collectionId": collection_id}, json={"allianceIds": [1]})
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["body"], test_cases.invalid_id_lists)
+def test_post_alliance_histories_invalid_alliance_ids(
+    body: dict[str, Any], assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    body = {"allianceIds": body["ids"]} if "ids" in body else {}
+    with client:
+        response = client.post("/allianceHistory/batch", json=body)
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_ALLIANCE_ID_INVALID)
+
+
+@pytest.mark.usefixtures("alliance_history_db", "alliance_history_out")
+@pytest.mark.usefixtures("patch_get_alliance_histories")
+@pytest.mark.parametrize(["ids", "parameters"], test_cases.valid_id_lists_and_filter_parameters)
+def test_post_alliance_histories_valid_parameters(
+    ids: list[int | str],
+    parameters: dict[str, bool | datetime | int | ParameterInterval],
+    alliance_history_out_json: Any,
+    client: TestClient,
+):
+    with client:
+        response = client.post("/allianceHistory/batch", params=parameters, json={"allianceIds": ids})
+        assert response.status_code == 200
+        assert response.json() == [
+            {"alliance_id": alliance_id, "history": [alliance_history_out_json]} for alliance_id in dict.fromkeys(int(id) for id in ids)
+        ]
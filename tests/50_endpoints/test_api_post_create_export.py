@@ -0,0 +1,32 @@
+import asyncio
+from typing import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api import export
+from src.api.models.enums import ErrorCode
+
+
+@pytest.mark.usefixtures("patch_check_is_authenticated_true", "patch_check_is_authorized_true")
+@pytest.mark.usefixtures("patch_export_collections", "patch_export_directory")
+def test_create_export(client: TestClient):
+    with client:
+        response = client.post("/exports")
+        assert response.status_code == 200
+        assert response.json() == [{"month": "2024-06", "table": "users", "row_count": 3, "size": 1024}]
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.usefixtures("patch_check_is_authenticated_true", "patch_check_is_authorized_true")
+@pytest.mark.usefixtures("patch_export_collections", "patch_export_directory")
+def test_create_export_running(assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    lock = asyncio.Lock()
+    asyncio.run(lock.acquire())
+    monkeypatch.setattr(export, "EXPORT_LOCK", lock)
+
+    with client:
+        response = client.post("/exports")
+        assert response.status_code == 409
+        assert_error_code(response, ErrorCode.EXPORT_RUNNING)
@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Any, Callable
+
+import pytest
+import test_cases
+from fastapi.testclient import TestClient
+from httpx import Response as HttpXResponse
+
+from src.api.models.enums import ErrorCode, ParameterInterval
+
+
+invalid_filter_parameters = [param for param in test_cases.invalid_filter_parameters if not {"cursor", "onMissing"} & param.values[0].keys()]
+"""parameters, expected_error_code"""
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["parameters", "expected_error_code"], invalid_filter_parameters)
+def test_post_user_histories_invalid_parameters(
+    parameters: dict[str, bool | datetime | int | ParameterInterval],
+    expected_error_code: ErrorCode,
+    assert_error_code: Callable[[HttpXResponse, ErrorCode], None],
+    client: TestClient,
+):
+    with client:
+        response = client.post("/userHistory/batch", params=parameters, json={"userIds": [1]})
+        assert response.status_code == 422
+        assert_error_code(response, expected_error_code)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["collection_id"], test_cases.invalid_ids)
+def test_post_user_histories_invalid_collection_id(
+    collection_id: int, assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    with client:
+        response = client.post("/userHistory/batch", params={"collectionId": collection_id}, json={"userIds": [1]})
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_COLLECTION_ID_INVALID)
+
+
+@pytest.mark.usefixtures("assert_error_code")
+@pytest.mark.parametrize(["body"], test_cases.invalid_id_lists)
+def test_post_user_histories_invalid_user_ids(
+    body: dict[str, Any], assert_error_code: Callable[[HttpXResponse, ErrorCode], None], client: TestClient
+):
+    body = {"userIds": body["ids"]} if "ids" in body else {}
+    with client:
+        response = client.post("/userHistory/batch", json=body)
+        assert response.status_code == 422
+        assert_error_code(response, ErrorCode.PARAMETER_USER_ID_INVALID)
+
+
+@pytest.mark.usefixtures("user_history_db", "user_history_out")
+@pytest.mark.usefixtures("patch_get_user_histories")
+@pytest.mark.parametrize(["ids", "parameters"], test_cases.valid_id_lists_and_filter_parameters)
+def test_post_user_histories_valid_parameters(
+    ids: list[int | str],
+    parameters: dict[str, bool | datetime | int | ParameterInterval],
+    user_history_out_json: Any,
+    client: TestClient,
+):
+    with client:
+        response = client.post("/userHistory/batch", params=parameters, json={"userIds": ids})
+        assert response.status_code == 200
+        assert response.json() == [{"user_id": user_id, "history": [user_history_out_json]} for user_id in dict.fromkeys(int(id) for id in ids)]
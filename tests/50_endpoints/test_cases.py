@@ -32,6 +32,18 @@ invalid_ids = [
 """id"""
 
 
+invalid_id_lists = [
+    # body
+    pytest.param({}, id="ids_missing"),
+    pytest.param({"ids": None}, id="ids_none"),
+    pytest.param({"ids": []}, id="ids_empty"),
+    pytest.param({"ids": [0]}, id="id_invalid"),
+    pytest.param({"ids": ["abc"]}, id="id_random_string"),
+    pytest.param({"ids": list(range(1, 102))}, id="ids_too_many"),
+]
+"""body"""
+
+
 invalid_collection_and_alliance_ids = [
     # collection_is, alliance_id, expected_error_code
     pytest.param(0, 1, ErrorCode.PARAMETER_COLLECTION_ID_INVALID, id="collection_id_invalid"),
@@ -75,6 +87,8 @@ invalid_filter_parameters = [
     pytest.param({"take": 101}, ErrorCode.PARAMETER_TAKE_INVALID, id="take_too_big"),
     pytest.param({"onMissing": None}, ErrorCode.PARAMETER_ONMISSING_INVALID, id="onMissing_none"),
     pytest.param({"onMissing": "invalid"}, ErrorCode.PARAMETER_ONMISSING_INVALID, id="onMissing_invalid"),
+    pytest.param({"cursor": "invalid"}, ErrorCode.PARAMETER_CURSOR_INVALID, id="cursor_invalid"),
+    pytest.param({"cursor": "a" * 257}, ErrorCode.PARAMETER_CURSOR_INVALID, id="cursor_too_long"),
 ]
 """parameters, expected_error_code"""
 
@@ -225,6 +239,32 @@ valid_id_and_filter_parameters = [
 """id, parameters"""
 
 
+valid_id_lists_and_filter_parameters = [
+    # ids, parameters
+    pytest.param([1], {}, id="single_id"),
+    pytest.param([1, 2, 3], {}, id="multiple_ids"),
+    pytest.param([1, "2", 1], {}, id="duplicate_ids"),
+    pytest.param(list(range(1, 101)), {}, id="max_ids"),
+    pytest.param([1, 2], {"collectionId": 1}, id="collection_id"),
+    pytest.param([1, 2], {"fromDate": "2020-02-01T00:00:00Z", "toDate": "2020-03-01T00:00:00Z", "interval": "day", "desc": True}, id="filter"),
+    pytest.param([1, 2], {"skip": 5, "take": 5}, id="skip_take"),
+]
+"""ids, parameters"""
+
+
+valid_on_missing_parameters = [
+    # parameters, expected_cursor
+    pytest.param({"onMissing": "empty", "take": 2}, datetime(2024, 1, 1, 1, 59), id="empty"),
+    pytest.param({"onMissing": "empty", "take": 3}, datetime(2024, 1, 1, 2, 59), id="empty_entity_missing"),
+    pytest.param({"onMissing": "null", "take": 2}, datetime(2024, 1, 1, 1, 59), id="null"),
+    pytest.param({"onMissing": "null", "take": 3}, datetime(2024, 1, 1, 2, 59), id="null_entity_missing"),
+]
+"""parameters, expected_cursor
+
+The endpoints return one entry of the entity and one filling in for a missing Collection. The page is full, if `take` slots starting at `fromDate` have been returned, even if the entity is missing from some of them.
+"""
+
+
 valid_update_files = [
     # schema_version, folder_path, file_name, collection_create_cls, to_db_convert_func
     pytest.param("tests/test_data", "update_test_data_schema_2.json", id="schema_version_3_without_division_design_id"),
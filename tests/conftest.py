@@ -1,8 +1,29 @@
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 
-from src.api.database.models import AllianceDB, AllianceHistoryDB, CollectionDB, UserDB, UserHistoryDB
+from src.api import snapshot
+from src.api.database.models import (
+    AllianceDB,
+    AllianceHistoryDB,
+    AllianceRankDB,
+    CollectionDB,
+    CollectionStatsDB,
+    DivisionStandingDB,
+    EntityEventDB,
+    EntityNameDB,
+    EntityNameSpanDB,
+    HistogramDB,
+    TournamentAllianceProgressDB,
+    TournamentDB,
+    TournamentUserDeltaDB,
+    UserDB,
+    UserHistoryDB,
+    UserHistoryDeltaDB,
+    UserMoverDB,
+    UserRankDB,
+)
 from src.api.models.api_models import (
     AllianceCreate2,
     AllianceCreate3,
@@ -28,6 +49,7 @@ from src.api.models.api_models import (
     UserCreate9,
     UserDataCreate3,
 )
+from src.api.models.enums import EntityEventType, EntityType, ParameterUserMetric
 
 
 @pytest.fixture(scope="function")
@@ -110,11 +132,100 @@ def collection_create_9() -> CollectionCreate9:
     return _create_collection_create_9()
 
 
+@pytest.fixture(scope="function")
+def alliance_rank_db() -> AllianceRankDB:
+    return (1, 1, "Trek Federation", 1, 2400)
+
+
 @pytest.fixture(scope="function")
 def collection_db() -> CollectionDB:
     return _create_collection_db()
 
 
+@pytest.fixture(scope="function")
+def collection_stats_db() -> CollectionStatsDB:
+    return CollectionStatsDB(
+        collection_id=1,
+        user_count=1,
+        alliance_count=1,
+        trophy_total=6000,
+        trophy_average=6000.0,
+        alliance_score_total=15,
+        active_user_count_day=1,
+        active_user_count_week=1,
+        active_user_count_month=1,
+        users_by_division={"1": 1},
+        users_by_membership={"FleetAdmiral": 1},
+    )
+
+
+@pytest.fixture(scope="function")
+def division_standing_db() -> DivisionStandingDB:
+    return (1, 1, "Trek Federation", 2400, 4800, 100, 12, 1800, 60000)
+
+
+@pytest.fixture(scope="function")
+def entity_event_db() -> EntityEventDB:
+    return EntityEventDB(
+        event_id=1,
+        collection_id=1,
+        collected_at=datetime(2024, 1, 2, 23, 59),
+        entity_type=EntityType.USER,
+        entity_id=1,
+        event_type=EntityEventType.JOINED_ALLIANCE,
+        old_value=None,
+        new_value="1",
+    )
+
+
+@pytest.fixture(scope="function")
+def entity_name_db() -> EntityNameDB:
+    return EntityNameDB(
+        entity_type=EntityType.ALLIANCE,
+        entity_id=1,
+        name="Trek Federation",
+        first_seen_at=datetime(2024, 1, 1, 23, 59),
+        last_seen_at=datetime(2024, 1, 2, 23, 59),
+    )
+
+
+@pytest.fixture(scope="function")
+def entity_name_span_db() -> EntityNameSpanDB:
+    return ("Trek Federation", datetime(2024, 1, 1, 23, 59), datetime(2024, 1, 2, 23, 59))
+
+
+@pytest.fixture(scope="function")
+def histogram_db() -> HistogramDB:
+    return (3, 1000, 1009, [(0.5, 1004)], [1, 0, 2])
+
+
+@pytest.fixture(scope="function")
+def tournament_db() -> TournamentDB:
+    first_collection = _create_collection_db()
+    first_collection.collected_at = datetime(2016, 1, 25, 0, 59)
+    first_collection.tournament_running = True
+    last_collection = _create_collection_db()
+    last_collection.collection_id = 2
+    last_collection.collected_at = datetime(2016, 1, 31, 23, 59)
+    last_collection.tournament_running = True
+    return (first_collection, last_collection, 168)
+
+
+@pytest.fixture(scope="function")
+def tournament_alliance_progress_db() -> TournamentAllianceProgressDB:
+    return (datetime(2016, 1, 25, 23, 59), 1, "Trek Federation", 1, 120, 40, 4800, 150)
+
+
+@pytest.fixture(scope="function")
+def tournament_user_delta_db() -> TournamentUserDeltaDB:
+    return (1, "The worst.", 1, 30, 10, 15, 5)
+
+
+@pytest.fixture(scope="function")
+def user_rank_db() -> UserRankDB:
+    return (1, 1, "The worst.", 1, 6000)
+
+
 @pytest.fixture(scope="function")
 def user_create_3() -> UserCreate3:
     return _create_user_create_3()
@@ -178,6 +289,17 @@ def user_history_db_with_alliance() -> UserHistoryDB:
     return (_create_collection_db(), _create_user_db_with_alliance())
 
 
+@pytest.fixture(scope="function")
+def user_history_delta_db() -> UserHistoryDeltaDB:
+    metric_count = len(ParameterUserMetric)
+    return (1, datetime(2024, 1, 2, 23, 59), [1000] * metric_count, [10] * metric_count, [10 / 3] * metric_count)
+
+
+@pytest.fixture(scope="function")
+def user_mover_db() -> UserMoverDB:
+    return (1, "Test User", 1, 1000, 1250, 250)
+
+
 # Helpers
 
 
@@ -378,6 +500,17 @@ def _create_user_data_create_3() -> UserDataCreate3:
     )
 
 
+def _create_shared_snapshot(directory: Path, collections: list[CollectionDB], version: str = "v1") -> snapshot.SharedSnapshot:
+    """Writes a version of the snapshot containing the `collections` ordered descending by `collected_at` and maps it."""
+    collections = sorted(collections, key=lambda collection: collection.collected_at, reverse=True)
+    catalog_rows = sorted(tuple(getattr(collection, column.name) for column in CollectionDB.__table__.columns) for collection in collections)
+    catalog = snapshot._to_record_batch(catalog_rows, snapshot.CATALOG_SCHEMA)
+    batches = [snapshot._to_record_batches(collection) for collection in collections]
+    collection_ids = [collection.collection_id for collection in collections]
+    snapshot._write_version(directory, version, catalog, collection_ids, [batch[0] for batch in batches], [batch[1] for batch in batches])
+    return snapshot.read_snapshot(directory)
+
+
 def _create_user_db() -> UserDB:
     return UserDB(
         collection_id=1,